@@ -59,7 +59,7 @@ with open(input_path, 'r') as file:
     tweet_ids = json.load(file)
 
 # Zusätzliche Parameter (tweet_fields)
-tweet_fields = ["id", "text", "lang", "source", "public_metrics"]
+tweet_fields = ["id", "text", "lang", "source", "public_metrics", "geo"]
 
 # Liste zum Speichern der Tweet-Informationen
 all_tweet_info = []
@@ -78,12 +78,17 @@ try:
         # Jeden Tweet im Batch verarbeiten
         if tweets.data:
             for tweet in tweets.data:
+                # Exakte GPS-Koordinaten [lon, lat], nur bei Tweets mit Standortfreigabe
+                geo = tweet.get('geo') or {}
+                coordinates = (geo.get('coordinates') or {}).get('coordinates')
+
                 tweet_info = {
                     "tweet_id": tweet['id'],
                     "text": tweet['text'],
                     "lang": tweet['lang'],
                     "source": tweet['source'],
-                    "public_metrics": tweet['public_metrics']
+                    "public_metrics": tweet['public_metrics'],
+                    "coordinates": coordinates
                 }
 
                 # Tweet-Informationen zur Liste hinzufügen
@@ -4,6 +4,9 @@ from typing import List, Dict, Any, Optional
 import os
 from datetime import datetime
 import emoji
+from zeitstempel import zeitstempel_felder
+from hashtag_segmentierung import Segmentierer
+from komposita import KompositaZerleger
 
 # spaCy mit deutschem Large-Modell laden
 try:
@@ -15,9 +18,26 @@ try:
 except:
     raise ImportError("spaCy de_core_news_lg nicht gefunden. Installiere mit: python -m spacy download de_core_news_lg")
 
+# In clean_text zusammengeschriebene Eigennamen - werden auch als Hashtag nicht zerlegt
+ZUSAMMENGESCHRIEBEN = [
+    'RobertKochInstitut', 'CoronaWarnApp', 'HomeOffice', 'BadenWürttemberg', 'NordrheinWestfalen',
+    'RheinlandPfalz', 'SachsenAnhalt', 'SchleswigHolstein', 'MecklenburgVorpommern'
+]
+
+# Optional: zusammengesetzte Hashtags in Wörter zerlegen (#WirBleibenZuhause → Wir Bleiben Zuhause).
+# Ändert die Tokens und damit die LDA-Topics - danach 24 neu trainieren und die Labels prüfen!
+HASHTAGS_ZERLEGEN = False
+
+# Optional: seltene Komposita in häufige Bestandteile zerlegen (kleineres Vokabular für 22-31).
+# Ändert die Tokens und damit die LDA-Topics - danach 24 neu trainieren und die Labels prüfen!
+KOMPOSITA_ZERLEGEN = False
+
 
 class GermanTweetPreprocessor:
-    def __init__(self):
+    def __init__(self, segmentierer: Optional[Segmentierer] = None):
+        # Optional: zusammengesetzte Hashtags in Wörter zerlegen (#WirBleibenZuhause → Wir Bleiben Zuhause)
+        self.segmentierer = segmentierer
+
         # Stoppwörter Ergänzung
         self.custom_stopwords = {
             'rt', 'via', 'amp', 'https', 'http', 'www', 'com', 'html', 'htm', 'mal', 'eigentlich'
@@ -83,8 +103,11 @@ class GermanTweetPreprocessor:
         text = re.sub(r'\bSchleswig[\s-]+Holsteins?\b', 'SchleswigHolstein', text, flags=re.IGNORECASE)
         text = re.sub(r'\bMecklenburg[\s-]+Vorpommerns?\b', 'MecklenburgVorpommern', text, flags=re.IGNORECASE)
 
-        # Hashtag-Symbol entfernen, Inhalt behalten
-        text = re.sub(r'#(\w+)', r'\1', text)
+        # Hashtag-Symbol entfernen, Inhalt behalten (mit Segmentierer in Wörter zerlegt)
+        if self.segmentierer:
+            text = re.sub(r'#(\w+)', lambda m: ' '.join(self.segmentierer.segmentieren(m.group(1))), text)
+        else:
+            text = re.sub(r'#(\w+)', r'\1', text)
 
         # Datumsformate entfernen
         text = re.sub(r'\d{1,2}\.\d{1,2}\.\d{2,4}', '', text)
@@ -192,14 +215,20 @@ class GermanTweetPreprocessor:
         entities = tweet.get('entities', {}).copy()
         entities['emojis'] = emojis
 
+        # Zeitstempel einmalig parsen: Unix-Epoch + Kalendertag nach Ortszeit (Europe/Berlin)
+        created_at_epoch, datum_lokal = zeitstempel_felder(tweet.get('created_at'))
+
         # Finales verarbeitetes Tweet-Objekt
         return {
             'tweet_id': tweet.get('tweet_id'),
             'created_at': tweet.get('created_at'),
+            'created_at_epoch': created_at_epoch,
+            'datum_lokal': datum_lokal,
             'user_id': tweet.get('user_id'),
             'geo_source': tweet.get('geo_source'),
             'geo': tweet.get('geo'),
             'place': tweet.get('place'),
+            'coordinates': tweet.get('coordinates'),
             'original_text': text,
             'processed_text': ' '.join(tokens),
             'tokens': tokens,
@@ -240,13 +269,70 @@ class GermanTweetPreprocessor:
         print(f"Fertig: {processed} verarbeitet, {skipped} übersprungen")
         return output_file
 
+def komposita_zerlegen(output_file, komposita_datei):
+    """
+    Zweiter Durchlauf über die Ausgabe: Komposita in den Tokens zerlegen (Häufigkeiten der
+    Lemmata aus dem ganzen Korpus). Häufigkeiten und Zerlegungen je verschiedenem Token
+    liegen in komposita_datei; die Zerlegungen werden beim nächsten Lauf nur wiederverwendet,
+    wenn die gespeicherten Häufigkeiten genau zum aktuellen Korpus passen.
+    """
+    def tokens():
+        with open(output_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)['tokens']
+
+    zerleger = KompositaZerleger.aus_tokens(tokens(), ganz=ZUSAMMENGESCHRIEBEN)
+    if os.path.exists(komposita_datei):
+        gespeichert = KompositaZerleger.laden(komposita_datei, ganz=ZUSAMMENGESCHRIEBEN)
+        if gespeichert.min_vorkommen == zerleger.min_vorkommen and \
+                gespeichert.haeufigkeiten == zerleger.haeufigkeiten:
+            zerleger = gespeichert
+        else:
+            print(f"⚠ Korpus hat sich seit {komposita_datei} geändert - Zerlegungen werden neu berechnet")
+
+    vorher, nachher = set(), set()
+    temp_file = output_file + '.tmp'
+    with open(output_file, 'r', encoding='utf-8') as infile, \
+            open(temp_file, 'w', encoding='utf-8') as outfile:
+        for line in infile:
+            tweet = json.loads(line)
+            vorher.update(tweet['tokens'])
+            tweet['tokens'] = zerleger.anwenden(tweet['tokens'])
+            tweet['processed_text'] = ' '.join(tweet['tokens'])
+            nachher.update(tweet['tokens'])
+            json.dump(tweet, outfile, ensure_ascii=False)
+            outfile.write('\n')
+    os.replace(temp_file, output_file)
+    zerleger.speichern(komposita_datei)
+
+    zerlegt = sum(len(teile) > 1 for teile in zerleger.zerlegungen.values())
+    print(f"Komposita-Zerlegung: {zerlegt:,} Tokens zerlegt, Vokabular {len(vorher):,} → {len(nachher):,}")
+
+
 # An eigene Pfade anpassen!
 def main():
-    preprocessor = GermanTweetPreprocessor()
-    preprocessor.process_dataset(
-        r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Final_Dataset.json",
-        r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Data Cleaning"
-    )
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Final_Dataset.json"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Data Cleaning"
+
+    segmentierer = None
+    if HASHTAGS_ZERLEGEN:
+        # Unigramm-Häufigkeiten für die Hashtag-Zerlegung (beim ersten Lauf aus den Tweet-Texten gezählt)
+        unigramm_datei = os.path.join(output_dir, "unigramme.json")
+        if os.path.exists(unigramm_datei):
+            segmentierer = Segmentierer.laden(unigramm_datei, ganz=ZUSAMMENGESCHRIEBEN)
+        else:
+            os.makedirs(output_dir, exist_ok=True)
+            segmentierer = Segmentierer.aus_korpus(input_file, ganz=ZUSAMMENGESCHRIEBEN)
+            segmentierer.speichern(unigramm_datei)
+
+    preprocessor = GermanTweetPreprocessor(segmentierer)
+    output_file = preprocessor.process_dataset(input_file, output_dir)
+    if segmentierer:
+        print(f"Hashtag-Zerlegung: {segmentierer.cache_info().currsize:,} verschiedene Hashtags")
+
+    if KOMPOSITA_ZERLEGEN:
+        # Häufigkeiten aus den Tokens, Zerlegungen aus dem letzten Lauf bei gleichem Korpus
+        komposita_zerlegen(output_file, os.path.join(output_dir, "komposita.json"))
 
 
 if __name__ == "__main__":
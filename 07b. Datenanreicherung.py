@@ -0,0 +1,125 @@
+import os
+import json
+import time
+import numpy as np
+from regionen import extract_bundesland
+from zeitstempel import lokale_tage
+from gazetteer import Gazetteer
+from anreicherung import Merkmale, KEIN_TAG
+from aggregationswuerfel import HASHTAGS
+from hashtag_kategorien import normalize_hashtag
+from sentiment import SentimentLexikon, SentimentBewertung
+
+# Stadt/Land-Klassifizierung (Großstädte >= 100.000 Einwohner, siehe grossstaedte.csv)
+GAZETTEER = Gazetteer.laden()
+
+
+def lade_lexika(sentiws_dateien, emoji_datei):
+    """Wort- und Emoji-Lexikon für das Sentiment; None, wenn eine Datei fehlt"""
+    try:
+        woerter = SentimentLexikon.sentiws(sentiws_dateien)
+        emojis = SentimentLexikon.emoji_ranking(emoji_datei)
+    except FileNotFoundError as e:
+        print(f"⚠ Sentiment-Lexikon nicht gefunden ({e.filename}) - Sentiment bleibt leer")
+        return None
+
+    print(f"✓ Sentiment-Lexika: {len(woerter):,} Wortformen, {len(emojis):,} Emojis")
+    return SentimentBewertung(woerter, emojis)
+
+
+def anreichern(input_file, bewertung=None):
+    """
+    Einmaliger Durchlauf über die bereinigten Tweets (gleiche Zeilen wie load_tweets
+    in den Auswertungsskripten): Bundesland, Stadt/Land, lokaler Tag, Trend-Hashtags
+    und (mit bewertung) Sentiment aus Tokens und den in 07 behaltenen Emojis.
+    """
+    print(f"Lese Tweets aus: {input_file}")
+    tweet_ids, bundeslaender, urban_klassen, hashtag_listen = [], [], [], []
+    zeit_felder = []
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num % 10000 == 0:
+                print(f"  {line_num} Zeilen gelesen...")
+
+            try:
+                tweet = json.loads(line.strip())
+            except:
+                continue
+
+            tweet_ids.append(str(tweet.get('tweet_id')))
+            bundeslaender.append(extract_bundesland(tweet))
+            urban_klassen.append(GAZETTEER.klassifiziere(tweet))
+
+            # Nur die Zeitfelder behalten, nicht den ganzen Tweet
+            zeit_felder.append({
+                'datum_lokal': tweet.get('datum_lokal'),
+                'created_at_epoch': tweet.get('created_at_epoch'),
+                'created_at': tweet.get('created_at')
+            })
+
+            normalisiert = []
+            for hashtag in tweet.get('entities', {}).get('hashtags', []):
+                # Ergebnis je unterschiedlichem Hashtag wird im Kategorisierer gecacht
+                normalized, _ = normalize_hashtag(hashtag)
+                if normalized:
+                    normalisiert.append(normalized)
+            hashtag_listen.append(normalisiert)
+
+            if bewertung is not None:
+                bewertung.hinzufuegen(tweet.get('tokens', []), tweet.get('entities', {}).get('emojis', []))
+
+    print(f"✓ {len(tweet_ids):,} Tweets gelesen")
+    sentiment = bewertung.ergebnis() if bewertung is not None else None
+    return Merkmale.kodieren(tweet_ids, bundeslaender, urban_klassen, lokale_tage(zeit_felder),
+                             hashtag_listen, sentiment)
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    # Merkmale je Tweet (zeilengleich zu Cleaned_Data.jsonl), genutzt z.B. in 35
+    merkmale_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data_merkmale.npz"
+    # Sentiment-Lexika (lokal): SentiWS v2.0 und Emoji Sentiment Ranking v1.0
+    sentiws_dateien = [
+        r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\SentiWS_v2.0\SentiWS_v2.0_Positive.txt",
+        r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\SentiWS_v2.0\SentiWS_v2.0_Negative.txt"
+    ]
+    emoji_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Emoji_Sentiment_Data_v1.0.csv"
+
+    print("=" * 70)
+    print("DATENANREICHERUNG: BUNDESLAND, OST/WEST, STADT/LAND, TAG, TREND-HASHTAGS, SENTIMENT")
+    print("=" * 70)
+
+    start = time.perf_counter()
+
+    print("\n[1/2] Berechne Merkmale...")
+    merkmale = anreichern(input_file, lade_lexika(sentiws_dateien, emoji_datei))
+
+    print("\n[2/2] Speichere Merkmale...")
+    merkmale.speichern(merkmale_datei)
+    print(f"✓ Gespeichert: {merkmale_datei} ({os.path.getsize(merkmale_datei) / 1024:.0f} KB)")
+    print(f"✓ Dauer: {time.perf_counter() - start:.1f}s")
+
+    # Kurzer Überblick
+    bundeslaender = merkmale.zaehlen('bundesland')
+    print(f"\n✓ Mit Bundesland: {int(bundeslaender.drop('Unbekannt').sum()):,} "
+          f"(Ost: {int(merkmale.ost.sum()):,})")
+    for kategorie, anzahl in merkmale.zaehlen('urban').items():
+        print(f"  {kategorie}: {anzahl:,}")
+    print(f"✓ Mit gültigem Tag: {int((merkmale.tag != KEIN_TAG).sum()):,}")
+    for hashtag in HASHTAGS:
+        print(f"  #{hashtag}: {int(merkmale.maske(hashtag=hashtag).sum()):,} Tweets")
+    bewertet = ~np.isnan(merkmale.sentiment)
+    if bewertet.any():
+        print(f"✓ Mit Sentiment: {int(bewertet.sum()):,} (Mittel {np.nanmean(merkmale.sentiment):+.3f})")
+        for kategorie, wert in merkmale.mittelwert('sentiment', 'urban').items():
+            print(f"  {kategorie}: {wert:+.3f}")
+
+    print(f"\n{'=' * 70}")
+    print("DATENANREICHERUNG ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
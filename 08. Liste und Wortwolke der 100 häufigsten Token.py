@@ -2,8 +2,7 @@ import json
 from collections import Counter
 import os
 from datetime import datetime
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+from wortwolken import speichere_wortwolke
 
 
 def load_tweets(input_file):
@@ -24,7 +23,7 @@ def load_tweets(input_file):
     return tweets
 
 
-def analyze_tokens(tweets, output_dir):
+def analyze_tokens(tweets, output_dir, cache_dir=None, vorschau=False):
     """Analysiert Tokens, erstellt Top-100-Liste und Wortwolke"""
 
     print("Analysiere Tokens...")
@@ -65,24 +64,10 @@ def analyze_tokens(tweets, output_dir):
     # --- WORTWOLKE ---
     print("Erstelle Wortwolke...")
 
-    wordcloud = WordCloud(
-        width=1600,
-        height=800,
-        background_color='white',
-        colormap='viridis',
-        max_words=200,
-        relative_scaling=0.5,
-        min_font_size=10
-    ).generate_from_frequencies(token_counter)
-
-    plt.figure(figsize=(20, 10))
-    plt.imshow(wordcloud, interpolation='bilinear')
-    plt.axis('off')
-    plt.title(f'Top Tokens ({len(tweets):,} Tweets)', fontsize=20, pad=20)
-
+    # Unveränderte Wortwolken werden aus dem Cache übernommen
     wordcloud_file = os.path.join(output_dir, f"wordcloud_{timestamp}.png")
-    plt.savefig(wordcloud_file, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    speichere_wortwolke(token_counter, wordcloud_file, f'Top Tokens ({len(tweets):,} Tweets)',
+                        cache_dir=cache_dir, vorschau=vorschau)
 
     print(f"✓ Wortwolke: {wordcloud_file}")
     print(f"\n{'=' * 70}")
@@ -94,9 +79,13 @@ def main():
     # An eigene Pfade anpassen!
     input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
     output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Tokens"
+    cache_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Tokens\wortwolken_cache"
+
+    # Auf True setzen für eine schnelle Vorschau in niedriger Auflösung
+    vorschau = False
 
     tweets = load_tweets(input_file)
-    analyze_tokens(tweets, output_dir)
+    analyze_tokens(tweets, output_dir, cache_dir, vorschau)
 
 
 if __name__ == "__main__":
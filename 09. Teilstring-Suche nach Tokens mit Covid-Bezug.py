@@ -2,6 +2,7 @@ import json
 from collections import Counter
 import os
 from datetime import datetime
+from vokabular_index import VokabularIndex
 
 
 def load_tweets(input_file):
@@ -48,19 +49,17 @@ def find_corona_related_tokens(tweets, output_dir):
 
     print("Suche nach Corona/COVID/SARS/Virus-verwandten Tokens...")
 
-    # Finde alle Tokens die einen der Substrings enthalten
-    corona_tokens = {}
+    # Vokabular-Index einmalig aufbauen (Suffix-Array + Präfix-Index)
+    vokabular_index = VokabularIndex(token_counter.keys())
 
-    for token in token_counter.keys():
-        token_lower = token.lower()
+    # Finde alle Tokens die einen der Substrings enthalten (ein Durchlauf per Aho-Corasick)
+    corona_tokens = {}
 
-        for substring in search_substrings:
-            if substring in token_lower:
-                corona_tokens[token] = {
-                    'count': token_counter[token],
-                    'percentage': (token_counter[token] / total_tokens) * 100
-                }
-                break
+    for token in vokabular_index.enthaelt_eines(search_substrings):
+        corona_tokens[token] = {
+            'count': token_counter[token],
+            'percentage': (token_counter[token] / total_tokens) * 100
+        }
 
     # Sortiere alphabetisch
     corona_tokens_alphabetical = sorted(corona_tokens.items(), key=lambda x: x[0].lower())
@@ -85,14 +84,77 @@ def find_corona_related_tokens(tweets, output_dir):
 
     print(f"✓ Liste gespeichert: {txt_file}")
 
+    return vokabular_index, token_counter
+
+
+def interaktive_suche(vokabular_index, token_counter, stopwords_file):
+    """
+    Interaktive Suche im Vokabular zum Kuratieren der Corona-Stoppwörter.
+    Eingaben:
+        text     -> alle Tokens, die 'text' enthalten
+        ^text    -> alle Tokens, die mit 'text' beginnen
+        +        -> letztes Suchergebnis zur Stoppwortliste hinzufügen
+        -token   -> einzelnes Token wieder von der Liste entfernen
+        (leer)   -> beenden und Stoppwortliste speichern
+    """
+    stopwords = set()
+    if os.path.exists(stopwords_file):
+        with open(stopwords_file, 'r', encoding='utf-8') as f:
+            stopwords = {line.strip().lower() for line in f if line.strip()}
+
+    print(f"\nInteraktive Suche ({len(vokabular_index):,} Tokens, {len(stopwords)} Stoppwörter geladen)")
+    letztes_ergebnis = []
+
+    while True:
+        eingabe = input("Suche> ").strip().lower()
+
+        if not eingabe:
+            break
+
+        if eingabe == '+':
+            stopwords.update(letztes_ergebnis)
+            print(f"  ✓ {len(letztes_ergebnis)} Tokens übernommen ({len(stopwords)} gesamt)")
+            continue
+
+        if eingabe.startswith('-'):
+            stopwords.discard(eingabe[1:])
+            print(f"  ✓ '{eingabe[1:]}' entfernt ({len(stopwords)} gesamt)")
+            continue
+
+        if eingabe.startswith('^'):
+            letztes_ergebnis = vokabular_index.praefix(eingabe[1:])
+        else:
+            letztes_ergebnis = vokabular_index.teilstring(eingabe)
+
+        # Nach Häufigkeit sortiert anzeigen
+        for token in sorted(letztes_ergebnis, key=lambda t: token_counter[t], reverse=True)[:50]:
+            markierung = '*' if token in stopwords else ' '
+            print(f"  {markierung} {token:<40} {token_counter[token]:>8,}")
+
+        if len(letztes_ergebnis) > 50:
+            print(f"  ... und {len(letztes_ergebnis) - 50} weitere")
+
+    with open(stopwords_file, 'w', encoding='utf-8') as f:
+        for token in sorted(stopwords):
+            f.write(f"{token}\n")
+
+    print(f"✓ Stoppwortliste gespeichert: {stopwords_file}")
+
 
 def main():
     # An eigene Pfade anpassen!
     input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
     output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Tokens"
+    stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\corona_stopwords.txt"
+
+    # Auf True setzen, um die Stoppwortliste interaktiv zu kuratieren
+    interaktiv = False
 
     tweets = load_tweets(input_file)
-    find_corona_related_tokens(tweets, output_dir)
+    vokabular_index, token_counter = find_corona_related_tokens(tweets, output_dir)
+
+    if interaktiv:
+        interaktive_suche(vokabular_index, token_counter, stopwords_file)
 
 
 if __name__ == "__main__":
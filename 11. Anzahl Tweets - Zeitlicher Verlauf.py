@@ -5,6 +5,8 @@ import plotly.express as px
 from datetime import datetime
 import os
 from collections import Counter
+import numpy as np
+from zeitstempel import epochs, lokale_zeit
 
 
 def load_tweets(input_file):
@@ -26,25 +28,14 @@ def load_tweets(input_file):
     return tweets
 
 
-def parse_twitter_date(date_str):
-    """Konvertiert Twitter-Datum in datetime-Objekt"""
-    # Twitter Format: "Sat Feb 01 17:11:42 +0000 2020"
-    return datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y')
-
-
 def create_temporal_analysis(tweets, output_dir):
     """Erstellt zeitliche Analysen"""
 
     print("Erstelle zeitliche Analysen...")
 
-    # Timestamps extrahieren und parsen
-    dates = []
-    for tweet in tweets:
-        try:
-            date = parse_twitter_date(tweet['created_at'])
-            dates.append(date)
-        except:
-            continue
+    # Timestamps vektorisiert extrahieren (Ortszeit Europe/Berlin, ungültige = NaT)
+    dates = lokale_zeit(epochs(tweets))
+    dates = dates[~np.isnat(dates)]
 
     print(f"✓ {len(dates)} Tweets mit gültigem Datum\n")
 
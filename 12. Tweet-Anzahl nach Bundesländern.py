@@ -1,72 +1,20 @@
 import json
 import pandas as pd
-import geopandas as gpd
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 from collections import Counter
 import os
 from datetime import datetime
+from geometrie import lade_bundeslaender
+from regionen import EINWOHNER_2020, OST_BUNDESLAENDER, OST_OHNE_BERLIN, extract_bundesland
 
 # Matplotlib auf Deutsch
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['axes.unicode_minus'] = False
 
-# Übersetzung Englisch → Deutsch
-STATE_MAPPING = {
-    'Berlin': 'Berlin',
-    'North Rhine-Westphalia': 'Nordrhein-Westfalen',
-    'Bavaria': 'Bayern',
-    'Baden-Württemberg': 'Baden-Württemberg',
-    'Hamburg': 'Hamburg',
-    'Hesse': 'Hessen',
-    'Lower Saxony': 'Niedersachsen',
-    'Rhineland-Palatinate': 'Rheinland-Pfalz',
-    'Saxony': 'Sachsen',
-    'Brandenburg': 'Brandenburg',
-    'Schleswig-Holstein': 'Schleswig-Holstein',
-    'Saxony-Anhalt': 'Sachsen-Anhalt',
-    'Free Hanseatic City of Bremen': 'Bremen',
-    'Thuringia': 'Thüringen',
-    'Mecklenburg-Vorpommern': 'Mecklenburg-Vorpommern',
-    'Mecklenburg-Western Pomerania': 'Mecklenburg-Vorpommern',
-    'Saarland': 'Saarland'
-}
-
-# Einwohnerzahlen Bundesländer, Stand 31.12.2019
-# https://www.destatis.de/DE/Presse/Pressemitteilungen/2021/06/PD21_287_12411.html)
-EINWOHNER_2020 = {
-    'Baden-Württemberg': 11_100_400,
-    'Bayern': 13_124_700,
-    'Berlin': 3_669_500,
-    'Brandenburg': 2_521_900,
-    'Bremen': 681_200,
-    'Hamburg': 1_847_300,
-    'Hessen': 6_288_100,
-    'Mecklenburg-Vorpommern': 1_608_100,
-    'Niedersachsen': 7_993_600,
-    'Nordrhein-Westfalen': 17_947_200,
-    'Rheinland-Pfalz': 4_093_900,
-    'Saarland': 986_900,
-    'Sachsen': 4_072_000,
-    'Sachsen-Anhalt': 2_194_800,
-    'Schleswig-Holstein': 2_903_800,
-    'Thüringen': 2_133_400
-}
-
-# Ost-Bundesländer
-OST_BUNDESLAENDER = {
-    'Berlin', 'Brandenburg', 'Mecklenburg-Vorpommern',
-    'Sachsen', 'Sachsen-Anhalt', 'Thüringen'
-}
-
-# Ost-Bundesländer OHNE Berlin
-OST_OHNE_BERLIN = {
-    'Brandenburg', 'Mecklenburg-Vorpommern',
-    'Sachsen', 'Sachsen-Anhalt', 'Thüringen'
-}
-
-# Pfad zu den Shapefiles
+# Pfad zu den Shapefiles (Fallback, falls das Geometrie-Artefakt aus 36 fehlt)
 SHAPEFILE_PATH = r"C:\Users\katri\Desktop\LFP Datensätze\ne_10m_admin_1_states_provinces\ne_10m_admin_1_states_provinces.shp"
+GEOMETRIE_DIR = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
 
 
 def load_tweets(input_file):
@@ -88,31 +36,14 @@ def load_tweets(input_file):
     return tweets
 
 
-def extract_bundesland(tweet):
-    """Extrahiert und übersetzt Bundesland aus geo_source"""
-    geo_source = tweet.get('geo_source')
-
-    if not geo_source:
-        return None
-
-    bundesland_en = None
-    if geo_source == 'place' and tweet.get('place'):
-        bundesland_en = tweet['place'].get('state')
-    elif geo_source == 'coordinates' and tweet.get('geo'):
-        bundesland_en = tweet['geo'].get('state')
-
-    return STATE_MAPPING.get(bundesland_en) if bundesland_en else None
-
-
 def create_heatmaps(tweets, output_dir):
     """Erstellt Heatmaps und Statistiken"""
 
     print("Erstelle Analyse...")
 
-    # Shapefile laden
-    print("Lade Shapefile...")
-    germany_gdf = gpd.read_file(SHAPEFILE_PATH)
-    germany_gdf = germany_gdf[germany_gdf['admin'] == 'Germany'].copy()
+    # Bundesland-Geometrien laden (vorberechnetes Artefakt, siehe 36)
+    print("Lade Bundesland-Geometrien...")
+    germany_gdf = lade_bundeslaender(GEOMETRIE_DIR, 'druck', SHAPEFILE_PATH)
 
     # Bundesländer extrahieren
     bundeslaender = [extract_bundesland(tweet) for tweet in tweets]
@@ -303,7 +234,7 @@ def create_visualizations(germany_gdf, df, output_dir, timestamp):
     ax1.axis('off')
 
     for idx, row in germany_gdf.iterrows():
-        centroid = row['geometry'].centroid
+        centroid = row['label_punkt']
 
         if row['Bundesland'] == 'Berlin':
             label_x = centroid.x
@@ -343,7 +274,7 @@ def create_visualizations(germany_gdf, df, output_dir, timestamp):
     ax2.axis('off')
 
     for idx, row in germany_gdf.iterrows():
-        centroid = row['geometry'].centroid
+        centroid = row['label_punkt']
 
         if row['Bundesland'] == 'Berlin':
             label_x = centroid.x
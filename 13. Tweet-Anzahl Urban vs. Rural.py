@@ -4,6 +4,7 @@ from plotly.subplots import make_subplots
 from collections import Counter
 import os
 from datetime import datetime
+from gazetteer import Gazetteer
 
 # Emoji-Modifier, die gefiltert werden sollen
 EMOJI_MODIFIERS = {
@@ -12,111 +13,8 @@ EMOJI_MODIFIERS = {
     '️', '\ufe0f',
 }
 
-# Urban/Rural Klassifizierung
-CITY_CLASSIFICATION = {
-    # Urban (>= 100.000 Einwohner - Großstädte)
-    'Berlin': 'urban',
-    'Hamburg': 'urban',
-    'Munich': 'urban',
-    'München': 'urban',
-    'Cologne': 'urban',
-    'Köln': 'urban',
-    'Frankfurt': 'urban',
-    'Frankfurt am Main': 'urban',
-    'Stuttgart': 'urban',
-    'Düsseldorf': 'urban',
-    'Dusseldorf': 'urban',
-    'Dortmund': 'urban',
-    'Essen': 'urban',
-    'Leipzig': 'urban',
-    'Bremen': 'urban',
-    'Dresden': 'urban',
-    'Hannover': 'urban',
-    'Hanover': 'urban',
-    'Nürnberg': 'urban',
-    'Nuremberg': 'urban',
-    'Duisburg': 'urban',
-    'Bochum': 'urban',
-    'Wuppertal': 'urban',
-    'Bielefeld': 'urban',
-    'Bonn': 'urban',
-    'Münster': 'urban',
-    'Munster': 'urban',
-    'Karlsruhe': 'urban',
-    'Mannheim': 'urban',
-    'Augsburg': 'urban',
-    'Wiesbaden': 'urban',
-    'Gelsenkirchen': 'urban',
-    'Mönchengladbach': 'urban',
-    'Monchengladbach': 'urban',
-    'Braunschweig': 'urban',
-    'Brunswick': 'urban',
-    'Chemnitz': 'urban',
-    'Kiel': 'urban',
-    'Aachen': 'urban',
-    'Halle': 'urban',
-    'Halle (Saale)': 'urban',
-    'Magdeburg': 'urban',
-    'Freiburg': 'urban',
-    'Freiburg im Breisgau': 'urban',
-    'Krefeld': 'urban',
-    'Lübeck': 'urban',
-    'Lubeck': 'urban',
-    'Oberhausen': 'urban',
-    'Erfurt': 'urban',
-    'Mainz': 'urban',
-    'Rostock': 'urban',
-    'Kassel': 'urban',
-    'Hagen': 'urban',
-    'Saarbrücken': 'urban',
-    'Saarbrucken': 'urban',
-    'Mülheim': 'urban',
-    'Mulheim': 'urban',
-    'Mülheim an der Ruhr': 'urban',
-    'Potsdam': 'urban',
-    'Ludwigshafen': 'urban',
-    'Ludwigshafen am Rhein': 'urban',
-    'Oldenburg': 'urban',
-    'Leverkusen': 'urban',
-    'Osnabrück': 'urban',
-    'Osnabruck': 'urban',
-    'Solingen': 'urban',
-    'Heidelberg': 'urban',
-    'Herne': 'urban',
-    'Neuss': 'urban',
-    'Darmstadt': 'urban',
-    'Paderborn': 'urban',
-    'Regensburg': 'urban',
-    'Ingolstadt': 'urban',
-    'Würzburg': 'urban',
-    'Wurzburg': 'urban',
-    'Fürth': 'urban',
-    'Furth': 'urban',
-    'Wolfsburg': 'urban',
-    'Offenbach': 'urban',
-    'Offenbach am Main': 'urban',
-    'Ulm': 'urban',
-    'Heilbronn': 'urban',
-    'Pforzheim': 'urban',
-    'Göttingen': 'urban',
-    'Gottingen': 'urban',
-    'Bottrop': 'urban',
-    'Trier': 'urban',
-    'Recklinghausen': 'urban',
-    'Reutlingen': 'urban',
-    'Bremerhaven': 'urban',
-    'Koblenz': 'urban',
-    'Bergisch Gladbach': 'urban',
-    'Jena': 'urban',
-    'Remscheid': 'urban',
-    'Erlangen': 'urban',
-    'Moers': 'urban',
-    'Siegen': 'urban',
-    'Hildesheim': 'urban',
-    'Salzgitter': 'urban',
-    'Gütersloh': 'urban',
-    'Gutersloh': 'urban',
-}
+# Urban/Rural Klassifizierung (Großstädte >= 100.000 Einwohner, siehe grossstaedte.csv)
+GAZETTEER = Gazetteer.laden()
 
 
 def filter_emoji_modifiers(emojis):
@@ -125,20 +23,9 @@ def filter_emoji_modifiers(emojis):
 
 
 def classify_location(tweet):
-    """Klassifiziert Tweet als urban oder rural basierend auf Stadt"""
-    city = None
-
-    geo_source = tweet.get('geo_source')
-
-    if geo_source == 'coordinates' and tweet.get('geo'):
-        city = tweet['geo'].get('city')
-    elif geo_source == 'place' and tweet.get('place'):
-        city = tweet['place'].get('city')
-
-    if not city:
-        return None
-
-    return CITY_CLASSIFICATION.get(city, 'rural')
+    """Klassifiziert Tweet als urban oder rural (einheitlicher Gazetteer, siehe gazetteer.py)"""
+    kategorie = GAZETTEER.klassifiziere(tweet)
+    return kategorie.lower() if kategorie else None
 
 
 def load_tweets(input_file):
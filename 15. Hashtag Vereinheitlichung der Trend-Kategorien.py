@@ -2,57 +2,7 @@ import json
 import pandas as pd
 from collections import Counter, defaultdict
 import re
-
-
-def normalize_hashtag(hashtag):
-    """
-    Normalisiert Hashtags zu Kategorien - IDENTISCH zur Hauptanalyse
-    """
-    tag_lower = hashtag.lower().replace('_', '').replace('-', '').replace(' ', '').replace('ー', '')
-
-    # Ausschlussliste - diese Hashtags werden NICHT kategorisiert
-    excluded = ['aviationlockdownnow', 'ausgangssperrejetzt', 'ausgangssperreüberfällig',
-                'endthelockdown', 'lockdownend',
-                'trotzabstandhaltenwirzusammen', 'friendlydistancing']
-
-    if tag_lower in excluded:
-        return None, None
-
-    # 1. FlattenTheCurve Varianten
-    if any(x in tag_lower for x in ['flattenthecurve', 'flatenthecurve', 'flatthecurve',
-                                    'kurveflachen', 'kurveabflachen', 'diekurveflachen']):
-        return 'FlattenTheCurve', 'Gesundheitsmaßnahmen'
-
-    # 2. Stay Home / Bleibt Zuhause Varianten
-    if any(x in tag_lower for x in ['wirbleibenzuhause', 'bleibtzuhause', 'bleibzuhause',
-                                    'ichbleibezuhause', 'bleibtdaheim', 'bleibtheim',
-                                    'zuhausebleiben', 'daheimbleiben',
-                                    'stayhome', 'stayathome', 'stayinghome',
-                                    'stayindoors', 'stayinside',
-                                    'wirbleibendaheim', 'ichbleibedaheim']):
-        return 'WirBleibenZuhause', 'Solidarität'
-
-    # 3. Social Distancing Varianten
-    if any(x in tag_lower for x in ['socialdistancing', 'socialdistance', 'socialdist',
-                                    'physicaldistancing', 'physicaldistance',
-                                    'sozialedistanzierung', 'sozialedistanz',
-                                    'abstandhalten', 'abstandhalte', 'keepdistance',
-                                    'distancing', 'distanz']):
-        return 'SocialDistancing', 'Gesundheitsmaßnahmen'
-
-    # 4. Lockdown Varianten
-    if any(x in tag_lower for x in ['lockdown', 'coronalockdown', 'covidlockdown',
-                                    'shutdown', 'ausgangssperre', 'ausgangsbeschränkung', 'ausgangsverbot',
-                                    'kontaktsperre', 'kontaktverbot', 'kontaktbeschränkung']):
-        return 'Lockdown', 'Maßnahmen'
-
-    # 5. Coronakrise Varianten
-    if any(x in tag_lower for x in ['coronakrise', 'coronacrisis', 'covidkrise', 'covidcrisis',
-                                    'coronaviruskrise', 'coronaviruscrisis',
-                                    'covid19krise', 'covid19crisis']):
-        return 'Coronakrise', 'Framing'
-
-    return None, None
+from hashtag_kategorien import normalize_hashtag
 
 
 def analyze_hashtag_variants(input_file, output_file):
@@ -5,58 +5,12 @@ from collections import Counter, defaultdict
 import os
 from datetime import datetime
 import re
+from zeitstempel import lokale_tage
+from hashtag_kategorien import normalize_hashtag
+from bursts import BurstErkennung
 
-def normalize_hashtag(hashtag):
-    """
-    Normalisiert Hashtags zu Kategorien
-    hashtag.lower wandelt in Kleinschreibung um
-    Returns: (normalized_tag, category) oder (None, None) wenn nicht relevant
-    """
-    tag_lower = hashtag.lower().replace('_', '').replace('-', '').replace(' ', '').replace('ー', '')
-
-    # Ausschlussliste - diese Hashtags werden NICHT kategorisiert
-    excluded = ['aviationlockdownnow', 'ausgangssperrejetzt', 'ausgangssperreüberfällig',
-                'endthelockdown', 'lockdownend',
-                'trotzabstandhaltenwirzusammen', 'friendlydistancing']
-
-    if tag_lower in excluded:
-        return None, None
-
-    # 1. FlattenTheCurve Varianten
-    if any(x in tag_lower for x in ['flattenthecurve', 'flatenthecurve', 'flatthecurve',
-                                    'kurveflachen', 'kurveabflachen', 'diekurveflachen']):
-        return 'FlattenTheCurve', 'Gesundheitsmaßnahmen'
-
-    # 2. Stay Home / Bleibt Zuhause Varianten
-    if any(x in tag_lower for x in ['wirbleibenzuhause', 'bleibtzuhause', 'bleibzuhause',
-                                    'ichbleibezuhause', 'bleibtdaheim', 'bleibtheim',
-                                    'zuhausebleiben', 'daheimbleiben',
-                                    'stayhome', 'stayathome', 'stayinghome',
-                                    'stayindoors', 'stayinside',
-                                    'wirbleibendaheim', 'ichbleibedaheim']):
-        return 'WirBleibenZuhause', 'Solidarität'
-
-    # 3. Social Distancing Varianten
-    if any(x in tag_lower for x in ['socialdistancing', 'socialdistance', 'socialdist',
-                                    'physicaldistancing', 'physicaldistance',
-                                    'sozialedistanzierung', 'sozialedistanz',
-                                    'abstandhalten', 'abstandhalte', 'keepdistance',
-                                    'distancing', 'distanz']):
-        return 'SocialDistancing', 'Gesundheitsmaßnahmen'
-
-    # 4. Lockdown Varianten
-    if any(x in tag_lower for x in ['lockdown', 'coronalockdown', 'covidlockdown',
-                                    'shutdown', 'ausgangssperre', 'ausgangsbeschränkung', 'ausgangsverbot',
-                                    'kontaktsperre', 'kontaktverbot', 'kontaktbeschränkung']):
-        return 'Lockdown', 'Maßnahmen'
-
-    # 5. Coronakrise Varianten
-    if any(x in tag_lower for x in ['coronakrise', 'coronacrisis', 'covidkrise', 'covidcrisis',
-                                    'coronaviruskrise', 'coronaviruscrisis',
-                                    'covid19krise', 'covid19crisis']):
-        return 'Coronakrise', 'Framing'
-
-    return None, None
+# Rohe Hashtags (kleingeschrieben) gehen erst ab so vielen Vorkommen in die Burst-Erkennung
+MIN_VORKOMMEN_BURSTS = 50
 
 
 def load_tweets(input_file):
@@ -78,9 +32,41 @@ def load_tweets(input_file):
     return tweets
 
 
-def parse_twitter_date(date_str):
-    """Konvertiert Twitter-Datum in datetime-Objekt"""
-    return datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y')
+def timeline_frame(timeline, tage):
+    """{Reihe: {Datum: Anzahl}} → DataFrame (Index = alle Tage, Spalten = Reihen, fehlende Tage = 0)"""
+    df = pd.DataFrame({name: pd.Series(counts, dtype='int64') for name, counts in timeline.items()})
+    return df.reindex(tage, fill_value=0).fillna(0).astype('int64')
+
+
+def detect_bursts(timelines, tweets_per_day, output_dir, timestamp):
+    """
+    Kleinberg-Bursts für Trend-Hashtags, Kategorien und rohe Hashtags (alle Reihen
+    einer Gruppe in einem vektorisierten Durchlauf). Der Modellzustand wird gespeichert,
+    damit neue Tage mit BurstErkennung.fortschreiben() ohne Neuberechnung folgen können.
+    Returns: DataFrame aller Burst-Intervalle, {Gruppe: BurstErkennung}
+    """
+    tage = sorted(tweets_per_day)
+    gesamt = pd.Series(tweets_per_day).reindex(tage)
+
+    intervalle = []
+    modelle = {}
+    for gruppe, timeline in timelines.items():
+        if not timeline:
+            continue
+        modell = BurstErkennung.anpassen(timeline_frame(timeline, tage), gesamt)
+        modell.speichern(os.path.join(output_dir, f"bursts_modell_{gruppe}.npz"))
+        modelle[gruppe] = modell
+
+        df = modell.intervalle()
+        df.insert(0, 'gruppe', gruppe)
+        intervalle.append(df)
+        print(f"✓ Bursts {gruppe}: {len(df)} Intervalle in {len(modell)} Reihen")
+
+    alle = pd.concat(intervalle, ignore_index=True) if intervalle else pd.DataFrame()
+    csv_file = os.path.join(output_dir, f"hashtag_bursts_{timestamp}.csv")
+    alle.to_csv(csv_file, index=False, encoding='utf-8-sig')
+    print(f"✓ Burst-Intervalle: {csv_file}")
+    return alle, modelle
 
 
 def analyze_hashtag_trends(tweets, output_dir):
@@ -91,18 +77,28 @@ def analyze_hashtag_trends(tweets, output_dir):
     # Datenstruktur: {normalized_hashtag: {date: count}}
     hashtag_timeline = defaultdict(lambda: defaultdict(int))
     category_timeline = defaultdict(lambda: defaultdict(int))
+    # Für die Burst-Erkennung: alle Hashtags (kleingeschrieben) und Tweets pro Tag als Bezugsgröße
+    raw_timeline = defaultdict(lambda: defaultdict(int))
+    tweets_per_day = Counter()
 
     # Alle Varianten tracken für Report
     hashtag_variants = defaultdict(set)
 
     processed = 0
 
-    for tweet in tweets:
+    # Kalendertage aller Tweets vektorisiert (Ortszeit Europe/Berlin, ungültig = None)
+    dates = lokale_tage(tweets).astype(object)
+
+    for tweet, date in zip(tweets, dates):
+        if date is None:
+            continue
+        tweets_per_day[date] += 1
+
         try:
-            date = parse_twitter_date(tweet['created_at']).date()
             hashtags = tweet.get('entities', {}).get('hashtags', [])
 
             for hashtag in hashtags:
+                raw_timeline[hashtag.lower()][date] += 1
                 normalized, category = normalize_hashtag(hashtag)
 
                 if normalized:
@@ -130,6 +126,12 @@ def analyze_hashtag_trends(tweets, output_dir):
     os.makedirs(output_dir, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    # Burst-Erkennung statt Peaks nach Augenmaß
+    raw_timeline = {hashtag: dates for hashtag, dates in raw_timeline.items()
+                    if sum(dates.values()) >= MIN_VORKOMMEN_BURSTS}
+    bursts, _ = detect_bursts({'trend': hashtag_timeline, 'kategorie': category_timeline, 'roh': raw_timeline},
+                              tweets_per_day, output_dir, timestamp)
+
     # --- TXT-REPORT ---
     txt_file = os.path.join(output_dir, f"hashtag_trends_{timestamp}.txt")
     with open(txt_file, 'w', encoding='utf-8') as f:
@@ -212,6 +214,30 @@ def analyze_hashtag_trends(tweets, output_dir):
             percentage = (total / processed) * 100
             f.write(f"  {idx}. {hashtag}: {total:,} ({percentage:.1f}% aller relevanten Hashtags)\n")
 
+        f.write("\n\n" + "=" * 80 + "\n")
+        f.write("BURSTS (KLEINBERG)\n")
+        f.write("=" * 80 + "\n\n")
+        f.write("Zeiträume, in denen der Anteil eines Hashtags an allen Tweets deutlich\n")
+        f.write("über seiner Grundrate lag (Stufe 1 = doppelt, Stufe 2 = vierfach):\n\n")
+
+        if not bursts.empty:
+            for gruppe, titel in [('trend', 'Trend-Hashtags'), ('kategorie', 'Kategorien'),
+                                  ('roh', 'Alle Hashtags (Top 20 nach Intensität)')]:
+                auswahl = bursts[bursts['gruppe'] == gruppe]
+                if gruppe == 'roh':
+                    auswahl = auswahl.head(20)
+                else:
+                    auswahl = auswahl.sort_values(['reihe', 'start'])
+                f.write(f"{titel}:\n")
+                if auswahl.empty:
+                    f.write("  (keine)\n")
+                praefix = '' if gruppe == 'kategorie' else '#'
+                for _, row in auswahl.iterrows():
+                    f.write(f"  {praefix + row['reihe']:<26} Stufe {row['stufe']}  {row['start']} bis {row['ende']}  "
+                            f"({row['anzahl']:,} statt {row['erwartet']:,.0f} erwartet, "
+                            f"Intensität {row['intensitaet']:,.0f})\n")
+                f.write("\n")
+
         f.write("\n\n" + "=" * 80 + "\n")
         f.write("INTERPRETATION\n")
         f.write("=" * 80 + "\n\n")
@@ -314,6 +340,17 @@ def analyze_hashtag_trends(tweets, output_dir):
             font=dict(size=11)
         )
 
+        # Burst-Intervalle hinterlegen
+        if not bursts.empty:
+            for _, row in bursts[(bursts['gruppe'] == 'trend') & (bursts['reihe'] == hashtag)].iterrows():
+                fig_single.add_vrect(
+                    x0=pd.Timestamp(row['start']) - pd.Timedelta(hours=12),
+                    x1=pd.Timestamp(row['ende']) + pd.Timedelta(hours=12),
+                    fillcolor=colors.get(hashtag, 'steelblue'),
+                    opacity=0.08 * row['stufe'],
+                    line_width=0
+                )
+
         # Durchschnittslinie
         mean_val = df['Anzahl'].mean()
         fig_single.add_hline(
@@ -1,143 +1,15 @@
 import json
 import pandas as pd
-import geopandas as gpd
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as path_effects
-from collections import Counter, defaultdict
 import os
 from datetime import datetime
-
-# Übersetzung Englisch → Deutsch
-STATE_MAPPING = {
-    'Berlin': 'Berlin',
-    'North Rhine-Westphalia': 'Nordrhein-Westfalen',
-    'Bavaria': 'Bayern',
-    'Baden-Württemberg': 'Baden-Württemberg',
-    'Hamburg': 'Hamburg',
-    'Hesse': 'Hessen',
-    'Lower Saxony': 'Niedersachsen',
-    'Rhineland-Palatinate': 'Rheinland-Pfalz',
-    'Saxony': 'Sachsen',
-    'Brandenburg': 'Brandenburg',
-    'Schleswig-Holstein': 'Schleswig-Holstein',
-    'Saxony-Anhalt': 'Sachsen-Anhalt',
-    'Free Hanseatic City of Bremen': 'Bremen',
-    'Thuringia': 'Thüringen',
-    'Mecklenburg-Vorpommern': 'Mecklenburg-Vorpommern',
-    'Mecklenburg-Western Pomerania': 'Mecklenburg-Vorpommern',
-    'Saarland': 'Saarland'
-}
-
-# Ost-Bundesländer
-OST_BUNDESLAENDER = {
-    'Berlin', 'Brandenburg', 'Mecklenburg-Vorpommern',
-    'Sachsen', 'Sachsen-Anhalt', 'Thüringen'
-}
-
-# Alle Bundesländer
-ALLE_BUNDESLAENDER = [
-    'Baden-Württemberg', 'Bayern', 'Berlin', 'Brandenburg', 'Bremen',
-    'Hamburg', 'Hessen', 'Mecklenburg-Vorpommern', 'Niedersachsen',
-    'Nordrhein-Westfalen', 'Rheinland-Pfalz', 'Saarland', 'Sachsen',
-    'Sachsen-Anhalt', 'Schleswig-Holstein', 'Thüringen'
-]
-
-# Mapping von Natural Earth Namen zu deutschen Namen
-NATURAL_EARTH_MAPPING = {
-    'Baden-Württemberg': 'Baden-Württemberg',
-    'Bayern': 'Bayern',
-    'Berlin': 'Berlin',
-    'Brandenburg': 'Brandenburg',
-    'Bremen': 'Bremen',
-    'Hamburg': 'Hamburg',
-    'Hessen': 'Hessen',
-    'Mecklenburg-Vorpommern': 'Mecklenburg-Vorpommern',
-    'Niedersachsen': 'Niedersachsen',
-    'Nordrhein-Westfalen': 'Nordrhein-Westfalen',
-    'Rheinland-Pfalz': 'Rheinland-Pfalz',
-    'Saarland': 'Saarland',
-    'Sachsen': 'Sachsen',
-    'Sachsen-Anhalt': 'Sachsen-Anhalt',
-    'Schleswig-Holstein': 'Schleswig-Holstein',
-    'Thüringen': 'Thüringen'
-}
-
-
-def normalize_hashtag(hashtag):
-    """
-    Normalisiert Hashtags zu Kategorien
-    Returns: (normalized_tag, category) oder (None, None) wenn nicht relevant
-    """
-    tag_lower = hashtag.lower().replace('_', '').replace('-', '').replace(' ', '').replace('ー', '')
-
-    # Ausschlussliste - diese Hashtags werden NICHT kategorisiert
-    excluded = ['aviationlockdownnow', 'ausgangssperrejetzt', 'ausgangssperreüberfällig',
-                'endthelockdown', 'lockdownend',
-                'trotzabstandhaltenwirzusammen', 'friendlydistancing']
-
-    if tag_lower in excluded:
-        return None, None
-
-    # 1. FlattenTheCurve Varianten
-    if any(x in tag_lower for x in ['flattenthecurve', 'flatenthecurve', 'flatthecurve',
-                                    'kurveflachen', 'kurveabflachen', 'diekurveflachen']):
-        return 'FlattenTheCurve', 'Gesundheitsmaßnahmen'
-
-    # 2. Stay Home / Bleibt Zuhause Varianten
-    if any(x in tag_lower for x in ['wirbleibenzuhause', 'bleibtzuhause', 'bleibzuhause',
-                                    'ichbleibezuhause', 'bleibtdaheim', 'bleibtheim',
-                                    'zuhausebleiben', 'daheimbleiben',
-                                    'stayhome', 'stayathome', 'stayinghome',
-                                    'stayindoors', 'stayinside',
-                                    'wirbleibendaheim', 'ichbleibedaheim']):
-        return 'WirBleibenZuhause', 'Solidarität'
-
-    # 3. Social Distancing Varianten
-    if any(x in tag_lower for x in ['socialdistancing', 'socialdistance', 'socialdist',
-                                    'physicaldistancing', 'physicaldistance',
-                                    'sozialedistanzierung', 'sozialedistanz',
-                                    'abstandhalten', 'abstandhalte', 'keepdistance',
-                                    'distancing', 'distanz']):
-        return 'SocialDistancing', 'Gesundheitsmaßnahmen'
-
-    # 4. Lockdown Varianten
-    if any(x in tag_lower for x in ['lockdown', 'coronalockdown', 'covidlockdown',
-                                    'shutdown', 'ausgangssperre', 'ausgangsbeschränkung', 'ausgangsverbot',
-                                    'kontaktsperre', 'kontaktverbot', 'kontaktbeschränkung']):
-        return 'Lockdown', 'Maßnahmen'
-
-    # 5. Coronakrise Varianten
-    if any(x in tag_lower for x in ['coronakrise', 'coronacrisis', 'covidkrise', 'covidcrisis',
-                                    'coronaviruskrise', 'coronaviruscrisis',
-                                    'covid19krise', 'covid19crisis']):
-        return 'Coronakrise', 'Framing'
-
-    return None, None
-
-
-def load_natural_earth_shapefile(shapefile_path):
-    """Lädt Natural Earth Shapefile und filtert deutsche Bundesländer"""
-    print("Lade Natural Earth Shapefile...")
-
-    # Lade den kompletten Datensatz
-    gdf = gpd.read_file(shapefile_path)
-
-    # Filtere nur deutsche Bundesländer
-    gdf_germany = gdf[gdf['admin'] == 'Germany'].copy()
-
-    # Verwende 'name' Spalte für Bundesland-Namen
-    gdf_germany['bundesland'] = gdf_germany['name']
-
-    # Mappe zu standardisierten deutschen Namen falls nötig
-    gdf_germany['name'] = gdf_germany['bundesland'].map(NATURAL_EARTH_MAPPING)
-
-    # Entferne Zeilen ohne Mapping
-    gdf_germany = gdf_germany[gdf_germany['name'].notna()]
-
-    print(f"✓ {len(gdf_germany)} deutsche Bundesländer geladen")
-
-    return gdf_germany
+from geometrie import lade_bundeslaender
+from gruppen_topk import GruppenTopK
+from hashtag_kategorien import normalize_hashtag
+from aggregationswuerfel import HASHTAGS
+from regionen import BUNDESLAENDER, OST_BUNDESLAENDER, extract_bundesland
 
 
 def load_tweets(input_file):
@@ -159,29 +31,13 @@ def load_tweets(input_file):
     return tweets
 
 
-def extract_bundesland(tweet):
-    """Extrahiert und übersetzt Bundesland aus geo_source (place oder coordinates)"""
-    geo_source = tweet.get('geo_source')
-
-    if not geo_source:
-        return None
-
-    bundesland_en = None
-    if geo_source == 'coordinates' and tweet.get('geo'):
-        bundesland_en = tweet['geo'].get('state')
-    elif geo_source == 'place' and tweet.get('place'):
-        bundesland_en = tweet['place'].get('state')
-
-    return STATE_MAPPING.get(bundesland_en) if bundesland_en else None
-
-
-def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
+def analyze_spatial_hashtags(tweets, output_dir, shapefile_path, geometrie_dir=None):
     """Analysiert räumliche Verteilung der Hashtag-Kategorien"""
 
     print("Analysiere räumliche Verteilung der Hashtag-Kategorien...")
 
-    # Datenstruktur: {bundesland: {hashtag_category: count}}
-    bundesland_hashtags = defaultdict(lambda: defaultdict(int))
+    # Zählmatrix Bundesland × vereinheitlichter Hashtag
+    bundesland_hashtags = GruppenTopK(BUNDESLAENDER)
 
     tweets_processed = 0
 
@@ -192,67 +48,55 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
 
         hashtags = tweet.get('entities', {}).get('hashtags', [])
 
-        for hashtag in hashtags:
-            normalized, category = normalize_hashtag(hashtag)
-            if normalized:
-                bundesland_hashtags[bundesland][normalized] += 1
-                tweets_processed += 1
+        normalized = [normalize_hashtag(hashtag)[0] for hashtag in hashtags]
+        normalized = [hashtag for hashtag in normalized if hashtag]
+        bundesland_hashtags.hinzufuegen(bundesland, normalized)
+        tweets_processed += len(normalized)
 
     print(f"✓ {tweets_processed:,} relevante Hashtags mit Geo-Info gefunden\n")
 
+    # Top-Hashtag und Zählungen der Trend-Hashtags je Bundesland
+    top_hashtags = bundesland_hashtags.top_k(1)
+    gesamt = bundesland_hashtags.summen()
+    counts = bundesland_hashtags.werte(HASHTAGS)
+
     # DataFrame erstellen
     data = []
-    for bundesland in ALLE_BUNDESLAENDER:
-        if bundesland not in bundesland_hashtags:
+    for bundesland in BUNDESLAENDER:
+        if gesamt[bundesland] == 0:
             # Bundesland ohne Daten
             data.append({
                 'name': bundesland,
                 'Top_Hashtag': 'Keine Daten',
                 'Top_Hashtag_Count': 0,
-                'FlattenTheCurve': 0,
-                'WirBleibenZuhause': 0,
-                'SocialDistancing': 0,
-                'Lockdown': 0,
-                'Coronakrise': 0,
+                **{hashtag: 0 for hashtag in HASHTAGS},
                 'Gesamt': 0,
                 'Ost_West': 'Ost' if bundesland in OST_BUNDESLAENDER else 'West'
             })
         else:
-            counts = bundesland_hashtags[bundesland]
-
-            # Top-Hashtag finden
-            if counts:
-                top_hashtag = max(counts.items(), key=lambda x: x[1])
-                top_name = top_hashtag[0]
-                top_count = top_hashtag[1]
-            else:
-                top_name = 'Keine Daten'
-                top_count = 0
+            top_name, top_count = top_hashtags[bundesland][0]
 
             data.append({
                 'name': bundesland,
                 'Top_Hashtag': top_name,
                 'Top_Hashtag_Count': top_count,
-                'FlattenTheCurve': counts.get('FlattenTheCurve', 0),
-                'WirBleibenZuhause': counts.get('WirBleibenZuhause', 0),
-                'SocialDistancing': counts.get('SocialDistancing', 0),
-                'Lockdown': counts.get('Lockdown', 0),
-                'Coronakrise': counts.get('Coronakrise', 0),
-                'Gesamt': sum(counts.values()),
+                **counts.loc[bundesland].to_dict(),
+                'Gesamt': int(gesamt[bundesland]),
                 'Ost_West': 'Ost' if bundesland in OST_BUNDESLAENDER else 'West'
             })
 
     df = pd.DataFrame(data)
 
-    # Natural Earth Shapefile laden und mit Daten mergen
-    gdf = load_natural_earth_shapefile(shapefile_path)
+    # Bundesland-Geometrien laden (Artefakt aus 36, sonst Natural Earth Shapefile) und mit Daten mergen
+    gdf = lade_bundeslaender(geometrie_dir, 'druck', shapefile_path)
+    print(f"✓ {len(gdf)} deutsche Bundesländer geladen")
     gdf = gdf.merge(df, on='name', how='left')
 
     # Output-Verzeichnis erstellen
     os.makedirs(output_dir, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Farben für Hashtag-Kategorien (wie in den anderen Plots)
+    # Farben für Hashtag-Kategorien (wie in den anderen Plots, weitere Trend-Hashtags in steelblue)
     colors = {
         'FlattenTheCurve': '#e74c3c',
         'WirBleibenZuhause': '#3498db',
@@ -295,14 +139,8 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
 
             # Prozentuale Verteilung
             total = row['Gesamt']
-            f.write(
-                f"  #FlattenTheCurve:      {row['FlattenTheCurve']:>6,} ({row['FlattenTheCurve'] / total * 100:>5.1f}%)\n")
-            f.write(
-                f"  #WirBleibenZuhause:    {row['WirBleibenZuhause']:>6,} ({row['WirBleibenZuhause'] / total * 100:>5.1f}%)\n")
-            f.write(
-                f"  #SocialDistancing:     {row['SocialDistancing']:>6,} ({row['SocialDistancing'] / total * 100:>5.1f}%)\n")
-            f.write(f"  #Lockdown:             {row['Lockdown']:>6,} ({row['Lockdown'] / total * 100:>5.1f}%)\n")
-            f.write(f"  #Coronakrise:          {row['Coronakrise']:>6,} ({row['Coronakrise'] / total * 100:>5.1f}%)\n")
+            for hashtag in HASHTAGS:
+                f.write(f"  #{hashtag + ':':<22}{row[hashtag]:>6,} ({row[hashtag] / total * 100:>5.1f}%)\n")
 
         f.write("\n\n" + "=" * 80 + "\n")
         f.write("OST-WEST-VERGLEICH\n")
@@ -311,21 +149,9 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
         ost_df = df[df['Ost_West'] == 'Ost']
         west_df = df[df['Ost_West'] == 'West']
 
-        ost_totals = {
-            'FlattenTheCurve': ost_df['FlattenTheCurve'].sum(),
-            'WirBleibenZuhause': ost_df['WirBleibenZuhause'].sum(),
-            'SocialDistancing': ost_df['SocialDistancing'].sum(),
-            'Lockdown': ost_df['Lockdown'].sum(),
-            'Coronakrise': ost_df['Coronakrise'].sum()
-        }
-
-        west_totals = {
-            'FlattenTheCurve': west_df['FlattenTheCurve'].sum(),
-            'WirBleibenZuhause': west_df['WirBleibenZuhause'].sum(),
-            'SocialDistancing': west_df['SocialDistancing'].sum(),
-            'Lockdown': west_df['Lockdown'].sum(),
-            'Coronakrise': west_df['Coronakrise'].sum()
-        }
+        ost_totals = {hashtag: ost_df[hashtag].sum() for hashtag in HASHTAGS}
+
+        west_totals = {hashtag: west_df[hashtag].sum() for hashtag in HASHTAGS}
 
         ost_sum = sum(ost_totals.values())
         west_sum = sum(west_totals.values())
@@ -333,7 +159,7 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
         f.write(f"{'Hashtag':<25} {'Ost':<15} {'West':<15} {'Ost %':<10} {'West %':<10}\n")
         f.write("-" * 80 + "\n")
 
-        for hashtag in ['FlattenTheCurve', 'WirBleibenZuhause', 'SocialDistancing', 'Lockdown', 'Coronakrise']:
+        for hashtag in HASHTAGS:
             ost_count = ost_totals[hashtag]
             west_count = west_totals[hashtag]
             ost_pct = (ost_count / ost_sum * 100) if ost_sum > 0 else 0
@@ -370,12 +196,12 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
     fig, ax = plt.subplots(1, 1, figsize=(14, 12))
 
     # Karte plotten
-    gdf['color'] = gdf['Top_Hashtag'].map(colors)
+    gdf['color'] = gdf['Top_Hashtag'].map(lambda hashtag: colors.get(hashtag, 'steelblue'))
     gdf.plot(ax=ax, color=gdf['color'], edgecolor='black', linewidth=0.8)
 
     # Bundesland-Namen hinzufügen mit speziellen Offsets
     for idx, row in gdf.iterrows():
-        centroid = row.geometry.centroid
+        centroid = row['label_punkt']
 
         # Brandenburg nach oben verschieben
         if row['name'] == 'Brandenburg':
@@ -389,8 +215,8 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
                 path_effects=[path_effects.withStroke(linewidth=3, foreground='black')])
 
     # Legende erstellen
-    legend_elements = [mpatches.Patch(facecolor=color, label=f'#{hashtag}', edgecolor='black')
-                       for hashtag, color in colors.items() if hashtag != 'Keine Daten']
+    legend_elements = [mpatches.Patch(facecolor=colors.get(hashtag, 'steelblue'), label=f'#{hashtag}', edgecolor='black')
+                       for hashtag in HASHTAGS]
     ax.legend(handles=legend_elements, loc='lower left', fontsize=11, frameon=True, fancybox=True, shadow=True)
 
     ax.set_title('Dominanter Hashtag pro Bundesland', fontsize=18, weight='bold', pad=20)
@@ -403,7 +229,7 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
     print(f"✓ Karte (dominanter Hashtag): {png_file1}")
 
     # --- VISUALISIERUNG 2: Einzelne Karten pro Hashtag (OHNE Zahlen) ---
-    for hashtag in ['FlattenTheCurve', 'WirBleibenZuhause', 'SocialDistancing', 'Lockdown', 'Coronakrise']:
+    for hashtag in HASHTAGS:
         fig, ax = plt.subplots(1, 1, figsize=(14, 12))
 
         # Normalisieren für bessere Farbskala
@@ -416,7 +242,7 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
 
         # Nur Bundesland-Namen hinzufügen (OHNE Zahlen)
         for idx, row in gdf.iterrows():
-            centroid = row.geometry.centroid
+            centroid = row['label_punkt']
 
             # Brandenburg nach oben verschieben
             if row['name'] == 'Brandenburg':
@@ -442,16 +268,17 @@ def analyze_spatial_hashtags(tweets, output_dir, shapefile_path):
     print(f"\n{'=' * 60}")
     print("RÄUMLICHE HASHTAG-ANALYSE ABGESCHLOSSEN!")
     print(f"{'=' * 60}\n")
-    print(f"Erstellt: 1 TXT-Report, 6 PNG-Karten (1 Hauptkarte + 5 Einzelkarten)")
+    print(f"Erstellt: 1 TXT-Report, {len(HASHTAGS) + 1} PNG-Karten (1 Hauptkarte + {len(HASHTAGS)} Einzelkarten)")
 
 
 def main():
     input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
     output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Hashtags"
     shapefile_path = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\ne_10m_admin_1_states_provinces\ne_10m_admin_1_states_provinces.shp"
+    geometrie_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
 
     tweets = load_tweets(input_file)
-    analyze_spatial_hashtags(tweets, output_dir, shapefile_path)
+    analyze_spatial_hashtags(tweets, output_dir, shapefile_path, geometrie_dir)
 
 
 if __name__ == "__main__":
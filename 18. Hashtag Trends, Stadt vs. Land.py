@@ -4,169 +4,16 @@ import matplotlib.pyplot as plt
 from collections import Counter
 import os
 from datetime import datetime
+from gazetteer import Gazetteer
+from hashtag_kategorien import normalize_hashtag
 
 # Matplotlib auf Deutsch
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['axes.unicode_minus'] = False
 
 
-# Großstädte-Mapping (Englisch → Deutsch)
-GROSSSTAEDTE_MAPPING = {
-    "Berlin": "Berlin",
-    "Hamburg": "Hamburg",
-    "Munich": "München",
-    "Cologne": "Köln",
-    "Frankfurt": "Frankfurt am Main",
-    "Frankfurt am Main": "Frankfurt am Main",
-    "Dusseldorf": "Düsseldorf",
-    "Düsseldorf": "Düsseldorf",
-    "Stuttgart": "Stuttgart",
-    "Leipzig": "Leipzig",
-    "Dortmund": "Dortmund",
-    "Bremen": "Bremen",
-    "Essen": "Essen",
-    "Dresden": "Dresden",
-    "Nuremberg": "Nürnberg",
-    "Nürnberg": "Nürnberg",
-    "Hanover": "Hannover",
-    "Hannover": "Hannover",
-    "Duisburg": "Duisburg",
-    "Bochum": "Bochum",
-    "Wuppertal": "Wuppertal",
-    "Bielefeld": "Bielefeld",
-    "Bonn": "Bonn",
-    "Mannheim": "Mannheim",
-    "Karlsruhe": "Karlsruhe",
-    "Munster": "Münster",
-    "Münster": "Münster",
-    "Augsburg": "Augsburg",
-    "Wiesbaden": "Wiesbaden",
-    "Gelsenkirchen": "Gelsenkirchen",
-    "Monchengladbach": "Mönchengladbach",
-    "Mönchengladbach": "Mönchengladbach",
-    "Aachen": "Aachen",
-    "Brunswick": "Braunschweig",
-    "Braunschweig": "Braunschweig",
-    "Kiel": "Kiel",
-    "Chemnitz": "Chemnitz",
-    "Magdeburg": "Magdeburg",
-    "Freiburg": "Freiburg im Breisgau",
-    "Freiburg im Breisgau": "Freiburg im Breisgau",
-    "Krefeld": "Krefeld",
-    "Halle": "Halle (Saale)",
-    "Halle (Saale)": "Halle (Saale)",
-    "Mainz": "Mainz",
-    "Erfurt": "Erfurt",
-    "Lubeck": "Lübeck",
-    "Lübeck": "Lübeck",
-    "Oberhausen": "Oberhausen",
-    "Rostock": "Rostock",
-    "Kassel": "Kassel",
-    "Hagen": "Hagen",
-    "Potsdam": "Potsdam",
-    "Saarbrucken": "Saarbrücken",
-    "Saarbrücken": "Saarbrücken",
-    "Hamm": "Hamm",
-    "Ludwigshafen": "Ludwigshafen am Rhein",
-    "Ludwigshafen am Rhein": "Ludwigshafen am Rhein",
-    "Oldenburg": "Oldenburg",
-    "Mulheim": "Mülheim an der Ruhr",
-    "Mülheim": "Mülheim an der Ruhr",
-    "Mülheim an der Ruhr": "Mülheim an der Ruhr",
-    "Leverkusen": "Leverkusen",
-    "Darmstadt": "Darmstadt",
-    "Osnabruck": "Osnabrück",
-    "Osnabrück": "Osnabrück",
-    "Solingen": "Solingen",
-    "Paderborn": "Paderborn",
-    "Herne": "Herne",
-    "Heidelberg": "Heidelberg",
-    "Neuss": "Neuss",
-    "Regensburg": "Regensburg",
-    "Ingolstadt": "Ingolstadt",
-    "Pforzheim": "Pforzheim",
-    "Wurzburg": "Würzburg",
-    "Würzburg": "Würzburg",
-    "Offenbach": "Offenbach am Main",
-    "Offenbach am Main": "Offenbach am Main",
-    "Furth": "Fürth",
-    "Fürth": "Fürth",
-    "Heilbronn": "Heilbronn",
-    "Ulm": "Ulm",
-    "Wolfsburg": "Wolfsburg",
-    "Gottingen": "Göttingen",
-    "Göttingen": "Göttingen",
-    "Reutlingen": "Reutlingen",
-    "Bremerhaven": "Bremerhaven",
-    "Bottrop": "Bottrop",
-    "Erlangen": "Erlangen",
-    "Recklinghausen": "Recklinghausen",
-    "Remscheid": "Remscheid",
-    "Koblenz": "Koblenz",
-    "Bergisch Gladbach": "Bergisch Gladbach",
-    "Jena": "Jena",
-    "Salzgitter": "Salzgitter",
-    "Trier": "Trier",
-    "Siegen": "Siegen",
-    "Moers": "Moers",
-    "Gutersloh": "Gütersloh",
-    "Gütersloh": "Gütersloh",
-}
-
-GROSSSTAEDTE_ENGLISCH = set(GROSSSTAEDTE_MAPPING.keys())
-STADTSTAATEN = ['Berlin', 'Hamburg', 'Bremen', 'Free Hanseatic City of Bremen', 'Hanseatic City']
-
-
-def normalize_hashtag(hashtag):
-    """
-    Normalisiert Hashtags zu Kategorien
-    Returns: (normalized_tag, category) oder (None, None) wenn nicht relevant
-    """
-    tag_lower = hashtag.lower().replace('_', '').replace('-', '').replace(' ', '').replace('ー', '')
-
-    # Ausschlussliste
-    excluded = ['aviationlockdownnow', 'ausgangssperrejetzt', 'ausgangssperreüberfällig',
-                'endthelockdown', 'lockdownend',
-                'trotzabstandhaltenwirzusammen', 'friendlydistancing']
-
-    if tag_lower in excluded:
-        return None, None
-
-    # 1. FlattenTheCurve Varianten
-    if any(x in tag_lower for x in ['flattenthecurve', 'flatenthecurve', 'flatthecurve',
-                                    'kurveflachen', 'kurveabflachen', 'diekurveflachen']):
-        return 'FlattenTheCurve', 'Gesundheitsmaßnahmen'
-
-    # 2. Stay Home / Bleibt Zuhause Varianten
-    if any(x in tag_lower for x in ['wirbleibenzuhause', 'bleibtzuhause', 'bleibzuhause',
-                                    'ichbleibezuhause', 'bleibtdaheim', 'bleibtheim',
-                                    'zuhausebleiben', 'daheimbleiben',
-                                    'stayhome', 'stayathome', 'stayinghome',
-                                    'stayindoors', 'stayinside',
-                                    'wirbleibendaheim', 'ichbleibedaheim']):
-        return 'WirBleibenZuhause', 'Solidarität'
-
-    # 3. Social Distancing Varianten
-    if any(x in tag_lower for x in ['socialdistancing', 'socialdistance', 'socialdist',
-                                    'physicaldistancing', 'physicaldistance',
-                                    'sozialedistanzierung', 'sozialedistanz',
-                                    'abstandhalten', 'abstandhalte', 'keepdistance',
-                                    'distancing', 'distanz']):
-        return 'SocialDistancing', 'Gesundheitsmaßnahmen'
-
-    # 4. Lockdown Varianten
-    if any(x in tag_lower for x in ['lockdown', 'coronalockdown', 'covidlockdown',
-                                    'shutdown', 'ausgangssperre', 'ausgangsbeschränkung', 'ausgangsverbot',
-                                    'kontaktsperre', 'kontaktverbot', 'kontaktbeschränkung']):
-        return 'Lockdown', 'Maßnahmen'
-
-    # 5. Coronakrise Varianten
-    if any(x in tag_lower for x in ['coronakrise', 'coronacrisis', 'covidkrise', 'covidcrisis',
-                                    'coronaviruskrise', 'coronaviruscrisis',
-                                    'covid19krise', 'covid19crisis']):
-        return 'Coronakrise', 'Framing'
-
-    return None, None
+# Stadt/Land-Klassifizierung (Großstädte >= 100.000 Einwohner, siehe grossstaedte.csv)
+GAZETTEER = Gazetteer.laden()
 
 
 def load_tweets(input_file):
@@ -188,43 +35,6 @@ def load_tweets(input_file):
     return tweets
 
 
-def kategorisiere_tweet_urban_rural(tweet):
-    """Kategorisiert Tweet als Urban oder Rural"""
-    geo_source = tweet.get('geo_source')
-
-    if not geo_source:
-        return 'Unknown'
-
-    if geo_source == 'place' and tweet.get('place'):
-        location_data = tweet['place']
-    elif geo_source == 'coordinates' and tweet.get('geo'):
-        location_data = tweet['geo']
-    else:
-        return 'Unknown'
-
-    # Stadtstaaten
-    state = location_data.get('state', '')
-    if any(stadtstaat in state for stadtstaat in STADTSTAATEN):
-        return 'Urban'
-
-    # city oder county
-    ort = None
-    if 'city' in location_data and location_data['city']:
-        ort = location_data['city']
-    elif 'county' in location_data and location_data['county']:
-        ort = location_data['county']
-
-    if not ort:
-        return 'Unknown'
-
-    ort_clean = ort.replace("Region ", "").replace("City of ", "").strip()
-
-    if ort_clean in GROSSSTAEDTE_ENGLISCH:
-        return 'Urban'
-    else:
-        return 'Rural'
-
-
 def analyze_hashtag_trends_urban_rural(tweets, output_dir):
     """Analysiert Hashtag-Trends nach Urban/Rural - ANTEIL AN ALLEN HASHTAGS"""
 
@@ -255,9 +65,9 @@ def analyze_hashtag_trends_urban_rural(tweets, output_dir):
         tweets_processed += 1
 
         # Kategorisiere Tweet
-        kategorie = kategorisiere_tweet_urban_rural(tweet)
+        kategorie = GAZETTEER.klassifiziere(tweet)
 
-        if kategorie == 'Unknown':
+        if kategorie is None:
             continue
 
         # Zähle ALLE Hashtags
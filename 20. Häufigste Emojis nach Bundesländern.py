@@ -1,44 +1,11 @@
 import json
 import pandas as pd
 import plotly.graph_objects as go
-from collections import Counter, defaultdict
 import os
 from datetime import datetime
-
-# Übersetzung Englisch → Deutsch
-STATE_MAPPING = {
-    'Berlin': 'Berlin',
-    'North Rhine-Westphalia': 'Nordrhein-Westfalen',
-    'Bavaria': 'Bayern',
-    'Baden-Württemberg': 'Baden-Württemberg',
-    'Hamburg': 'Hamburg',
-    'Hesse': 'Hessen',
-    'Lower Saxony': 'Niedersachsen',
-    'Rhineland-Palatinate': 'Rheinland-Pfalz',
-    'Saxony': 'Sachsen',
-    'Brandenburg': 'Brandenburg',
-    'Schleswig-Holstein': 'Schleswig-Holstein',
-    'Saxony-Anhalt': 'Sachsen-Anhalt',
-    'Free Hanseatic City of Bremen': 'Bremen',
-    'Thuringia': 'Thüringen',
-    'Mecklenburg-Vorpommern': 'Mecklenburg-Vorpommern',
-    'Mecklenburg-Western Pomerania': 'Mecklenburg-Vorpommern',
-    'Saarland': 'Saarland'
-}
-
-# Ost-Bundesländer
-OST_BUNDESLAENDER = {
-    'Berlin', 'Brandenburg', 'Mecklenburg-Vorpommern',
-    'Sachsen', 'Sachsen-Anhalt', 'Thüringen'
-}
-
-# Alle Bundesländer
-ALLE_BUNDESLAENDER = [
-    'Baden-Württemberg', 'Bayern', 'Berlin', 'Brandenburg', 'Bremen',
-    'Hamburg', 'Hessen', 'Mecklenburg-Vorpommern', 'Niedersachsen',
-    'Nordrhein-Westfalen', 'Rheinland-Pfalz', 'Saarland', 'Sachsen',
-    'Sachsen-Anhalt', 'Schleswig-Holstein', 'Thüringen'
-]
+from geometrie import lade_geojson
+from gruppen_topk import GruppenTopK
+from regionen import BUNDESLAENDER, OST_BUNDESLAENDER, extract_bundesland
 
 # Emoji-Modifier, die gefiltert werden sollen
 EMOJI_MODIFIERS = {
@@ -92,77 +59,30 @@ def load_tweets(input_file):
     return tweets
 
 
-def extract_bundesland(tweet):
-    """Extrahiert und übersetzt Bundesland aus geo_source (place oder coordinates)"""
-    geo_source = tweet.get('geo_source')
-
-    if not geo_source:
-        return None
-
-    bundesland_en = None
-    if geo_source == 'coordinates' and tweet.get('geo'):
-        bundesland_en = tweet['geo'].get('state')
-    elif geo_source == 'place' and tweet.get('place'):
-        bundesland_en = tweet['place'].get('state')
-
-    return STATE_MAPPING.get(bundesland_en) if bundesland_en else None
-
-
-def load_geojson_from_shapefile(shapefile_path):
-    """Konvertiert Shapefile zu GeoJSON für Plotly"""
+def load_geojson(geometrie_dir, shapefile_path):
+    """Lädt das vorberechnete GeoJSON (siehe 36) für Plotly, sonst Konvertierung aus dem Shapefile"""
     try:
-        import geopandas as gpd
-
-        print("Lade Shapefile und konvertiere zu GeoJSON...")
-        gdf = gpd.read_file(shapefile_path)
-
-        # Filtere nur deutsche Bundesländer
-        gdf_germany = gdf[gdf['admin'] == 'Germany'].copy()
-
-        # Mapping für Namen
-        name_mapping = {
-            'Baden-Württemberg': 'Baden-Württemberg',
-            'Bayern': 'Bayern',
-            'Berlin': 'Berlin',
-            'Brandenburg': 'Brandenburg',
-            'Bremen': 'Bremen',
-            'Hamburg': 'Hamburg',
-            'Hessen': 'Hessen',
-            'Mecklenburg-Vorpommern': 'Mecklenburg-Vorpommern',
-            'Niedersachsen': 'Niedersachsen',
-            'Nordrhein-Westfalen': 'Nordrhein-Westfalen',
-            'Rheinland-Pfalz': 'Rheinland-Pfalz',
-            'Saarland': 'Saarland',
-            'Sachsen': 'Sachsen',
-            'Sachsen-Anhalt': 'Sachsen-Anhalt',
-            'Schleswig-Holstein': 'Schleswig-Holstein',
-            'Thüringen': 'Thüringen'
-        }
-
-        gdf_germany['name'] = gdf_germany['name'].map(name_mapping)
-        gdf_germany = gdf_germany[gdf_germany['name'].notna()]
-
-        # Zu GeoJSON konvertieren
-        geojson = json.loads(gdf_germany.to_json())
-
-        print(f"✓ GeoJSON mit {len(gdf_germany)} Bundesländern erstellt")
+        print("Lade GeoJSON der Bundesländer...")
+        geojson = lade_geojson(geometrie_dir, 'web', shapefile_path)
+
+        print(f"✓ GeoJSON mit {len(geojson['features'])} Bundesländern geladen")
         return geojson
 
     except ImportError:
         print("⚠ Geopandas nicht verfügbar. Karte wird ohne Grenzen erstellt.")
         return None
     except Exception as e:
-        print(f"⚠ Fehler beim Laden der Shapefile: {e}")
+        print(f"⚠ Fehler beim Laden der Geometrie: {e}")
         return None
 
 
-def analyze_spatial_emojis(tweets, output_dir, shapefile_path=None):
+def analyze_spatial_emojis(tweets, output_dir, shapefile_path=None, geometrie_dir=None):
     """Analysiert räumliche Verteilung der Emojis"""
 
     print("Analysiere räumliche Verteilung der Emojis...")
 
-    # Datenstruktur: {bundesland: Counter(emojis)}
-    bundesland_emojis = defaultdict(Counter)
+    # Zählmatrix Bundesland × Emoji (feste Reihenfolge, leere Bundesländer bleiben erhalten)
+    bundesland_emojis = GruppenTopK(BUNDESLAENDER)
 
     emojis_processed = 0
     filtered_modifiers = 0
@@ -185,17 +105,25 @@ def analyze_spatial_emojis(tweets, output_dir, shapefile_path=None):
         if not emojis:
             continue
 
-        for emoji in emojis:
-            bundesland_emojis[bundesland][emoji] += 1
-            emojis_processed += 1
+        bundesland_emojis.hinzufuegen(bundesland, emojis)
+        emojis_processed += len(emojis)
 
     print(f"✓ {emojis_processed:,} Emojis mit Geo-Info gefunden")
     print(f"✓ {filtered_modifiers:,} Emoji-Modifier herausgefiltert\n")
 
+    # Top 10 je Bundesland und Ost/West in einem Schritt
+    top_emojis = bundesland_emojis.top_k(10)
+    gesamt = bundesland_emojis.summen()
+    unique = bundesland_emojis.verschiedene()
+    ost_west = bundesland_emojis.zusammenfassen(
+        lambda bl: 'Ost' if bl in OST_BUNDESLAENDER else 'West', ['Ost', 'West'])
+    ost_west_top = ost_west.top_k(10)
+    ost_west_gesamt = ost_west.summen()
+
     # DataFrame erstellen
     data = []
-    for bundesland in ALLE_BUNDESLAENDER:
-        if bundesland not in bundesland_emojis or len(bundesland_emojis[bundesland]) == 0:
+    for bundesland in BUNDESLAENDER:
+        if gesamt[bundesland] == 0:
             data.append({
                 'name': bundesland,
                 'Top_Emoji': '—',
@@ -207,15 +135,14 @@ def analyze_spatial_emojis(tweets, output_dir, shapefile_path=None):
                 'lon': BUNDESLAND_COORDS[bundesland][1]
             })
         else:
-            emoji_counter = bundesland_emojis[bundesland]
-            top_emoji = emoji_counter.most_common(1)[0]
+            top_emoji = top_emojis[bundesland][0]
 
             data.append({
                 'name': bundesland,
                 'Top_Emoji': top_emoji[0],
                 'Top_Emoji_Count': top_emoji[1],
-                'Gesamt': sum(emoji_counter.values()),
-                'Unique_Emojis': len(emoji_counter),
+                'Gesamt': int(gesamt[bundesland]),
+                'Unique_Emojis': int(unique[bundesland]),
                 'Ost_West': 'Ost' if bundesland in OST_BUNDESLAENDER else 'West',
                 'lat': BUNDESLAND_COORDS[bundesland][0],
                 'lon': BUNDESLAND_COORDS[bundesland][1]
@@ -253,24 +180,23 @@ def analyze_spatial_emojis(tweets, output_dir, shapefile_path=None):
         f.write("TOP 10 EMOJIS PRO BUNDESLAND\n")
         f.write("=" * 80 + "\n\n")
 
-        for bundesland in sorted(ALLE_BUNDESLAENDER):
-            if bundesland not in bundesland_emojis or len(bundesland_emojis[bundesland]) == 0:
+        for bundesland in sorted(BUNDESLAENDER):
+            if gesamt[bundesland] == 0:
                 f.write(f"\n{bundesland.upper()}\n")
                 f.write("-" * 80 + "\n")
                 f.write("Keine Daten verfügbar\n")
                 continue
 
-            emoji_counter = bundesland_emojis[bundesland]
-            total = sum(emoji_counter.values())
+            total = gesamt[bundesland]
 
             f.write(f"\n{bundesland.upper()}\n")
             f.write("-" * 80 + "\n")
             f.write(f"Gesamt Emojis: {total:,}\n")
-            f.write(f"Unique Emojis: {len(emoji_counter):,}\n\n")
+            f.write(f"Unique Emojis: {unique[bundesland]:,}\n\n")
             f.write(f"{'Rang':<6} {'Emoji':<10} {'Anzahl':<12} {'Anteil':<10}\n")
             f.write("-" * 80 + "\n")
 
-            for idx, (emoji, count) in enumerate(emoji_counter.most_common(10), 1):
+            for idx, (emoji, count) in enumerate(top_emojis[bundesland], 1):
                 anteil = (count / total) * 100
                 f.write(f"{idx:<6} {emoji:<10} {count:<12,} {anteil:>6.2f}%\n")
 
@@ -294,23 +220,12 @@ def analyze_spatial_emojis(tweets, output_dir, shapefile_path=None):
         f.write(
             f"{'Durchschn. pro Bundesland:':<30} {ost_sum / len(ost_df):<20,.1f} {west_sum / len(west_df):<20,.1f}\n")
 
-        # Top-Emojis pro Region
-        ost_all_emojis = Counter()
-        west_all_emojis = Counter()
-
-        for bundesland in ALLE_BUNDESLAENDER:
-            if bundesland in bundesland_emojis:
-                if bundesland in OST_BUNDESLAENDER:
-                    ost_all_emojis.update(bundesland_emojis[bundesland])
-                else:
-                    west_all_emojis.update(bundesland_emojis[bundesland])
-
         f.write("\n\nTop 10 Emojis Ost-Deutschland:\n")
         f.write("-" * 80 + "\n")
         f.write(f"{'Rang':<6} {'Emoji':<10} {'Anzahl':<12} {'Anteil':<10}\n")
         f.write("-" * 80 + "\n")
-        ost_total = sum(ost_all_emojis.values())
-        for idx, (emoji, count) in enumerate(ost_all_emojis.most_common(10), 1):
+        ost_total = ost_west_gesamt['Ost']
+        for idx, (emoji, count) in enumerate(ost_west_top['Ost'], 1):
             anteil = (count / ost_total) * 100 if ost_total > 0 else 0
             f.write(f"{idx:<6} {emoji:<10} {count:<12,} {anteil:>6.2f}%\n")
 
@@ -318,18 +233,18 @@ def analyze_spatial_emojis(tweets, output_dir, shapefile_path=None):
         f.write("-" * 80 + "\n")
         f.write(f"{'Rang':<6} {'Emoji':<10} {'Anzahl':<12} {'Anteil':<10}\n")
         f.write("-" * 80 + "\n")
-        west_total = sum(west_all_emojis.values())
-        for idx, (emoji, count) in enumerate(west_all_emojis.most_common(10), 1):
+        west_total = ost_west_gesamt['West']
+        for idx, (emoji, count) in enumerate(ost_west_top['West'], 1):
             anteil = (count / west_total) * 100 if west_total > 0 else 0
             f.write(f"{idx:<6} {emoji:<10} {count:<12,} {anteil:>6.2f}%\n")
 
     print(f"✓ TXT-Report: {txt_file}")
 
     # --- PLOTLY KARTE MIT GRENZEN ---
-    # GeoJSON laden (falls Shapefile verfügbar)
+    # GeoJSON laden (falls Geometrie-Artefakt oder Shapefile verfügbar)
     geojson = None
-    if shapefile_path:
-        geojson = load_geojson_from_shapefile(shapefile_path)
+    if geometrie_dir or shapefile_path:
+        geojson = load_geojson(geometrie_dir, shapefile_path)
 
     # Erstelle Hover-Text
     df['hover_text'] = df.apply(
@@ -416,9 +331,10 @@ def main():
     input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
     output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Emojis"
     shapefile_path = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\ne_10m_admin_1_states_provinces\ne_10m_admin_1_states_provinces.shp"
+    geometrie_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
 
     tweets = load_tweets(input_file)
-    analyze_spatial_emojis(tweets, output_dir, shapefile_path)
+    analyze_spatial_emojis(tweets, output_dir, shapefile_path, geometrie_dir)
 
 
 if __name__ == "__main__":
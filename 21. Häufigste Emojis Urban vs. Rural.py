@@ -1,9 +1,10 @@
 import json
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from collections import Counter
 import os
 from datetime import datetime
+from gazetteer import Gazetteer
+from gruppen_topk import GruppenTopK
 
 # Emoji-Modifier, die gefiltert werden sollen
 EMOJI_MODIFIERS = {
@@ -12,88 +13,8 @@ EMOJI_MODIFIERS = {
     '️', '\ufe0f',
 }
 
-# Urban/Rural Klassifizierung
-CITY_CLASSIFICATION = {
-    'Berlin': 'urban',
-    'Hamburg': 'urban',
-    'München': 'urban',
-    'Köln': 'urban',
-    'Frankfurt': 'urban',
-    'Stuttgart': 'urban',
-    'Düsseldorf': 'urban',
-    'Dortmund': 'urban',
-    'Essen': 'urban',
-    'Leipzig': 'urban',
-    'Bremen': 'urban',
-    'Dresden': 'urban',
-    'Hannover': 'urban',
-    'Nürnberg': 'urban',
-    'Duisburg': 'urban',
-    'Bochum': 'urban',
-    'Wuppertal': 'urban',
-    'Bielefeld': 'urban',
-    'Bonn': 'urban',
-    'Münster': 'urban',
-    'Karlsruhe': 'urban',
-    'Mannheim': 'urban',
-    'Augsburg': 'urban',
-    'Wiesbaden': 'urban',
-    'Gelsenkirchen': 'urban',
-    'Mönchengladbach': 'urban',
-    'Braunschweig': 'urban',
-    'Chemnitz': 'urban',
-    'Kiel': 'urban',
-    'Aachen': 'urban',
-    'Halle': 'urban',
-    'Magdeburg': 'urban',
-    'Freiburg': 'urban',
-    'Krefeld': 'urban',
-    'Lübeck': 'urban',
-    'Oberhausen': 'urban',
-    'Erfurt': 'urban',
-    'Mainz': 'urban',
-    'Rostock': 'urban',
-    'Kassel': 'urban',
-    'Hagen': 'urban',
-    'Hamm': 'urban',
-    'Saarbrücken': 'urban',
-    'Mülheim': 'urban',
-    'Potsdam': 'urban',
-    'Ludwigshafen': 'urban',
-    'Oldenburg': 'urban',
-    'Leverkusen': 'urban',
-    'Osnabrück': 'urban',
-    'Solingen': 'urban',
-    'Heidelberg': 'urban',
-    'Herne': 'urban',
-    'Neuss': 'urban',
-    'Darmstadt': 'urban',
-    'Paderborn': 'urban',
-    'Regensburg': 'urban',
-    'Ingolstadt': 'urban',
-    'Würzburg': 'urban',
-    'Fürth': 'urban',
-    'Wolfsburg': 'urban',
-    'Offenbach': 'urban',
-    'Ulm': 'urban',
-    'Heilbronn': 'urban',
-    'Pforzheim': 'urban',
-    'Göttingen': 'urban',
-    'Bottrop': 'urban',
-    'Trier': 'urban',
-    'Recklinghausen': 'urban',
-    'Reutlingen': 'urban',
-    'Bremerhaven': 'urban',
-    'Koblenz': 'urban',
-    'Bergisch Gladbach': 'urban',
-    'Jena': 'urban',
-    'Remscheid': 'urban',
-    'Erlangen': 'urban',
-    'Moers': 'urban',
-    'Siegen': 'urban',
-    'Hildesheim': 'urban',
-    'Salzgitter': 'urban',
-}
+# Urban/Rural Klassifizierung (Großstädte >= 100.000 Einwohner, siehe grossstaedte.csv)
+GAZETTEER = Gazetteer.laden()
 
 
 def filter_emoji_modifiers(emojis):
@@ -102,20 +23,9 @@ def filter_emoji_modifiers(emojis):
 
 
 def classify_location(tweet):
-    """Klassifiziert Tweet als urban oder rural basierend auf Stadt"""
-    city = None
-
-    geo_source = tweet.get('geo_source')
-
-    if geo_source == 'coordinates' and tweet.get('geo'):
-        city = tweet['geo'].get('city')
-    elif geo_source == 'place' and tweet.get('place'):
-        city = tweet['place'].get('city')
-
-    if not city:
-        return None
-
-    return CITY_CLASSIFICATION.get(city, 'rural')
+    """Klassifiziert Tweet als urban oder rural (einheitlicher Gazetteer, siehe gazetteer.py)"""
+    kategorie = GAZETTEER.klassifiziere(tweet)
+    return kategorie.lower() if kategorie else None
 
 
 def load_tweets(input_file):
@@ -142,9 +52,8 @@ def visualize_urban_rural_emojis(tweets, output_dir):
 
     print("Analysiere Emojis nach Urban/Rural...")
 
-    # Datenstrukturen
-    urban_emojis = []
-    rural_emojis = []
+    # Zählmatrix Urban/Rural × Emoji
+    emoji_zaehlung = GruppenTopK(['urban', 'rural'])
 
     urban_tweets = 0
     rural_tweets = 0
@@ -171,10 +80,10 @@ def visualize_urban_rural_emojis(tweets, output_dir):
         classification = classify_location(tweet)
 
         if classification == 'urban':
-            urban_emojis.extend(emojis)
+            emoji_zaehlung.hinzufuegen('urban', emojis)
             urban_tweets += 1
         elif classification == 'rural':
-            rural_emojis.extend(emojis)
+            emoji_zaehlung.hinzufuegen('rural', emojis)
             rural_tweets += 1
 
     print(f"✓ {tweets_with_emojis:,} Tweets mit Emojis")
@@ -182,17 +91,16 @@ def visualize_urban_rural_emojis(tweets, output_dir):
     print(f"✓ {rural_tweets:,} Rural Tweets")
     print(f"✓ {filtered_modifiers:,} Emoji-Modifier herausgefiltert\n")
 
-    # Counter erstellen
-    urban_counter = Counter(urban_emojis)
-    rural_counter = Counter(rural_emojis)
+    # Top 15 je Gruppe
+    top_15 = emoji_zaehlung.top_k(15)
 
     # Output-Verzeichnis erstellen
     os.makedirs(output_dir, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # --- VISUALISIERUNG 1: Side-by-Side Balkendiagramme (Top 15) ---
-    top_15_urban = urban_counter.most_common(15)
-    top_15_rural = rural_counter.most_common(15)
+    top_15_urban = top_15['urban']
+    top_15_rural = top_15['rural']
 
     emojis_urban = [emoji for emoji, _ in top_15_urban]
     counts_urban = [count for _, count in top_15_urban]
@@ -252,14 +160,13 @@ def visualize_urban_rural_emojis(tweets, output_dir):
     print(f"✓ Side-by-Side Diagramm: {html_file1}")
 
     # --- VISUALISIERUNG 2: Direkter Vergleich (Top 10 gemeinsam) ---
-    # Finde die Top 10 Emojis insgesamt
-    all_emojis = urban_emojis + rural_emojis
-    all_counter = Counter(all_emojis)
-    top_10_overall = [emoji for emoji, _ in all_counter.most_common(10)]
+    # Finde die Top 10 Emojis insgesamt (Urban + Rural)
+    top_10_overall = [emoji for emoji, _ in emoji_zaehlung.gesamt().top_k(10)['Gesamt']]
 
     # Zähle für jedes dieser Emojis in Urban und Rural
-    urban_values = [urban_counter.get(emoji, 0) for emoji in top_10_overall]
-    rural_values = [rural_counter.get(emoji, 0) for emoji in top_10_overall]
+    top_10_werte = emoji_zaehlung.werte(top_10_overall)
+    urban_values = top_10_werte.loc['urban'].tolist()
+    rural_values = top_10_werte.loc['rural'].tolist()
 
     fig2 = go.Figure()
 
@@ -311,11 +218,10 @@ def visualize_urban_rural_emojis(tweets, output_dir):
     # --- VISUALISIERUNG 3: Prozentuale Anteile (Stacked) ---
     fig3 = go.Figure()
 
-    total_urban = sum(urban_counter.values())
-    total_rural = sum(rural_counter.values())
+    total_urban, total_rural = emoji_zaehlung.summen()
 
-    urban_pct = [urban_counter.get(emoji, 0) / total_urban * 100 for emoji in top_10_overall]
-    rural_pct = [rural_counter.get(emoji, 0) / total_rural * 100 for emoji in top_10_overall]
+    urban_pct = [count / total_urban * 100 for count in urban_values]
+    rural_pct = [count / total_rural * 100 for count in rural_values]
 
     fig3.add_trace(go.Bar(
         name='Urban',
@@ -366,10 +272,7 @@ def visualize_urban_rural_emojis(tweets, output_dir):
     ratios = []
     emoji_labels = []
 
-    for emoji in top_10_overall:
-        urban_count = urban_counter.get(emoji, 0)
-        rural_count = rural_counter.get(emoji, 0)
-
+    for emoji, urban_count, rural_count in zip(top_10_overall, urban_values, rural_values):
         if rural_count > 0:
             ratio = urban_count / rural_count
             ratios.append(ratio)
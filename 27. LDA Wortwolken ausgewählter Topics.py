@@ -1,6 +1,6 @@
 import json
 import matplotlib.pyplot as plt
-from wordcloud import WordCloud
+from wortwolken import erzeuge_parallel, speichere_wortwolke, SPEICHER_DPI, VORSCHAU_DPI
 from gensim.models import LdaModel
 import os
 from datetime import datetime
@@ -14,6 +14,13 @@ def main():
     # An eigene Pfade anpassen!
     model_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\final_14_topics"
     output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\wortwolken"
+    cache_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\wortwolken\cache"
+
+    # Auf True setzen für eine schnelle Vorschau in niedriger Auflösung
+    vorschau = False
+
+    # Layout der Topic-Wortwolken
+    wolken_parameter = {'max_words': 40, 'prefer_horizontal': 0.7}
 
     os.makedirs(output_dir, exist_ok=True)
 
@@ -40,36 +47,27 @@ def main():
         11: 12  # Topic 11 → Topic 12
     }
 
+    # Top 40 Wörter mit Wahrscheinlichkeiten je Topic
+    topic_freqs = {
+        topic_id_model: {word: prob for word, prob in lda_model.show_topic(topic_id_model, topn=40)}
+        for topic_id_model in selected_topics
+    }
+
+    # Alle 6 Wortwolken parallel erzeugen (bzw. aus dem Cache laden)
+    print("  Erzeuge Wortwolken parallel...")
+    bilder = erzeuge_parallel(list(topic_freqs.values()), cache_dir=cache_dir, vorschau=vorschau,
+                              **wolken_parameter)
+
     # Figure mit 3×2 Grid (3 Zeilen, 2 Spalten)
     # Reduzierter Abstand: wspace=0.15 (zwischen Spalten), hspace=0.2 (zwischen Zeilen)
     fig, axes = plt.subplots(3, 2, figsize=(16, 18))
     fig.subplots_adjust(wspace=0.15, hspace=0.2)  # ← WENIGER Abstand
     axes = axes.flatten()
 
-    for idx, (topic_id_model, topic_id_display) in enumerate(selected_topics.items()):
-        print(f"  Erstelle Wortwolke für Topic {topic_id_display}...")
-
-        # Hole Top 40 Wörter mit Wahrscheinlichkeiten
-        topic_words = lda_model.show_topic(topic_id_model, topn=40)
-
-        # Konvertiere zu Dictionary für WordCloud
-        word_freq = {word: prob for word, prob in topic_words}
-
-        # Erstelle Wortwolke
-        wordcloud = WordCloud(
-            width=1600,
-            height=800,
-            background_color='white',
-            colormap='viridis',
-            max_words=40,
-            relative_scaling=0.5,
-            min_font_size=10,
-            prefer_horizontal=0.7
-        ).generate_from_frequencies(word_freq)
-
+    for idx, (bild, topic_id_display) in enumerate(zip(bilder, selected_topics.values())):
         # Plotte Wortwolke
         ax = axes[idx]
-        ax.imshow(wordcloud, interpolation='bilinear')
+        ax.imshow(bild, interpolation='bilinear')
         ax.set_title(f'Topic {topic_id_display}', fontsize=16, fontweight='bold', pad=10)
         ax.axis('off')
         # KEINE Umrandung mehr!
@@ -77,7 +75,7 @@ def main():
     # Speichern
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = os.path.join(output_dir, f'wortwolken_6_topics_{timestamp}.png')
-    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(output_file, dpi=VORSCHAU_DPI if vorschau else SPEICHER_DPI, bbox_inches='tight', facecolor='white')
     print(f"\n✓ Wortwolken gespeichert: {output_file}")
 
     plt.close()
@@ -89,32 +87,12 @@ def main():
     os.makedirs(single_dir, exist_ok=True)
 
     for topic_id_model, topic_id_display in selected_topics.items():
-        # Hole Wörter
-        topic_words = lda_model.show_topic(topic_id_model, topn=40)
-        word_freq = {word: prob for word, prob in topic_words}
-
-        # Erstelle Wortwolke
-        wordcloud = WordCloud(
-            width=1600,
-            height=800,
-            background_color='white',
-            colormap='viridis',
-            max_words=40,
-            relative_scaling=0.5,
-            min_font_size=10,
-            prefer_horizontal=0.7
-        ).generate_from_frequencies(word_freq)
-
-        # Plotte
-        fig, ax = plt.subplots(figsize=(20, 10))
-        ax.imshow(wordcloud, interpolation='bilinear')
-        ax.set_title(f'Topic {topic_id_display}', fontsize=20, fontweight='bold', pad=20)
-        ax.axis('off')
-
-        # Speichern
+        # Wortwolke selbst liegt bereits im Cache (gleiches Layout wie im Grid)
         single_file = os.path.join(single_dir, f'wortwolke_topic_{topic_id_display}_{timestamp}.png')
-        plt.savefig(single_file, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        speichere_wortwolke(topic_freqs[topic_id_model], single_file, f'Topic {topic_id_display}',
+                            cache_dir=cache_dir, vorschau=vorschau,
+                            titel_format={'fontsize': 20, 'fontweight': 'bold', 'pad': 20},
+                            **wolken_parameter)
 
         print(f"  ✓ Topic {topic_id_display}")
 
@@ -1,24 +1,14 @@
-import json
 import pandas as pd
 import plotly.graph_objects as go
-from collections import defaultdict
 import os
 from datetime import datetime
-from gensim import corpora
-from gensim.models import LdaModel
-
-
-def parse_twitter_date(date_str):
-    """Konvertiert Twitter-Datum in datetime-Objekt"""
-    return datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y')
+from aggregationswuerfel import Aggregationswuerfel, ANZAHL_TOPICS
 
 
 def main():
     # An eigene Pfade anpassen!
-    model_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\final_14_topics"
-    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
-    stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\corona_stopwords.txt"
-    spacy_stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\spacy_stopwords_deutsch.txt"
+    # Würfel aus "35. Aggregationswürfel bauen.py"
+    wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\wuerfel.npz"
     output_dir = r"C:\Users\katri\[NUTZERNAME]\[ORDNERNAME]\LDA\zeitliche_analyse"
 
     os.makedirs(output_dir, exist_ok=True)
@@ -40,92 +30,27 @@ def main():
     # Mapping für Darstellung (Modell → Darstellung)
     TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
 
-    # 1. Modell laden
-    print("\n[1/5] Lade Modell...")
-    model_file = os.path.join(model_dir, "lda_model_14_topics_20251124_235500")
-    lda_model = LdaModel.load(model_file)
-    print("✓ Modell geladen")
-
-    # 2. Tweets laden
-    print("\n[2/5] Lade Tweets...")
-    tweets = []
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            tweets.append(json.loads(line))
-    print(f"✓ {len(tweets):,} Tweets geladen")
-
-    # 3. Stopwörter und Preprocessing
-    print("\n[3/5] Preprocessing...")
-    with open(stopwords_file, 'r', encoding='utf-8') as f:
-        corona_stopwords = set([line.strip().lower() for line in f if line.strip()])
-
-    with open(spacy_stopwords_file, 'r', encoding='utf-8') as f:
-        spacy_stopwords = set([
-            line.strip().lower() for line in f
-            if line.strip() and not line.startswith('#')
-        ])
-
-    all_stopwords = corona_stopwords | spacy_stopwords
-
-    documents = []
-    valid_tweets = []
-
-    for tweet in tweets:
-        filtered_tokens = [
-            token for token in tweet['tokens']
-            if token.lower() not in all_stopwords
-               and len(token) > 2
-               and not token.isnumeric()
-        ]
-        if len(filtered_tokens) > 0:
-            documents.append(filtered_tokens)
-            valid_tweets.append(tweet)
-
-    print(f"✓ {len(valid_tweets):,} verwendbare Tweets")
-
-    # Dictionary und Corpus
-    dictionary = corpora.Dictionary(documents)
-    dictionary.filter_extremes(no_below=5, no_above=0.5, keep_n=10000)
-    corpus = [dictionary.doc2bow(doc) for doc in documents]
-
-    # 4. Zeitliche Zuordnung
-    print("\n[4/5] Weise Topics zu und analysiere zeitlich...")
-
-    # Datenstruktur: {topic_id: {date: count}}
-    topic_timeline = {topic_id: defaultdict(int) for topic_id in SELECTED_TOPICS.keys()}
-
-    total_tweets = 0
-    analyzed_tweets = 0
-
-    for idx, doc_bow in enumerate(corpus):
-        if idx % 10000 == 0 and idx > 0:
-            print(f"  Verarbeitet: {idx:,} Tweets...")
-
-        total_tweets += 1
-
-        # Finde dominantes Topic (aus ALLEN 14)
-        topic_dist = lda_model.get_document_topics(doc_bow, minimum_probability=0.0)
-        if not topic_dist:
-            continue
-
-        dominant_topic, prob = max(topic_dist, key=lambda x: x[1])
-
-        # Nur wenn es eines der 6 ausgewählten ist
-        if dominant_topic in SELECTED_TOPICS:
-            analyzed_tweets += 1
-
-            # Datum extrahieren
-            try:
-                date = parse_twitter_date(valid_tweets[idx]['created_at']).date()
-                topic_timeline[dominant_topic][date] += 1
-            except:
-                continue
+    # 1. Würfel laden (Topics und Kalendertage bereits zugeordnet)
+    print("\n[1/2] Lade Aggregationswürfel...")
+    wuerfel = Aggregationswuerfel.laden(wuerfel_datei)
+    print("✓ Würfel geladen")
+
+    # Tweets mit Topic-Zuordnung (verwertbare Tokens) und davon in der Auswahl
+    total_tweets = wuerfel.summe(topic=list(range(ANZAHL_TOPICS)))
+    counts = wuerfel.summe(nach=('topic', 'tag'), topic=list(SELECTED_TOPICS.keys()))
+    analyzed_tweets = int(counts.sum())
+
+    # Datenstruktur: {topic_id: {date: count}} (nur Tage mit Tweets)
+    topic_timeline = {
+        topic_id: {tag: int(anzahl) for tag, anzahl in counts[topic_id].items() if anzahl > 0}
+        for topic_id in SELECTED_TOPICS.keys()
+    }
 
     print(
         f"\n✓ Analysierte Tweets: {analyzed_tweets:,} / {total_tweets:,} ({analyzed_tweets / total_tweets * 100:.1f}%)")
 
     # In DataFrames konvertieren
-    print("\n[5/5] Erstelle Visualisierungen...")
+    print("\n[2/2] Erstelle Visualisierungen...")
 
     dfs = {}
     for topic_id, dates in topic_timeline.items():
@@ -1,72 +1,24 @@
-import json
 import pandas as pd
-import geopandas as gpd
 import matplotlib.pyplot as plt
-from collections import defaultdict
 import os
 from datetime import datetime
-from gensim import corpora
-from gensim.models import LdaModel
+from aggregationswuerfel import Aggregationswuerfel, ANZAHL_TOPICS
+from geometrie import lade_bundeslaender
+from regionen import BUNDESLAENDER
 
 # Matplotlib auf Deutsch
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['axes.unicode_minus'] = False
 
-# Übersetzung Englisch → Deutsch
-STATE_MAPPING = {
-    'Berlin': 'Berlin',
-    'North Rhine-Westphalia': 'Nordrhein-Westfalen',
-    'Bavaria': 'Bayern',
-    'Baden-Württemberg': 'Baden-Württemberg',
-    'Hamburg': 'Hamburg',
-    'Hesse': 'Hessen',
-    'Lower Saxony': 'Niedersachsen',
-    'Rhineland-Palatinate': 'Rheinland-Pfalz',
-    'Saxony': 'Sachsen',
-    'Brandenburg': 'Brandenburg',
-    'Schleswig-Holstein': 'Schleswig-Holstein',
-    'Saxony-Anhalt': 'Sachsen-Anhalt',
-    'Free Hanseatic City of Bremen': 'Bremen',
-    'Thuringia': 'Thüringen',
-    'Mecklenburg-Vorpommern': 'Mecklenburg-Vorpommern',
-    'Mecklenburg-Western Pomerania': 'Mecklenburg-Vorpommern',
-    'Saarland': 'Saarland'
-}
-
-# Liste aller Bundesländer
-BUNDESLAENDER = [
-    'Baden-Württemberg', 'Bayern', 'Berlin', 'Brandenburg', 'Bremen',
-    'Hamburg', 'Hessen', 'Mecklenburg-Vorpommern', 'Niedersachsen',
-    'Nordrhein-Westfalen', 'Rheinland-Pfalz', 'Saarland', 'Sachsen',
-    'Sachsen-Anhalt', 'Schleswig-Holstein', 'Thüringen'
-]
-
-# Pfad zum Shapefile
+# Pfad zum Shapefile (Fallback, falls das Geometrie-Artefakt aus 36 fehlt)
 SHAPEFILE_PATH = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\ne_10m_admin_1_states_provinces\ne_10m_admin_1_states_provinces.shp"
-
-
-def extract_bundesland(tweet):
-    """Extrahiert und übersetzt Bundesland aus geo_source"""
-    geo_source = tweet.get('geo_source')
-
-    if not geo_source:
-        return None
-
-    bundesland_en = None
-    if geo_source == 'place' and tweet.get('place'):
-        bundesland_en = tweet['place'].get('state')
-    elif geo_source == 'coordinates' and tweet.get('geo'):
-        bundesland_en = tweet['geo'].get('state')
-
-    return STATE_MAPPING.get(bundesland_en) if bundesland_en else None
+GEOMETRIE_DIR = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
 
 
 def main():
     # An eigene Pfade anpassen!
-    model_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\final_14_topics"
-    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
-    stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\corona_stopwords.txt"
-    spacy_stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\spacy_stopwords_deutsch.txt"
+    # Würfel aus "35. Aggregationswürfel bauen.py"
+    wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\wuerfel.npz"
     output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\raeumliche_analyse"
 
     os.makedirs(output_dir, exist_ok=True)
@@ -87,91 +39,24 @@ def main():
 
     TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
 
-    # 1. Modell laden
-    print("\n[1/5] Lade Modell...")
-    model_file = os.path.join(model_dir, "lda_model_14_topics_20251124_235500")
-    lda_model = LdaModel.load(model_file)
-    print("✓ Modell geladen")
-
-    # 2. Tweets laden
-    print("\n[2/5] Lade Tweets...")
-    tweets = []
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            tweets.append(json.loads(line))
-    print(f"✓ {len(tweets):,} Tweets geladen")
-
-    # 3. Preprocessing
-    print("\n[3/5] Preprocessing...")
-    with open(stopwords_file, 'r', encoding='utf-8') as f:
-        corona_stopwords = set([line.strip().lower() for line in f if line.strip()])
-
-    with open(spacy_stopwords_file, 'r', encoding='utf-8') as f:
-        spacy_stopwords = set([
-            line.strip().lower() for line in f
-            if line.strip() and not line.startswith('#')
-        ])
-
-    all_stopwords = corona_stopwords | spacy_stopwords
-
-    documents = []
-    valid_tweets = []
-
-    for tweet in tweets:
-        filtered_tokens = [
-            token for token in tweet['tokens']
-            if token.lower() not in all_stopwords
-               and len(token) > 2
-               and not token.isnumeric()
-        ]
-        if len(filtered_tokens) > 0:
-            documents.append(filtered_tokens)
-            valid_tweets.append(tweet)
-
-    print(f"✓ {len(valid_tweets):,} verwendbare Tweets")
-
-    dictionary = corpora.Dictionary(documents)
-    dictionary.filter_extremes(no_below=5, no_above=0.5, keep_n=10000)
-    corpus = [dictionary.doc2bow(doc) for doc in documents]
-
-    # 4. Topic-Zuordnung
-    print("\n[4/5] Weise Topics zu und aggregiere...")
-
-    # Zähle Tweets pro Bundesland und Topic
-    bundesland_topic_counts = defaultdict(lambda: defaultdict(int))
-    bundesland_total_counts = defaultdict(int)
-
-    tweets_with_geo = 0
-
-    for idx, doc_bow in enumerate(corpus):
-        if idx % 10000 == 0 and idx > 0:
-            print(f"  Verarbeitet: {idx:,} Tweets...")
-
-        # Bundesland extrahieren
-        bundesland = extract_bundesland(valid_tweets[idx])
-        if not bundesland:
-            continue
-
-        tweets_with_geo += 1
-
-        # Dominantes Topic finden
-        topic_dist = lda_model.get_document_topics(doc_bow, minimum_probability=0.0)
-        if not topic_dist:
-            continue
+    # 1. Würfel laden (Topics und Bundesländer bereits zugeordnet)
+    print("\n[1/2] Lade Aggregationswürfel...")
+    wuerfel = Aggregationswuerfel.laden(wuerfel_datei)
+    print("✓ Würfel geladen")
 
-        dominant_topic, prob = max(topic_dist, key=lambda x: x[1])
+    # Tweets mit Topic-Zuordnung (verwertbare Tokens) pro Bundesland und Topic
+    counts = wuerfel.summe(nach=('bundesland', 'topic'), bundesland=BUNDESLAENDER,
+                           topic=list(range(ANZAHL_TOPICS))).unstack()
 
-        # Zähle alle Tweets pro Bundesland
-        bundesland_total_counts[bundesland] += 1
+    bundesland_topic_counts = counts.to_dict(orient='index')
+    bundesland_total_counts = counts.sum(axis=1).to_dict()
 
-        # Zähle nur ausgewählte Topics
-        if dominant_topic in SELECTED_TOPICS:
-            bundesland_topic_counts[bundesland][dominant_topic] += 1
+    tweets_with_geo = int(counts.values.sum())
 
     print(f"\n✓ Tweets mit Geo-Info: {tweets_with_geo:,}")
 
-    # 5. Berechne Anteile
-    print("\n[5/5] Berechne Anteile und erstelle Visualisierungen...")
+    # 2. Berechne Anteile
+    print("\n[2/2] Berechne Anteile und erstelle Visualisierungen...")
 
     # Erstelle DataFrame für jedes Topic
     topic_dataframes = {}
@@ -196,9 +81,8 @@ def main():
 
         topic_dataframes[topic_id] = pd.DataFrame(data)
 
-    # Shapefile laden
-    germany_gdf = gpd.read_file(SHAPEFILE_PATH)
-    germany_gdf = germany_gdf[germany_gdf['admin'] == 'Germany'].copy()
+    # Bundesland-Geometrien laden (vorberechnetes Artefakt, siehe 36)
+    germany_gdf = lade_bundeslaender(GEOMETRIE_DIR, 'druck', SHAPEFILE_PATH)
     germany_gdf['Bundesland'] = germany_gdf['name']
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -292,7 +176,7 @@ def create_maps(germany_gdf, topic_dataframes, SELECTED_TOPICS, TOPIC_DISPLAY,
         # Labels
         for _, row in gdf_topic.iterrows():
             if pd.notna(row['Anteil_Prozent']) and row['Anteil_Prozent'] > 0:
-                centroid = row['geometry'].centroid
+                centroid = row['label_punkt']
 
                 if row['Bundesland'] == 'Berlin':
                     label_x = centroid.x
@@ -1,66 +1,18 @@
-import json
 import pandas as pd
 import matplotlib.pyplot as plt
-from collections import defaultdict
 import os
 from datetime import datetime
-from gensim import corpora
-from gensim.models import LdaModel
+from aggregationswuerfel import Aggregationswuerfel, ANZAHL_TOPICS
 
 # Matplotlib auf Deutsch
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['axes.unicode_minus'] = False
 
-# Übersetzung Englisch → Deutsch
-STATE_MAPPING = {
-    'Berlin': 'Berlin',
-    'North Rhine-Westphalia': 'Nordrhein-Westfalen',
-    'Bavaria': 'Bayern',
-    'Baden-Württemberg': 'Baden-Württemberg',
-    'Hamburg': 'Hamburg',
-    'Hesse': 'Hessen',
-    'Lower Saxony': 'Niedersachsen',
-    'Rhineland-Palatinate': 'Rheinland-Pfalz',
-    'Saxony': 'Sachsen',
-    'Brandenburg': 'Brandenburg',
-    'Schleswig-Holstein': 'Schleswig-Holstein',
-    'Saxony-Anhalt': 'Sachsen-Anhalt',
-    'Free Hanseatic City of Bremen': 'Bremen',
-    'Thuringia': 'Thüringen',
-    'Mecklenburg-Vorpommern': 'Mecklenburg-Vorpommern',
-    'Mecklenburg-Western Pomerania': 'Mecklenburg-Vorpommern',
-    'Saarland': 'Saarland'
-}
-
-# Ost-Bundesländer
-OST_BUNDESLAENDER = {
-    'Berlin', 'Brandenburg', 'Mecklenburg-Vorpommern',
-    'Sachsen', 'Sachsen-Anhalt', 'Thüringen'
-}
-
-
-def extract_bundesland(tweet):
-    """Extrahiert und übersetzt Bundesland aus geo_source"""
-    geo_source = tweet.get('geo_source')
-
-    if not geo_source:
-        return None
-
-    bundesland_en = None
-    if geo_source == 'place' and tweet.get('place'):
-        bundesland_en = tweet['place'].get('state')
-    elif geo_source == 'coordinates' and tweet.get('geo'):
-        bundesland_en = tweet['geo'].get('state')
-
-    return STATE_MAPPING.get(bundesland_en) if bundesland_en else None
-
 
 def main():
     # An eigene Pfade anpassen!
-    model_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\final_14_topics"
-    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
-    stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\corona_stopwords.txt"
-    spacy_stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\spacy_stopwords_deutsch.txt"
+    # Würfel aus "35. Aggregationswürfel bauen.py"
+    wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\wuerfel.npz"
     output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\ost_west_analyse"
 
     os.makedirs(output_dir, exist_ok=True)
@@ -81,98 +33,28 @@ def main():
 
     TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
 
-    # 1. Modell laden
-    print("\n[1/5] Lade Modell...")
-    model_file = os.path.join(model_dir, "lda_model_14_topics_20251124_235500")
-    lda_model = LdaModel.load(model_file)
-    print("✓ Modell geladen")
-
-    # 2. Tweets laden
-    print("\n[2/5] Lade Tweets...")
-    tweets = []
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            tweets.append(json.loads(line))
-    print(f"✓ {len(tweets):,} Tweets geladen")
-
-    # 3. Preprocessing
-    print("\n[3/5] Preprocessing...")
-    with open(stopwords_file, 'r', encoding='utf-8') as f:
-        corona_stopwords = set([line.strip().lower() for line in f if line.strip()])
-
-    with open(spacy_stopwords_file, 'r', encoding='utf-8') as f:
-        spacy_stopwords = set([
-            line.strip().lower() for line in f
-            if line.strip() and not line.startswith('#')
-        ])
-
-    all_stopwords = corona_stopwords | spacy_stopwords
-
-    documents = []
-    valid_tweets = []
-
-    for tweet in tweets:
-        filtered_tokens = [
-            token for token in tweet['tokens']
-            if token.lower() not in all_stopwords
-               and len(token) > 2
-               and not token.isnumeric()
-        ]
-        if len(filtered_tokens) > 0:
-            documents.append(filtered_tokens)
-            valid_tweets.append(tweet)
-
-    print(f"✓ {len(valid_tweets):,} verwendbare Tweets")
-
-    dictionary = corpora.Dictionary(documents)
-    dictionary.filter_extremes(no_below=5, no_above=0.5, keep_n=10000)
-    corpus = [dictionary.doc2bow(doc) for doc in documents]
-
-    # 4. Topic-Zuordnung
-    print("\n[4/5] Weise Topics zu und aggregiere...")
-
-    # Zähle Tweets nach Ost/West und Topic
-    ost_topic_counts = defaultdict(int)
-    west_topic_counts = defaultdict(int)
-    ost_total = 0
-    west_total = 0
-
-    tweets_with_geo = 0
-
-    for idx, doc_bow in enumerate(corpus):
-        if idx % 10000 == 0 and idx > 0:
-            print(f"  Verarbeitet: {idx:,} Tweets...")
-
-        bundesland = extract_bundesland(valid_tweets[idx])
-        if not bundesland:
-            continue
-
-        tweets_with_geo += 1
-
-        topic_dist = lda_model.get_document_topics(doc_bow, minimum_probability=0.0)
-        if not topic_dist:
-            continue
-
-        dominant_topic, prob = max(topic_dist, key=lambda x: x[1])
-
-        # Ost oder West?
-        is_ost = bundesland in OST_BUNDESLAENDER
-
-        if is_ost:
-            ost_total += 1
-            if dominant_topic in SELECTED_TOPICS:
-                ost_topic_counts[dominant_topic] += 1
-        else:
-            west_total += 1
-            if dominant_topic in SELECTED_TOPICS:
-                west_topic_counts[dominant_topic] += 1
+    # 1. Würfel laden (Topics und Bundesländer bereits zugeordnet)
+    print("\n[1/2] Lade Aggregationswürfel...")
+    wuerfel = Aggregationswuerfel.laden(wuerfel_datei)
+    print("✓ Würfel geladen")
+
+    # Tweets mit Topic-Zuordnung (verwertbare Tokens) nach Ost/West und Topic
+    counts = wuerfel.summe(nach=('ost_west', 'topic'), ost_west=['Ost', 'West'],
+                           topic=list(range(ANZAHL_TOPICS)))
+
+    ost_topic_counts = counts['Ost'].to_dict()
+    west_topic_counts = counts['West'].to_dict()
+    ost_total = int(counts['Ost'].sum())
+    west_total = int(counts['West'].sum())
+
+    tweets_with_geo = ost_total + west_total
 
     print(f"\n✓ Tweets mit Geo-Info: {tweets_with_geo:,}")
     print(f"   Ost: {ost_total:,} ({ost_total / tweets_with_geo * 100:.1f}%)")
     print(f"   West: {west_total:,} ({west_total / tweets_with_geo * 100:.1f}%)")
 
-    # 5. Berechne Anteile
-    print("\n[5/5] Berechne Anteile und erstelle Visualisierungen...")
+    # 2. Berechne Anteile
+    print("\n[2/2] Berechne Anteile und erstelle Visualisierungen...")
 
     results = []
     for topic_id in sorted(SELECTED_TOPICS.keys()):
@@ -1,113 +1,18 @@
-import json
 import pandas as pd
 import matplotlib.pyplot as plt
-from collections import defaultdict
 import os
 from datetime import datetime
-from gensim import corpora
-from gensim.models import LdaModel
+from aggregationswuerfel import Aggregationswuerfel, ANZAHL_TOPICS
 
 # Matplotlib auf Deutsch
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['axes.unicode_minus'] = False
 
-# Großstädte-Mapping 
-GROSSSTAEDTE_MAPPING = {
-    "Berlin": "Berlin", "Hamburg": "Hamburg", "Munich": "München",
-    "Cologne": "Köln", "Frankfurt": "Frankfurt am Main",
-    "Frankfurt am Main": "Frankfurt am Main",
-    "Dusseldorf": "Düsseldorf", "Düsseldorf": "Düsseldorf",
-    "Stuttgart": "Stuttgart", "Leipzig": "Leipzig", "Dortmund": "Dortmund",
-    "Bremen": "Bremen", "Essen": "Essen", "Dresden": "Dresden",
-    "Nuremberg": "Nürnberg", "Nürnberg": "Nürnberg",
-    "Hanover": "Hannover", "Hannover": "Hannover",
-    "Duisburg": "Duisburg", "Bochum": "Bochum", "Wuppertal": "Wuppertal",
-    "Bielefeld": "Bielefeld", "Bonn": "Bonn", "Mannheim": "Mannheim",
-    "Karlsruhe": "Karlsruhe", "Munster": "Münster", "Münster": "Münster",
-    "Augsburg": "Augsburg", "Wiesbaden": "Wiesbaden",
-    "Gelsenkirchen": "Gelsenkirchen",
-    "Monchengladbach": "Mönchengladbach", "Mönchengladbach": "Mönchengladbach",
-    "Aachen": "Aachen", "Brunswick": "Braunschweig", "Braunschweig": "Braunschweig",
-    "Kiel": "Kiel", "Chemnitz": "Chemnitz", "Magdeburg": "Magdeburg",
-    "Freiburg": "Freiburg im Breisgau", "Freiburg im Breisgau": "Freiburg im Breisgau",
-    "Krefeld": "Krefeld", "Halle": "Halle (Saale)", "Halle (Saale)": "Halle (Saale)",
-    "Mainz": "Mainz", "Erfurt": "Erfurt", "Lubeck": "Lübeck", "Lübeck": "Lübeck",
-    "Oberhausen": "Oberhausen", "Rostock": "Rostock", "Kassel": "Kassel",
-    "Hagen": "Hagen", "Potsdam": "Potsdam",
-    "Saarbrucken": "Saarbrücken", "Saarbrücken": "Saarbrücken",
-    "Hamm": "Hamm", "Ludwigshafen": "Ludwigshafen am Rhein",
-    "Ludwigshafen am Rhein": "Ludwigshafen am Rhein",
-    "Oldenburg": "Oldenburg",
-    "Mulheim": "Mülheim an der Ruhr", "Mülheim": "Mülheim an der Ruhr",
-    "Mülheim an der Ruhr": "Mülheim an der Ruhr",
-    "Leverkusen": "Leverkusen", "Darmstadt": "Darmstadt",
-    "Osnabruck": "Osnabrück", "Osnabrück": "Osnabrück",
-    "Solingen": "Solingen", "Paderborn": "Paderborn", "Herne": "Herne",
-    "Heidelberg": "Heidelberg", "Neuss": "Neuss", "Regensburg": "Regensburg",
-    "Ingolstadt": "Ingolstadt", "Pforzheim": "Pforzheim",
-    "Wurzburg": "Würzburg", "Würzburg": "Würzburg",
-    "Offenbach": "Offenbach am Main", "Offenbach am Main": "Offenbach am Main",
-    "Furth": "Fürth", "Fürth": "Fürth", "Heilbronn": "Heilbronn",
-    "Ulm": "Ulm", "Wolfsburg": "Wolfsburg",
-    "Gottingen": "Göttingen", "Göttingen": "Göttingen",
-    "Reutlingen": "Reutlingen", "Bremerhaven": "Bremerhaven",
-    "Bottrop": "Bottrop", "Erlangen": "Erlangen",
-    "Recklinghausen": "Recklinghausen", "Remscheid": "Remscheid",
-    "Koblenz": "Koblenz", "Bergisch Gladbach": "Bergisch Gladbach",
-    "Jena": "Jena", "Salzgitter": "Salzgitter", "Trier": "Trier",
-    "Siegen": "Siegen", "Moers": "Moers",
-    "Gutersloh": "Gütersloh", "Gütersloh": "Gütersloh"
-}
-
-GROSSSTAEDTE_ENGLISCH = set(GROSSSTAEDTE_MAPPING.keys())
-
-# Stadtstaaten
-STADTSTAATEN = ['Berlin', 'Hamburg', 'Bremen', 'Free Hanseatic City of Bremen', 'Hanseatic City']
-
-
-def kategorisiere_urban_rural(tweet):
-    """Kategorisiert Tweet als Urban (Großstadt >100k) oder Rural"""
-    geo_source = tweet.get('geo_source')
-
-    if not geo_source:
-        return None
-
-    if geo_source == 'place' and tweet.get('place'):
-        location_data = tweet['place']
-    elif geo_source == 'coordinates' and tweet.get('geo'):
-        location_data = tweet['geo']
-    else:
-        return None
-
-    # Stadtstaaten sind immer Urban
-    state = location_data.get('state', '')
-    if any(stadtstaat in state for stadtstaat in STADTSTAATEN):
-        return 'Urban'
-
-    # Bestimme Ortsnamen
-    ort = None
-    if 'city' in location_data and location_data['city']:
-        ort = location_data['city']
-    elif 'county' in location_data and location_data['county']:
-        ort = location_data['county']
-
-    if not ort:
-        return None
-
-    ort_clean = ort.replace("Region ", "").replace("City of ", "").strip()
-
-    if ort_clean in GROSSSTAEDTE_ENGLISCH:
-        return 'Urban'
-    else:
-        return 'Rural'
-
 
 def main():
     # An eigene Pfade anpassen!
-    model_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\final_14_topics"
-    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
-    stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\corona_stopwords.txt"
-    spacy_stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\spacy_stopwords_deutsch.txt"
+    # Würfel aus "35. Aggregationswürfel bauen.py"
+    wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\wuerfel.npz"
     output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\urban_rural_analyse"
 
     os.makedirs(output_dir, exist_ok=True)
@@ -128,96 +33,28 @@ def main():
 
     TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
 
-    # 1. Modell laden
-    print("\n[1/5] Lade Modell...")
-    model_file = os.path.join(model_dir, "lda_model_14_topics_20251124_235500")
-    lda_model = LdaModel.load(model_file)
-    print("✓ Modell geladen")
-
-    # 2. Tweets laden
-    print("\n[2/5] Lade Tweets...")
-    tweets = []
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            tweets.append(json.loads(line))
-    print(f"✓ {len(tweets):,} Tweets geladen")
-
-    # 3. Preprocessing
-    print("\n[3/5] Preprocessing...")
-    with open(stopwords_file, 'r', encoding='utf-8') as f:
-        corona_stopwords = set([line.strip().lower() for line in f if line.strip()])
-
-    with open(spacy_stopwords_file, 'r', encoding='utf-8') as f:
-        spacy_stopwords = set([
-            line.strip().lower() for line in f
-            if line.strip() and not line.startswith('#')
-        ])
-
-    all_stopwords = corona_stopwords | spacy_stopwords
-
-    documents = []
-    valid_tweets = []
-
-    for tweet in tweets:
-        filtered_tokens = [
-            token for token in tweet['tokens']
-            if token.lower() not in all_stopwords
-               and len(token) > 2
-               and not token.isnumeric()
-        ]
-        if len(filtered_tokens) > 0:
-            documents.append(filtered_tokens)
-            valid_tweets.append(tweet)
-
-    print(f"✓ {len(valid_tweets):,} verwendbare Tweets")
-
-    dictionary = corpora.Dictionary(documents)
-    dictionary.filter_extremes(no_below=5, no_above=0.5, keep_n=10000)
-    corpus = [dictionary.doc2bow(doc) for doc in documents]
-
-    # 4. Topic-Zuordnung
-    print("\n[4/5] Weise Topics zu und aggregiere...")
-
-    # Zähle Tweets nach Urban/Rural und Topic
-    urban_topic_counts = defaultdict(int)
-    rural_topic_counts = defaultdict(int)
-    urban_total = 0
-    rural_total = 0
-
-    tweets_with_geo = 0
-
-    for idx, doc_bow in enumerate(corpus):
-        if idx % 10000 == 0 and idx > 0:
-            print(f"  Verarbeitet: {idx:,} Tweets...")
-
-        kategorie = kategorisiere_urban_rural(valid_tweets[idx])
-        if not kategorie:
-            continue
-
-        tweets_with_geo += 1
-
-        topic_dist = lda_model.get_document_topics(doc_bow, minimum_probability=0.0)
-        if not topic_dist:
-            continue
-
-        dominant_topic, prob = max(topic_dist, key=lambda x: x[1])
-
-        # Urban oder Rural?
-        if kategorie == 'Urban':
-            urban_total += 1
-            if dominant_topic in SELECTED_TOPICS:
-                urban_topic_counts[dominant_topic] += 1
-        elif kategorie == 'Rural':
-            rural_total += 1
-            if dominant_topic in SELECTED_TOPICS:
-                rural_topic_counts[dominant_topic] += 1
+    # 1. Würfel laden (Topics und Stadt/Land bereits zugeordnet)
+    print("\n[1/2] Lade Aggregationswürfel...")
+    wuerfel = Aggregationswuerfel.laden(wuerfel_datei)
+    print("✓ Würfel geladen")
+
+    # Tweets mit Topic-Zuordnung (verwertbare Tokens) nach Urban/Rural und Topic
+    counts = wuerfel.summe(nach=('urban_rural', 'topic'), urban_rural=['Urban', 'Rural'],
+                           topic=list(range(ANZAHL_TOPICS)))
+
+    urban_topic_counts = counts['Urban'].to_dict()
+    rural_topic_counts = counts['Rural'].to_dict()
+    urban_total = int(counts['Urban'].sum())
+    rural_total = int(counts['Rural'].sum())
+
+    tweets_with_geo = urban_total + rural_total
 
     print(f"\n✓ Tweets mit Geo-Info: {tweets_with_geo:,}")
     print(f"   Urban: {urban_total:,} ({urban_total / tweets_with_geo * 100:.1f}%)")
     print(f"   Rural: {rural_total:,} ({rural_total / tweets_with_geo * 100:.1f}%)")
 
-    # 5. Berechne Anteile
-    print("\n[5/5] Berechne Anteile und erstelle Visualisierungen...")
+    # 2. Berechne Anteile
+    print("\n[2/2] Berechne Anteile und erstelle Visualisierungen...")
 
     results = []
     for topic_id in sorted(SELECTED_TOPICS.keys()):
@@ -0,0 +1,195 @@
+import json
+import os
+from datetime import datetime
+from sketches import HeavyHitterSketch, kombiniere
+
+# Emoji-Modifier, die gefiltert werden sollen
+EMOJI_MODIFIERS = {
+    '🏻', '🏼', '🏽', '🏾', '🏿',
+    '♂', '♀', '⚧',
+    '️', '\ufe0f',
+}
+
+# Sketch-Parameter: k überwachte Items, Count-Min mit width x depth Zählern
+SKETCH_K = 5000
+SKETCH_WIDTH = 2 ** 14
+SKETCH_DEPTH = 4
+
+ITEM_TYPEN = ['tokens', 'hashtags', 'emojis']
+
+# Bereits eingelesene Eingabedateien je Sketch-Ordner (Pfad → Größe und Änderungszeit)
+EINGELESEN_DATEI = 'eingelesen.json'
+
+
+def parse_twitter_date(date_str):
+    """Konvertiert Twitter-Datum in datetime-Objekt"""
+    return datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y')
+
+
+def extract_items(tweet):
+    """Extrahiert Tokens, Hashtags und Emojis (ohne Modifier) aus einem Tweet"""
+    entities = tweet.get('entities', {})
+    return {
+        'tokens': tweet.get('tokens', []),
+        'hashtags': entities.get('hashtags', []),
+        'emojis': [emoji for emoji in entities.get('emojis', []) if emoji not in EMOJI_MODIFIERS]
+    }
+
+
+def eingabe_kennung(input_file):
+    """Absoluter Pfad und Fingerabdruck (Größe, Änderungszeit) einer Eingabedatei"""
+    info = os.stat(input_file)
+    return os.path.normcase(os.path.abspath(input_file)), [info.st_size, int(info.st_mtime)]
+
+
+def build_daily_sketches(input_file, sketch_dir):
+    """
+    Liest die JSONL-Datei zeilenweise (ohne alle Tweets im Speicher zu halten)
+    und baut pro Tag und Item-Typ einen Heavy-Hitter-Sketch.
+    Existiert für einen Tag bereits ein Sketch (z.B. aus einem anderen Shard),
+    wird der neue Sketch mit dem vorhandenen zusammengeführt. Jede Eingabedatei
+    wird nur einmal eingelesen (EINGELESEN_DATEI), sonst zählten Tage doppelt.
+    """
+    os.makedirs(sketch_dir, exist_ok=True)
+    eingelesen_pfad = os.path.join(sketch_dir, EINGELESEN_DATEI)
+    eingelesen = {}
+    if os.path.exists(eingelesen_pfad):
+        with open(eingelesen_pfad, 'r', encoding='utf-8') as f:
+            eingelesen = json.load(f)
+
+    eingabe, kennung = eingabe_kennung(input_file)
+    if eingabe in eingelesen:
+        if eingelesen[eingabe] == kennung:
+            print(f"✓ Bereits eingelesen, übersprungen: {input_file}\n")
+            return
+        raise ValueError(f"{input_file} hat sich seit dem Einlesen geändert - "
+                         f"bitte {sketch_dir} leeren und die Sketches neu bauen")
+
+    print(f"Baue Tages-Sketches aus: {input_file}")
+
+    # Struktur: {item_typ: {datum: HeavyHitterSketch}}
+    sketches = {typ: {} for typ in ITEM_TYPEN}
+    processed = skipped = 0
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num % 100000 == 0:
+                print(f"  {line_num:,} Zeilen gelesen...")
+
+            try:
+                tweet = json.loads(line.strip())
+                # Vorberechneter Kalendertag aus 07 (Ortszeit), sonst UTC-Datum
+                tag = tweet.get('datum_lokal') or parse_twitter_date(tweet['created_at']).date().isoformat()
+            except:
+                skipped += 1
+                continue
+
+            for typ, items in extract_items(tweet).items():
+                if not items:
+                    continue
+                if tag not in sketches[typ]:
+                    sketches[typ][tag] = HeavyHitterSketch(SKETCH_K, SKETCH_WIDTH, SKETCH_DEPTH)
+                sketches[typ][tag].update_many(items)
+
+            processed += 1
+
+    print(f"✓ {processed:,} Tweets verarbeitet, {skipped:,} übersprungen\n")
+
+    # Speichern (und mit vorhandenen Sketches desselben Tages zusammenführen)
+    for typ, tages_sketches in sketches.items():
+        typ_dir = os.path.join(sketch_dir, typ)
+        os.makedirs(typ_dir, exist_ok=True)
+
+        for tag, sketch in tages_sketches.items():
+            pfad = os.path.join(typ_dir, f"{tag}.npz")
+            if os.path.exists(pfad):
+                sketch = sketch.merge(HeavyHitterSketch.laden(pfad))
+            sketch.speichern(pfad)
+
+        print(f"✓ {len(tages_sketches)} Tages-Sketches ({typ}) gespeichert in: {typ_dir}")
+
+    eingelesen[eingabe] = kennung
+    with open(eingelesen_pfad, 'w', encoding='utf-8') as f:
+        json.dump(eingelesen, f, ensure_ascii=False, indent=2)
+
+
+def load_range(sketch_dir, typ, start=None, end=None):
+    """Lädt alle Tages-Sketches eines Typs im Zeitraum [start, end] und führt sie zusammen"""
+    typ_dir = os.path.join(sketch_dir, typ)
+    tage = sorted(f[:-4] for f in os.listdir(typ_dir) if f.endswith('.npz'))
+
+    if start:
+        tage = [tag for tag in tage if tag >= start.isoformat()]
+    if end:
+        tage = [tag for tag in tage if tag <= end.isoformat()]
+
+    sketch = kombiniere(HeavyHitterSketch.laden(os.path.join(typ_dir, f"{tag}.npz")) for tag in tage)
+    return sketch, tage
+
+
+def write_top_n_report(sketch_dir, output_dir, top_n=100, start=None, end=None):
+    """Erstellt Top-N-Listen mit Fehlerschranken für alle Item-Typen"""
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    txt_file = os.path.join(output_dir, f"top{top_n}_sketches_{timestamp}.txt")
+
+    with open(txt_file, 'w', encoding='utf-8') as f:
+        f.write(f"TOP {top_n} TOKENS, HASHTAGS UND EMOJIS (HEAVY-HITTER-SKETCHES)\n")
+        f.write("=" * 90 + "\n\n")
+        f.write(f"Analysezeitpunkt: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Sketch-Parameter: k={SKETCH_K}, Count-Min {SKETCH_DEPTH} x {SKETCH_WIDTH}\n")
+        f.write("Spalten: Schätzung = obere Schranke, Untergrenze = garantierte Mindestanzahl,\n")
+        f.write("         * = Item gehört garantiert zu den Top N\n\n")
+
+        for typ in ITEM_TYPEN:
+            sketch, tage = load_range(sketch_dir, typ, start, end)
+
+            f.write("=" * 90 + "\n")
+            f.write(f"{typ.upper()}\n")
+            f.write("=" * 90 + "\n\n")
+
+            if sketch is None:
+                f.write("Keine Daten im gewählten Zeitraum\n\n")
+                continue
+
+            f.write(f"Zeitraum: {tage[0]} bis {tage[-1]} ({len(tage)} Tage)\n")
+            f.write(f"Gesamt-Vorkommen: {sketch.total:,}\n")
+            f.write(f"Max. Fehler (Space-Saving, N/k): {sketch.total / SKETCH_K:,.1f}\n\n")
+            f.write(f"{'Rang':<6} {'Item':<35} {'Schätzung':<12} {'Untergrenze':<12} {'Anteil':<10}\n")
+            f.write("-" * 90 + "\n")
+
+            for idx, row in enumerate(sketch.top_n(top_n), 1):
+                anteil = (row['schaetzung'] / sketch.total) * 100
+                markierung = '*' if row['garantiert'] else ' '
+                f.write(f"{idx:<6} {row['item']:<35} {row['schaetzung']:<12,} "
+                        f"{row['untergrenze']:<12,} {anteil:>6.2f}% {markierung}\n")
+            f.write("\n")
+
+    print(f"✓ Top-{top_n}-Listen: {txt_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    sketch_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Sketches"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Sketches\Reports"
+
+    # Auf False setzen, um nur vorhandene Sketches auszuwerten (ohne Tweets neu zu lesen)
+    sketches_bauen = True
+
+    # Zeitraum für die Auswertung (None = alle Tage), datetime.date
+    start = None  # z.B. date(2020, 3, 1)
+    end = None  # z.B. date(2020, 3, 31)
+
+    if sketches_bauen:
+        build_daily_sketches(input_file, sketch_dir)
+
+    write_top_n_report(sketch_dir, output_dir, top_n=100, start=start, end=end)
+
+    print(f"\n{'=' * 70}")
+    print("SKETCH-ANALYSE ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import os
+import time
+from datetime import datetime
+from invertierter_index import InvertierterIndex
+
+
+def build_index(index, input_file):
+    """Indexiert neue Tweets (bereits indexierte Zeilen werden übersprungen)"""
+    print(f"Aktualisiere Index mit: {input_file}")
+
+    start = time.perf_counter()
+    neu = index.aktualisieren(input_file)
+    dauer = time.perf_counter() - start
+
+    print(f"✓ {neu:,} neue Tweets indexiert in {dauer:.1f}s")
+    print(f"✓ Index enthält {index.anzahl_tweets:,} Tweets in {len(index.segmente)} Segment(en)\n")
+
+
+def write_kwic_report(index, anfragen, output_dir, breite=50, limit=25):
+    """Führt alle Anfragen aus und schreibt die KWIC-Zeilen in eine TXT-Datei"""
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    txt_file = os.path.join(output_dir, f"kwic_{timestamp}.txt")
+
+    with open(txt_file, 'w', encoding='utf-8') as f:
+        f.write("KEYWORD IN CONTEXT (INVERTIERTER INDEX)\n")
+        f.write("=" * 120 + "\n\n")
+        f.write(f"Analysezeitpunkt: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Indexierte Tweets: {index.anzahl_tweets:,}\n\n")
+
+        for anfrage in anfragen:
+            start = time.perf_counter()
+            anzahl, zeilen = index.kwic(anfrage, breite=breite, limit=limit)
+            dauer = (time.perf_counter() - start) * 1000
+
+            print(f"  {anfrage:<45} {anzahl:>10,} Treffer  ({dauer:.1f} ms)")
+
+            f.write("=" * 120 + "\n")
+            f.write(f"ANFRAGE: {anfrage}\n")
+            f.write(f"Treffer: {anzahl:,} (Anzeige: max. {limit}, Suchzeit: {dauer:.1f} ms)\n")
+            f.write("=" * 120 + "\n\n")
+
+            for zeile in zeilen:
+                f.write(f"{zeile['links']:>{breite}} [{zeile['treffer']}] {zeile['rechts']}\n")
+            f.write("\n")
+
+    print(f"\n✓ KWIC-Liste: {txt_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    index_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Index"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Index\KWIC"
+
+    # Auf False setzen, um nur den vorhandenen Index abzufragen
+    index_aktualisieren = True
+
+    # Anfragen: token  #hashtag  text:wort  "phrase"  AND  OR  NOT  ( )
+    anfragen = [
+        'maske',
+        '#lockdown AND schule',
+        '#flattenthecurve OR #wirbleibenzuhause',
+        '"bleibt zu hause"',
+        'ausgangssperre NOT #lockdown',
+        '(#coronakrise OR #coronavirus) AND text:Bayern'
+    ]
+
+    index = InvertierterIndex(index_dir)
+
+    if index_aktualisieren:
+        build_index(index, input_file)
+
+    print("Führe Anfragen aus...")
+    write_kwic_report(index, anfragen, output_dir)
+    index.schliessen()
+
+    print(f"\n{'=' * 70}")
+    print("INDEX-ABFRAGE ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
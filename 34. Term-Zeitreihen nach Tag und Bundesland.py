@@ -0,0 +1,81 @@
+import os
+import time
+from datetime import datetime
+import plotly.graph_objects as go
+from term_zeitreihen import TermZeitreihen
+
+
+def plot_vergleich(zeitreihen, terme, bundeslaender, output_dir, timestamp, glaettung=7):
+    """Vergleicht eine Termmenge zwischen Bundesländern (normalisiert, gleitender Mittelwert)"""
+    start = time.perf_counter()
+    df = zeitreihen.vergleich(terme, bundeslaender, normalisiert=True)
+    dauer = (time.perf_counter() - start) * 1000
+    print(f"  {' + '.join(terme)}: {', '.join(bundeslaender)} ({dauer:.1f} ms)")
+
+    geglaettet = df.rolling(glaettung, min_periods=1).mean()
+
+    fig = go.Figure()
+    for bl in bundeslaender:
+        fig.add_trace(go.Scatter(
+            x=geglaettet.index,
+            y=geglaettet[bl],
+            mode='lines',
+            name=bl,
+            line=dict(width=3),
+            hovertemplate='<b>%{fullData.name}</b><br>Datum: %{x}<br>Pro 10.000 Tokens: %{y:.2f}<extra></extra>'
+        ))
+
+    name = '_'.join(terme)
+    fig.update_layout(
+        title=f"'{' + '.join(terme)}' im Zeitverlauf ({glaettung}-Tage-Mittel)",
+        xaxis_title='Datum',
+        yaxis_title='Vorkommen pro 10.000 Tokens',
+        height=600,
+        hovermode='x unified',
+        plot_bgcolor='#f8f9fa'
+    )
+
+    html_file = os.path.join(output_dir, f"term_{name}_{timestamp}.html")
+    fig.write_html(html_file)
+    df.to_csv(os.path.join(output_dir, f"term_{name}_{timestamp}.csv"), encoding='utf-8-sig')
+    print(f"  ✓ {html_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    matrix_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Term-Zeitreihen"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Term-Zeitreihen\Plots"
+
+    # Auf False setzen, um die gespeicherte Matrix zu verwenden
+    matrix_bauen = True
+
+    # Vergleiche: (Termmenge, Bundesländer)
+    vergleiche = [
+        (['maske'], ['Bayern', 'Berlin']),
+        (['maske', 'mundschutz'], ['Bayern', 'Berlin', 'Nordrhein-Westfalen']),
+        (['ausgangssperre'], ['Bayern', 'Sachsen', 'Hamburg'])
+    ]
+
+    if matrix_bauen:
+        zeitreihen = TermZeitreihen.bauen(input_file, min_count=5)
+        zeitreihen.speichern(matrix_dir)
+        print(f"✓ Matrix gespeichert in: {matrix_dir}\n")
+    else:
+        zeitreihen = TermZeitreihen.laden(matrix_dir)
+        print(f"✓ Matrix geladen: {len(zeitreihen.tage)} Tage, {len(zeitreihen.terme):,} Terme\n")
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    print("Erstelle Vergleiche...")
+    for terme, bundeslaender in vergleiche:
+        plot_vergleich(zeitreihen, terme, bundeslaender, output_dir, timestamp)
+
+    print(f"\n{'=' * 70}")
+    print("TERM-ZEITREIHEN ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
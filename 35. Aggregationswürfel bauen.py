@@ -0,0 +1,171 @@
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+from gensim import corpora
+from gensim.models import LdaModel
+from anreicherung import Merkmale, KEIN_TAG
+from aggregationswuerfel import Aggregationswuerfel, TOPICS
+
+
+def load_tweets(input_file):
+    """Lädt Tweets aus JSONL-Datei"""
+    print(f"Lade Tweets aus: {input_file}")
+    tweets = []
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num % 10000 == 0:
+                print(f"  {line_num} Zeilen gelesen...")
+
+            try:
+                tweets.append(json.loads(line.strip()))
+            except:
+                continue
+
+    print(f"✓ {len(tweets)} Tweets geladen\n")
+    return tweets
+
+
+def dominant_topics(tweets, lda_model, stopwords_file, spacy_stopwords_file, chunk_size=2000):
+    """
+    Dominantes LDA-Topic pro Tweet (-1 = keine verwertbaren Tokens).
+    Preprocessing und Dictionary wie in 24-31; die Inferenz läuft einmalig
+    in Blöcken statt Tweet für Tweet in jedem Auswertungsskript.
+    """
+    with open(stopwords_file, 'r', encoding='utf-8') as f:
+        corona_stopwords = set([line.strip().lower() for line in f if line.strip()])
+
+    with open(spacy_stopwords_file, 'r', encoding='utf-8') as f:
+        spacy_stopwords = set([
+            line.strip().lower() for line in f
+            if line.strip() and not line.startswith('#')
+        ])
+
+    all_stopwords = corona_stopwords | spacy_stopwords
+
+    documents = []
+    valid_idx = []
+
+    for idx, tweet in enumerate(tweets):
+        filtered_tokens = [
+            token for token in tweet.get('tokens', [])
+            if token.lower() not in all_stopwords
+               and len(token) > 2
+               and not token.isnumeric()
+        ]
+        if len(filtered_tokens) > 0:
+            documents.append(filtered_tokens)
+            valid_idx.append(idx)
+
+    print(f"✓ {len(valid_idx):,} verwendbare Tweets")
+
+    dictionary = corpora.Dictionary(documents)
+    dictionary.filter_extremes(no_below=5, no_above=0.5, keep_n=10000)
+    corpus = [dictionary.doc2bow(doc) for doc in documents]
+
+    topics = np.full(len(tweets), -1, dtype=np.int64)
+    dominant = np.empty(len(corpus), dtype=np.int64)
+
+    for start in range(0, len(corpus), chunk_size):
+        if start % 20000 == 0 and start > 0:
+            print(f"  Verarbeitet: {start:,} Tweets...")
+
+        # gamma ist die unnormalisierte Topic-Verteilung - argmax entspricht dem
+        # Maximum von get_document_topics
+        gamma, _ = lda_model.inference(corpus[start:start + chunk_size])
+        dominant[start:start + chunk_size] = gamma.argmax(axis=1)
+
+    topics[valid_idx] = dominant
+    return topics
+
+
+def build_cube(merkmale, topics):
+    """
+    Baut den Würfel aus den Integer-Spalten der Datenanreicherung (07b);
+    Bundesland, Stadt/Land, Trend-Hashtags und Sentiment werden nicht erneut je Tweet bestimmt.
+    """
+    # Tage (Ortszeit Europe/Berlin); Tweets ohne gültiges Datum fallen heraus
+    gueltig = merkmale.tag != KEIN_TAG
+    tage, tag_idx = np.unique(merkmale.tag[gueltig], return_inverse=True)
+
+    region_idx = merkmale.bundesland[gueltig].astype(np.int64)
+    urban_idx = merkmale.urban[gueltig].astype(np.int64)
+    topic_idx = pd.Index(TOPICS).get_indexer(topics[gueltig])
+
+    # Ein Eintrag pro Trend-Hashtag-Vorkommen (Tweet-Position, Hashtag-Index)
+    anzahl = merkmale.hashtag_anzahl[gueltig]
+    hashtag_tweet_idx, hashtag_idx = np.nonzero(anzahl)
+    wiederholungen = anzahl[hashtag_tweet_idx, hashtag_idx]
+    hashtag_tweet_idx = np.repeat(hashtag_tweet_idx, wiederholungen)
+    hashtag_idx = np.repeat(hashtag_idx, wiederholungen)
+
+    print(f"✓ {int(gueltig.sum()):,} Tweets mit gültigem Datum, {len(tage)} Tage")
+    print(f"✓ {len(hashtag_idx):,} Trend-Hashtag-Vorkommen")
+
+    # Sentiment je Tweet aus 07b (NaN = kein Lexikon-Treffer)
+    sentiment = merkmale.sentiment[gueltig]
+    print(f"✓ {int((~np.isnan(sentiment)).sum()):,} Tweets mit Sentiment")
+
+    return Aggregationswuerfel.bauen(
+        tage.astype('datetime64[D]').astype(object), tag_idx,
+        region_idx, urban_idx, topic_idx, hashtag_tweet_idx, hashtag_idx, sentiment
+    )
+
+
+def main():
+    # An eigene Pfade anpassen!
+    model_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\LDA\final_14_topics"
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    # Merkmale je Tweet aus "07b. Datenanreicherung.py"
+    merkmale_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data_merkmale.npz"
+    stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\corona_stopwords.txt"
+    spacy_stopwords_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\spacy_stopwords_deutsch.txt"
+    wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\wuerfel.npz"
+    # Dominantes Topic je Tweet, z.B. für die Kreis-Aggregation in 38
+    topics_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\topics.npz"
+
+    os.makedirs(os.path.dirname(wuerfel_datei), exist_ok=True)
+
+    print("=" * 70)
+    print("AGGREGATIONSWÜRFEL: TAG × BUNDESLAND × STADT/LAND × TOPIC × HASHTAG")
+    print("=" * 70)
+
+    start = time.perf_counter()
+
+    # 1. Modell laden
+    print("\n[1/4] Lade Modell...")
+    model_file = os.path.join(model_dir, "lda_model_14_topics_20251124_235500")
+    lda_model = LdaModel.load(model_file)
+    print("✓ Modell geladen")
+
+    # 2. Tweets laden
+    print("\n[2/4] Lade Tweets und Merkmale...")
+    tweets = load_tweets(input_file)
+    merkmale = Merkmale.laden(merkmale_datei)
+    merkmale.pruefen(tweets)
+    print(f"✓ Merkmale geladen: {merkmale_datei}")
+
+    # 3. Dominante Topics (einmalige LDA-Inferenz)
+    print("\n[3/4] Bestimme dominante Topics...")
+    topics = dominant_topics(tweets, lda_model, stopwords_file, spacy_stopwords_file)
+    np.savez_compressed(topics_datei, tweet_ids=np.array([str(tweet.get('tweet_id')) for tweet in tweets]),
+                        topics=topics)
+    print(f"✓ Topics gespeichert: {topics_datei}")
+
+    # 4. Würfel bauen und speichern
+    print("\n[4/4] Baue Würfel...")
+    wuerfel = build_cube(merkmale, topics)
+    wuerfel.speichern(wuerfel_datei)
+
+    print(f"\n✓ Würfel gespeichert: {wuerfel_datei} ({os.path.getsize(wuerfel_datei) / 1024:.0f} KB)")
+    print(f"✓ Dauer: {time.perf_counter() - start:.1f}s")
+
+    print(f"\n{'=' * 70}")
+    print("AGGREGATIONSWÜRFEL ERSTELLT!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import time
+from geometrie import TOLERANZEN, geometrie_bauen, kreise_bauen, lade_bundeslaender, lade_geojson
+from raumstatistik import gewichte_bauen
+
+
+def main():
+    # An eigene Pfade anpassen!
+    shapefile_path = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\ne_10m_admin_1_states_provinces\ne_10m_admin_1_states_provinces.shp"
+    geometrie_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
+    # Optional: VG250 (BKG) für Kreis-Choroplethen, None = nur Bundesländer
+    vg250_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\vg250_01-01.utm32s.shape.ebenen\vg250_ebenen_0101"
+
+    # Toleranz in Grad je Variante (druck = PNG-Karten, web = Plotly)
+    toleranzen = dict(TOLERANZEN)
+
+    start = time.perf_counter()
+    geometrie_bauen(shapefile_path, geometrie_dir, toleranzen)
+    if vg250_dir:
+        print()
+        kreise_bauen(vg250_dir, geometrie_dir, toleranzen)
+
+    # Nachbarschaften für Moran's I / LISA (41) gleich mitbauen
+    print()
+    for ebene in ['bundeslaender', 'kreise'] if vg250_dir else ['bundeslaender']:
+        gewichte = gewichte_bauen(geometrie_dir, ebene)
+        print(f"✓ Nachbarschaft {ebene}: {len(gewichte)} Regionen, "
+              f"{int(gewichte.anzahl_nachbarn.sum()) // 2} Nachbarpaare")
+    print(f"✓ Build in {time.perf_counter() - start:.1f} s\n")
+
+    # Ladezeit der Artefakte prüfen
+    for variante in toleranzen:
+        start = time.perf_counter()
+        gdf = lade_bundeslaender(geometrie_dir, variante)
+        geojson = lade_geojson(geometrie_dir, variante)
+        dauer = (time.perf_counter() - start) * 1000
+        print(f"✓ {variante}: {len(gdf)} Bundesländer, {len(geojson['features'])} Features geladen ({dauer:.0f} ms)")
+
+    print(f"\n{'=' * 60}")
+    print("GEOMETRIE-ARTEFAKT ERSTELLT!")
+    print(f"{'=' * 60}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import os
+import json
+import time
+from datetime import datetime
+from regionen import extract_bundesland
+from reverse_geocoder import ReverseGeocoder
+
+
+def load_tweets(input_file):
+    """Lädt Tweets aus JSONL-Datei"""
+    print(f"Lade Tweets aus: {input_file}")
+    tweets = []
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num % 10000 == 0:
+                print(f"  {line_num} Zeilen gelesen...")
+
+            try:
+                tweets.append(json.loads(line.strip()))
+            except:
+                continue
+
+    print(f"✓ {len(tweets)} Tweets geladen\n")
+    return tweets
+
+
+def vergleich_mit_state_mapping(tweets, df):
+    """Vergleicht Punkt-in-Polygon mit der bisherigen Zuordnung über STATE_MAPPING"""
+    df = df.copy()
+    df['bundesland_mapping'] = [extract_bundesland(tweet) for tweet in tweets]
+
+    mit_koordinaten = df['bundesland'].notna()
+    return {
+        'tweets': len(df),
+        'mit_koordinaten': int(mit_koordinaten.sum()),
+        'uebereinstimmend': int((df['bundesland'] == df['bundesland_mapping']).sum()),
+        'abweichend': int((mit_koordinaten & df['bundesland_mapping'].notna()
+                           & (df['bundesland'] != df['bundesland_mapping'])).sum()),
+        'bisher_verloren': int((mit_koordinaten & df['bundesland_mapping'].isna()).sum())
+    }
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    vg250_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\vg250_01-01.utm32s.shape.ebenen\vg250_ebenen_0101"
+    cache_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie\VG250"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Reverse Geocoding"
+
+    # Auf False setzen, um die gespeicherten Gemeinde-Geometrien zu verwenden
+    geocoder_bauen = True
+
+    if geocoder_bauen:
+        geocoder = ReverseGeocoder.aus_vg250(vg250_dir)
+        geocoder.speichern(cache_dir)
+        print(f"✓ Geocoder gespeichert in: {cache_dir}\n")
+    else:
+        geocoder = ReverseGeocoder.laden(cache_dir)
+        print(f"✓ Geocoder geladen: {len(geocoder.gemeinden):,} Gemeinden\n")
+
+    tweets = load_tweets(input_file)
+
+    start = time.perf_counter()
+    df = geocoder.zuordnen_tweets(tweets)
+    dauer = time.perf_counter() - start
+    print(f"✓ {df['gemeinde'].notna().sum():,} Tweets zugeordnet ({dauer:.2f} s)\n")
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    csv_file = os.path.join(output_dir, f"reverse_geocoding_{timestamp}.csv")
+    df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+    print(f"✓ CSV: {csv_file}")
+
+    stats = vergleich_mit_state_mapping(tweets, df)
+    txt_file = os.path.join(output_dir, f"reverse_geocoding_{timestamp}.txt")
+    with open(txt_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 70 + "\n")
+        f.write("REVERSE GEOCODING DER KOORDINATEN (VG250)\n")
+        f.write("=" * 70 + "\n\n")
+        f.write(f"Tweets gesamt:                         {stats['tweets']:,}\n")
+        f.write(f"Per Koordinaten zugeordnet:            {stats['mit_koordinaten']:,}\n")
+        f.write(f"Übereinstimmend mit STATE_MAPPING:     {stats['uebereinstimmend']:,}\n")
+        f.write(f"Abweichend von STATE_MAPPING:          {stats['abweichend']:,}\n")
+        f.write(f"Bisher ohne Bundesland (jetzt erkannt): {stats['bisher_verloren']:,}\n\n")
+
+        f.write("TWEETS PRO KREIS (TOP 20)\n")
+        f.write("-" * 70 + "\n")
+        kreise = df.groupby(['kreis_ags', 'kreis']).size().sort_values(ascending=False).head(20)
+        for (ags, kreis), anzahl in kreise.items():
+            f.write(f"{ags:<8} {kreis:<45} {anzahl:>10,}\n")
+
+    print(f"✓ TXT-Report: {txt_file}")
+
+    print(f"\n{'=' * 60}")
+    print("REVERSE GEOCODING ABGESCHLOSSEN!")
+    print(f"{'=' * 60}\n")
+
+
+if __name__ == "__main__":
+    main()
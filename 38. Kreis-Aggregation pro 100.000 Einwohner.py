@@ -0,0 +1,167 @@
+import os
+import json
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from zeitstempel import lokale_tage
+from aggregationswuerfel import TOPICS, lade_topics
+from reverse_geocoder import ReverseGeocoder
+from kreise import KreisZuordnung, KreisWuerfel, lade_einwohner, UNBEKANNT
+from geometrie import lade_kreise
+
+# Matplotlib auf Deutsch
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['axes.unicode_minus'] = False
+
+# Die 6 ausgewählten Topics (wie in 28-31)
+SELECTED_TOPICS = {
+    0: "Gesellschaftspolitische Reflexion",
+    2: "Soziale Distanzierung",
+    5: "Maskenpflicht",
+    6: "Wirtschaftliche Lage & Finanzielle Unterstützung",
+    9: "Hashtag-Kampagnen & Solidarität",
+    11: "Regionales Infektionsgeschehen"
+}
+
+TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
+
+
+def load_tweets(input_file):
+    """Lädt Tweets aus JSONL-Datei"""
+    print(f"Lade Tweets aus: {input_file}")
+    tweets = []
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num % 10000 == 0:
+                print(f"  {line_num} Zeilen gelesen...")
+
+            try:
+                tweets.append(json.loads(line.strip()))
+            except:
+                continue
+
+    print(f"✓ {len(tweets)} Tweets geladen\n")
+    return tweets
+
+
+def build_kreis_cube(tweets, topics, zuordnung):
+    """Kodiert Kreis, Tag und Topic als Integer-Arrays und baut den Würfel"""
+    kreis_ags, quelle = zuordnung.kreise(tweets)
+    print(f"✓ Kreis über Koordinaten: {int((quelle == 'koordinaten').sum()):,}, "
+          f"über Ortsnamen: {int((quelle == 'ortsname').sum()):,}, "
+          f"ohne Kreis: {int(pd.isna(quelle).sum()):,}")
+
+    tage_array = lokale_tage(tweets)
+    gueltig = ~np.isnat(tage_array)
+    tage, tag_idx = np.unique(tage_array[gueltig], return_inverse=True)
+
+    kreise = sorted(zuordnung.geocoder.kreis_namen) + [UNBEKANNT]
+    kreis_codes = pd.Series(kreis_ags[gueltig]).fillna(UNBEKANNT)
+    kreis_idx = pd.Index(kreise).get_indexer(kreis_codes)
+    topic_idx = pd.Index(TOPICS).get_indexer(topics[gueltig])
+
+    return KreisWuerfel.bauen(kreise, tage.astype(object), kreis_idx, tag_idx, topic_idx)
+
+
+def create_rate_map(kreise_gdf, raten, spalte, titel, legende, map_file):
+    """Choropleth der Kreise (Geometrie-Artefakt aus 36)"""
+    gdf = kreise_gdf.merge(raten, left_on='ags', right_index=True, how='left')
+
+    fig, ax = plt.subplots(1, 1, figsize=(12, 14))
+    gdf.plot(
+        column=spalte,
+        cmap='YlOrRd',
+        linewidth=0.2,
+        ax=ax,
+        edgecolor='gray',
+        legend=True,
+        legend_kwds={'label': legende, 'shrink': 0.6},
+        missing_kwds={'color': 'lightgray', 'label': 'Keine Daten'}
+    )
+    ax.set_title(titel, fontsize=14, fontweight='bold', pad=15)
+    ax.axis('off')
+
+    plt.tight_layout()
+    plt.savefig(map_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close()
+    print(f"✓ Karte: {map_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    # Gemeinde-Geometrien aus "37. Reverse Geocoding der Koordinaten.py"
+    geocoder_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie\VG250"
+    # Dominante Topics aus "35. Aggregationswürfel bauen.py"
+    topics_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\topics.npz"
+    # Kreisgrenzen aus "36. Geometrie-Artefakt bauen.py"
+    geometrie_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
+    # Einwohner je Kreis (Spalten ags;einwohner), z.B. Destatis 12411-0015
+    einwohner_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\einwohner_kreise_2019.csv"
+    kreis_wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\kreis_wuerfel.npz"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Kreise"
+
+    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(os.path.dirname(kreis_wuerfel_datei), exist_ok=True)
+
+    print("=" * 70)
+    print("KREIS-AGGREGATION: KREIS × TAG × TOPIC")
+    print("=" * 70)
+
+    # 1. Geocoder und Tweets laden
+    print("\n[1/4] Lade Geocoder und Tweets...")
+    geocoder = ReverseGeocoder.laden(geocoder_dir)
+    tweets = load_tweets(input_file)
+    topics = lade_topics(topics_datei, tweets)
+
+    # 2. Kreise zuordnen und Würfel bauen
+    print("\n[2/4] Ordne Kreise zu und baue Würfel...")
+    start = time.perf_counter()
+    wuerfel = build_kreis_cube(tweets, topics, KreisZuordnung(geocoder))
+    wuerfel.speichern(kreis_wuerfel_datei)
+    print(f"✓ Würfel {wuerfel.werte.shape} gespeichert: {kreis_wuerfel_datei} "
+          f"({time.perf_counter() - start:.1f}s)")
+
+    # 3. Raten pro 100.000 Einwohner
+    print("\n[3/4] Berechne Raten pro 100.000 Einwohner...")
+    einwohner = lade_einwohner(einwohner_file)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    raten = wuerfel.pro_100k(einwohner)
+    raten.insert(0, 'Kreis', raten.index.map(geocoder.kreis_namen))
+    raten = raten.sort_values('Pro_100k', ascending=False)
+    csv_file = os.path.join(output_dir, f"kreise_pro_100k_{timestamp}.csv")
+    raten.to_csv(csv_file, encoding='utf-8-sig', index_label='AGS')
+    print(f"✓ CSV: {csv_file}")
+
+    topic_raten = wuerfel.pro_100k_nach(einwohner, 'topic', topic=list(SELECTED_TOPICS))
+    topic_raten.columns = [f"Topic {TOPIC_DISPLAY[t]}" for t in topic_raten.columns]
+    topic_csv = os.path.join(output_dir, f"kreise_topics_pro_100k_{timestamp}.csv")
+    topic_raten.to_csv(topic_csv, encoding='utf-8-sig', index_label='AGS')
+    print(f"✓ CSV: {topic_csv}")
+
+    # 4. Karten
+    print("\n[4/4] Erstelle Karten...")
+    kreise_gdf = lade_kreise(geometrie_dir, 'druck')
+
+    create_rate_map(kreise_gdf, raten, 'Pro_100k', 'Tweets pro 100.000 Einwohner nach Kreis',
+                    'Tweets pro 100.000 Einwohner',
+                    os.path.join(output_dir, f"kreise_pro_100k_{timestamp}.png"))
+
+    for topic_id, topic_label in SELECTED_TOPICS.items():
+        spalte = f"Topic {TOPIC_DISPLAY[topic_id]}"
+        create_rate_map(kreise_gdf, topic_raten[[spalte]], spalte,
+                        f"{spalte}: {topic_label} (pro 100.000 Einwohner)",
+                        'Tweets pro 100.000 Einwohner',
+                        os.path.join(output_dir, f"kreise_topic_{TOPIC_DISPLAY[topic_id]}_{timestamp}.png"))
+
+    print(f"\n{'=' * 70}")
+    print("KREIS-AGGREGATION ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import LogNorm
+from anreicherung import Merkmale, KEIN_TAG
+from aggregationswuerfel import TOPICS, lade_topics
+from reverse_geocoder import koordinaten
+from hexgitter import HexGitter
+from geometrie import lade_bundeslaender
+
+# Matplotlib auf Deutsch
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['axes.unicode_minus'] = False
+
+# Die 6 ausgewählten Topics (wie in 28-31)
+SELECTED_TOPICS = {
+    0: "Gesellschaftspolitische Reflexion",
+    2: "Soziale Distanzierung",
+    5: "Maskenpflicht",
+    6: "Wirtschaftliche Lage & Finanzielle Unterstützung",
+    9: "Hashtag-Kampagnen & Solidarität",
+    11: "Regionales Infektionsgeschehen"
+}
+
+TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
+
+# Auflösungsstufe für die Topic-Karten (Index in KANTEN_KM, 10 km)
+TOPIC_STUFE = 2
+
+
+def load_tweets(input_file):
+    """Lädt Tweets aus JSONL-Datei"""
+    print(f"Lade Tweets aus: {input_file}")
+    tweets = []
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num % 10000 == 0:
+                print(f"  {line_num} Zeilen gelesen...")
+
+            try:
+                tweets.append(json.loads(line.strip()))
+            except:
+                continue
+
+    print(f"✓ {len(tweets)} Tweets geladen\n")
+    return tweets
+
+
+def build_hex_grid(tweets, merkmale, topics):
+    """Kodiert Tag und Topic als Integer-Arrays und bint alle Koordinaten in allen Stufen"""
+    lon, lat = koordinaten(tweets)
+    print(f"✓ {int((~np.isnan(lon)).sum()):,} Tweets mit Koordinaten")
+
+    gueltig = merkmale.tag != KEIN_TAG
+    tage, tag_idx = np.unique(merkmale.tag[gueltig], return_inverse=True)
+    tag_codes = np.full(len(merkmale), -1, dtype=np.int64)
+    tag_codes[gueltig] = tag_idx
+
+    return HexGitter.bauen(lon, lat, tage.astype('datetime64[D]').astype(object),
+                           tag_codes, pd.Index(TOPICS).get_indexer(topics))
+
+
+def create_hex_map(stufe, werte, laender_gdf, titel, map_file):
+    """Dichtekarte der belegten Sechsecke (logarithmische Farbskala) über den Ländergrenzen"""
+    belegt = werte > 0
+    fig, ax = plt.subplots(1, 1, figsize=(12, 14))
+
+    laender_gdf.plot(ax=ax, color='whitesmoke', edgecolor='gray', linewidth=0.5)
+    if belegt.any():
+        polygone = PolyCollection(stufe.ecken()[belegt], array=werte[belegt], cmap='YlOrRd',
+                                  norm=LogNorm(vmin=1, vmax=max(int(werte.max()), 2)),
+                                  edgecolors='none', alpha=0.9)
+        ax.add_collection(polygone)
+        fig.colorbar(polygone, ax=ax, shrink=0.6, label='Tweets je Sechseck')
+
+    ax.set_title(titel, fontsize=14, fontweight='bold', pad=15)
+    ax.set_aspect(1 / np.cos(np.radians(51)))
+    ax.axis('off')
+
+    plt.tight_layout()
+    plt.savefig(map_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close()
+    print(f"✓ Karte: {map_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    # Merkmale je Tweet aus "07b. Datenanreicherung.py"
+    merkmale_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data_merkmale.npz"
+    # Dominante Topics aus "35. Aggregationswürfel bauen.py"
+    topics_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\topics.npz"
+    # Ländergrenzen aus "36. Geometrie-Artefakt bauen.py"
+    geometrie_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
+    hex_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\hexgitter.npz"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Hexkarten"
+
+    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(os.path.dirname(hex_datei), exist_ok=True)
+
+    print("=" * 70)
+    print("HEXAGONALE DICHTEKARTEN: SECHSECK × TAG × TOPIC")
+    print("=" * 70)
+
+    # 1. Tweets, Merkmale und Topics laden
+    print("\n[1/3] Lade Tweets, Merkmale und Topics...")
+    tweets = load_tweets(input_file)
+    merkmale = Merkmale.laden(merkmale_datei)
+    merkmale.pruefen(tweets)
+    topics = lade_topics(topics_datei, tweets)
+
+    # 2. Gitter in allen Auflösungen bauen
+    print("\n[2/3] Baue Hex-Gitter...")
+    start = time.perf_counter()
+    gitter = build_hex_grid(tweets, merkmale, topics)
+    gitter.speichern(hex_datei)
+    for stufe in gitter.stufen:
+        print(f"  {stufe.kante_km:>5.1f} km: {len(stufe):,} belegte Sechsecke")
+    print(f"✓ Gespeichert: {hex_datei} ({time.perf_counter() - start:.1f}s)")
+
+    # 3. Karten
+    print("\n[3/3] Erstelle Karten...")
+    laender_gdf = lade_bundeslaender(geometrie_dir, 'druck')
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    for stufe in gitter.stufen:
+        create_hex_map(stufe, stufe.summe(), laender_gdf,
+                       f"Tweets mit Koordinaten (Sechsecke mit {stufe.kante_km:g} km Kantenlänge)",
+                       os.path.join(output_dir, f"hex_{stufe.kante_km:g}km_{timestamp}.png"))
+
+    stufe = gitter[TOPIC_STUFE]
+    for topic_id, topic_label in SELECTED_TOPICS.items():
+        create_hex_map(stufe, stufe.summe(topic=topic_id), laender_gdf,
+                       f"Topic {TOPIC_DISPLAY[topic_id]}: {topic_label} ({stufe.kante_km:g} km)",
+                       os.path.join(output_dir, f"hex_topic_{TOPIC_DISPLAY[topic_id]}_{timestamp}.png"))
+
+    print(f"\n{'=' * 70}")
+    print("HEXAGONALE DICHTEKARTEN ERSTELLT!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import os
+import json
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from anreicherung import Merkmale, KEIN_TAG
+from aggregationswuerfel import lade_topics
+from reverse_geocoder import koordinaten, ReverseGeocoder
+from hotspots import hotspots, zusammenfassen
+from geometrie import lade_bundeslaender
+
+# Matplotlib auf Deutsch
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['axes.unicode_minus'] = False
+
+# Die 6 ausgewählten Topics (wie in 28-31)
+SELECTED_TOPICS = {
+    0: "Gesellschaftspolitische Reflexion",
+    2: "Soziale Distanzierung",
+    5: "Maskenpflicht",
+    6: "Wirtschaftliche Lage & Finanzielle Unterstützung",
+    9: "Hashtag-Kampagnen & Solidarität",
+    11: "Regionales Infektionsgeschehen"
+}
+
+TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
+
+# DBSCAN-Parameter: Radius (km) und Mindestanzahl Tweets im Radius
+EPS_KM = 2.0
+MIN_TWEETS_GESAMT = 30
+# Für einzelne Wochen bzw. Topics (deutlich weniger Tweets je Auswertung)
+MIN_TWEETS_TEILMENGE = 10
+
+# Beschriftete Hotspots in der Karte
+TOP_N_KARTE = 15
+
+
+def load_tweets(input_file):
+    """Lädt Tweets aus JSONL-Datei"""
+    print(f"Lade Tweets aus: {input_file}")
+    tweets = []
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num % 10000 == 0:
+                print(f"  {line_num} Zeilen gelesen...")
+
+            try:
+                tweets.append(json.loads(line.strip()))
+            except:
+                continue
+
+    print(f"✓ {len(tweets)} Tweets geladen\n")
+    return tweets
+
+
+def cluster_auswertung(lon, lat, tage, topics, maske, min_tweets, geocoder):
+    """DBSCAN für eine Teilmenge und Steckbriefe je Hotspot"""
+    labels = hotspots(lon[maske], lat[maske], EPS_KM, min_tweets)
+    # Anzeige-Nummern wie in 24-31 (Topic-ID + 1)
+    topic_namen = {t: f"Topic {t + 1}" for t in range(14)}
+    df = zusammenfassen(labels, lon[maske], lat[maske], tage[maske], topics[maske],
+                        topic_namen=topic_namen)
+
+    # Gemeinde und Kreis des Mittelpunkts (falls Gemeinde-Geometrien aus 37 vorhanden)
+    if geocoder is not None and len(df):
+        orte = geocoder.zuordnen(df['lon'].values, df['lat'].values)
+        df.insert(1, 'gemeinde', orte['gemeinde'].values)
+        df.insert(2, 'kreis', orte['kreis'].values)
+    return df, labels
+
+
+def create_hotspot_map(laender_gdf, df, titel, map_file):
+    """Hotspots als Kreise (Fläche ~ Anzahl Tweets) über den Ländergrenzen"""
+    fig, ax = plt.subplots(1, 1, figsize=(12, 14))
+    laender_gdf.plot(ax=ax, color='whitesmoke', edgecolor='gray', linewidth=0.5)
+
+    if len(df):
+        groesse = 2000 * df['anzahl'] / df['anzahl'].max()
+        ax.scatter(df['lon'], df['lat'], s=groesse, c='#d73027', alpha=0.6,
+                   edgecolors='darkred', linewidths=0.5, zorder=3)
+
+        beschriftung = 'gemeinde' if 'gemeinde' in df.columns else 'cluster'
+        for _, row in df.head(TOP_N_KARTE).iterrows():
+            ax.annotate(f"{row[beschriftung]} ({row['anzahl']:,})", (row['lon'], row['lat']),
+                        xytext=(6, 6), textcoords='offset points', fontsize=8, zorder=4,
+                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8, edgecolor='none'))
+
+    ax.set_title(titel, fontsize=14, fontweight='bold', pad=15)
+    ax.set_aspect(1 / np.cos(np.radians(51)))
+    ax.axis('off')
+
+    plt.tight_layout()
+    plt.savefig(map_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close()
+    print(f"✓ Karte: {map_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    # Merkmale je Tweet aus "07b. Datenanreicherung.py"
+    merkmale_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data_merkmale.npz"
+    # Dominante Topics aus "35. Aggregationswürfel bauen.py"
+    topics_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\topics.npz"
+    # Ländergrenzen aus "36. Geometrie-Artefakt bauen.py"
+    geometrie_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
+    # Optional: Gemeinde-Geometrien aus "37. Reverse Geocoding der Koordinaten.py"
+    geocoder_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie\VG250"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Hotspots"
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    print("=" * 70)
+    print("HOTSPOTS: DBSCAN ÜBER TWEET-KOORDINATEN")
+    print("=" * 70)
+
+    # 1. Daten laden
+    print("\n[1/3] Lade Tweets, Merkmale und Topics...")
+    tweets = load_tweets(input_file)
+    merkmale = Merkmale.laden(merkmale_datei)
+    merkmale.pruefen(tweets)
+    topics = lade_topics(topics_datei, tweets)
+
+    lon, lat = koordinaten(tweets)
+    tage = merkmale.tage()
+    mit_koordinaten = ~np.isnan(lon)
+    print(f"✓ {int(mit_koordinaten.sum()):,} Tweets mit Koordinaten")
+
+    geocoder = None
+    if os.path.exists(os.path.join(geocoder_dir, 'gemeinden.parquet')):
+        geocoder = ReverseGeocoder.laden(geocoder_dir)
+        print("✓ Gemeinde-Geometrien geladen")
+    else:
+        print("⚠ Keine Gemeinde-Geometrien gefunden - Hotspots ohne Ortsnamen")
+
+    # 2. Hotspots: gesamt, je Woche, je Topic
+    print("\n[2/3] Suche Hotspots...")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ergebnisse = []
+
+    start = time.perf_counter()
+    gesamt, _ = cluster_auswertung(lon, lat, tage, topics, mit_koordinaten, MIN_TWEETS_GESAMT, geocoder)
+    ergebnisse.append(gesamt.assign(fenster='Gesamt', topic='Alle'))
+    print(f"✓ Gesamt: {len(gesamt)} Hotspots ({time.perf_counter() - start:.1f}s)")
+
+    for beschriftung, von, bis in merkmale.wochen():
+        maske = mit_koordinaten & merkmale.maske(tag=(von, bis))
+        df, _ = cluster_auswertung(lon, lat, tage, topics, maske, MIN_TWEETS_TEILMENGE, geocoder)
+        ergebnisse.append(df.assign(fenster=beschriftung, topic='Alle'))
+        print(f"  {beschriftung}: {len(df)} Hotspots")
+
+    for topic_id in SELECTED_TOPICS:
+        maske = mit_koordinaten & (topics == topic_id) & (merkmale.tag != KEIN_TAG)
+        df, _ = cluster_auswertung(lon, lat, tage, topics, maske, MIN_TWEETS_TEILMENGE, geocoder)
+        ergebnisse.append(df.assign(fenster='Gesamt', topic=f"Topic {TOPIC_DISPLAY[topic_id]}"))
+        print(f"  Topic {TOPIC_DISPLAY[topic_id]}: {len(df)} Hotspots")
+
+    alle = pd.concat(ergebnisse, ignore_index=True)
+    spalten = ['fenster', 'topic'] + [spalte for spalte in alle.columns if spalte not in ('fenster', 'topic')]
+    csv_file = os.path.join(output_dir, f"hotspots_{timestamp}.csv")
+    alle[spalten].to_csv(csv_file, index=False, encoding='utf-8-sig')
+    print(f"✓ CSV: {csv_file}")
+
+    # 3. Karte der Hotspots im Gesamtzeitraum
+    print("\n[3/3] Erstelle Karte...")
+    laender_gdf = lade_bundeslaender(geometrie_dir, 'druck')
+    create_hotspot_map(laender_gdf, gesamt,
+                       f"Hotspots der COVID-19-Debatte (DBSCAN, {EPS_KM:g} km, mind. {MIN_TWEETS_GESAMT} Tweets)",
+                       os.path.join(output_dir, f"hotspots_{timestamp}.png"))
+
+    print(f"\n{'=' * 70}")
+    print("HOTSPOT-ANALYSE ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import os
+from datetime import datetime
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
+from regionen import BUNDESLAENDER, EINWOHNER_2020
+from aggregationswuerfel import Aggregationswuerfel, ANZAHL_TOPICS, HASHTAGS
+from kreise import KreisWuerfel, lade_einwohner, UNBEKANNT
+from raumstatistik import lade_gewichte, morans_i, lisa, NICHT_SIGNIFIKANT
+from geometrie import lade_bundeslaender, lade_kreise
+
+# Matplotlib auf Deutsch
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['axes.unicode_minus'] = False
+
+# Die 6 ausgewählten Topics (wie in 28-31)
+SELECTED_TOPICS = {
+    0: "Gesellschaftspolitische Reflexion",
+    2: "Soziale Distanzierung",
+    5: "Maskenpflicht",
+    6: "Wirtschaftliche Lage & Finanzielle Unterstützung",
+    9: "Hashtag-Kampagnen & Solidarität",
+    11: "Regionales Infektionsgeschehen"
+}
+
+TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
+
+# Kreise mit weniger Tweets (mit Topic) bleiben bei Anteilen außen vor (zu unsicher)
+MIN_TWEETS_KREIS = 20
+
+# Farben der LISA-Cluster (wie in GeoDa)
+LISA_FARBEN = {
+    'High-High': '#d7191c',
+    'Low-Low': '#2c7bb6',
+    'Low-High': '#abd9e9',
+    'High-Low': '#fdae61',
+    NICHT_SIGNIFIKANT: '#eeeeee'
+}
+
+
+def bundesland_masse(wuerfel):
+    """Kennzahlen je Bundesland aus dem Würfel (35): Rate, Topic- und Hashtag-Anteile"""
+    masse = {}
+
+    tweets = wuerfel.summe(nach=('bundesland',), bundesland=BUNDESLAENDER)
+    masse['Tweets pro 100.000 Einwohner'] = tweets / pd.Series(EINWOHNER_2020) * 100_000
+
+    counts = wuerfel.summe(nach=('bundesland', 'topic'), bundesland=BUNDESLAENDER,
+                           topic=list(range(ANZAHL_TOPICS))).unstack()
+    for topic_id in SELECTED_TOPICS:
+        masse[f"Anteil Topic {TOPIC_DISPLAY[topic_id]} (%)"] = counts[topic_id] / counts.sum(axis=1) * 100
+
+    hashtags = wuerfel.summe(nach=('bundesland', 'hashtag'), hashtags=True, bundesland=BUNDESLAENDER).unstack()
+    for hashtag in HASHTAGS:
+        masse[f"#{hashtag} je 1.000 Tweets"] = hashtags[hashtag] / tweets * 1000
+
+    return masse
+
+
+def kreis_masse(kreis_wuerfel, einwohner):
+    """Kennzahlen je Kreis aus dem Kreis-Würfel (38): Rate und Topic-Anteile"""
+    # Kreise ohne Tweets fehlen im Würfel, haben aber die Rate 0
+    raten = kreis_wuerfel.pro_100k(einwohner)['Pro_100k'].reindex(einwohner.index).fillna(0)
+    masse = {'Tweets pro 100.000 Einwohner': raten}
+
+    counts = kreis_wuerfel.summe(nach=('kreis', 'topic'), topic=list(range(ANZAHL_TOPICS))).unstack()
+    counts = counts.drop(UNBEKANNT, errors='ignore')
+    gesamt = counts.sum(axis=1)
+    for topic_id in SELECTED_TOPICS:
+        anteil = counts[topic_id] / gesamt * 100
+        masse[f"Anteil Topic {TOPIC_DISPLAY[topic_id]} (%)"] = anteil.where(gesamt >= MIN_TWEETS_KREIS)
+
+    return masse
+
+
+def auswerten(ebene, masse, gewichte):
+    """Moran's I und LISA für alle Kennzahlen einer Ebene"""
+    global_rows = []
+    lokal = {}
+
+    for name, werte in masse.items():
+        ergebnis = morans_i(werte, gewichte, seed=42)
+        global_rows.append({'Ebene': ebene, 'Kennzahl': name, **ergebnis})
+        lokal[name] = lisa(werte, gewichte, seed=42)
+
+        signifikant = '✓' if ergebnis['p_sim'] <= 0.05 else ' '
+        print(f"  {signifikant} {name:<40} I = {ergebnis['I']:>6.3f}  p = {ergebnis['p_sim']:.4f}  (n = {ergebnis['n']})")
+
+    return global_rows, lokal
+
+
+def create_lisa_map(gdf, id_spalte, lisa_df, titel, map_file):
+    """LISA-Clusterkarte (High-High, Low-Low, Ausreißer, nicht signifikant)"""
+    gdf = gdf.merge(lisa_df[['cluster']], left_on=id_spalte, right_index=True, how='left')
+    gdf['cluster'] = gdf['cluster'].fillna(NICHT_SIGNIFIKANT)
+
+    fig, ax = plt.subplots(1, 1, figsize=(12, 14))
+    gdf.plot(color=gdf['cluster'].map(LISA_FARBEN), linewidth=0.2, edgecolor='gray', ax=ax)
+
+    legende = [Patch(facecolor=farbe, edgecolor='gray', label=f"{cluster} ({int((gdf['cluster'] == cluster).sum())})")
+               for cluster, farbe in LISA_FARBEN.items()]
+    ax.legend(handles=legende, loc='upper left', fontsize=10, framealpha=0.9)
+    ax.set_title(titel, fontsize=14, fontweight='bold', pad=15)
+    ax.axis('off')
+
+    plt.tight_layout()
+    plt.savefig(map_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close()
+    print(f"✓ Karte: {map_file}")
+
+
+def lisa_tabelle(lokal):
+    """Cluster und p-Wert je Region und Kennzahl nebeneinander"""
+    return pd.concat({name: df[['wert', 'p_sim', 'cluster']] for name, df in lokal.items()}, axis=1)
+
+
+def main():
+    # An eigene Pfade anpassen!
+    # Würfel aus "35. Aggregationswürfel bauen.py" und "38. Kreis-Aggregation pro 100.000 Einwohner.py"
+    wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\wuerfel.npz"
+    kreis_wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\kreis_wuerfel.npz"
+    einwohner_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\einwohner_kreise_2019.csv"
+    # Geometrie-Artefakt aus "36. Geometrie-Artefakt bauen.py" (Nachbarschaften werden daneben gespeichert)
+    geometrie_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Geometrie"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Raumstatistik"
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    print("=" * 70)
+    print("RÄUMLICHE AUTOKORRELATION: MORAN'S I UND LISA")
+    print("=" * 70)
+
+    # 1. Bundesländer
+    print("\n[1/3] Bundesländer...")
+    wuerfel = Aggregationswuerfel.laden(wuerfel_datei)
+    gewichte_laender = lade_gewichte(geometrie_dir, 'bundeslaender')
+    global_laender, lokal_laender = auswerten('Bundesland', bundesland_masse(wuerfel), gewichte_laender)
+
+    # 2. Kreise
+    print("\n[2/3] Kreise...")
+    kreis_wuerfel = KreisWuerfel.laden(kreis_wuerfel_datei)
+    gewichte_kreise = lade_gewichte(geometrie_dir, 'kreise')
+    print(f"✓ {len(gewichte_kreise)} Kreise, im Mittel {gewichte_kreise.anzahl_nachbarn.mean():.1f} Nachbarn")
+    global_kreise, lokal_kreise = auswerten('Kreis', kreis_masse(kreis_wuerfel, lade_einwohner(einwohner_file)),
+                                            gewichte_kreise)
+
+    # 3. Export
+    print("\n[3/3] Exportiere Ergebnisse...")
+    global_df = pd.DataFrame(global_laender + global_kreise)
+    global_csv = os.path.join(output_dir, f"morans_i_{timestamp}.csv")
+    global_df.to_csv(global_csv, index=False, encoding='utf-8-sig')
+    print(f"✓ CSV: {global_csv}")
+
+    for ebene, lokal in [('bundeslaender', lokal_laender), ('kreise', lokal_kreise)]:
+        lisa_csv = os.path.join(output_dir, f"lisa_{ebene}_{timestamp}.csv")
+        lisa_tabelle(lokal).to_csv(lisa_csv, encoding='utf-8-sig')
+        print(f"✓ CSV: {lisa_csv}")
+
+    create_lisa_map(lade_bundeslaender(geometrie_dir, 'druck'), 'name',
+                    lokal_laender['Tweets pro 100.000 Einwohner'],
+                    'LISA-Cluster: Tweets pro 100.000 Einwohner (Bundesländer)',
+                    os.path.join(output_dir, f"lisa_bundeslaender_rate_{timestamp}.png"))
+
+    kreise_gdf = lade_kreise(geometrie_dir, 'druck')
+    for i, (name, lisa_df) in enumerate(lokal_kreise.items()):
+        create_lisa_map(kreise_gdf, 'ags', lisa_df, f"LISA-Cluster: {name} (Kreise)",
+                        os.path.join(output_dir, f"lisa_kreise_{i + 1:02d}_{timestamp}.png"))
+
+    print(f"\n{'=' * 70}")
+    print("RÄUMLICHE AUTOKORRELATION ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
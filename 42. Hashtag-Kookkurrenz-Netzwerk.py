@@ -0,0 +1,171 @@
+import os
+import time
+from datetime import datetime
+import pandas as pd
+import matplotlib.pyplot as plt
+from regionen import BUNDESLAENDER, OST_BUNDESLAENDER
+from anreicherung import Merkmale
+from hashtag_graph import HashtagGraph, hashtag_form
+from hashtag_kategorien import KATEGORISIERER
+
+# Matplotlib auf Deutsch
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['axes.unicode_minus'] = False
+
+# Partner je Trend-Hashtag und Teilmenge
+TOP_PARTNER = 15
+
+# Häufigste Hashtags in der NPMI-Heatmap bzw. in der Gemeinschaftssuche
+HEATMAP_HASHTAGS = 30
+GEMEINSCHAFT_HASHTAGS = 2000
+
+
+def lade_graph(input_file, graph_datei):
+    """Hashtag-Graph laden bzw. beim ersten Lauf bauen und speichern"""
+    if os.path.exists(graph_datei):
+        graph = HashtagGraph.laden(graph_datei)
+        print(f"✓ Graph geladen: {graph_datei} ({len(graph):,} Hashtags)")
+        return graph
+
+    start = time.perf_counter()
+    graph = HashtagGraph.bauen(input_file)
+    graph.speichern(graph_datei)
+    print(f"✓ Graph gespeichert: {graph_datei} ({time.perf_counter() - start:.1f}s)")
+    return graph
+
+
+def partner_tabelle(graph, trend_hashtags, teilmengen):
+    """Top-Partner (NPMI) je Trend-Hashtag für jede Teilmenge als lange Tabelle"""
+    tabellen = []
+    for name, maske in teilmengen:
+        for hashtag in trend_hashtags:
+            df = graph.top_assoziiert(hashtag, TOP_PARTNER, maske=maske)
+            df.insert(0, 'Trend-Hashtag', f"#{hashtag}")
+            df.insert(0, 'Teilmenge', name)
+            tabellen.append(df)
+    return pd.concat(tabellen, ignore_index=True)
+
+
+def create_npmi_heatmap(graph, n, output_file):
+    """NPMI-Heatmap der n häufigsten Hashtags"""
+    hashtags = graph.haeufigkeit().index[:n]
+    npmi = graph.npmi_matrix(hashtags)
+
+    fig, ax = plt.subplots(figsize=(14, 12))
+    bild = ax.imshow(npmi.to_numpy(), cmap='RdBu_r', vmin=-1, vmax=1)
+    ax.set_xticks(range(len(hashtags)))
+    ax.set_yticks(range(len(hashtags)))
+    ax.set_xticklabels([f"#{h}" for h in hashtags], rotation=90, fontsize=9)
+    ax.set_yticklabels([f"#{h}" for h in hashtags], fontsize=9)
+
+    fig.colorbar(bild, ax=ax, shrink=0.8, label='Normalisierte PMI')
+    ax.set_title(f'Gemeinsames Auftreten der {n} häufigsten Hashtags (NPMI)',
+                 fontsize=14, fontweight='bold', pad=15)
+
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close()
+    print(f"✓ Heatmap: {output_file}")
+
+
+def write_report(graph, paare, gemeinschaften, output_file, top_n=20):
+    """TXT-Bericht: stärkste Paare und größte Hashtag-Gemeinschaften"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 70 + "\n")
+        f.write("HASHTAG-KOOKKURRENZ-NETZWERK\n")
+        f.write("=" * 70 + "\n\n")
+        f.write(f"Tweets mit Hashtag: {graph.tweets():,}\n")
+        f.write(f"Hashtags (im Graph): {len(graph):,}\n\n")
+
+        f.write(f"STÄRKSTE PAARE (NPMI, TOP {len(paare)})\n")
+        f.write("-" * 70 + "\n")
+        for _, row in paare.iterrows():
+            f.write(f"  #{row['hashtag_a']:<25} #{row['hashtag_b']:<25} "
+                    f"NPMI {row['npmi']:.3f}  ({row['gemeinsam']:,} Tweets)\n")
+
+        f.write(f"\nGRÖSSTE GEMEINSCHAFTEN (Label Propagation, TOP {top_n})\n")
+        f.write("-" * 70 + "\n")
+        verbunden = gemeinschaften[gemeinschaften['gemeinschaft'] >= 0]
+        for nummer, gruppe in list(verbunden.groupby('gemeinschaft'))[:top_n]:
+            mitglieder = ', '.join(f"#{h}" for h in gruppe['hashtag'].head(12))
+            f.write(f"\n  Gemeinschaft {nummer + 1} ({len(gruppe)} Hashtags, "
+                    f"{int(gruppe['tweets'].sum()):,} Vorkommen)\n")
+            f.write(f"    {mitglieder}\n")
+
+    print(f"✓ Bericht: {output_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    # Merkmale je Tweet aus "07b. Datenanreicherung.py"
+    merkmale_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data_merkmale.npz"
+    # Wird beim ersten Lauf gebaut (Tweet × Hashtag, dünn besetzt)
+    graph_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Hashtags\hashtag_graph.npz"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Hashtags\Netzwerk"
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    print("=" * 70)
+    print("HASHTAG-KOOKKURRENZ-NETZWERK")
+    print("=" * 70)
+
+    # 1. Graph und Merkmale
+    print("\n[1/4] Lade Hashtag-Graph und Merkmale...")
+    graph = lade_graph(input_file, graph_datei)
+    merkmale = Merkmale.laden(merkmale_datei)
+    graph.pruefen(merkmale)
+    # Trend-Hashtags in ihrer Grundform (Schreibvarianten sind eigene Knoten im Graph)
+    trend_hashtags = [hashtag_form(hashtag) for hashtag in KATEGORISIERER.hashtags()]
+
+    # 2. Partner der Trend-Hashtags nach Raum und Stadt/Land
+    print("\n[2/4] Partner der Trend-Hashtags...")
+    west = [bl for bl in BUNDESLAENDER if bl not in OST_BUNDESLAENDER]
+    teilmengen = [
+        ('Gesamt', None),
+        ('Urban', merkmale.maske(urban='Urban')),
+        ('Rural', merkmale.maske(urban='Rural')),
+        ('Ost', merkmale.maske(bundesland=OST_BUNDESLAENDER)),
+        ('West', merkmale.maske(bundesland=west))
+    ] + [(bl, merkmale.maske(bundesland=bl)) for bl in BUNDESLAENDER]
+
+    partner = partner_tabelle(graph, trend_hashtags, teilmengen)
+    partner_csv = os.path.join(output_dir, f"trend_partner_{timestamp}.csv")
+    partner.to_csv(partner_csv, index=False, encoding='utf-8-sig')
+    print(f"✓ CSV: {partner_csv}")
+
+    for hashtag in trend_hashtags:
+        top = graph.top_assoziiert(hashtag, 5)
+        print(f"  #{hashtag:<20} → {', '.join('#' + h for h in top['hashtag'])}")
+
+    # 3. Partner je Kalenderwoche
+    print("\n[3/4] Partner je Kalenderwoche...")
+    wochen_liste = merkmale.wochen()
+    woche_partner = partner_tabelle(graph, trend_hashtags,
+                                    [(name, merkmale.maske(tag=(von, bis))) for name, von, bis in wochen_liste])
+    woche_csv = os.path.join(output_dir, f"trend_partner_wochen_{timestamp}.csv")
+    woche_partner.to_csv(woche_csv, index=False, encoding='utf-8-sig')
+    print(f"✓ {len(wochen_liste)} Wochen, CSV: {woche_csv}")
+
+    # 4. Paare, Gemeinschaften, Heatmap
+    print("\n[4/4] Paare und Gemeinschaften...")
+    paare = graph.paare(50)
+    gemeinschaften = graph.gemeinschaften(GEMEINSCHAFT_HASHTAGS, seed=42)
+    anzahl = gemeinschaften.loc[gemeinschaften['gemeinschaft'] >= 0, 'gemeinschaft'].nunique()
+    print(f"✓ {anzahl} Gemeinschaften unter den {GEMEINSCHAFT_HASHTAGS} häufigsten Hashtags")
+
+    gemeinschaften_csv = os.path.join(output_dir, f"gemeinschaften_{timestamp}.csv")
+    gemeinschaften.to_csv(gemeinschaften_csv, index=False, encoding='utf-8-sig')
+    print(f"✓ CSV: {gemeinschaften_csv}")
+
+    write_report(graph, paare, gemeinschaften, os.path.join(output_dir, f"netzwerk_{timestamp}.txt"))
+    create_npmi_heatmap(graph, HEATMAP_HASHTAGS, os.path.join(output_dir, f"npmi_heatmap_{timestamp}.png"))
+
+    print(f"\n{'=' * 70}")
+    print("NETZWERK-ANALYSE ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import os
+import json
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from regionen import BUNDESLAENDER, OST_BUNDESLAENDER
+from aggregationswuerfel import REGIONEN, URBAN_RURAL
+from anreicherung import Merkmale
+from gruppen_topk import GruppenTopK
+from hashtag_graph import hashtag_form
+import keyness
+
+# Matplotlib auf Deutsch
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['axes.unicode_minus'] = False
+
+# Emoji-Modifier, die gefiltert werden sollen (wie in 19-21)
+EMOJI_MODIFIERS = {
+    '🏻', '🏼', '🏽', '🏾', '🏿',
+    '♂', '♀', '⚧',
+    '️', '\ufe0f'
+}
+
+# Signifikanzschwelle und Länge der Listen je Richtung
+P_MAX = 0.001
+TOP_N = 15
+CSV_TOP_N = 200
+
+
+def load_tweets(input_file):
+    """Lädt Tweets aus JSONL-Datei"""
+    print(f"Lade Tweets aus: {input_file}")
+    tweets = []
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if line_num % 100000 == 0:
+                print(f"  {line_num:,} Zeilen gelesen...")
+
+            try:
+                tweets.append(json.loads(line.strip()))
+            except:
+                continue
+
+    print(f"✓ {len(tweets):,} Tweets geladen\n")
+    return tweets
+
+
+def zaehlen(tweets, merkmale):
+    """
+    Ein Durchlauf: Tokens, Hashtags und Emojis je (Bundesland, Stadt/Land).
+    Bundesländer, Ost/West und Stadt/Land werden daraus per zusammenfassen() abgeleitet.
+    """
+    zaehlungen = {'Tokens': GruppenTopK(), 'Hashtags': GruppenTopK(), 'Emojis': GruppenTopK()}
+
+    for i, tweet in enumerate(tweets):
+        gruppe = (REGIONEN[merkmale.bundesland[i]], URBAN_RURAL[merkmale.urban[i]])
+        entities = tweet.get('entities', {})
+
+        zaehlungen['Tokens'].hinzufuegen(gruppe, tweet.get('tokens', []))
+        zaehlungen['Hashtags'].hinzufuegen(gruppe, [hashtag_form(h) for h in entities.get('hashtags', [])])
+        zaehlungen['Emojis'].hinzufuegen(gruppe, [e for e in entities.get('emojis', []) if e not in EMOJI_MODIFIERS])
+
+    for art, zaehlung in zaehlungen.items():
+        print(f"✓ {art}: {int(zaehlung.summen().sum()):,} Vorkommen, {len(zaehlung.items):,} verschiedene")
+    return zaehlungen
+
+
+def gruppierungen(zaehlung):
+    """Bundesland, Ost/West und Stadt/Land aus der (Bundesland, Stadt/Land)-Zählung"""
+    return {
+        'Bundesland': zaehlung.zusammenfassen(lambda g: g[0] if g[0] in BUNDESLAENDER else None, BUNDESLAENDER),
+        'Ost/West': zaehlung.zusammenfassen(
+            lambda g: None if g[0] not in BUNDESLAENDER else ('Ost' if g[0] in OST_BUNDESLAENDER else 'West'),
+            ['Ost', 'West']),
+        'Stadt/Land': zaehlung.zusammenfassen(lambda g: g[1], ['Urban', 'Rural'])
+    }
+
+
+def format_zeile(row):
+    return (f"  {str(row['item']):<28} {row['anzahl']:>9,} {row['anzahl_ref']:>9,} "
+            f"{row['g2']:>10.1f}  {row['log_ratio']:>+6.2f} [{row['ki_unten']:+.2f}, {row['ki_oben']:+.2f}]\n")
+
+
+def write_vergleich(f, titel, name_a, name_b, ergebnis):
+    """Abschnitt im TXT-Bericht: typische Items beider Seiten eines Vergleichs"""
+    f.write(f"\n{titel}\n")
+    f.write("-" * 70 + "\n")
+    kopf = f"  {'Item':<28} {'Anzahl':>9} {'Referenz':>9} {'G²':>10}  {'Log-Ratio [95%-KI]'}\n"
+
+    for name, richtung in [(name_a, 1), (name_b, -1)]:
+        treffer = keyness.top(ergebnis, TOP_N, P_MAX, richtung)
+        f.write(f"\n Typisch für {name} ({len(treffer)} signifikant, p < {P_MAX}):\n")
+        f.write(kopf)
+        for _, row in treffer.iterrows():
+            f.write(format_zeile(row))
+
+
+def create_log_ratio_plot(ergebnis, name_a, name_b, art, output_file):
+    """Log-Ratio mit Konfidenzintervall für die typischsten Items beider Seiten"""
+    oben = keyness.top(ergebnis, TOP_N, P_MAX, 1)
+    unten = keyness.top(ergebnis, TOP_N, P_MAX, -1)
+    daten = pd.concat([unten.iloc[::-1], oben.iloc[::-1]], ignore_index=True)
+    if len(daten) == 0:
+        print(f"⚠ Keine signifikanten {art} für {name_a} vs. {name_b}")
+        return
+
+    fig, ax = plt.subplots(figsize=(12, max(6, len(daten) * 0.3)))
+    farben = np.where(daten['log_ratio'] > 0, '#e74c3c', '#3498db')
+    y = np.arange(len(daten))
+    ax.barh(y, daten['log_ratio'], color=farben, alpha=0.8)
+    ax.errorbar(daten['log_ratio'], y,
+                xerr=[daten['log_ratio'] - daten['ki_unten'], daten['ki_oben'] - daten['log_ratio']],
+                fmt='none', ecolor='black', elinewidth=1, capsize=3)
+    ax.set_yticks(y)
+    ax.set_yticklabels(daten['item'].astype(str), fontsize=10)
+    ax.axvline(0, color='black', linewidth=0.8)
+
+    ax.set_xlabel(f'Log-Ratio (log2, 95%-KI)   ← {name_b}  |  {name_a} →', fontsize=12)
+    ax.set_title(f'Typische {art}: {name_a} vs. {name_b} (G², p < {P_MAX})',
+                 fontsize=14, fontweight='bold', pad=15)
+    ax.grid(axis='x', alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close()
+    print(f"✓ Diagramm: {output_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    # Merkmale je Tweet aus "07b. Datenanreicherung.py"
+    merkmale_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data_merkmale.npz"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Keyness"
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    print("=" * 70)
+    print("KEYNESS: STADT/LAND, OST/WEST, BUNDESLÄNDER")
+    print("=" * 70)
+
+    # 1. Tweets und Merkmale
+    print("\n[1/4] Lade Tweets und Merkmale...")
+    tweets = load_tweets(input_file)
+    merkmale = Merkmale.laden(merkmale_datei)
+    merkmale.pruefen(tweets)
+
+    # 2. Zählmatrizen
+    print("\n[2/4] Zähle Tokens, Hashtags und Emojis...")
+    zaehlungen = zaehlen(tweets, merkmale)
+    del tweets
+
+    # 3. Keyness je Vergleich
+    print("\n[3/4] Berechne Keyness (G², Log-Ratio, Chi²)...")
+    vergleiche = {}
+    bundeslaender = {}
+    for art, zaehlung in zaehlungen.items():
+        gruppen = gruppierungen(zaehlung)
+        vergleiche[(art, 'Urban', 'Rural')] = keyness.vergleich(gruppen['Stadt/Land'], 'Urban', 'Rural')
+        vergleiche[(art, 'Ost', 'West')] = keyness.vergleich(gruppen['Ost/West'], 'Ost', 'West')
+        bundeslaender[art] = keyness.gegen_rest(gruppen['Bundesland'])
+        print(f"✓ {art}: {len(bundeslaender[art]):,} Bundesland-Item-Paare bewertet")
+
+    # 4. Ausgabe
+    print("\n[4/4] Schreibe Ergebnisse...")
+    for (art, name_a, name_b), ergebnis in vergleiche.items():
+        csv_datei = os.path.join(output_dir, f"keyness_{art.lower()}_{name_a.lower()}_{name_b.lower()}_{timestamp}.csv")
+        pd.concat([keyness.top(ergebnis, CSV_TOP_N, P_MAX, 1),
+                   keyness.top(ergebnis, CSV_TOP_N, P_MAX, -1)]).to_csv(csv_datei, index=False, encoding='utf-8-sig')
+        print(f"✓ CSV: {csv_datei}")
+        create_log_ratio_plot(ergebnis, name_a, name_b, art, os.path.join(
+            output_dir, f"keyness_{art.lower()}_{name_a.lower()}_{name_b.lower()}_{timestamp}.png"))
+
+    for art, ergebnis in bundeslaender.items():
+        csv_datei = os.path.join(output_dir, f"keyness_{art.lower()}_bundeslaender_{timestamp}.csv")
+        keyness.top(ergebnis, CSV_TOP_N, P_MAX, 1).to_csv(csv_datei, index=False, encoding='utf-8-sig')
+        print(f"✓ CSV: {csv_datei}")
+
+    txt_file = os.path.join(output_dir, f"keyness_{timestamp}.txt")
+    with open(txt_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 70 + "\n")
+        f.write("KEYNESS-ANALYSE\n")
+        f.write("=" * 70 + "\n\n")
+        f.write(f"Analysezeitpunkt: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Signifikanz: G² mit p < {P_MAX}; Log-Ratio = log2 der relativen Häufigkeiten\n")
+        f.write("(+1 = doppelt so häufig wie in der Referenz), Intervall = 95%-Konfidenzintervall\n")
+
+        for (art, name_a, name_b), ergebnis in vergleiche.items():
+            write_vergleich(f, f"{art.upper()}: {name_a.upper()} VS. {name_b.upper()}", name_a, name_b, ergebnis)
+
+        for art, ergebnis in bundeslaender.items():
+            f.write(f"\n\n{'=' * 70}\n{art.upper()}: JEDES BUNDESLAND GEGEN DEN REST\n{'=' * 70}\n")
+            typisch = keyness.top(ergebnis, 10, P_MAX, 1)
+            for bundesland in BUNDESLAENDER:
+                treffer = typisch[typisch['gruppe'] == bundesland]
+                f.write(f"\n {bundesland}:\n")
+                if len(treffer) == 0:
+                    f.write("  Keine signifikanten Items\n")
+                for _, row in treffer.iterrows():
+                    f.write(format_zeile(row))
+
+    print(f"✓ Bericht: {txt_file}")
+
+    print(f"\n{'=' * 70}")
+    print("KEYNESS-ANALYSE ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import os
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from regionen import BUNDESLAENDER, OST_BUNDESLAENDER
+from anreicherung import Merkmale
+from mention_netzwerk import MentionNetzwerk
+
+# Matplotlib auf Deutsch
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['axes.unicode_minus'] = False
+
+# Konten je Ranking bzw. Teilmenge
+TOP_GESAMT = 30
+TOP_TEILMENGE = 10
+
+# Meisterwähnte Konten in der Reichweiten-Heatmap
+HEATMAP_KONTEN = 20
+
+
+def lade_netzwerk(input_file, netzwerk_datei):
+    """Mention-Netzwerk laden bzw. beim ersten Lauf bauen und speichern"""
+    if os.path.exists(netzwerk_datei):
+        netzwerk = MentionNetzwerk.laden(netzwerk_datei)
+        print(f"✓ Netzwerk geladen: {netzwerk_datei} ({len(netzwerk):,} Konten)")
+        return netzwerk
+
+    start = time.perf_counter()
+    netzwerk = MentionNetzwerk.bauen(input_file)
+    netzwerk.speichern(netzwerk_datei)
+    print(f"✓ Netzwerk gespeichert: {netzwerk_datei} ({time.perf_counter() - start:.1f}s)")
+    return netzwerk
+
+
+def ranking_tabelle(netzwerk, teilmengen, n):
+    """Top-Konten (nutzer-normierter In-Grad) je Teilmenge als lange Tabelle"""
+    tabellen = []
+    for name, maske in teilmengen:
+        df = netzwerk.ranking(n, maske=maske)
+        df.insert(0, 'Rang', np.arange(1, len(df) + 1))
+        df.insert(0, 'Teilmenge', name)
+        tabellen.append(df)
+    return pd.concat(tabellen, ignore_index=True)
+
+
+def create_reach_heatmap(anteil, output_file):
+    """Heatmap: Anteil der aktiven Nutzer je Bundesland, die das Konto erwähnen"""
+    fig, ax = plt.subplots(figsize=(16, 10))
+    bild = ax.imshow(anteil.to_numpy(dtype=np.float64), cmap='YlOrRd', aspect='auto')
+    ax.set_xticks(range(len(anteil.columns)))
+    ax.set_yticks(range(len(anteil.index)))
+    ax.set_xticklabels([f"@{k}" for k in anteil.columns], rotation=60, ha='right', fontsize=10)
+    ax.set_yticklabels(anteil.index, fontsize=10)
+
+    fig.colorbar(bild, ax=ax, shrink=0.8, label='Anteil der aktiven Nutzer (%)')
+    ax.set_title(f'Regionale Reichweite der {len(anteil.columns)} meisterwähnten Konten',
+                 fontsize=14, fontweight='bold', pad=15)
+
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close()
+    print(f"✓ Heatmap: {output_file}")
+
+
+def write_report(netzwerk, gesamt, regionen, anteil, bundeslaender, output_file):
+    """TXT-Bericht: Gesamtranking, Top-Konten je Bundesland, Reichweite"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 70 + "\n")
+        f.write("MENTION-NETZWERK\n")
+        f.write("=" * 70 + "\n\n")
+        f.write(f"Tweets: {len(netzwerk.tweet_ids):,}\n")
+        f.write(f"Nutzer: {netzwerk.n_nutzer:,}\n")
+        f.write(f"Konten (im Netzwerk): {len(netzwerk):,}\n")
+        f.write(f"Erwähnungen: {netzwerk.inzidenz.nnz:,}\n\n")
+
+        f.write(f"TOP {len(gesamt)} KONTEN (NUTZER-NORMIERTER IN-GRAD)\n")
+        f.write("-" * 70 + "\n")
+        f.write("Gewicht: jeder erwähnende Nutzer verteilt 1 anteilig auf die von ihm erwähnten Konten\n")
+        f.write("(Anteil in %; Vielschreiber zählen nicht mehrfach)\n\n")
+        f.write(f"  {'Konto':<28} {'Gewicht':>9} {'Nutzer':>9} {'Erwähnungen':>12} {'Länder':>7}\n")
+        for _, row in gesamt.iterrows():
+            f.write(f"  @{row['konto']:<27} {row['gewicht'] * 100:>8.2f}% {row['nutzer']:>9,} "
+                    f"{row['erwaehnungen']:>12,} {bundeslaender.get(row['konto'], 0):>7}\n")
+
+        f.write(f"\nTOP-KONTEN JE TEILMENGE (GEWICHT, TOP {TOP_TEILMENGE})\n")
+        f.write("-" * 70 + "\n")
+        for name, gruppe in regionen.groupby('Teilmenge', sort=False):
+            konten = ', '.join(f"@{k}" for k in gruppe['konto'].head(5))
+            f.write(f"  {name:<24} {konten}\n")
+
+        f.write("\nREICHWEITE (ANTEIL AKTIVER NUTZER IN %, TOP 5 KONTEN)\n")
+        f.write("-" * 70 + "\n")
+        for bundesland, zeile in anteil.iterrows():
+            top = zeile.sort_values(ascending=False).head(5)
+            f.write(f"  {bundesland:<24} " + ', '.join(f"@{k} {v:.1f}%" for k, v in top.items()) + "\n")
+
+    print(f"✓ Bericht: {output_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    input_file = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data.jsonl"
+    # Merkmale je Tweet aus "07b. Datenanreicherung.py"
+    merkmale_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Cleaned_Data_merkmale.npz"
+    # Wird beim ersten Lauf gebaut (Tweet × Konto, dünn besetzt)
+    netzwerk_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Mentions\mention_netzwerk.npz"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Mentions"
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    print("=" * 70)
+    print("MENTION-NETZWERK")
+    print("=" * 70)
+
+    # 1. Netzwerk und Merkmale
+    print("\n[1/4] Lade Mention-Netzwerk und Merkmale...")
+    netzwerk = lade_netzwerk(input_file, netzwerk_datei)
+    merkmale = Merkmale.laden(merkmale_datei)
+    netzwerk.pruefen(merkmale)
+
+    # 2. Rankings gesamt und nach Raum
+    print("\n[2/4] Gewichteter und einfacher In-Grad...")
+    gesamt = netzwerk.ranking(TOP_GESAMT)
+    for _, row in gesamt.head(10).iterrows():
+        print(f"  @{row['konto']:<25} Gewicht {row['gewicht']:.2%}  ({row['nutzer']:,} Nutzer)")
+
+    west = [bl for bl in BUNDESLAENDER if bl not in OST_BUNDESLAENDER]
+    teilmengen = [
+        ('Urban', merkmale.maske(urban='Urban')),
+        ('Rural', merkmale.maske(urban='Rural')),
+        ('Ost', merkmale.maske(bundesland=OST_BUNDESLAENDER)),
+        ('West', merkmale.maske(bundesland=west))
+    ] + [(bl, merkmale.maske(bundesland=bl)) for bl in BUNDESLAENDER]
+    regionen = ranking_tabelle(netzwerk, teilmengen, TOP_TEILMENGE)
+
+    gesamt_csv = os.path.join(output_dir, f"konten_gesamt_{timestamp}.csv")
+    gesamt.to_csv(gesamt_csv, index=False, encoding='utf-8-sig')
+    regionen_csv = os.path.join(output_dir, f"konten_regionen_{timestamp}.csv")
+    regionen.to_csv(regionen_csv, index=False, encoding='utf-8-sig')
+    print(f"✓ CSV: {gesamt_csv}")
+    print(f"✓ CSV: {regionen_csv}")
+
+    # 3. Rankings je Kalenderwoche
+    print("\n[3/4] Rankings je Kalenderwoche...")
+    wochen_liste = merkmale.wochen()
+    woche_ranking = ranking_tabelle(netzwerk, [(name, merkmale.maske(tag=(von, bis)))
+                                               for name, von, bis in wochen_liste], TOP_TEILMENGE)
+    woche_csv = os.path.join(output_dir, f"konten_wochen_{timestamp}.csv")
+    woche_ranking.to_csv(woche_csv, index=False, encoding='utf-8-sig')
+    print(f"✓ {len(wochen_liste)} Wochen, CSV: {woche_csv}")
+
+    # 4. Regionale Reichweite
+    print("\n[4/4] Regionale Reichweite...")
+    anteil, bundeslaender = netzwerk.reichweite(merkmale)
+    reichweite_csv = os.path.join(output_dir, f"reichweite_{timestamp}.csv")
+    anteil[gesamt['konto']].to_csv(reichweite_csv, encoding='utf-8-sig')
+    print(f"✓ CSV: {reichweite_csv}")
+
+    top_konten = netzwerk.ranking(HEATMAP_KONTEN, mass='nutzer')['konto']
+    create_reach_heatmap(anteil[top_konten], os.path.join(output_dir, f"reichweite_heatmap_{timestamp}.png"))
+    write_report(netzwerk, gesamt, regionen, anteil[gesamt['konto']], bundeslaender,
+                 os.path.join(output_dir, f"mention_netzwerk_{timestamp}.txt"))
+
+    print(f"\n{'=' * 70}")
+    print("MENTION-ANALYSE ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import os
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from regionen import BUNDESLAENDER
+from aggregationswuerfel import Aggregationswuerfel, HASHTAG_KATEGORIEN
+import diffusion
+
+# Matplotlib auf Deutsch
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['axes.unicode_minus'] = False
+
+# Die 6 ausgewählten Topics (wie in 28-31)
+SELECTED_TOPICS = {
+    0: "Gesellschaftspolitische Reflexion",
+    2: "Soziale Distanzierung",
+    5: "Maskenpflicht",
+    6: "Wirtschaftliche Lage & Finanzielle Unterstützung",
+    9: "Hashtag-Kampagnen & Solidarität",
+    11: "Regionales Infektionsgeschehen"
+}
+
+TOPIC_DISPLAY = {0: 1, 2: 3, 5: 6, 6: 7, 9: 10, 11: 12}
+
+# Signifikanzschwelle (Surrogat-Test je Paar)
+P_MAX = 0.05
+
+
+def tagesreihen(counts, tweets, tage):
+    """
+    Anteil (%) an allen Tweets je Reihe × Bundesland × Tag als ndarray.
+    counts: Series mit Index (reihe, bundesland, tag); tweets: Series mit Index (bundesland, tag)
+    Tage ohne Tweets zählen als 0.
+    """
+    namen = list(counts.index.get_level_values(0).unique())
+    index = pd.MultiIndex.from_product([namen, BUNDESLAENDER, tage])
+    zaehler = counts.reindex(index, fill_value=0).to_numpy(dtype=np.float64)
+    nenner = tweets.reindex(pd.MultiIndex.from_product([BUNDESLAENDER, tage]), fill_value=0).to_numpy(dtype=np.float64)
+    zaehler = zaehler.reshape(len(namen), len(BUNDESLAENDER), len(tage))
+    nenner = nenner.reshape(1, len(BUNDESLAENDER), len(tage))
+    return namen, np.divide(zaehler, nenner, out=np.zeros_like(zaehler), where=nenner > 0) * 100
+
+
+def lade_reihen(wuerfel):
+    """Topic-Anteile (28/29) und Anteile der Hashtag-Kategorien (16/17) je Bundesland und Tag"""
+    tage = [tag.date() for tag in pd.date_range(min(wuerfel.tage), max(wuerfel.tage), freq='D')]
+    tweets = wuerfel.summe(nach=('bundesland', 'tag'), bundesland=BUNDESLAENDER)
+
+    topics = wuerfel.summe(nach=('topic', 'bundesland', 'tag'), topic=list(SELECTED_TOPICS.keys()),
+                           bundesland=BUNDESLAENDER)
+    topics = topics.rename(lambda t: f"Topic {TOPIC_DISPLAY[t]}: {SELECTED_TOPICS[t]}", level=0)
+
+    hashtags = wuerfel.summe(nach=('hashtag', 'bundesland', 'tag'), hashtags=True, bundesland=BUNDESLAENDER)
+    kategorien = hashtags.groupby([hashtags.index.get_level_values(0).map(HASHTAG_KATEGORIEN),
+                                   hashtags.index.get_level_values(1),
+                                   hashtags.index.get_level_values(2)]).sum()
+    kategorien = kategorien.rename(lambda k: f"Kategorie: {k}", level=0)
+
+    namen, reihen = tagesreihen(pd.concat([topics, kategorien]), tweets, tage)
+    return namen, reihen, tage
+
+
+def paar_tabelle(ergebnis, namen):
+    """Alle Paare (Reihe, Vorläufer, Nachzügler) mit Lag > 0 als lange Tabelle"""
+    zeilen = []
+    for s, name in enumerate(namen):
+        for i, von in enumerate(BUNDESLAENDER):
+            for j, nach in enumerate(BUNDESLAENDER):
+                if ergebnis['lag'][s, i, j] > 0:
+                    zeilen.append({'reihe': name, 'vorlaeufer': von, 'nachzuegler': nach,
+                                   'lag_tage': int(ergebnis['lag'][s, i, j]),
+                                   'korrelation': ergebnis['korr'][s, i, j], 'p_wert': ergebnis['p'][s, i, j]})
+    return pd.DataFrame(zeilen).sort_values(['reihe', 'p_wert', 'korrelation'], ascending=[True, True, False],
+                                            kind='stable').reset_index(drop=True)
+
+
+def create_lag_heatmaps(ergebnis, namen, max_lag, output_file):
+    """Lag-Matrix je Reihe (Zeile läuft Spalte voraus), nicht signifikante Paare ausgeblendet"""
+    spalten = 3
+    zeilen = int(np.ceil(len(namen) / spalten))
+    fig, axes = plt.subplots(zeilen, spalten, figsize=(7 * spalten, 6.5 * zeilen), squeeze=False)
+
+    for ax, (s, name) in zip(axes.flat, enumerate(namen)):
+        lag = np.where(ergebnis['p'][s] < P_MAX, ergebnis['lag'][s], np.nan)
+        bild = ax.imshow(np.ma.masked_invalid(lag), cmap='RdBu_r', vmin=-max_lag, vmax=max_lag)
+        ax.set_xticks(range(len(BUNDESLAENDER)))
+        ax.set_yticks(range(len(BUNDESLAENDER)))
+        ax.set_xticklabels(BUNDESLAENDER, rotation=90, fontsize=7)
+        ax.set_yticklabels(BUNDESLAENDER, fontsize=7)
+        ax.set_facecolor('#eeeeee')
+        ax.set_title(name, fontsize=10, fontweight='bold')
+        fig.colorbar(bild, ax=ax, shrink=0.7, label='Vorlauf Zeile → Spalte (Tage)')
+
+    for ax in axes.flat[len(namen):]:
+        ax.axis('off')
+
+    fig.suptitle(f'Regionale Diffusion: Lead-Lag der Bundesländer (p < {P_MAX}, grau = nicht signifikant)',
+                 fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close()
+    print(f"✓ Heatmaps: {output_file}")
+
+
+def write_report(namen, tage, vorlauf, paare, n_surrogate, max_lag, output_file):
+    """TXT-Bericht: Vorreiter und Nachzügler je Reihe, stärkste Paare"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("=" * 70 + "\n")
+        f.write("REGIONALE DIFFUSION (LEAD-LAG DER BUNDESLÄNDER)\n")
+        f.write("=" * 70 + "\n\n")
+        f.write(f"Analysezeitpunkt: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Zeitraum: {tage[0]} bis {tage[-1]} ({len(tage)} Tage)\n")
+        f.write("Reihen: Anteil an allen Tweets je Bundesland und Tag, erste Differenzen\n")
+        f.write(f"Kreuzkorrelation für Verschiebungen bis ±{max_lag} Tage, Signifikanz gegen "
+                f"{n_surrogate} Phasen-Surrogate (p < {P_MAX})\n")
+        f.write("Vorlauf > 0: das Bundesland zeigt Veränderungen früher als seine Partner\n")
+
+        for name in namen:
+            f.write(f"\n{name.upper()}\n")
+            f.write("-" * 70 + "\n")
+            tabelle = vorlauf[(vorlauf['reihe'] == name) & (vorlauf['paare'] > 0)]
+            if len(tabelle) == 0:
+                f.write("  Keine signifikanten Paare\n")
+                continue
+            f.write(f"  {'Bundesland':<24} {'Vorlauf':>8} {'voraus':>7} {'hinterher':>10} {'Paare':>6}\n")
+            for _, row in tabelle.sort_values('vorlauf', ascending=False).iterrows():
+                f.write(f"  {row['region']:<24} {row['vorlauf']:>+8.2f} {row['voraus']:>7} "
+                        f"{row['hinterher']:>10} {row['paare']:>6}\n")
+
+            staerkste = paare[(paare['reihe'] == name) & (paare['p_wert'] < P_MAX)].head(5)
+            if len(staerkste):
+                f.write("\n  Stärkste Paare:\n")
+            for _, row in staerkste.iterrows():
+                f.write(f"    {row['vorlaeufer']} → {row['nachzuegler']}: {row['lag_tage']} Tage, "
+                        f"r = {row['korrelation']:.2f}, p = {row['p_wert']:.3f}\n")
+
+    print(f"✓ Bericht: {output_file}")
+
+
+def main():
+    # An eigene Pfade anpassen!
+    # Würfel aus "35. Aggregationswürfel bauen.py"
+    wuerfel_datei = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Aggregation\wuerfel.npz"
+    output_dir = r"C:\Users\[NUTZERNAME]\[ORDNERNAME]\Diffusion"
+
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    print("=" * 70)
+    print("REGIONALE DIFFUSION (LEAD-LAG)")
+    print("=" * 70)
+
+    # 1. Tagesreihen je Bundesland
+    print("\n[1/3] Lade Aggregationswürfel und Tagesreihen...")
+    wuerfel = Aggregationswuerfel.laden(wuerfel_datei)
+    namen, reihen, tage = lade_reihen(wuerfel)
+    print(f"✓ {len(namen)} Reihen × {len(BUNDESLAENDER)} Bundesländer × {len(tage)} Tage")
+
+    # 2. Kreuzkorrelationen und Surrogat-Test
+    print(f"\n[2/3] Kreuzkorrelationen und {diffusion.N_SURROGATE} Surrogate...")
+    start = time.perf_counter()
+    ergebnis = diffusion.lead_lag(reihen)
+    signifikant = int((ergebnis['p'] < P_MAX).sum()) // 2
+    print(f"✓ {signifikant:,} von {len(namen) * len(BUNDESLAENDER) * (len(BUNDESLAENDER) - 1) // 2:,} "
+          f"Paaren signifikant ({time.perf_counter() - start:.1f}s)")
+
+    # 3. Ausgabe
+    print("\n[3/3] Schreibe Ergebnisse...")
+    vorlauf = diffusion.vorlauf(ergebnis, namen, BUNDESLAENDER, P_MAX)
+    paare = paar_tabelle(ergebnis, namen)
+
+    vorlauf_csv = os.path.join(output_dir, f"vorlauf_bundeslaender_{timestamp}.csv")
+    vorlauf.to_csv(vorlauf_csv, index=False, encoding='utf-8-sig')
+    paare_csv = os.path.join(output_dir, f"lead_lag_paare_{timestamp}.csv")
+    paare.to_csv(paare_csv, index=False, encoding='utf-8-sig')
+    print(f"✓ CSV: {vorlauf_csv}")
+    print(f"✓ CSV: {paare_csv}")
+
+    create_lag_heatmaps(ergebnis, namen, diffusion.MAX_LAG,
+                        os.path.join(output_dir, f"lead_lag_heatmaps_{timestamp}.png"))
+    write_report(namen, tage, vorlauf, paare, diffusion.N_SURROGATE, diffusion.MAX_LAG,
+                 os.path.join(output_dir, f"diffusion_{timestamp}.txt"))
+
+    print(f"\n{'=' * 70}")
+    print("DIFFUSIONSANALYSE ABGESCHLOSSEN!")
+    print(f"{'=' * 70}\n")
+
+
+if __name__ == "__main__":
+    main()
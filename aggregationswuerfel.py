@@ -0,0 +1,198 @@
+import json
+from datetime import date
+import numpy as np
+import pandas as pd
+from regionen import BUNDESLAENDER, OST_BUNDESLAENDER
+from hashtag_kategorien import KATEGORISIERER
+
+# Achsen-Beschriftungen
+REGIONEN = BUNDESLAENDER + ['Unbekannt']
+URBAN_RURAL = ['Urban', 'Rural', 'Unbekannt']
+ANZAHL_TOPICS = 14
+TOPICS = list(range(ANZAHL_TOPICS)) + [-1]  # -1 = kein Topic (keine verwertbaren Tokens)
+
+# Normalisierte Trend-Hashtags und ihre Kategorien (aus hashtag_kategorien.json, siehe 15)
+HASHTAG_KATEGORIEN = KATEGORISIERER.hashtags()
+HASHTAGS = list(HASHTAG_KATEGORIEN.keys())
+
+# Abgeleitete Dimension: Bundesland → Ost/West
+OST_WEST = ['Ost', 'West', 'Unbekannt']
+
+
+def _ost_west(region):
+    if region == 'Unbekannt':
+        return 'Unbekannt'
+    return 'Ost' if region in OST_BUNDESLAENDER else 'West'
+
+
+class Aggregationswuerfel:
+    """
+    Vorberechnete Zählwürfel für alle Zähl-Auswertungen.
+    - tweets:   Tweets je (tag, bundesland, urban_rural, topic)
+    - hashtags: Trend-Hashtag-Vorkommen je (tag, bundesland, urban_rural, topic, hashtag)
+    - sentiment_summe / sentiment_anzahl: Summe der Tweet-Sentiments und bewertete Tweets
+      je (tag, bundesland, urban_rural, topic), Mittelwerte über sentiment()
+    Jede Auswertung ist ein Filtern und Summieren über Achsen (summe),
+    ohne erneuten Durchlauf über die Tweets oder erneute LDA-Inferenz.
+    """
+
+    def __init__(self, tage, tweets, hashtags, sentiment_summe=None, sentiment_anzahl=None):
+        self.tage = list(tage)
+        self.tweets = tweets
+        self.hashtags = hashtags
+        # Ältere Würfel ohne Sentiment: keine bewerteten Tweets
+        self.sentiment_summe = np.zeros(tweets.shape) if sentiment_summe is None else sentiment_summe
+        self.sentiment_anzahl = np.zeros(tweets.shape, dtype=np.int32) if sentiment_anzahl is None else sentiment_anzahl
+        self.achsen = {
+            'tag': self.tage,
+            'bundesland': REGIONEN,
+            'urban_rural': URBAN_RURAL,
+            'topic': TOPICS,
+            'hashtag': HASHTAGS
+        }
+
+    @classmethod
+    def bauen(cls, tage, tag_idx, region_idx, urban_idx, topic_idx, hashtag_tweet_idx, hashtag_idx, sentiment=None):
+        """
+        Baut den Würfel aus Integer-Codes pro Tweet (Index in die jeweilige Achse).
+        hashtag_tweet_idx / hashtag_idx: ein Eintrag pro Trend-Hashtag-Vorkommen
+        (Tweet-Position und Hashtag-Index).
+        sentiment: Sentiment je Tweet (NaN = nicht bewertet), optional
+        """
+        form = (len(tage), len(REGIONEN), len(URBAN_RURAL), len(TOPICS))
+        codes = np.ravel_multi_index((tag_idx, region_idx, urban_idx, topic_idx), form)
+        tweets = np.bincount(codes, minlength=int(np.prod(form))).reshape(form).astype(np.int32)
+
+        hashtag_form = form + (len(HASHTAGS),)
+        hashtag_codes = codes[hashtag_tweet_idx] * len(HASHTAGS) + hashtag_idx
+        hashtags = np.bincount(hashtag_codes, minlength=int(np.prod(hashtag_form))).reshape(hashtag_form).astype(np.int32)
+
+        sentiment_summe = sentiment_anzahl = None
+        if sentiment is not None:
+            sentiment = np.asarray(sentiment, dtype=np.float64)
+            bewertet = ~np.isnan(sentiment)
+            sentiment_summe = np.bincount(codes[bewertet], weights=sentiment[bewertet],
+                                          minlength=int(np.prod(form))).reshape(form)
+            sentiment_anzahl = np.bincount(codes[bewertet], minlength=int(np.prod(form))).reshape(form).astype(np.int32)
+
+        return cls(tage, tweets, hashtags, sentiment_summe, sentiment_anzahl)
+
+    def speichern(self, pfad):
+        np.savez_compressed(
+            pfad,
+            tweets=self.tweets,
+            hashtags=self.hashtags,
+            sentiment_summe=self.sentiment_summe,
+            sentiment_anzahl=self.sentiment_anzahl,
+            achsen=np.array(json.dumps({
+                'tage': [tag.isoformat() for tag in self.tage],
+                'bundesland': REGIONEN,
+                'urban_rural': URBAN_RURAL,
+                'topic': TOPICS,
+                'hashtag': HASHTAGS
+            }, ensure_ascii=False))
+        )
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        achsen = json.loads(str(data['achsen']))
+        if (achsen['bundesland'], achsen['urban_rural'], achsen['topic'], achsen['hashtag']) != \
+                (REGIONEN, URBAN_RURAL, TOPICS, HASHTAGS):
+            raise ValueError("Gespeicherter Würfel passt nicht zu den aktuellen Achsen - bitte neu bauen")
+
+        return cls([date.fromisoformat(tag) for tag in achsen['tage']], data['tweets'], data['hashtags'],
+                   data['sentiment_summe'] if 'sentiment_summe' in data else None,
+                   data['sentiment_anzahl'] if 'sentiment_anzahl' in data else None)
+
+    def summe(self, nach=(), hashtags=False, **auswahl):
+        """
+        Slice-and-Sum über den Würfel.
+        nach: Achsen, die erhalten bleiben (tag, bundesland, ost_west, urban_rural, topic, hashtag)
+        hashtags: False = Tweets zählen, True = Trend-Hashtag-Vorkommen zählen
+        auswahl: Filter je Achse, z.B. bundesland='Bayern', topic=[0, 2], tag=(start, ende)
+        Returns: int (ohne nach) oder pandas Series mit (Multi-)Index über nach
+        """
+        return self._summe(self.hashtags if hashtags else self.tweets, nach, auswahl)
+
+    def sentiment(self, nach=(), **auswahl):
+        """
+        Mittleres Sentiment der bewerteten Tweets, gleiche Achsen und Filter wie summe()
+        (ohne hashtag). Returns: float oder pandas Series (NaN = kein bewerteter Tweet)
+        """
+        summe = self._summe(self.sentiment_summe, nach, auswahl)
+        anzahl = self._summe(self.sentiment_anzahl, nach, auswahl)
+        if not nach:
+            return summe / anzahl if anzahl else float('nan')
+        return (summe / anzahl.where(anzahl > 0)).rename('Sentiment')
+
+    def _summe(self, werte, nach, auswahl):
+        hashtags = werte.ndim == self.tweets.ndim + 1
+        namen = ['tag', 'bundesland', 'urban_rural', 'topic'] + (['hashtag'] if hashtags else [])
+        labels = [self.achsen[name] for name in namen]
+
+        # Ost/West als aggregierte Bundesland-Achse
+        if 'ost_west' in nach or 'ost_west' in auswahl:
+            if 'bundesland' in nach:
+                raise ValueError("Gruppierung nach 'bundesland' und 'ost_west' zugleich nicht möglich")
+            achse = namen.index('bundesland')
+            regionen = REGIONEN
+            # Bundesland-Filter vor dem Zusammenfassen anwenden (danach gibt es die Achse nicht mehr)
+            if 'bundesland' in auswahl:
+                auswahl = dict(auswahl)
+                idx = _auswahl_indizes('bundesland', REGIONEN, auswahl.pop('bundesland'))
+                werte = np.take(werte, idx, axis=achse)
+                regionen = [REGIONEN[i] for i in idx]
+            zuordnung = np.zeros((len(regionen), len(OST_WEST)), dtype=werte.dtype)
+            zuordnung[np.arange(len(regionen)), [OST_WEST.index(_ost_west(r)) for r in regionen]] = 1
+            werte = np.moveaxis(np.moveaxis(werte, achse, -1) @ zuordnung, -1, achse)
+            namen[achse] = 'ost_west'
+            labels[achse] = OST_WEST
+
+        return achsen_summe(werte, namen, labels, nach, auswahl)
+
+
+def _auswahl_indizes(achse, labels, wert):
+    """Indizes einer Auswahl: einzelnes Label, Liste/Menge oder (start, ende) für Tage"""
+    if achse == 'tag' and isinstance(wert, tuple):
+        start, ende = wert
+        return [i for i, tag in enumerate(labels)
+                if (start is None or tag >= start) and (ende is None or tag <= ende)]
+    if isinstance(wert, (list, set, frozenset)):
+        return [labels.index(w) for w in wert if w in labels]
+    return [labels.index(wert)]
+
+
+def achsen_summe(werte, namen, labels, nach=(), auswahl=None):
+    """
+    Filtern und Summieren eines Zählwürfels mit benannten Achsen
+    (gemeinsam für Aggregationswuerfel und kreise.KreisWuerfel).
+    werte: ndarray, namen/labels: Name und Beschriftung je Achse
+    """
+    labels = list(labels)
+    for name, wert in (auswahl or {}).items():
+        achse = namen.index(name)
+        idx = _auswahl_indizes(name, labels[achse], wert)
+        werte = np.take(werte, idx, axis=achse)
+        labels[achse] = [labels[achse][i] for i in idx]
+
+    summen_achsen = tuple(i for i, name in enumerate(namen) if name not in nach)
+    werte = werte.sum(axis=summen_achsen)
+    if not nach:
+        return werte.item()
+
+    verbleibend = [name for name in namen if name in nach]
+    werte = np.transpose(werte, [verbleibend.index(name) for name in nach])
+
+    if len(nach) == 1:
+        index = pd.Index(labels[namen.index(nach[0])], name=nach[0])
+    else:
+        index = pd.MultiIndex.from_product([labels[namen.index(name)] for name in nach], names=list(nach))
+    return pd.Series(werte.ravel(), index=index, name='Anzahl')
+
+
+def lade_topics(topics_datei, tweets):
+    """Dominantes Topic je Tweet aus 35 (über tweet_id, -1 = ohne Topic)"""
+    data = np.load(topics_datei)
+    topic_von = dict(zip(data['tweet_ids'], data['topics']))
+    return np.array([topic_von.get(str(tweet.get('tweet_id')), -1) for tweet in tweets], dtype=np.int64)
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+from regionen import OST_BUNDESLAENDER
+from aggregationswuerfel import REGIONEN, URBAN_RURAL, HASHTAGS, HASHTAG_KATEGORIEN
+
+# Tag ohne gültigen Zeitstempel
+KEIN_TAG = -1
+
+# Gespeicherte Spalten (eine Zeile je Tweet, Reihenfolge wie in der JSONL-Datei)
+# bundesland:     Index in REGIONEN (16 = Unbekannt)
+# ost:            Bundesland liegt im Osten (inkl. Berlin)
+# urban:          Index in URBAN_RURAL (2 = Unbekannt)
+# tag:            Kalendertag Europe/Berlin als Tage seit 1970-01-01 (KEIN_TAG = ungültig)
+# hashtag_anzahl: Vorkommen je Trend-Hashtag (Tweets × HASHTAGS, beliebig viele Regeln)
+# sentiment*:     mittlere Lexikon-Polarität aus Wörtern und Emojis bzw. getrennt (NaN = kein Treffer)
+SPALTEN = {
+    'bundesland': np.uint8,
+    'ost': np.bool_,
+    'urban': np.uint8,
+    'tag': np.int32,
+    'hashtag_anzahl': np.uint8,
+    'sentiment': np.float32,
+    'sentiment_wort': np.float32,
+    'sentiment_emoji': np.float32
+}
+
+# Spalten, die in älteren Merkmal-Dateien fehlen dürfen (dann NaN)
+SENTIMENT_SPALTEN = ['sentiment', 'sentiment_wort', 'sentiment_emoji']
+
+
+class Merkmale:
+    """
+    Vorberechnete kategoriale Merkmale aller Tweets (siehe 07b) als Integer-Spalten.
+    Filter und Gruppierungen laufen als NumPy-Masken und bincount statt
+    als Durchlauf über die verschachtelten Tweet-Dicts.
+    """
+
+    def __init__(self, tweet_ids, **spalten):
+        self.tweet_ids = np.asarray(tweet_ids)
+        for name, dtype in SPALTEN.items():
+            setattr(self, name, np.asarray(spalten[name], dtype=dtype))
+
+    def __len__(self):
+        return len(self.tweet_ids)
+
+    @classmethod
+    def kodieren(cls, tweet_ids, bundeslaender, urban_klassen, tage, hashtag_listen, sentiment=None):
+        """
+        Listen je Tweet → Integer-Spalten.
+        bundeslaender / urban_klassen: Namen oder None, tage: datetime64[D] (NaT = ungültig),
+        hashtag_listen: normalisierte Trend-Hashtags je Tweet (Wiederholungen zählen),
+        sentiment: Ergebnis von sentiment.SentimentBewertung (None = ohne Lexika, alles NaN)
+        """
+        bundesland = pd.Index(REGIONEN).get_indexer(
+            pd.Series(bundeslaender, dtype=object).fillna('Unbekannt'))
+        urban = pd.Index(URBAN_RURAL).get_indexer(
+            pd.Series(urban_klassen, dtype=object).fillna('Unbekannt'))
+        if (bundesland < 0).any() or (urban < 0).any():
+            raise ValueError("Unbekanntes Bundesland bzw. unbekannte Stadt/Land-Klasse")
+
+        tage = np.asarray(tage, dtype='datetime64[D]')
+        tag = np.where(np.isnat(tage), KEIN_TAG, tage.astype(np.int64))
+
+        # Hashtag-Vorkommen als (Tweet, Hashtag)-Paare zählen
+        hashtag_pos = {hashtag: i for i, hashtag in enumerate(HASHTAGS)}
+        zeilen = np.repeat(np.arange(len(hashtag_listen)), [len(liste) for liste in hashtag_listen])
+        spalten = np.array([hashtag_pos[h] for liste in hashtag_listen for h in liste], dtype=np.int64)
+        anzahl = np.zeros((len(hashtag_listen), len(HASHTAGS)), dtype=np.int64)
+        np.add.at(anzahl, (zeilen, spalten), 1)
+
+        ost_codes = [REGIONEN.index(bl) for bl in OST_BUNDESLAENDER]
+
+        return cls(
+            tweet_ids,
+            bundesland=bundesland,
+            ost=np.isin(bundesland, ost_codes),
+            urban=urban,
+            tag=tag,
+            hashtag_anzahl=np.minimum(anzahl, 255),
+            **(sentiment or {name: np.full(len(tweet_ids), np.nan) for name in SENTIMENT_SPALTEN})
+        )
+
+    def speichern(self, pfad):
+        np.savez_compressed(pfad, tweet_ids=self.tweet_ids,
+                            **{name: getattr(self, name) for name in SPALTEN})
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        if data['hashtag_anzahl'].shape[1] != len(HASHTAGS):
+            raise ValueError("Gespeicherte Merkmale passen nicht zu HASHTAGS - bitte 07b erneut ausführen")
+        leer = np.full(len(data['tweet_ids']), np.nan)
+        return cls(data['tweet_ids'], **{name: data[name] if name in data else leer for name in SPALTEN})
+
+    def pruefen(self, tweets):
+        """Stellt sicher, dass die Merkmale zeilengleich zu den geladenen Tweets sind"""
+        ids = np.array([str(tweet.get('tweet_id')) for tweet in tweets])
+        if len(ids) != len(self) or not np.array_equal(ids, self.tweet_ids):
+            raise ValueError("Merkmale passen nicht zur Tweet-Datei - bitte 07b erneut ausführen")
+
+    def tage(self):
+        """Kalendertage als datetime64[D] (NaT = ungültig)"""
+        tage = self.tag.astype('datetime64[D]')
+        tage[self.tag == KEIN_TAG] = np.datetime64('NaT')
+        return tage
+
+    def wochen(self):
+        """
+        Kalenderwochen (Montag bis Sonntag) über alle gültigen Tage als Liste
+        (Beschriftung, start, ende), z.B. für maske(tag=(start, ende))
+        """
+        gueltig = self.tag[self.tag != KEIN_TAG]
+        if len(gueltig) == 0:
+            return []
+        erster, letzter = (pd.Timestamp(np.datetime64(int(t), 'D')) for t in (gueltig.min(), gueltig.max()))
+        montage = pd.date_range(erster.to_period('W-SUN').start_time, letzter, freq='W-MON')
+        # Beschriftung mit ISO-Jahr (die Woche ab 30.12.2019 ist KW 01/2020)
+        return [(f"KW {montag.isocalendar()[1]:02d}/{montag.isocalendar()[0]}",
+                 montag.date(), (montag + pd.Timedelta(days=6)).date()) for montag in montage]
+
+    def maske(self, bundesland=None, ost=None, urban=None, tag=None, hashtag=None, kategorie=None):
+        """
+        Boolesche Maske über alle Tweets; alle Angaben werden UND-verknüpft.
+        bundesland / urban / hashtag: Name oder Liste, ost: True/False,
+        tag: (start, ende) als date, kategorie: Hashtag-Kategorie (siehe HASHTAG_KATEGORIEN)
+        """
+        maske = np.ones(len(self), dtype=bool)
+
+        if bundesland is not None:
+            namen = [bundesland] if isinstance(bundesland, str) else bundesland
+            maske &= np.isin(self.bundesland, [REGIONEN.index(bl) for bl in namen])
+        if ost is not None:
+            maske &= self.ost == ost
+        if urban is not None:
+            namen = [urban] if isinstance(urban, str) else urban
+            maske &= np.isin(self.urban, [URBAN_RURAL.index(u) for u in namen])
+        if tag is not None:
+            start, ende = tag
+            maske &= self.tag != KEIN_TAG
+            if start is not None:
+                maske &= self.tag >= np.datetime64(start, 'D').astype(np.int64)
+            if ende is not None:
+                maske &= self.tag <= np.datetime64(ende, 'D').astype(np.int64)
+        if hashtag is not None or kategorie is not None:
+            namen = [hashtag] if isinstance(hashtag, str) else list(hashtag or [])
+            namen += [h for h, k in HASHTAG_KATEGORIEN.items() if k == kategorie]
+            spalten = [HASHTAGS.index(h) for h in namen]
+            maske &= (self.hashtag_anzahl[:, spalten] > 0).any(axis=1)
+
+        return maske
+
+    def zaehlen(self, nach, maske=None):
+        """
+        Anzahl Tweets je Ausprägung (bincount), optional nur innerhalb einer Maske.
+        nach: 'bundesland', 'urban', 'ost' oder 'tag'
+        Returns: pandas Series
+        """
+        werte = getattr(self, nach)
+        if maske is not None:
+            werte = werte[maske]
+
+        if nach == 'bundesland':
+            return pd.Series(np.bincount(werte, minlength=len(REGIONEN)), index=REGIONEN, name='Anzahl')
+        if nach == 'urban':
+            return pd.Series(np.bincount(werte, minlength=len(URBAN_RURAL)), index=URBAN_RURAL, name='Anzahl')
+        if nach == 'ost':
+            return pd.Series(np.bincount(werte, minlength=2), index=[False, True], name='Anzahl')
+
+        tage, anzahl = np.unique(werte[werte != KEIN_TAG], return_counts=True)
+        return pd.Series(anzahl, index=pd.to_datetime(tage.astype('datetime64[D]')), name='Anzahl')
+
+    def mittelwert(self, spalte, nach, maske=None):
+        """
+        Mittelwert einer Wertespalte (z.B. 'sentiment') je Ausprägung, NaN-Werte zählen nicht.
+        nach: wie in zaehlen(); Returns: pandas Series (NaN = keine Werte)
+        """
+        gueltig = ~np.isnan(getattr(self, spalte))
+        if maske is not None:
+            gueltig &= maske
+        werte = np.where(gueltig, getattr(self, spalte), 0.0).astype(np.float64)
+
+        codes = getattr(self, nach).astype(np.int64)
+        if nach == 'tag':
+            gueltig &= codes != KEIN_TAG
+            index, codes = np.unique(codes[gueltig], return_inverse=True)
+            werte = werte[gueltig]
+            gewichtet = np.ones(len(codes))
+            labels = pd.to_datetime(index.astype('datetime64[D]'))
+        else:
+            labels = {'bundesland': REGIONEN, 'urban': URBAN_RURAL, 'ost': [False, True]}[nach]
+            gewichtet = gueltig.astype(np.float64)
+
+        summe = np.bincount(codes, weights=werte, minlength=len(labels))
+        anzahl = np.bincount(codes, weights=gewichtet, minlength=len(labels))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return pd.Series(summe / anzahl, index=labels, name=spalte)
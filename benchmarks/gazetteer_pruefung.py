@@ -0,0 +1,56 @@
+import os
+import sys
+
+# Module aus dem Hauptverzeichnis importieren
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gazetteer import Gazetteer, normalisiere
+
+# Landkreise mit dem Namen einer Großstadt: dürfen nie die Stadt treffen
+LANDKREISE = [
+    ('Landkreis München', 'Bayern'),
+    ('Landkreis Leipzig', 'Sachsen'),
+    ('Kreis Offenbach', 'Hessen'),
+    ('Landkreis Rostock', 'Mecklenburg-Vorpommern'),
+    ('Landkreis Kassel', 'Hessen'),
+    ('Landkreis Karlsruhe', 'Baden-Württemberg'),
+]
+
+# Großstädte (auch mit Stadt-Präfix oder englischem Namen) bleiben Urban
+STAEDTE = [
+    ('München', 'Bayern'),
+    ('Munich', 'Bayern'),
+    ('Stadt Leipzig', 'Sachsen'),
+    ('Offenbach am Main', 'Hessen'),
+    ('Rostock', 'Mecklenburg-Vorpommern'),
+    ('City of Kassel', 'Hessen'),
+    ('Karlsruhe', 'Baden-Württemberg'),
+]
+
+
+def main():
+    gazetteer = Gazetteer.laden()
+    fehler = []
+
+    for name, bundesland in LANDKREISE:
+        ergebnis = gazetteer.klassifiziere_ort(name, bundesland)
+        if ergebnis != 'Rural' or gazetteer.stadt(name, bundesland) is not None:
+            fehler.append(f"{name}: {ergebnis} (erwartet Rural, keine Stadt)")
+    for name, bundesland in STAEDTE:
+        ergebnis = gazetteer.klassifiziere_ort(name, bundesland)
+        if ergebnis != 'Urban':
+            fehler.append(f"{name}: {ergebnis} (erwartet Urban)")
+
+    # Landkreis und Kreis ergeben dieselbe Vergleichsform, die Stadt eine andere
+    if normalisiere('Landkreis Leipzig') != normalisiere('Kreis Leipzig') or \
+            normalisiere('Kreis Leipzig') == normalisiere('Leipzig'):
+        fehler.append("normalisiere: Kreis-Präfix nicht eindeutig")
+
+    for zeile in fehler:
+        print(f"⚠ {zeile}")
+    print(f"{'✓' if not fehler else '⚠'} {len(LANDKREISE) + len(STAEDTE) - len(fehler)}/"
+          f"{len(LANDKREISE) + len(STAEDTE)} Orte korrekt klassifiziert")
+    return 1 if fehler else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import os
+import sys
+import json
+import time
+import numpy as np
+
+# Module aus dem Hauptverzeichnis importieren
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hashtag_segmentierung import Segmentierer, woerter_zaehlen
+
+# Synthetisch: Größenordnung des vollen Datensatzes (verschiedene Hashtags / Vorkommen)
+ANZAHL_WOERTER = 50_000
+ANZAHL_HASHTAGS = 300_000
+ANZAHL_VORKOMMEN = 3_000_000
+BUCHSTABEN = list('eeennniiissrrtaaahhdulcgmobwfkzpväüöß')
+
+
+def synthetische_daten(rng):
+    """Zipf-verteiltes Zufallsvokabular und Hashtags aus 1-4 Wörtern (klein, CamelCase oder mit Ziffern)"""
+    woerter = set()
+    while len(woerter) < ANZAHL_WOERTER:
+        woerter.add(''.join(rng.choice(BUCHSTABEN, rng.integers(2, 10))))
+    woerter = sorted(woerter)
+    rng.shuffle(woerter)
+    haeufigkeit = (1e6 / np.arange(1, len(woerter) + 1)).astype(np.int64) + 3
+    unigramme = dict(zip(woerter, haeufigkeit.tolist()))
+
+    # Wortindizes und Längen vorab ziehen (2x Überschuss für Duplikate)
+    p = haeufigkeit / haeufigkeit.sum()
+    laengen = rng.integers(1, 5, 2 * ANZAHL_HASHTAGS)
+    indizes = np.split(rng.choice(len(woerter), laengen.sum(), p=p), np.cumsum(laengen)[:-1])
+    arten = rng.random(len(laengen))
+
+    hashtags, wahr = {}, {}
+    for idx, art in zip(indizes, arten):
+        if len(hashtags) >= ANZAHL_HASHTAGS:
+            break
+        teile = [woerter[i] for i in idx]
+        if art < 0.6:
+            hashtag = ''.join(teile)
+        elif art < 0.9:
+            hashtag = ''.join(teil.capitalize() for teil in teile)
+        else:
+            hashtag = ''.join(teile) + str(rng.integers(1, 30))
+        hashtags[hashtag] = None
+        wahr[hashtag] = teile
+    return unigramme, list(hashtags), wahr
+
+
+def aus_jsonl(pfad):
+    """Echte Daten: Unigramme aus den Texten, verschiedene Hashtags aus entities"""
+    texte, vorkommen = [], []
+    with open(pfad, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                tweet = json.loads(line)
+            except:
+                continue
+            texte.append(tweet.get('original_text') or tweet.get('text') or '')
+            vorkommen.extend(tweet.get('entities', {}).get('hashtags', []))
+    return woerter_zaehlen(texte), vorkommen
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    if len(sys.argv) > 1:
+        # Aufruf mit Cleaned_Data.jsonl bzw. Final_Dataset.json als Argument
+        unigramme, vorkommen = aus_jsonl(sys.argv[1])
+        hashtags = list(dict.fromkeys(vorkommen))
+        wahr = None
+        print(f"Datensatz: {len(unigramme):,} Wörter, {len(hashtags):,} verschiedene Hashtags, "
+              f"{len(vorkommen):,} Vorkommen\n")
+    else:
+        unigramme, hashtags, wahr = synthetische_daten(rng)
+        # Vorkommen Zipf-verteilt über die verschiedenen Hashtags
+        gewichte = 1 / np.arange(1, len(hashtags) + 1)
+        vorkommen = [hashtags[i] for i in rng.choice(len(hashtags), ANZAHL_VORKOMMEN, p=gewichte / gewichte.sum())]
+        print(f"Synthetisch: {len(unigramme):,} Wörter, {len(hashtags):,} verschiedene Hashtags, "
+              f"{len(vorkommen):,} Vorkommen\n")
+
+    start = time.perf_counter()
+    segmentierer = Segmentierer(unigramme)
+    aufbau = time.perf_counter() - start
+
+    # Kalt: jeder verschiedene Hashtag einmal (volle DP)
+    start = time.perf_counter()
+    ergebnisse = [segmentierer.segmentieren(hashtag) for hashtag in hashtags]
+    kalt = time.perf_counter() - start
+
+    # Warm: alle Vorkommen, Wiederholungen aus dem LRU-Cache
+    start = time.perf_counter()
+    for hashtag in vorkommen:
+        segmentierer.segmentieren(hashtag)
+    warm = time.perf_counter() - start
+
+    print(f"{'Schritt':<32} {'Dauer':>9}  {'pro Sekunde':>14}")
+    print("-" * 58)
+    print(f"{'Aufbau (Unigramme)':<32} {aufbau:>8.2f}s")
+    print(f"{'Verschiedene Hashtags (kalt)':<32} {kalt:>8.2f}s  {len(hashtags) / kalt:>14,.0f}")
+    print(f"{'Alle Vorkommen (LRU-Cache)':<32} {warm:>8.2f}s  {len(vorkommen) / warm:>14,.0f}")
+    print(f"\n{segmentierer.cache_info()}")
+
+    if wahr:
+        # Wörter ohne Ziffern und Schreibweise vergleichen
+        richtig = sum([w.lower() for w in woerter if not w.isdigit()] == wahr[hashtag]
+                      for hashtag, woerter in zip(hashtags, ergebnisse))
+        print(f"Exakt zerlegt: {richtig / len(hashtags):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+# Module aus dem Hauptverzeichnis importieren
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hotspots import hotspots, EPS_KM, MIN_TWEETS, ERDRADIUS_KM
+
+GROESSEN = [200_000, 2_000_000]
+BBOX = (5.9, 47.3, 15.0, 55.0)
+ANZAHL_ZENTREN = 40
+
+
+def synthetische_koordinaten(anzahl, rng):
+    """Städtische Ballungen (Normalverteilung um Zentren) plus gleichverteiltes Rauschen, ~100 m Raster"""
+    zentren = rng.uniform(BBOX[:2], BBOX[2:], (ANZAHL_ZENTREN, 2))
+    ballung = zentren[rng.integers(0, ANZAHL_ZENTREN, anzahl)] + rng.normal(0, 0.02, (anzahl, 2))
+    rauschen = rng.uniform(BBOX[:2], BBOX[2:], (anzahl, 2))
+    punkte = np.where(rng.random((anzahl, 1)) < 0.8, ballung, rauschen)
+    return np.round(punkte[:, 0], 3), np.round(punkte[:, 1], 3)
+
+
+def referenz(lon, lat, eps_km, min_tweets):
+    """Direktes DBSCAN über die volle Haversine-Distanzmatrix (nur für kleine n)"""
+    lon, lat = np.radians(lon), np.radians(lat)
+    a = (np.sin((lat[:, None] - lat[None, :]) / 2) ** 2
+         + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin((lon[:, None] - lon[None, :]) / 2) ** 2)
+    nah = 2 * ERDRADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1))) <= eps_km
+    kern = nah.sum(axis=1) >= min_tweets
+    _, komponente = connected_components(nah & kern[:, None] & kern[None, :], directed=False)
+    rauschen = ~kern & ~(nah & kern[None, :]).any(axis=1)
+    return kern, komponente, rauschen
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    # Plausibilität: Kernpunkt-Partition und Rauschen wie beim direkten Verfahren
+    lon, lat = synthetische_koordinaten(4000, rng)
+    labels = hotspots(lon, lat, EPS_KM, 10)
+    kern, komponente, rauschen = referenz(lon, lat, EPS_KM, 10)
+    assert np.array_equal(labels == -1, rauschen)
+    paare = set(zip(labels[kern], komponente[kern]))
+    assert len(paare) == len(set(labels[kern])) == len(set(komponente[kern]))
+    print(f"Referenzvergleich (4.000 Punkte): {labels.max() + 1} Cluster, identisch\n")
+
+    print(f"{'Punkte':>10}  {'Orte':>10}  {'DBSCAN':>10}  {'Punkte/s':>12}  {'Cluster':>8}")
+    print("-" * 58)
+
+    for anzahl in GROESSEN:
+        lon, lat = synthetische_koordinaten(anzahl, rng)
+
+        start = time.perf_counter()
+        labels = hotspots(lon, lat, EPS_KM, MIN_TWEETS)
+        dauer = time.perf_counter() - start
+        orte = len(np.unique(np.column_stack([lon, lat]), axis=0))
+        print(f"{anzahl:>10,}  {orte:>10,}  {dauer:>9.2f}s  {anzahl / dauer:>12,.0f}  {labels.max() + 1:>8}")
+
+
+if __name__ == "__main__":
+    main()
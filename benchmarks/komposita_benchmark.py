@@ -0,0 +1,131 @@
+import os
+import sys
+import json
+import time
+import numpy as np
+from gensim import corpora
+from gensim.models import LdaModel
+
+# Module aus dem Hauptverzeichnis importieren
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from komposita import KompositaZerleger
+
+# Filter und LDA-Parameter wie in "24. LDA final 14 Topics.py"
+FILTER = dict(no_below=5, no_above=0.5, keep_n=10000)
+LDA_PARAMETER = dict(num_topics=14, random_state=42, passes=15, iterations=500,
+                     alpha='auto', eta='auto', per_word_topics=True)
+
+# Synthetisch: Grundwörter, daraus gebildete Komposita und Dokumente
+ANZAHL_WOERTER = 3_000
+ANZAHL_KOMPOSITA = 30_000
+ANZAHL_DOKUMENTE = 20_000
+BUCHSTABEN = list('eeennniiissrrtaaahhdulcgmobwfkzpväüöß')
+
+
+def synthetische_daten(rng):
+    """Zipf-verteilte Grundwörter; Komposita aus zwei Grundwörtern (mit Fuge), selten im Korpus"""
+    woerter = set()
+    while len(woerter) < ANZAHL_WOERTER:
+        woerter.add(''.join(rng.choice(BUCHSTABEN, rng.integers(4, 9))))
+    woerter = sorted(woerter)
+    rng.shuffle(woerter)
+    p = 1 / np.arange(1, len(woerter) + 1)
+    p /= p.sum()
+
+    paare = rng.choice(len(woerter), (ANZAHL_KOMPOSITA, 2), p=p)
+    fugen = rng.choice(['', '', 's', 'n'], ANZAHL_KOMPOSITA)
+    komposita = [woerter[a] + fuge + woerter[b] for (a, b), fuge in zip(paare, fugen)]
+    q = 1 / np.arange(1, len(komposita) + 1) ** 1.2
+    q /= q.sum()
+
+    dokumente = []
+    for laenge in rng.integers(4, 15, ANZAHL_DOKUMENTE):
+        anzahl_komposita = rng.binomial(laenge, 0.3)
+        dokument = [woerter[i] for i in rng.choice(len(woerter), laenge - anzahl_komposita, p=p)]
+        dokument += [komposita[i] for i in rng.choice(len(komposita), anzahl_komposita, p=q)]
+        dokumente.append(dokument)
+    return dokumente
+
+
+def aus_jsonl(pfad, stopwords):
+    """Echte Daten: Tokens je Tweet aus Cleaned_Data.jsonl, gefiltert wie in 24"""
+    dokumente = []
+    with open(pfad, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                tweet = json.loads(line)
+            except:
+                continue
+            tokens = [token for token in tweet.get('tokens', [])
+                      if token.lower() not in stopwords and len(token) > 2 and not token.isnumeric()]
+            if tokens:
+                dokumente.append(tokens)
+    return dokumente
+
+
+def lade_stopwords(pfade):
+    stopwords = set()
+    for pfad in pfade:
+        with open(pfad, 'r', encoding='utf-8') as f:
+            stopwords.update(line.strip().lower() for line in f if line.strip() and not line.startswith('#'))
+    return stopwords
+
+
+def lda_messen(dokumente):
+    """Vokabular vor/nach filter_extremes, Anteil abgedeckter Tokens und LDA-Trainingszeit"""
+    dictionary = corpora.Dictionary(dokumente)
+    roh = len(dictionary)
+    dictionary.filter_extremes(**FILTER)
+    corpus = [dictionary.doc2bow(dokument) for dokument in dokumente]
+    abgedeckt = sum(anzahl for bow in corpus for _, anzahl in bow) / sum(map(len, dokumente))
+
+    start = time.perf_counter()
+    LdaModel(corpus=corpus, id2word=dictionary, **LDA_PARAMETER)
+    return roh, len(dictionary), abgedeckt, time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(0)
+
+    if len(sys.argv) > 1:
+        # Aufruf mit Cleaned_Data.jsonl und optional den Stoppwort-Dateien aus 24
+        dokumente = aus_jsonl(sys.argv[1], lade_stopwords(sys.argv[2:]))
+        print(f"Datensatz: {len(dokumente):,} Dokumente\n")
+    else:
+        dokumente = synthetische_daten(rng)
+        print(f"Synthetisch: {len(dokumente):,} Dokumente, {ANZAHL_KOMPOSITA:,} Komposita\n")
+
+    start = time.perf_counter()
+    zerleger = KompositaZerleger.aus_tokens(dokumente)
+    aufbau = time.perf_counter() - start
+
+    # Kalt: jede Entscheidung wird berechnet, danach alle Vorkommen aus dem Memo
+    start = time.perf_counter()
+    zerlegt = [zerleger.anwenden(dokument) for dokument in dokumente]
+    kalt = time.perf_counter() - start
+    start = time.perf_counter()
+    for dokument in dokumente:
+        zerleger.anwenden(dokument)
+    warm = time.perf_counter() - start
+
+    anzahl_zerlegt = sum(len(teile) > 1 for teile in zerleger.zerlegungen.values())
+    print(f"{'Zerlegung':<32} {'Dauer':>9}")
+    print("-" * 42)
+    print(f"{'Aufbau (Häufigkeiten)':<32} {aufbau:>8.2f}s")
+    print(f"{'Alle Tokens (kalt)':<32} {kalt:>8.2f}s")
+    print(f"{'Alle Tokens (Memo)':<32} {warm:>8.2f}s")
+    print(f"\nMemo: {len(zerleger):,} Entscheidungen, davon {anzahl_zerlegt:,} zerlegt\n")
+
+    ergebnisse = {'Original': lda_messen(dokumente), 'Komposita zerlegt': lda_messen(zerlegt)}
+
+    print(f"{'Variante':<20} {'Vokabular':>10} {'gefiltert':>10} {'Tokens abgedeckt':>17} {'LDA-Training':>13}")
+    print("-" * 74)
+    for name, (roh, gefiltert, abgedeckt, dauer) in ergebnisse.items():
+        print(f"{name:<20} {roh:>10,} {gefiltert:>10,} {abgedeckt:>16.1%} {dauer:>12.1f}s")
+
+    (roh_a, _, _, dauer_a), (roh_b, _, _, dauer_b) = ergebnisse.values()
+    print(f"\nVokabular: {(roh_b - roh_a) / roh_a:+.1%}, LDA-Training: {(dauer_b - dauer_a) / dauer_a:+.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import shapely
+
+# Module aus dem Hauptverzeichnis importieren
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from reverse_geocoder import ReverseGeocoder
+
+# Größenordnung VG250: ca. 11.000 Gemeinden, 400 Kreise, 16 Länder
+ANZAHL_GEMEINDEN = 11_000
+GROESSEN = [20_000, 2_000_000]
+BBOX = (5.9, 47.3, 15.0, 55.0)
+
+
+def synthetische_gemeinden(anzahl, seed=42):
+    """Voronoi-Zellen als Gemeinden, Grenzen auf ~200 m verdichtet (realistische Stützpunktzahl)"""
+    rng = np.random.default_rng(seed)
+    zentren = rng.uniform(BBOX[:2], BBOX[2:], (anzahl, 2))
+    zellen = shapely.get_parts(shapely.voronoi_polygons(shapely.multipoints(zentren)))
+    zellen = shapely.segmentize(shapely.intersection(zellen, shapely.box(*BBOX)), 0.002)
+
+    # Schlüssel: Land (2) + Kreis (3) + Gemeinde (3 Stellen) wie beim AGS
+    ags = [f"{i % 16 + 1:02d}{i % 400:03d}{i:03d}"[:8] for i in range(len(zellen))]
+    gemeinden = gpd.GeoDataFrame({'ags': ags, 'name': [f"Gemeinde {a}" for a in ags]},
+                                 geometry=zellen, crs=4326)
+    kreise = pd.DataFrame({'ags': sorted({a[:5] for a in ags})})
+    kreise['name'] = 'Kreis ' + kreise['ags']
+    laender = pd.DataFrame({'ags': [f"{i:02d}" for i in range(1, 17)]})
+    laender['name'] = 'Land ' + laender['ags']
+    return gemeinden, kreise, laender
+
+
+def main():
+    gemeinden, kreise, laender = synthetische_gemeinden(ANZAHL_GEMEINDEN)
+    start = time.perf_counter()
+    geocoder = ReverseGeocoder(gemeinden, kreise, laender)
+    print(f"Geocoder: {len(gemeinden):,} Gemeinden, "
+          f"{int(shapely.get_num_coordinates(gemeinden.geometry.values).sum()):,} Stützpunkte "
+          f"({time.perf_counter() - start:.2f} s)\n")
+
+    rng = np.random.default_rng(0)
+    print(f"{'Punkte':>10}  {'Batch (STRtree)':>16}  {'Punkte/s':>12}")
+    print("-" * 44)
+
+    for anzahl in GROESSEN:
+        lon = rng.uniform(BBOX[0], BBOX[2], anzahl)
+        lat = rng.uniform(BBOX[1], BBOX[3], anzahl)
+
+        start = time.perf_counter()
+        df = geocoder.zuordnen(lon, lat)
+        dauer = time.perf_counter() - start
+        print(f"{anzahl:>10,}  {dauer:>15.2f}s  {anzahl / dauer:>12,.0f}")
+
+        # Plausibilität: Stichprobe gegen direkten Punkt-in-Polygon-Test
+        stichprobe = rng.choice(anzahl, 200, replace=False)
+        for i in stichprobe:
+            treffer = gemeinden.geometry.contains(shapely.Point(lon[i], lat[i]))
+            erwartet = gemeinden['ags'][treffer].iloc[0] if treffer.any() else None
+            assert df['gemeinde_ags'].iloc[i] == erwartet
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import random
+from datetime import datetime, timezone, timedelta
+import numpy as np
+
+# Module aus dem Hauptverzeichnis importieren
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from zeitstempel import parse_twitter_dates, lokale_zeit, zeitstempel_felder
+
+# Datensatzgrößen: aktuelles Sample und volle Größenordnung
+GROESSEN = [20_000, 2_000_000]
+
+
+def parse_twitter_date(date_str):
+    """Bisherige Variante aus 11, 16 und 28"""
+    return datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y')
+
+
+def erzeuge_zeitstempel(anzahl, seed=42):
+    """Synthetische created_at-Strings im Twitter-Format (Feb–Mai 2020)"""
+    random.seed(seed)
+    start = datetime(2020, 2, 1, tzinfo=timezone.utc)
+    basis = [(start + timedelta(seconds=random.randint(0, 120 * 86400))).strftime('%a %b %d %H:%M:%S %z %Y')
+             for _ in range(10_000)]
+    return [basis[i % len(basis)] for i in range(anzahl)]
+
+
+def messen(funktion, *args):
+    start = time.perf_counter()
+    ergebnis = funktion(*args)
+    return time.perf_counter() - start, ergebnis
+
+
+def main():
+    print(f"{'Tweets':>10}  {'strptime (UTC-Tag)':>20}  {'vektorisiert (Berlin)':>22}  {'vorberechnet':>14}  {'Faktor':>8}")
+    print("-" * 84)
+
+    for anzahl in GROESSEN:
+        strings = erzeuge_zeitstempel(anzahl)
+
+        # Bisher: strptime pro Zeile, Tagesgrenze in UTC
+        dauer_alt, tage_alt = messen(lambda s: [parse_twitter_date(d).date() for d in s], strings)
+
+        # Neu: vektorisiertes Parsen + Umrechnung nach Europe/Berlin
+        dauer_neu, tage_neu = messen(lambda s: lokale_zeit(parse_twitter_dates(s)).astype('datetime64[D]'), strings)
+
+        # Mit vorberechneter Spalte datum_lokal aus 07
+        spalte = [zeitstempel_felder(d)[1] for d in strings[:10_000]] * (anzahl // 10_000)
+        dauer_spalte, _ = messen(lambda s: np.array(s, dtype='datetime64[D]'), spalte)
+
+        # Plausibilität: Epoch identisch zu strptime
+        stichprobe = strings[:1000]
+        epoch_neu = parse_twitter_dates(stichprobe).astype(np.int64)
+        epoch_alt = np.array([int(parse_twitter_date(d).timestamp()) for d in stichprobe])
+        assert (epoch_neu == epoch_alt).all()
+
+        print(f"{anzahl:>10,}  {dauer_alt:>19.2f}s  {dauer_neu:>21.2f}s  {dauer_spalte:>13.2f}s  "
+              f"{dauer_alt / dauer_neu:>7.1f}x")
+
+        abweichend = np.mean(np.array(tage_alt, dtype='datetime64[D]') != tage_neu) * 100
+        print(f"{'':>10}  Tweets mit anderem Kalendertag (UTC vs. Berlin): {abweichend:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+import json
+from datetime import date
+import numpy as np
+import pandas as pd
+
+# Kleinberg-Modell (Zustandsautomat mit Stufen 0 = Grundrate, 1..STUFEN = Burst):
+# Stufe i erwartet den Anteil p0 * SKALIERUNG**i an allen Tweets des Tages,
+# jeder Aufstieg um eine Stufe kostet GAMMA * ln(Anzahl Tage).
+SKALIERUNG = 2.0
+GAMMA = 1.0
+STUFEN = 2
+
+# Obergrenze für die Anteile der Burst-Stufen (log(1 - p) bleibt endlich)
+MAX_ANTEIL = 0.9999
+
+
+class BurstErkennung:
+    """
+    Burst-Erkennung nach Kleinberg für viele Zeitreihen gleichzeitig.
+    Der Viterbi-Vorwärtsschritt eines Tages ist eine NumPy-Operation über alle
+    Reihen × Stufen; neue Tage werden mit fortschreiben() angehängt, ohne die
+    Historie neu zu rechnen (Grundraten und Übergangskosten bleiben fest).
+    """
+
+    def __init__(self, namen, basis, uebergang_kosten, skalierung=SKALIERUNG, stufen=STUFEN):
+        self.namen = list(namen)
+        self.basis = np.asarray(basis, dtype=np.float64)
+        self.uebergang_kosten = float(uebergang_kosten)
+        self.skalierung = skalierung
+        self.stufen = stufen
+
+        # Anteile je Reihe und Stufe (Reihen × Stufen+1)
+        self._anteile = np.minimum(self.basis[:, None] * skalierung ** np.arange(stufen + 1), MAX_ANTEIL)
+        # Übergang i → j kostet (j - i) * γ ln n beim Aufstieg, Abstieg ist kostenlos
+        schritte = np.arange(stufen + 1)
+        self._uebergang = np.maximum(schritte[None, :] - schritte[:, None], 0) * self.uebergang_kosten
+
+        self.tage = []
+        self._anzahl = []
+        self._gesamt = []
+        self._rueckzeiger = []
+        self._online = []
+        # Start in der Grundrate
+        self._kosten = np.full((len(self.namen), stufen + 1), np.inf)
+        self._kosten[:, 0] = 0.0
+
+    def __len__(self):
+        return len(self.namen)
+
+    @classmethod
+    def anpassen(cls, zaehlungen, gesamt, skalierung=SKALIERUNG, gamma=GAMMA, stufen=STUFEN):
+        """
+        Batch-Anpassung über die Historie.
+        zaehlungen: DataFrame (Index = Tage, Spalten = Reihen, z.B. Hashtags oder Kategorien)
+        gesamt: Tweets je Tag (Series mit gleichem Index), Bezugsgröße der Anteile
+        """
+        gesamt = pd.Series(gesamt).reindex(zaehlungen.index).fillna(0).to_numpy(dtype=np.float64)
+        werte = zaehlungen.to_numpy(dtype=np.float64)
+        # Reihen ohne Vorkommen in der Historie: halbes Vorkommen als Grundrate
+        # (sonst log(0) in den Emissionskosten, und ein Burst wäre nie möglich)
+        basis = np.maximum(werte.sum(axis=0), 0.5) / max(gesamt.sum(), 1.0)
+
+        modell = cls(zaehlungen.columns, basis, gamma * np.log(max(len(zaehlungen), 2)), skalierung, stufen)
+        for tag, anzahl, summe in zip(zaehlungen.index, werte, gesamt):
+            modell.fortschreiben(tag, anzahl, summe)
+        return modell
+
+    def _emission(self, anzahl, gesamt):
+        """Negative Log-Likelihood je Reihe und Stufe (Binomial, ohne stufenunabhängige Konstante)"""
+        anzahl = np.minimum(anzahl, gesamt)[:, None]
+        return -(anzahl * np.log(self._anteile) + (gesamt - anzahl) * np.log1p(-self._anteile))
+
+    def fortschreiben(self, tag, anzahl, gesamt):
+        """
+        Ein Tag (Vorwärtsschritt für alle Reihen). anzahl: Array in Reihenfolge von namen.
+        Returns: aktuelle Stufe je Reihe (online, nur aus der Vergangenheit geschätzt)
+        """
+        anzahl = np.asarray(anzahl, dtype=np.float64)
+        kandidaten = self._kosten[:, :, None] + self._uebergang[None, :, :]
+        rueckzeiger = kandidaten.argmin(axis=1)
+        self._kosten = np.take_along_axis(kandidaten, rueckzeiger[:, None, :], axis=1)[:, 0, :]
+        if gesamt > 0:
+            self._kosten = self._kosten + self._emission(anzahl, float(gesamt))
+        # Kosten relativ halten (nur Differenzen zählen)
+        self._kosten -= self._kosten.min(axis=1, keepdims=True)
+
+        online = self._kosten.argmin(axis=1).astype(np.int8)
+        self.tage.append(tag)
+        self._anzahl.append(anzahl)
+        self._gesamt.append(float(gesamt))
+        self._rueckzeiger.append(rueckzeiger.astype(np.int8))
+        self._online.append(online)
+        return online
+
+    def zustaende(self):
+        """Wahrscheinlichste Stufenfolge (Viterbi-Rückweg) als DataFrame Tage × Reihen"""
+        n_tage = len(self.tage)
+        pfad = np.zeros((n_tage, len(self)), dtype=np.int8)
+        if n_tage == 0:
+            return pd.DataFrame(pfad, columns=self.namen)
+
+        zeilen = np.arange(len(self))
+        stufe = self._kosten.argmin(axis=1)
+        for t in range(n_tage - 1, -1, -1):
+            pfad[t] = stufe
+            stufe = self._rueckzeiger[t][zeilen, stufe]
+        return pd.DataFrame(pfad, index=self.tage, columns=self.namen)
+
+    def neue_bursts(self):
+        """Reihen, die am letzten Tag (online) in eine höhere Stufe gewechselt sind"""
+        if not self._online:
+            return pd.Series(dtype=np.int8, name='Stufe')
+        aktuell = self._online[-1]
+        vorher = self._online[-2] if len(self._online) > 1 else np.zeros_like(aktuell)
+        neu = aktuell > vorher
+        return pd.Series(aktuell[neu], index=[name for name, n in zip(self.namen, neu) if n], name='Stufe')
+
+    def intervalle(self, min_stufe=1):
+        """
+        Burst-Intervalle je Reihe und Stufe (Stufe k = alle Tage mit Zustand >= k, verschachtelt).
+        Intensität: eingesparte Kosten gegenüber der Grundrate (Kleinberg-Gewicht).
+        Returns: DataFrame mit reihe, stufe, start, ende, tage, anzahl, erwartet, verhaeltnis, intensitaet
+        """
+        spalten = ['reihe', 'stufe', 'start', 'ende', 'tage', 'anzahl', 'erwartet', 'verhaeltnis', 'intensitaet']
+        pfad = self.zustaende().to_numpy()
+        if len(pfad) == 0:
+            return pd.DataFrame(columns=spalten)
+
+        anzahl = np.array(self._anzahl)
+        gesamt = np.array(self._gesamt)
+        zeilen = []
+        for stufe in range(min_stufe, self.stufen + 1):
+            aktiv = pfad >= stufe
+            # Beginn und Ende zusammenhängender Abschnitte je Reihe über Differenzen
+            rand = np.diff(np.vstack([np.zeros((1, len(self)), bool), aktiv, np.zeros((1, len(self)), bool)])
+                           .astype(np.int8), axis=0)
+            start_t, start_r = np.nonzero(rand == 1)
+            ende_t, ende_r = np.nonzero(rand == -1)
+            start_ordnung = np.lexsort((start_t, start_r))
+            ende_ordnung = np.lexsort((ende_t, ende_r))
+
+            for t0, t1, r in zip(start_t[start_ordnung], ende_t[ende_ordnung] - 1, start_r[start_ordnung]):
+                abschnitt = slice(t0, t1 + 1)
+                kosten_basis = self._emission_reihe(r, 0, anzahl[abschnitt, r], gesamt[abschnitt])
+                kosten_stufe = self._emission_reihe(r, stufe, anzahl[abschnitt, r], gesamt[abschnitt])
+                beobachtet = anzahl[abschnitt, r].sum()
+                erwartet = self.basis[r] * gesamt[abschnitt].sum()
+                zeilen.append({
+                    'reihe': self.namen[r],
+                    'stufe': stufe,
+                    'start': self.tage[t0],
+                    'ende': self.tage[t1],
+                    'tage': t1 - t0 + 1,
+                    'anzahl': int(beobachtet),
+                    'erwartet': erwartet,
+                    'verhaeltnis': beobachtet / erwartet if erwartet > 0 else np.nan,
+                    'intensitaet': float((kosten_basis - kosten_stufe).sum())
+                })
+
+        return (pd.DataFrame(zeilen, columns=spalten)
+                .sort_values(['intensitaet'], ascending=False).reset_index(drop=True))
+
+    def _emission_reihe(self, reihe, stufe, anzahl, gesamt):
+        p = self._anteile[reihe, stufe]
+        anzahl = np.minimum(anzahl, gesamt)
+        return -(anzahl * np.log(p) + (gesamt - anzahl) * np.log1p(-p))
+
+    def speichern(self, pfad):
+        """Zustand für spätere fortschreiben()-Aufrufe (z.B. täglicher Lauf)"""
+        parameter = {
+            'namen': self.namen,
+            'tage': [tag.isoformat() for tag in self.tage],
+            'uebergang_kosten': self.uebergang_kosten,
+            'skalierung': self.skalierung,
+            'stufen': self.stufen
+        }
+        np.savez_compressed(pfad, parameter=np.array(json.dumps(parameter, ensure_ascii=False)),
+                            basis=self.basis, kosten=self._kosten,
+                            anzahl=np.array(self._anzahl).reshape(-1, len(self)),
+                            gesamt=np.array(self._gesamt),
+                            rueckzeiger=np.array(self._rueckzeiger, dtype=np.int8).reshape(-1, len(self), self.stufen + 1),
+                            online=np.array(self._online, dtype=np.int8).reshape(-1, len(self)))
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        parameter = json.loads(str(data['parameter']))
+        modell = cls(parameter['namen'], data['basis'], parameter['uebergang_kosten'],
+                     parameter['skalierung'], parameter['stufen'])
+        modell.tage = [date.fromisoformat(tag) for tag in parameter['tage']]
+        modell._kosten = data['kosten']
+        modell._anzahl = list(data['anzahl'])
+        modell._gesamt = list(data['gesamt'])
+        modell._rueckzeiger = list(data['rueckzeiger'])
+        modell._online = list(data['online'])
+        return modell
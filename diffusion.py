@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+from scipy import fft as sp_fft
+
+# Verschiebungen (Tage) in beide Richtungen, die geprüft werden
+MAX_LAG = 7
+
+# Surrogate für den Signifikanztest und Surrogate je Stapel (Speicher: Stapel × Reihen × R² × FFT-Länge)
+N_SURROGATE = 999
+STAPEL = 16
+
+
+def vorbereiten(reihen, differenzieren=True):
+    """
+    Tagesreihen (..., Region, Tag) für die Kreuzkorrelation aufbereiten: optional erste
+    Differenzen (Trend und gemeinsames Wachstum aller Länder fallen heraus), danach
+    z-standardisiert je Reihe. Konstante Reihen werden zu Nullen.
+    """
+    x = np.asarray(reihen, dtype=np.float64)
+    if differenzieren:
+        x = np.diff(x, axis=-1)
+    x = x - x.mean(axis=-1, keepdims=True)
+    std = x.std(axis=-1, keepdims=True)
+    return np.divide(x, std, out=np.zeros_like(x), where=std > 0)
+
+
+def kreuzkorrelation(x, max_lag=MAX_LAG):
+    """
+    Kreuzkorrelation aller Regionspaare aller Reihen auf einmal per FFT.
+    x: z-standardisierte Reihen (..., R, T) aus vorbereiten()
+    Returns: (..., R, R, 2·max_lag+1), Eintrag [i, j, max_lag + k] = corr(x_i[t], x_j[t+k])
+    (wie R ccf: Summe über die Überlappung geteilt durch T). Ein Maximum bei k > 0
+    heißt: Region i läuft Region j um k Tage voraus.
+    """
+    t = x.shape[-1]
+    # Nullen anhängen, damit die zyklische Korrelation für |k| <= max_lag linear ist
+    n = sp_fft.next_fast_len(t + max_lag, real=True)
+    f = sp_fft.rfft(x, n=n, axis=-1)
+    produkt = np.conj(f)[..., :, None, :] * f[..., None, :, :]
+    zyklisch = sp_fft.irfft(produkt, n=n, axis=-1)
+    lags = np.arange(-max_lag, max_lag + 1)
+    return zyklisch[..., lags % n] / t
+
+
+def surrogate(x, anzahl, rng):
+    """
+    Phasen-randomisierte Surrogate (anzahl, ..., R, T): Betragsspektrum und damit
+    Autokorrelation jeder Reihe bleiben erhalten, die zeitliche Kopplung zwischen
+    den Regionen wird zerstört (unabhängige Zufallsphasen je Region).
+    """
+    t = x.shape[-1]
+    betrag = np.abs(sp_fft.rfft(x, axis=-1))
+    phasen = rng.uniform(0, 2 * np.pi, size=(anzahl,) + betrag.shape)
+    # Gleichanteil und (bei gerader Länge) Nyquist-Frequenz bleiben reell
+    phasen[..., 0] = 0
+    if t % 2 == 0:
+        phasen[..., -1] = 0
+    return sp_fft.irfft(betrag * np.exp(1j * phasen), n=t, axis=-1)
+
+
+def _spitze(korr, max_lag):
+    """Lag (Tage) und Wert der größten Korrelation je Paar"""
+    idx = korr.argmax(axis=-1)
+    return idx - max_lag, np.take_along_axis(korr, idx[..., None], axis=-1)[..., 0]
+
+
+def lead_lag(reihen, max_lag=MAX_LAG, n_surrogate=N_SURROGATE, differenzieren=True, stapel=STAPEL, seed=0):
+    """
+    Lead-Lag-Analyse für Reihen × Regionen × Tage.
+    Je Paar (i, j) der Lag mit der größten Kreuzkorrelation und deren Wert; p-Wert gegen
+    n_surrogate Phasen-Surrogate (Anteil der Surrogate mit mindestens so hoher Spitze,
+    p = (1 + Treffer) / (1 + n_surrogate)). Paare mit konstanter Reihe bleiben NaN.
+    Returns: dict mit 'lag', 'korr', 'p' (je Reihen × R × R) und 'korrelation' (volle Kurven)
+    """
+    x = vorbereiten(reihen, differenzieren)
+    korr = kreuzkorrelation(x, max_lag)
+    lag, spitze = _spitze(korr, max_lag)
+
+    rng = np.random.default_rng(seed)
+    treffer = np.zeros(spitze.shape, dtype=np.int64)
+    for start in range(0, n_surrogate, stapel):
+        anzahl = min(stapel, n_surrogate - start)
+        _, null_spitze = _spitze(kreuzkorrelation(surrogate(x, anzahl, rng), max_lag), max_lag)
+        treffer += (null_spitze >= spitze - 1e-12).sum(axis=0)
+    p = (1 + treffer) / (1 + n_surrogate)
+
+    # Paare mit konstanter Reihe und die Diagonale haben keine Aussage
+    aktiv = x.any(axis=-1)
+    gueltig = aktiv[..., :, None] & aktiv[..., None, :]
+    gueltig &= ~np.eye(x.shape[-2], dtype=bool)
+    return {
+        'lag': np.where(gueltig, lag, np.nan),
+        'korr': np.where(gueltig, spitze, np.nan),
+        'p': np.where(gueltig, p, np.nan),
+        'korrelation': korr
+    }
+
+
+def matrizen(ergebnis, reihe, regionen):
+    """Lag-, Korrelations- und p-Matrix einer Reihe als DataFrames (Zeile läuft Spalte voraus bei Lag > 0)"""
+    return {name: pd.DataFrame(ergebnis[name][reihe], index=regionen, columns=regionen)
+            for name in ('lag', 'korr', 'p')}
+
+
+def vorlauf(ergebnis, namen, regionen, p_max=0.05):
+    """
+    Mittlerer Vorlauf je Region und Reihe über die signifikanten Paare (Tage, > 0 = früher
+    als die Partner) und Anzahl der Regionen, denen sie signifikant vorausläuft.
+    Returns: DataFrame mit reihe, region, vorlauf, voraus, hinterher, paare
+    """
+    signifikant = ergebnis['p'] < p_max
+    lag = np.where(signifikant, ergebnis['lag'], np.nan)
+    paare = signifikant.sum(axis=-1)
+    mittel = np.divide(np.nansum(lag, axis=-1), paare, out=np.full(paare.shape, np.nan), where=paare > 0)
+    zeilen = []
+    for s, name in enumerate(namen):
+        for r, region in enumerate(regionen):
+            zeilen.append({
+                'reihe': name,
+                'region': region,
+                'vorlauf': mittel[s, r],
+                'voraus': int((lag[s, r] > 0).sum()),
+                'hinterher': int((lag[s, r] < 0).sum()),
+                'paare': int(paare[s, r])
+            })
+    return pd.DataFrame(zeilen)
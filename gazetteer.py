@@ -0,0 +1,165 @@
+import os
+import csv
+import unicodedata
+import numpy as np
+from scipy.spatial import cKDTree
+from regionen import extract_bundesland
+
+# Großstädte (>= 100.000 Einwohner) mit Aliasen, Einwohnern (31.12.2019, gerundet) und Zentrum
+GAZETTEER_DATEI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grossstaedte.csv')
+
+# Schwelle für "Urban" (Großstadt-Definition)
+URBAN_SCHWELLE = 100_000
+
+# Stadtstaaten (Teilstrings der state-Angabe in place/geo, wie bisher in 18 und 31)
+STADTSTAATEN = ['Berlin', 'Hamburg', 'Bremen', 'Free Hanseatic City of Bremen', 'Hanseatic City']
+
+# Präfixe in place/geo, die für den Namensvergleich entfallen
+PRAEFIXE = ('region ', 'city of ', 'stadt ', 'städteregion ')
+
+# Kreis-Präfixe bleiben als 'kreis ' im Vergleichsnamen: ein Landkreis trifft nie die
+# gleichnamige Stadt (Landkreis München ≠ München)
+KREIS_PRAEFIXE = ('landkreis ', 'kreis ')
+
+# Koordinaten-Fallback: Einzugsradius einer Großstadt aus ihrer Einwohnerzahl
+# bei angenommener Dichte (Einwohner pro km², grob der Mittelwert der Großstädte)
+STADT_DICHTE = 3000
+ERDRADIUS_KM = 6371.0
+
+
+def normalisiere(name):
+    """
+    Vergleichsform: Kleinschreibung, ohne Präfixe, Umlaute/Akzente gefaltet (Düsseldorf = Dusseldorf).
+    Landkreis/Kreis wird einheitlich zu 'kreis ' (Landkreis Leipzig = Kreis Leipzig ≠ Leipzig).
+    """
+    name = name.casefold().strip()
+    for praefix in PRAEFIXE:
+        if name.startswith(praefix):
+            name = name[len(praefix):]
+    kreis = False
+    for praefix in KREIS_PRAEFIXE:
+        if name.startswith(praefix):
+            name, kreis = name[len(praefix):], True
+    name = unicodedata.normalize('NFKD', name.replace('ß', 'ss'))
+    name = ''.join(zeichen for zeichen in name if not unicodedata.combining(zeichen)).strip()
+    return 'kreis ' + name if kreis else name
+
+
+def einheitsvektoren(lat, lon):
+    """Lat/Lon (Grad) → Punkte auf der Einheitskugel für den KD-Baum"""
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+class Gazetteer:
+    """
+    Einheitliche Stadt/Land-Klassifizierung für alle Skripte.
+    - Ortsname (city, sonst county): Hash-Index über normalisierte Namen und Aliase, O(1)
+    - Stadtstaaten: Urban (Prüfung je state-String nur einmal, danach aus dem Cache)
+    - Nur Koordinaten: nächste Großstädte per KD-Baum, Urban innerhalb des Einzugsradius
+    """
+
+    def __init__(self, staedte):
+        self.staedte = staedte
+        self._index = {}
+        for i, stadt in enumerate(staedte):
+            for name in [stadt['name']] + stadt['aliase']:
+                self._index[normalisiere(name)] = i
+
+        self._einwohner = np.array([stadt['einwohner'] for stadt in staedte], dtype=np.int64)
+        self._radius = np.sqrt(self._einwohner / STADT_DICHTE / np.pi) / ERDRADIUS_KM
+        self._baum = cKDTree(einheitsvektoren([s['lat'] for s in staedte], [s['lon'] for s in staedte]))
+        self._stadtstaat_cache = {}
+        self._ort_cache = {}
+
+    @classmethod
+    def laden(cls, pfad=GAZETTEER_DATEI):
+        staedte = []
+        with open(pfad, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f, delimiter=';'):
+                staedte.append({
+                    'name': row['name'],
+                    'aliase': [alias for alias in row['aliase'].split('|') if alias],
+                    'einwohner': int(row['einwohner']),
+                    'bundesland': row['bundesland'],
+                    'lat': float(row['lat']),
+                    'lon': float(row['lon'])
+                })
+        return cls(staedte)
+
+    def stadt(self, name, bundesland=None):
+        """
+        Großstadt zu einem Orts- oder Aliasnamen (dict) oder None.
+        Mit bundesland werden gleichnamige Orte in anderen Ländern ausgeschlossen
+        (z.B. Halle (Westf.) in NRW ≠ Halle (Saale)).
+        """
+        i = self._index.get(normalisiere(name))
+        if i is None:
+            return None
+        stadt = self.staedte[i]
+        if bundesland and stadt['bundesland'] != bundesland:
+            return None
+        return stadt
+
+    def kanonischer_name(self, name, bundesland=None):
+        """Deutscher Name einer Großstadt (Munich → München), sonst der Name selbst"""
+        stadt = self.stadt(name, bundesland)
+        return stadt['name'] if stadt else name
+
+    def _ist_stadtstaat(self, state):
+        if state not in self._stadtstaat_cache:
+            self._stadtstaat_cache[state] = any(stadtstaat in state for stadtstaat in STADTSTAATEN)
+        return self._stadtstaat_cache[state]
+
+    def klassifiziere_ort(self, ort, bundesland=None):
+        """'Urban' für Großstädte >= URBAN_SCHWELLE, sonst 'Rural' (je Ort nur einmal normalisiert)"""
+        schluessel = (ort, bundesland)
+        if schluessel not in self._ort_cache:
+            stadt = self.stadt(ort, bundesland)
+            self._ort_cache[schluessel] = 'Urban' if stadt and stadt['einwohner'] >= URBAN_SCHWELLE else 'Rural'
+        return self._ort_cache[schluessel]
+
+    def klassifiziere_koordinaten(self, lon, lat, k=4):
+        """
+        Vektorisiert: 'Urban', wenn einer der k nächsten Großstadt-Mittelpunkte näher liegt
+        als dessen Einzugsradius, sonst 'Rural'; ohne Koordinaten (NaN) None.
+        """
+        lon = np.asarray(lon, dtype=np.float64)
+        lat = np.asarray(lat, dtype=np.float64)
+        ergebnis = np.full(len(lon), None, dtype=object)
+
+        gueltig = ~(np.isnan(lon) | np.isnan(lat))
+        if gueltig.any():
+            k = min(k, len(self.staedte))
+            abstand, idx = self._baum.query(einheitsvektoren(lat[gueltig], lon[gueltig]), k=k)
+            abstand, idx = abstand.reshape(-1, k), idx.reshape(-1, k)
+            urban = (abstand <= self._radius[idx]).any(axis=1)
+            ergebnis[gueltig] = np.where(urban, 'Urban', 'Rural')
+        return ergebnis
+
+    def klassifiziere(self, tweet):
+        """
+        Stadt/Land für einen Tweet: 'Urban', 'Rural' oder None (keine Ortsangabe).
+        Reihenfolge: Stadtstaat → city/county → Koordinaten.
+        """
+        geo_source = tweet.get('geo_source')
+
+        location_data = None
+        if geo_source == 'place' and tweet.get('place'):
+            location_data = tweet['place']
+        elif geo_source == 'coordinates' and tweet.get('geo'):
+            location_data = tweet['geo']
+
+        if location_data:
+            if self._ist_stadtstaat(location_data.get('state') or ''):
+                return 'Urban'
+
+            ort = location_data.get('city') or location_data.get('county')
+            if ort:
+                return self.klassifiziere_ort(ort, extract_bundesland(tweet))
+
+        punkt = tweet.get('coordinates')
+        if punkt and len(punkt) == 2:
+            return self.klassifiziere_koordinaten([punkt[0]], [punkt[1]])[0]
+        return None
@@ -0,0 +1,181 @@
+import os
+import json
+from regionen import BUNDESLAENDER
+
+# Vereinfachungs-Toleranz in Grad (EPSG:4326) je Ausgabeformat
+# druck: feine Grenzen für PNG-Karten mit 300 DPI
+# web:   gröbere Grenzen für interaktive Plotly-Karten (kleines GeoJSON)
+TOLERANZEN = {
+    'druck': 0.001,
+    'web': 0.01
+}
+
+
+def _artefakt_pfad(geometrie_dir, variante, endung, ebene='bundeslaender'):
+    return os.path.join(geometrie_dir, f"{ebene}_{variante}.{endung}")
+
+
+def _aufbereiten(gdf):
+    """
+    Filtert Deutschland aus dem Natural-Earth-Datensatz, vereinheitlicht die Namen
+    und berechnet die Label-Ankerpunkte.
+    """
+    import geopandas as gpd
+
+    gdf = gdf[gdf['admin'] == 'Germany'][['name', 'geometry']].copy()
+    gdf = gdf[gdf['name'].isin(BUNDESLAENDER)]
+    gdf = gdf.iloc[gdf['name'].map(BUNDESLAENDER.index).argsort()].reset_index(drop=True)
+
+    return _mit_ankern(gpd.GeoDataFrame(gdf, geometry='geometry', crs=gdf.crs))
+
+
+def _mit_ankern(gdf):
+    """Label-Ankerpunkte (Schwerpunkt der unvereinfachten Fläche) als label_x / label_y"""
+    schwerpunkte = gdf.geometry.centroid
+    gdf['label_x'] = schwerpunkte.x
+    gdf['label_y'] = schwerpunkte.y
+    return gdf
+
+
+def _vereinfachen(gdf, toleranz):
+    """Vereinfacht die Grenzen; gemeinsame Kanten bleiben deckungsgleich, wenn möglich"""
+    if not toleranz:
+        return gdf
+    gdf = gdf.copy()
+    if hasattr(gdf.geometry, 'simplify_coverage'):
+        # Shapely >= 2.1: Nachbarn behalten identische Grenzlinien (keine Lücken)
+        gdf['geometry'] = gdf.geometry.simplify_coverage(toleranz)
+    else:
+        gdf['geometry'] = gdf.geometry.simplify(toleranz, preserve_topology=True)
+    return gdf
+
+
+def _mit_label_punkten(gdf):
+    """Ergänzt die Ankerpunkte als Spalte label_punkt (Punkt mit .x / .y)"""
+    import geopandas as gpd
+
+    gdf['label_punkt'] = gpd.points_from_xy(gdf['label_x'], gdf['label_y'])
+    return gdf
+
+
+def geometrie_bauen(shapefile_path, geometrie_dir, toleranzen=None):
+    """
+    Einmaliger Build: liest das weltweite Natural-Earth-Shapefile und schreibt
+    pro Variante (siehe TOLERANZEN) eine GeoParquet- und eine GeoJSON-Datei
+    sowie die Label-Ankerpunkte als JSON.
+    """
+    import geopandas as gpd
+
+    toleranzen = TOLERANZEN if toleranzen is None else toleranzen
+    os.makedirs(geometrie_dir, exist_ok=True)
+
+    print(f"Lade Shapefile: {shapefile_path}")
+    gdf = _aufbereiten(gpd.read_file(shapefile_path))
+    fehlend = sorted(set(BUNDESLAENDER) - set(gdf['name']))
+    if fehlend:
+        print(f"⚠ Im Shapefile nicht gefunden: {', '.join(fehlend)}")
+    print(f"✓ {len(gdf)} Bundesländer gefiltert\n")
+
+    for variante, toleranz in toleranzen.items():
+        vereinfacht = _vereinfachen(gdf, toleranz)
+
+        parquet_file = _artefakt_pfad(geometrie_dir, variante, 'parquet')
+        vereinfacht.to_parquet(parquet_file)
+
+        geojson_file = _artefakt_pfad(geometrie_dir, variante, 'geojson')
+        with open(geojson_file, 'w', encoding='utf-8') as f:
+            f.write(vereinfacht[['name', 'geometry']].to_json(ensure_ascii=False))
+
+        punkte = int(vereinfacht.geometry.count_coordinates().sum())
+        print(f"✓ {variante} (Toleranz {toleranz}°): {punkte:,} Stützpunkte, "
+              f"GeoJSON {os.path.getsize(geojson_file) / 1024:.0f} KB")
+
+    label_file = os.path.join(geometrie_dir, 'label_punkte.json')
+    with open(label_file, 'w', encoding='utf-8') as f:
+        json.dump({row['name']: [row['label_x'], row['label_y']] for _, row in gdf.iterrows()},
+                  f, ensure_ascii=False, indent=2)
+    print(f"✓ Label-Ankerpunkte: {label_file}")
+
+
+def kreise_bauen(vg250_dir, geometrie_dir, toleranzen=None):
+    """
+    Einmaliger Build der Kreisgrenzen (ca. 400 Kreise) aus VG250 für Choroplethen
+    auf Kreisebene. Spalten: ags (5-stellig), name, label_x, label_y, geometry
+    """
+    import geopandas as gpd
+    from reverse_geocoder import VG250_DATEIEN, GF_LAND
+
+    toleranzen = TOLERANZEN if toleranzen is None else toleranzen
+    os.makedirs(geometrie_dir, exist_ok=True)
+
+    print(f"Lade VG250-Kreise: {vg250_dir}")
+    gdf = gpd.read_file(os.path.join(vg250_dir, VG250_DATEIEN['kreis']))
+    gdf = gdf[gdf['GF'] == GF_LAND].to_crs(epsg=4326)
+    gdf = gdf.rename(columns={'AGS': 'ags', 'GEN': 'name'})[['ags', 'name', 'geometry']]
+    gdf = _mit_ankern(gdf.sort_values('ags').reset_index(drop=True))
+    print(f"✓ {len(gdf)} Kreise\n")
+
+    for variante, toleranz in toleranzen.items():
+        vereinfacht = _vereinfachen(gdf, toleranz)
+        vereinfacht.to_parquet(_artefakt_pfad(geometrie_dir, variante, 'parquet', 'kreise'))
+
+        geojson_file = _artefakt_pfad(geometrie_dir, variante, 'geojson', 'kreise')
+        with open(geojson_file, 'w', encoding='utf-8') as f:
+            f.write(vereinfacht[['ags', 'name', 'geometry']].to_json(ensure_ascii=False))
+
+        punkte = int(vereinfacht.geometry.count_coordinates().sum())
+        print(f"✓ Kreise {variante} (Toleranz {toleranz}°): {punkte:,} Stützpunkte, "
+              f"GeoJSON {os.path.getsize(geojson_file) / 1024:.0f} KB")
+
+
+def lade_bundeslaender(geometrie_dir, variante='druck', shapefile_path=None):
+    """
+    Lädt die Bundesland-Geometrien als GeoDataFrame.
+    Spalten: name, label_x, label_y, label_punkt, geometry
+    Fehlt das Artefakt (siehe 36), wird das Shapefile direkt gelesen (langsam).
+    """
+    import geopandas as gpd
+
+    parquet_file = _artefakt_pfad(geometrie_dir, variante, 'parquet') if geometrie_dir else None
+    if parquet_file and os.path.exists(parquet_file):
+        return _mit_label_punkten(gpd.read_parquet(parquet_file))
+
+    if not shapefile_path:
+        raise FileNotFoundError(f"Geometrie-Artefakt nicht gefunden: {parquet_file} (zuerst 36 ausführen)")
+
+    print(f"⚠ Geometrie-Artefakt '{variante}' nicht gefunden, lese Shapefile (zuerst 36 ausführen)")
+    gdf = _aufbereiten(gpd.read_file(shapefile_path))
+    return _mit_label_punkten(_vereinfachen(gdf, TOLERANZEN.get(variante)))
+
+
+def lade_geojson(geometrie_dir, variante='web', shapefile_path=None):
+    """
+    Lädt das vorberechnete GeoJSON (Feature-Property 'name') für Plotly.
+    Benötigt geopandas nur im Fallback über das Shapefile.
+    """
+    geojson_file = _artefakt_pfad(geometrie_dir, variante, 'geojson') if geometrie_dir else None
+    if geojson_file and os.path.exists(geojson_file):
+        with open(geojson_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    gdf = lade_bundeslaender(geometrie_dir, variante, shapefile_path)
+    return json.loads(gdf[['name', 'geometry']].to_json())
+
+
+def lade_label_punkte(geometrie_dir):
+    """Label-Ankerpunkte je Bundesland: {name: (x, y)}"""
+    with open(os.path.join(geometrie_dir, 'label_punkte.json'), 'r', encoding='utf-8') as f:
+        return {name: tuple(punkt) for name, punkt in json.load(f).items()}
+
+
+def lade_kreise(geometrie_dir, variante='druck'):
+    """
+    Lädt die Kreis-Geometrien (Artefakt aus 36 mit VG250).
+    Spalten: ags, name, label_x, label_y, label_punkt, geometry
+    """
+    import geopandas as gpd
+
+    parquet_file = _artefakt_pfad(geometrie_dir, variante, 'parquet', 'kreise')
+    if not os.path.exists(parquet_file):
+        raise FileNotFoundError(f"Kreis-Artefakt nicht gefunden: {parquet_file} (36 mit vg250_dir ausführen)")
+    return _mit_label_punkten(gpd.read_parquet(parquet_file))
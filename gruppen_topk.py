@@ -0,0 +1,132 @@
+from array import array
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class GruppenTopK:
+    """
+    Dünn besetzte Zählmatrix Gruppe × Item (z.B. Bundesland × Emoji, Urban/Rural × Hashtag,
+    Kalenderwoche × Token). Gruppen und Items werden beim Zählen auf fortlaufende
+    Ganzzahlen abgebildet. Abgeleitete Gruppierungen (Ost/West, Gesamt, Wochen) entstehen
+    per Matrixprodukt ohne neuen Durchlauf; die Top-k je Gruppe kommen aus einer partiellen
+    Sortierung (np.argpartition) über die Nicht-Null-Einträge statt aus einem Counter je Gruppe.
+    """
+
+    def __init__(self, gruppen=None):
+        # Feste Gruppen-Reihenfolge (z.B. BUNDESLAENDER), leere Gruppen bleiben erhalten
+        self._gruppe_idx = {gruppe: i for i, gruppe in enumerate(gruppen or [])}
+        self._item_idx = {}
+        self._zeilen = array('I')
+        self._spalten = array('I')
+        self._matrix = None
+
+    @classmethod
+    def aus_matrix(cls, matrix, gruppen, items):
+        zaehlung = cls(gruppen)
+        zaehlung._item_idx = {item: i for i, item in enumerate(items)}
+        zaehlung._matrix = sparse.csr_matrix(matrix, dtype=np.int64)
+        return zaehlung
+
+    def hinzufuegen(self, gruppe, items):
+        """Zählt alle items (Liste, Wiederholungen zählen mehrfach) für eine Gruppe"""
+        if not items:
+            return
+        g = self._gruppe_idx.setdefault(gruppe, len(self._gruppe_idx))
+        item_idx = self._item_idx
+        self._zeilen.extend([g] * len(items))
+        self._spalten.extend([item_idx.setdefault(item, len(item_idx)) for item in items])
+        self._matrix = None
+
+    @property
+    def gruppen(self):
+        return list(self._gruppe_idx)
+
+    @property
+    def items(self):
+        return list(self._item_idx)
+
+    @property
+    def matrix(self):
+        """CSR-Matrix Gruppe × Item (wird nach hinzufuegen() neu aufgebaut)"""
+        if self._matrix is None:
+            self._matrix = sparse.coo_matrix(
+                (np.ones(len(self._zeilen), dtype=np.int64),
+                 (np.frombuffer(self._zeilen, dtype=np.uint32), np.frombuffer(self._spalten, dtype=np.uint32))),
+                shape=(len(self._gruppe_idx), len(self._item_idx))
+            ).tocsr()
+        return self._matrix
+
+    def summen(self):
+        """Vorkommen je Gruppe"""
+        return pd.Series(np.asarray(self.matrix.sum(axis=1)).ravel(), index=self.gruppen, name='Gesamt')
+
+    def verschiedene(self):
+        """Verschiedene Items je Gruppe"""
+        return pd.Series(np.diff(self.matrix.indptr), index=self.gruppen, name='Verschiedene')
+
+    def werte(self, items):
+        """Zählungen ausgewählter Items (nicht vorkommende = 0) als DataFrame Gruppen × Items"""
+        spalten = [self._item_idx.get(item, -1) for item in items]
+        vorhanden = [i for i, spalte in enumerate(spalten) if spalte >= 0]
+        werte = np.zeros((len(self._gruppe_idx), len(items)), dtype=np.int64)
+        werte[:, vorhanden] = self.matrix[:, [spalten[i] for i in vorhanden]].toarray()
+        return pd.DataFrame(werte, index=self.gruppen, columns=list(items))
+
+    def zusammenfassen(self, zuordnung, gruppen=None):
+        """
+        Fasst Gruppen über eine Zuordnung alt → neu zusammen (z.B. Bundesland → Ost/West,
+        Tag → Kalenderwoche) als Produkt mit einer 0/1-Matrix. Nicht zugeordnete Gruppen fallen weg.
+        zuordnung: dict oder Funktion; gruppen: Reihenfolge der neuen Gruppen (optional)
+        """
+        abbilden = zuordnung.get if isinstance(zuordnung, dict) else zuordnung
+        ziele = [abbilden(gruppe) for gruppe in self.gruppen]
+        if gruppen is None:
+            gruppen = list(dict.fromkeys(ziel for ziel in ziele if ziel is not None))
+        neu_idx = {gruppe: i for i, gruppe in enumerate(gruppen)}
+
+        paare = [(neu_idx[ziel], alt) for alt, ziel in enumerate(ziele) if ziel in neu_idx]
+        zeilen, spalten = zip(*paare) if paare else ((), ())
+        indikator = sparse.csr_matrix((np.ones(len(paare), dtype=np.int64), (zeilen, spalten)),
+                                      shape=(len(neu_idx), len(ziele)))
+        return GruppenTopK.aus_matrix(indikator @ self.matrix, list(neu_idx), self.items)
+
+    def gesamt(self, name='Gesamt'):
+        """Alle Gruppen zu einer zusammengefasst"""
+        return self.zusammenfassen(lambda gruppe: name)
+
+    def top_k(self, k=10):
+        """
+        Die k häufigsten Items je Gruppe, absteigend; bei Gleichstand zuerst gezähltes Item.
+        Returns: dict Gruppe → Liste von (Item, Anzahl) wie Counter.most_common(k)
+        """
+        if k <= 0:
+            return {gruppe: [] for gruppe in self.gruppen}
+        matrix = self.matrix
+        n_items = matrix.shape[1]
+        items = np.empty(n_items, dtype=object)
+        items[:] = self.items
+
+        # Eindeutiger Schlüssel je Nicht-Null-Eintrag: Anzahl, bei Gleichstand kleinerer
+        # Item-Index (= zuerst gezählt); partielle Sortierung nur über die Einträge der Gruppe
+        schluessel = matrix.data * n_items + (n_items - 1 - matrix.indices)
+        ergebnis = {}
+        for zeile, gruppe in enumerate(self.gruppen):
+            start, ende = matrix.indptr[zeile], matrix.indptr[zeile + 1]
+            werte = -schluessel[start:ende]
+            if ende - start > k:
+                auswahl = np.argpartition(werte, k - 1)[:k]
+            else:
+                auswahl = np.arange(ende - start)
+            auswahl = start + auswahl[np.argsort(werte[auswahl])]
+            ergebnis[gruppe] = list(zip(items[matrix.indices[auswahl]].tolist(), matrix.data[auswahl].tolist()))
+        return ergebnis
+
+    def tabelle(self, k=10):
+        """top_k() als lange Tabelle mit Gruppe, Rang, Item, Anzahl und Anteil an der Gruppe"""
+        summen = self.summen()
+        zeilen = [{'Gruppe': gruppe, 'Rang': rang, 'Item': item, 'Anzahl': anzahl,
+                   'Anteil': anzahl / summen[gruppe]}
+                  for gruppe, top in self.top_k(k).items()
+                  for rang, (item, anzahl) in enumerate(top, 1)]
+        return pd.DataFrame(zeilen, columns=['Gruppe', 'Rang', 'Item', 'Anzahl', 'Anteil'])
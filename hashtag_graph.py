@@ -0,0 +1,273 @@
+import json
+from array import array
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Hashtags in weniger Tweets bleiben außen vor (Tippfehler, Einmal-Tags)
+MIN_TWEETS = 5
+
+# PMI überschätzt seltene Paare, daher Mindestzahl gemeinsamer Tweets
+MIN_GEMEINSAM = 5
+
+# Label Propagation: Abbruch spätestens nach so vielen Runden
+MAX_RUNDEN = 100
+
+
+def hashtag_form(hashtag):
+    """Vergleichsform: Kleinschreibung (#Lockdown = #lockdown)"""
+    return hashtag.lower()
+
+
+def _pmi(gemeinsam, anzahl_a, anzahl_b, n):
+    """Vektorisiert: PMI und normalisierte PMI (-1 bis 1) aus Tweet-Anzahlen"""
+    gemeinsam = np.asarray(gemeinsam, dtype=np.float64)
+    pmi = np.log(gemeinsam * n / (np.asarray(anzahl_a, dtype=np.float64) * anzahl_b))
+    h = -np.log(gemeinsam / n)
+    npmi = np.divide(pmi, h, out=np.ones_like(pmi), where=h > 0)
+    return pmi, npmi
+
+
+def _tweets_mit_hashtag(x):
+    """Anzahl Zeilen einer Inzidenz (CSR) mit mindestens einem Hashtag"""
+    return int((np.diff(x.indptr) > 0).sum())
+
+
+class HashtagGraph:
+    """
+    Hashtag-Kookkurrenz als dünn besetzte Matrizen.
+    - Inzidenz Tweet × Hashtag (CSR, zeilengleich zu Cleaned_Data.jsonl und den Merkmalen aus 07b)
+    - Kookkurrenz Hashtag × Hashtag = XᵀX (Diagonale = Tweets je Hashtag)
+    Teilmengen (Bundesland, Stadt/Land, Woche) sind Zeilenauswahlen der Inzidenz
+    über eine Merkmals-Maske, es wird nie eine dichte Matrix gebildet.
+    """
+
+    def __init__(self, tweet_ids, hashtags, inzidenz):
+        self.tweet_ids = np.asarray(tweet_ids)
+        self.hashtags = list(hashtags)
+        self.inzidenz = sparse.csr_matrix(inzidenz, dtype=np.int32)
+        self._idx = {hashtag: i for i, hashtag in enumerate(self.hashtags)}
+        self._gesamt = None
+
+    def __len__(self):
+        return len(self.hashtags)
+
+    @classmethod
+    def bauen(cls, input_file, min_tweets=MIN_TWEETS):
+        """
+        Liest die JSONL-Datei zeilenweise (gleiche Zeilen wie 07b) und merkt sich
+        je Tweet die Menge seiner Hashtags.
+        """
+        print(f"Baue Hashtag-Graph aus: {input_file}")
+
+        hashtag_idx = {}
+        tweet_ids = []
+        zeilen = array('I')
+        spalten = array('I')
+
+        with open(input_file, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                if line_num % 100000 == 0:
+                    print(f"  {line_num:,} Zeilen gelesen...")
+
+                try:
+                    tweet = json.loads(line.strip())
+                except:
+                    continue
+
+                zeile = len(tweet_ids)
+                tweet_ids.append(str(tweet.get('tweet_id')))
+                for hashtag in {hashtag_form(h) for h in tweet.get('entities', {}).get('hashtags', [])}:
+                    zeilen.append(zeile)
+                    spalten.append(hashtag_idx.setdefault(hashtag, len(hashtag_idx)))
+
+        inzidenz = sparse.csr_matrix(
+            (np.ones(len(zeilen), dtype=np.int32),
+             (np.frombuffer(zeilen, dtype=np.uint32), np.frombuffer(spalten, dtype=np.uint32))),
+            shape=(len(tweet_ids), len(hashtag_idx))
+        )
+
+        # Seltene Hashtags entfernen
+        hashtags = np.array(sorted(hashtag_idx, key=hashtag_idx.get), dtype=object)
+        behalten = np.flatnonzero(np.asarray(inzidenz.sum(axis=0)).ravel() >= min_tweets)
+        graph = cls(tweet_ids, hashtags[behalten].tolist(), inzidenz[:, behalten])
+
+        print(f"✓ {len(tweet_ids):,} Tweets, {len(graph):,} Hashtags (min_tweets={min_tweets}), "
+              f"{(graph.matrix().nnz - len(graph)) // 2:,} Hashtag-Paare\n")
+        return graph
+
+    def speichern(self, pfad):
+        np.savez_compressed(pfad, tweet_ids=self.tweet_ids, indptr=self.inzidenz.indptr,
+                            indices=self.inzidenz.indices,
+                            hashtags=np.array(json.dumps(self.hashtags, ensure_ascii=False)))
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        hashtags = json.loads(str(data['hashtags']))
+        inzidenz = sparse.csr_matrix((np.ones(len(data['indices']), dtype=np.int32), data['indices'], data['indptr']),
+                                     shape=(len(data['tweet_ids']), len(hashtags)))
+        return cls(data['tweet_ids'], hashtags, inzidenz)
+
+    def pruefen(self, merkmale):
+        """Stellt sicher, dass der Graph zeilengleich zu den Merkmalen (07b) ist"""
+        if len(merkmale) != len(self.tweet_ids) or not np.array_equal(merkmale.tweet_ids, self.tweet_ids):
+            raise ValueError("Hashtag-Graph passt nicht zu den Merkmalen - bitte neu bauen")
+
+    def _auswahl(self, maske):
+        return self.inzidenz if maske is None else self.inzidenz[np.asarray(maske, dtype=bool)]
+
+    def matrix(self, maske=None):
+        """
+        Kookkurrenz Hashtag × Hashtag (CSR): Anzahl Tweets mit beiden Hashtags.
+        maske: boolesche Auswahl der Tweets (z.B. merkmale.maske(urban='Urban')), None = alle
+        """
+        if maske is None and self._gesamt is not None:
+            return self._gesamt
+        x = self._auswahl(maske)
+        matrix = (x.T @ x).tocsr()
+        if maske is None:
+            self._gesamt = matrix
+        return matrix
+
+    def tweets(self, maske=None):
+        """Anzahl Tweets mit mindestens einem Hashtag (Grundgesamtheit für PMI)"""
+        return _tweets_mit_hashtag(self._auswahl(maske))
+
+    def haeufigkeit(self, maske=None):
+        """Tweets je Hashtag, absteigend sortiert"""
+        anzahl = np.asarray(self._auswahl(maske).sum(axis=0)).ravel()
+        return pd.Series(anzahl, index=self.hashtags, name='Tweets').sort_values(ascending=False)
+
+    def top_assoziiert(self, hashtag, n=20, mass='npmi', min_gemeinsam=MIN_GEMEINSAM, maske=None):
+        """
+        Am stärksten mit einem Hashtag verbundene Hashtags.
+        mass: 'gemeinsam' (Anzahl), 'anteil' (P(b|a)), 'pmi' oder 'npmi'
+        Returns: DataFrame mit hashtag, gemeinsam, anteil, pmi, npmi
+        """
+        spalten = ['hashtag', 'gemeinsam', 'anteil', 'pmi', 'npmi']
+        i = self._idx.get(hashtag_form(hashtag))
+        if i is None:
+            return pd.DataFrame(columns=spalten)
+
+        x = self._auswahl(maske)
+        if maske is None and self._gesamt is not None:
+            zeile = self._gesamt.getrow(i)
+            diagonale = self._gesamt.diagonal()
+        else:
+            # Nur die benötigte Zeile von XᵀX (Tweets mit dem Hashtag × alle Hashtags)
+            zeile = (x[:, i].T @ x).tocsr()
+            diagonale = np.asarray(x.sum(axis=0)).ravel()
+        partner, gemeinsam = zeile.indices, zeile.data
+        behalten = (partner != i) & (gemeinsam >= min_gemeinsam)
+        partner, gemeinsam = partner[behalten], gemeinsam[behalten]
+
+        pmi, npmi = _pmi(gemeinsam, diagonale[i], diagonale[partner], _tweets_mit_hashtag(x))
+        df = pd.DataFrame({
+            'hashtag': [self.hashtags[j] for j in partner],
+            'gemeinsam': gemeinsam,
+            'anteil': gemeinsam / diagonale[i],
+            'pmi': pmi,
+            'npmi': npmi
+        }, columns=spalten)
+        return df.sort_values([mass, 'gemeinsam'], ascending=False).head(n).reset_index(drop=True)
+
+    def paare(self, n=50, mass='npmi', min_gemeinsam=MIN_GEMEINSAM, maske=None):
+        """
+        Stärkste Hashtag-Paare über die ganze Matrix (nur obere Dreiecksmatrix).
+        Returns: DataFrame mit hashtag_a, hashtag_b, gemeinsam, pmi, npmi
+        """
+        matrix = self.matrix(maske)
+        diagonale = matrix.diagonal()
+        dreieck = sparse.triu(matrix, k=1).tocoo()
+        behalten = dreieck.data >= min_gemeinsam
+        a, b, gemeinsam = dreieck.row[behalten], dreieck.col[behalten], dreieck.data[behalten]
+
+        pmi, npmi = _pmi(gemeinsam, diagonale[a], diagonale[b], self.tweets(maske))
+        werte = {'gemeinsam': gemeinsam, 'pmi': pmi, 'npmi': npmi}[mass]
+        # Nur die besten n vollständig sortieren
+        if len(werte) > n:
+            auswahl = np.argpartition(-werte, n)[:n]
+        else:
+            auswahl = np.arange(len(werte))
+        auswahl = auswahl[np.argsort(-werte[auswahl], kind='stable')]
+
+        return pd.DataFrame({
+            'hashtag_a': [self.hashtags[j] for j in a[auswahl]],
+            'hashtag_b': [self.hashtags[j] for j in b[auswahl]],
+            'gemeinsam': gemeinsam[auswahl],
+            'pmi': pmi[auswahl],
+            'npmi': npmi[auswahl]
+        })
+
+    def npmi_matrix(self, hashtags, maske=None):
+        """NPMI zwischen wenigen ausgewählten Hashtags als (kleine) dichte Tabelle, z.B. für eine Heatmap"""
+        idx = [self._idx[hashtag_form(hashtag)] for hashtag in hashtags]
+        matrix = self.matrix(maske)
+        diagonale = matrix.diagonal()[idx]
+        gemeinsam = matrix[idx][:, idx].toarray()
+
+        npmi = np.full(gemeinsam.shape, np.nan)
+        vorhanden = gemeinsam > 0
+        zeile, spalte = np.nonzero(vorhanden)
+        _, npmi[vorhanden] = _pmi(gemeinsam[vorhanden], diagonale[zeile], diagonale[spalte], self.tweets(maske))
+        np.fill_diagonal(npmi, np.nan)
+        return pd.DataFrame(npmi, index=[self.hashtags[i] for i in idx], columns=[self.hashtags[i] for i in idx])
+
+    def gemeinschaften(self, max_hashtags=2000, min_npmi=0.1, min_gemeinsam=MIN_GEMEINSAM,
+                       maske=None, max_runden=MAX_RUNDEN, seed=None):
+        """
+        Hashtag-Gemeinschaften per Label Propagation auf dem NPMI-gewichteten Graphen
+        der häufigsten Hashtags. Jede Runde ist ein Sparse-Produkt (Gewichte × Label-Matrix);
+        pro Runde wechselt nur eine zufällige Hälfte der Knoten ihr Label (verhindert Oszillation).
+        Returns: DataFrame mit hashtag, gemeinschaft (0 = größte), tweets; ohne Kanten: -1
+        """
+        haeufigkeit = self.haeufigkeit(maske)
+        haeufigkeit = haeufigkeit[haeufigkeit > 0].head(max_hashtags)
+        auswahl = np.sort([self._idx[hashtag] for hashtag in haeufigkeit.index]).astype(np.int64)
+
+        matrix = self.matrix(maske)
+        diagonale = matrix.diagonal()[auswahl]
+        matrix = matrix[auswahl][:, auswahl].tocoo()
+        kante = (matrix.row != matrix.col) & (matrix.data >= min_gemeinsam)
+        a, b, gemeinsam = matrix.row[kante], matrix.col[kante], matrix.data[kante]
+        _, npmi = _pmi(gemeinsam, diagonale[a], diagonale[b], self.tweets(maske))
+        stark = npmi >= min_npmi
+        n = len(auswahl)
+        gewichte = sparse.csr_matrix((npmi[stark], (a[stark], b[stark])), shape=(n, n))
+
+        rng = np.random.default_rng(seed)
+        labels = np.arange(n)
+        hat_kanten = np.diff(gewichte.indptr) > 0
+        zeilen = np.arange(n)
+        for _ in range(max_runden):
+            label_matrix = sparse.csr_matrix((np.ones(n), (zeilen, labels)), shape=(n, n))
+            stimmen = (gewichte @ label_matrix).tocsr()
+
+            # Stärkstes Label je Knoten, Gleichstände zufällig aufgelöst
+            stimmen_zufall = stimmen.copy()
+            stimmen_zufall.data += rng.random(stimmen.nnz) * 1e-9
+            bestes = np.asarray(stimmen_zufall.argmax(axis=1)).ravel()
+
+            # Eigenes Label behalten, wenn es gleichauf mit dem besten liegt
+            eigenes = np.asarray(stimmen[zeilen, labels]).ravel()
+            maximum = stimmen.max(axis=1).toarray().ravel()
+            wechsel = np.flatnonzero(hat_kanten & (eigenes < maximum - 1e-12))
+            if len(wechsel) == 0:
+                break
+            wechsel = wechsel[rng.random(len(wechsel)) < 0.5] if len(wechsel) > 1 else wechsel
+            labels[wechsel] = bestes[wechsel]
+
+        # Gemeinschaften nach Größe nummerieren, isolierte Hashtags = -1
+        labels = np.where(hat_kanten, labels, -1)
+        groessen = pd.Series(labels[labels >= 0]).value_counts()
+        nummer = {label: i for i, label in enumerate(groessen.index)}
+
+        df = pd.DataFrame({
+            'hashtag': [self.hashtags[i] for i in auswahl],
+            'gemeinschaft': [nummer.get(label, -1) for label in labels],
+            'tweets': diagonale
+        })
+        df['isoliert'] = df['gemeinschaft'] < 0
+        df = df.sort_values(['isoliert', 'gemeinschaft', 'tweets'], ascending=[True, True, False])
+        return df.drop(columns='isoliert').reset_index(drop=True)
@@ -0,0 +1,75 @@
+import os
+import json
+from vokabular_index import AhoCorasick
+
+# Regeln der Trend-Kategorien (siehe 15), in Prioritätsreihenfolge:
+# {"ausschluss": [...], "regeln": [{"hashtag": ..., "kategorie": ..., "varianten": [...]}, ...]}
+# Neue Trend-Hashtags oder Varianten werden nur hier eingetragen.
+REGEL_DATEI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hashtag_kategorien.json')
+
+# Zeichen, die vor dem Vergleich entfernt werden (Flatten_The-Curve = flattenthecurve)
+ENTFERNEN = str.maketrans('', '', '_- ー')
+
+
+def vergleichsform(hashtag):
+    """Kleinschreibung, ohne Trenn- und Leerzeichen"""
+    return hashtag.lower().translate(ENTFERNEN)
+
+
+class HashtagKategorisierer:
+    """
+    Ordnet Hashtags einem normalisierten Trend-Hashtag und seiner Kategorie zu.
+    Alle Varianten stecken in einem Aho-Corasick-Automaten (siehe vokabular_index):
+    ein Durchlauf über den Hashtag findet jede enthaltene Variante, gewonnen hat
+    die Regel mit der kleinsten Nummer (wie die Reihenfolge der bisherigen if-Kaskade).
+    Ergebnisse werden je unterschiedlichem Hashtag nur einmal berechnet.
+    """
+
+    def __init__(self, regeln, ausschluss=()):
+        self.regeln = [(regel['hashtag'], regel['kategorie']) for regel in regeln]
+        self.ausschluss = set(ausschluss)
+        self._cache = {}
+
+        varianten = [(vergleichsform(variante), nummer)
+                     for nummer, regel in enumerate(regeln) for variante in regel['varianten']]
+        self._automat = AhoCorasick([variante for variante, _ in varianten])
+        self._regel_nummer = [nummer for _, nummer in varianten]
+
+    @classmethod
+    def laden(cls, pfad=REGEL_DATEI):
+        with open(pfad, 'r', encoding='utf-8') as f:
+            daten = json.load(f)
+        return cls(daten['regeln'], daten.get('ausschluss', []))
+
+    def _suchen(self, text):
+        """Kleinste Regelnummer, deren Variante in text vorkommt, sonst None"""
+        return min((self._regel_nummer[pattern_id] for _, pattern_id in self._automat.finditer(text)),
+                   default=None)
+
+    def normalisieren(self, hashtag):
+        """
+        Hashtag → (normalisierter Trend-Hashtag, Kategorie) oder (None, None)
+        Ausgeschlossene Hashtags (z.B. endthelockdown) werden nicht kategorisiert.
+        """
+        ergebnis = self._cache.get(hashtag)
+        if ergebnis is None:
+            text = vergleichsform(hashtag)
+            nummer = None if text in self.ausschluss else self._suchen(text)
+            ergebnis = self.regeln[nummer] if nummer is not None else (None, None)
+            self._cache[hashtag] = ergebnis
+        return ergebnis
+
+    def hashtags(self):
+        """Normalisierte Trend-Hashtags → Kategorie (Reihenfolge der Regeln)"""
+        return dict(self.regeln)
+
+
+# Gemeinsame Instanz für alle Skripte
+KATEGORISIERER = HashtagKategorisierer.laden()
+
+
+def normalize_hashtag(hashtag):
+    """
+    Normalisiert Hashtags zu Kategorien - IDENTISCH zur Hauptanalyse
+    """
+    return KATEGORISIERER.normalisieren(hashtag)
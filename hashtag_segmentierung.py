@@ -0,0 +1,162 @@
+import re
+import json
+import math
+from collections import Counter
+from functools import lru_cache
+from komposita import FUGEN, MIN_TEILLAENGE
+
+# Längstes Wort, das die Zerlegung in Betracht zieht
+MAX_WORTLAENGE = 24
+
+# Wörter mit weniger Vorkommen im Korpus gelten als unbekannt
+MIN_VORKOMMEN = 3
+
+# Verschiedene Hashtags im LRU-Cache (der volle Datensatz hat ein Vielfaches weniger als Vorkommen)
+CACHE_GROESSE = 500_000
+
+# Für das Zählen: URLs, Mentions und Hashtags selbst zählen nicht als Wörter
+_NICHT_ZAEHLEN = re.compile(r'http[s]?://\S+|www\.\S+|[@#]\w+')
+_WORT = re.compile(r'[^\W\d_]+')
+
+# Vorzerlegung an sicheren Grenzen: Unterstriche, Buchstabe/Ziffer, klein→Groß (CamelCase)
+# Fugenelemente nach ihrem letzten Buchstaben (nur dann lohnt die Suche nach Wort + Fuge)
+_FUGEN_NACH_ENDE = {ende: tuple(fuge for fuge in FUGEN if fuge[-1] == ende) for ende in {f[-1] for f in FUGEN}}
+
+_GRENZEN = re.compile(r'_+|(?<=[^\W\d_])(?=\d)|(?<=\d)(?=[^\W\d_])|(?<=[a-zäöüß])(?=[A-ZÄÖÜ])')
+
+
+def woerter_zaehlen(texte, min_vorkommen=MIN_VORKOMMEN):
+    """Unigramm-Häufigkeiten (kleingeschrieben) über Tweet-Texte, ohne URLs/Mentions/Hashtags"""
+    zaehler = Counter()
+    for text in texte:
+        zaehler.update(_WORT.findall(_NICHT_ZAEHLEN.sub(' ', text).lower()))
+    return {wort: anzahl for wort, anzahl in zaehler.items() if anzahl >= min_vorkommen}
+
+
+class Segmentierer:
+    """
+    Zerlegt zusammengesetzte Hashtags in Wörter (#coronakriseberlin → corona krise berlin).
+    Dynamische Programmierung über die Unigramm-Wahrscheinlichkeiten des Korpus
+    (wahrscheinlichste Wortfolge, unbekannte Wörter mit längenabhängiger Strafe),
+    Fugenelemente bleiben am vorderen Wort (#maskenpflicht → masken pflicht),
+    CamelCase und Ziffern geben feste Grenzen vor. Ergebnisse je verschiedenem
+    Hashtag liegen in einem LRU-Cache.
+    """
+
+    def __init__(self, unigramme, ganz=(), max_wortlaenge=MAX_WORTLAENGE, cache_groesse=CACHE_GROESSE):
+        self.unigramme = dict(unigramme)
+        # Ohne Häufigkeiten wäre jedes Wort "unbekannt" und billiger als ganze Wörter
+        # (log(10 / 1) > 0): jeder Hashtag zerfiele in einzelne Buchstaben
+        if not self.unigramme:
+            raise ValueError("Leere Unigramm-Tabelle - Hashtag-Zerlegung nicht möglich "
+                             "(unigramme.json löschen und aus dem Korpus neu zählen)")
+        self.max_wortlaenge = max_wortlaenge
+        # Wörter, die nie zerlegt werden (z.B. zusammengeschriebene Eigennamen aus 07)
+        self.ganz = {wort.lower() for wort in ganz}
+
+        gesamt = sum(self.unigramme.values())
+        self._log_p = {wort: math.log(anzahl / gesamt) for wort, anzahl in self.unigramme.items()}
+        # Unbekanntes Wort der Länge n: 10 / (N · 10^n) (je Buchstabe zehnmal unwahrscheinlicher)
+        # (bei sehr kleinen Tabellen wie bei N = 100, sonst wären einzelne Buchstaben billiger als das Wort)
+        self._log_unbekannt = math.log(10 / max(gesamt, 100))
+        self._log_zehn = math.log(10)
+
+        self.segmentieren = lru_cache(maxsize=cache_groesse)(self._segmentieren)
+
+    @classmethod
+    def aus_korpus(cls, input_file, text_feld='text', min_vorkommen=MIN_VORKOMMEN, **kwargs):
+        """Zählt die Unigramme in einer JSONL-Datei (ein Tweet pro Zeile)"""
+        print(f"Zähle Unigramme für die Hashtag-Zerlegung aus: {input_file}")
+
+        def texte():
+            with open(input_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line.strip()).get(text_feld) or ''
+                    except:
+                        continue
+
+        unigramme = woerter_zaehlen(texte(), min_vorkommen)
+        print(f"✓ {len(unigramme):,} Wörter (min_vorkommen={min_vorkommen})")
+        return cls(unigramme, **kwargs)
+
+    def speichern(self, pfad):
+        with open(pfad, 'w', encoding='utf-8') as f:
+            json.dump(self.unigramme, f, ensure_ascii=False)
+
+    @classmethod
+    def laden(cls, pfad, **kwargs):
+        with open(pfad, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), **kwargs)
+
+    def _mit_fuge(self, wort, fugen):
+        """
+        Log-Wahrscheinlichkeit eines bekannten Wortes mit angehängtem Fugenelement, sonst None.
+        Die Fuge kostet so viel wie ein unbekannter Buchstabe mehr: echte Wörter gehen vor.
+        """
+        beste = None
+        for fuge in fugen:
+            if wort.endswith(fuge) and len(wort) - len(fuge) >= MIN_TEILLAENGE:
+                wert = self._log_p.get(wort[:-len(fuge)])
+                if wert is not None and (beste is None or wert > beste):
+                    beste = wert
+        return None if beste is None else beste - self._log_zehn
+
+    def _zerlegen(self, text):
+        """Wahrscheinlichste Zerlegung von text (kleingeschrieben) als Liste von (start, ende)"""
+        n = len(text)
+        beste = [0.0] + [-math.inf] * n
+        zurueck = [0] * (n + 1)
+        log_p = self._log_p.get
+        fugen_nach_ende = _FUGEN_NACH_ENDE.get
+        unbekannt, zehn = self._log_unbekannt, self._log_zehn
+
+        for ende in range(1, n + 1):
+            bester_wert, bester_start = -math.inf, 0
+            for start in range(max(0, ende - self.max_wortlaenge), ende):
+                wort = text[start:ende]
+                wert = log_p(wort)
+                # Fugen-s/-n usw. gehören zum vorderen Wort (sonst ein einzelnes "unbekanntes" s)
+                if wert is None and ende < n:
+                    fugen = fugen_nach_ende(wort[-1])
+                    if fugen:
+                        wert = self._mit_fuge(wort, fugen)
+                if wert is None:
+                    wert = unbekannt - (ende - start) * zehn
+                wert += beste[start]
+                if wert > bester_wert:
+                    bester_wert, bester_start = wert, start
+            beste[ende], zurueck[ende] = bester_wert, bester_start
+
+        grenzen = []
+        ende = n
+        while ende > 0:
+            start = zurueck[ende]
+            grenzen.append((start, ende))
+            ende = start
+        return grenzen[::-1]
+
+    def _segmentieren(self, hashtag):
+        hashtag = hashtag.lstrip('#')
+        if hashtag.lower() in self.ganz:
+            return (hashtag,)
+
+        teile = [teil for teil in _GRENZEN.split(hashtag) if teil]
+        # Bei CamelCase hat der Autor die Wörter schon getrennt (#RobertKochInstitut)
+        camel_case = len(teile) > 1 and any(zeichen.isupper() for zeichen in hashtag[1:])
+
+        woerter = []
+        for teil in teile:
+            klein = teil.lower()
+            if (teil.isdigit() or klein in self.ganz or len(teil) <= 3
+                    or (camel_case and teil[1:].islower())):
+                woerter.append(teil)
+                continue
+            # Schreibweise des Originals behalten (wichtig für die Lemmatisierung),
+            # außer die Kleinschreibung ändert die Länge (z.B. İ)
+            quelle = teil if len(teil) == len(klein) else klein
+            woerter.extend(quelle[start:ende] for start, ende in self._zerlegen(klein))
+        return tuple(woerter)
+
+    def cache_info(self):
+        return self.segmentieren.cache_info()
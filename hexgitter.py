@@ -0,0 +1,202 @@
+import json
+from datetime import date
+import numpy as np
+import pandas as pd
+from aggregationswuerfel import TOPICS
+
+# Kantenlänge der Sechsecke je Auflösungsstufe (km), von grob nach fein
+KANTEN_KM = [40.0, 20.0, 10.0, 5.0, 2.5]
+
+# Für Deutschland genügt eine abstandstreue Zylinderprojektion um den Mittelpunkt
+# (Maßstabsfehler in Ost-West-Richtung < 10 % zwischen 47° und 55° N)
+MITTEL_LAENGE = 10.0
+MITTEL_BREITE = 51.0
+ERDRADIUS_KM = 6371.0
+_KM_PRO_GRAD_Y = np.pi / 180 * ERDRADIUS_KM
+_KM_PRO_GRAD_X = _KM_PRO_GRAD_Y * np.cos(np.radians(MITTEL_BREITE))
+
+# Axiale Koordinaten (q, r) werden zu einem int64-Schlüssel gepackt
+_VERSATZ = 1 << 20
+_WURZEL3 = np.sqrt(3.0)
+
+
+def projizieren(lon, lat):
+    """Lon/Lat (Grad) → ebene Koordinaten x/y in km"""
+    x = (np.asarray(lon, dtype=np.float64) - MITTEL_LAENGE) * _KM_PRO_GRAD_X
+    y = (np.asarray(lat, dtype=np.float64) - MITTEL_BREITE) * _KM_PRO_GRAD_Y
+    return x, y
+
+
+def zurueckprojizieren(x, y):
+    """Ebene Koordinaten x/y in km → Lon/Lat (Grad)"""
+    return np.asarray(x) / _KM_PRO_GRAD_X + MITTEL_LAENGE, np.asarray(y) / _KM_PRO_GRAD_Y + MITTEL_BREITE
+
+
+def hex_koordinaten(x, y, kante_km):
+    """
+    Vektorisiert: Punkt → Sechseck (spitze Oberseite) in axialen Koordinaten (q, r).
+    Rundung über Würfelkoordinaten, die Komponente mit der größten Abweichung
+    wird aus den beiden anderen bestimmt.
+    """
+    q = (_WURZEL3 / 3 * x - y / 3) / kante_km
+    r = (2 / 3 * y) / kante_km
+    s = -q - r
+
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+
+    q_fix = (dq > dr) & (dq > ds)
+    r_fix = ~q_fix & (dr > ds)
+    rq = np.where(q_fix, -rr - rs, rq)
+    rr = np.where(r_fix, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+
+def hex_zentren(q, r, kante_km):
+    """Mittelpunkte der Sechsecke als Lon/Lat"""
+    x = kante_km * _WURZEL3 * (np.asarray(q) + np.asarray(r) / 2)
+    y = kante_km * 1.5 * np.asarray(r)
+    return zurueckprojizieren(x, y)
+
+
+def hex_ecken(q, r, kante_km):
+    """Eckpunkte aller Sechsecke als Array (n × 6 × 2) in Lon/Lat, z.B. für PolyCollection"""
+    x = kante_km * _WURZEL3 * (np.asarray(q) + np.asarray(r) / 2)
+    y = kante_km * 1.5 * np.asarray(r)
+    winkel = np.radians(60 * np.arange(6) + 30)
+    lon, lat = zurueckprojizieren(x[:, None] + kante_km * np.cos(winkel),
+                                  y[:, None] + kante_km * np.sin(winkel))
+    return np.stack([lon, lat], axis=-1)
+
+
+class HexAggregat:
+    """
+    Tweets je (Sechseck, Tag, Topic) für eine Auflösungsstufe.
+    Nur belegte Zellen werden gespeichert (dünn besetzt, Koordinatenliste),
+    Auswertungen sind Filtern und bincount über die Einträge.
+    """
+
+    def __init__(self, kante_km, hex_q, hex_r, tage, hex_idx, tag_idx, topic_idx, anzahl):
+        self.kante_km = kante_km
+        self.hex_q = hex_q
+        self.hex_r = hex_r
+        self.tage = list(tage)
+        self.hex_idx = hex_idx
+        self.tag_idx = tag_idx
+        self.topic_idx = topic_idx
+        self.anzahl = anzahl
+
+    def __len__(self):
+        return len(self.hex_q)
+
+    @classmethod
+    def bauen(cls, kante_km, x, y, tage, tag_idx, topic_idx):
+        q, r = hex_koordinaten(x, y, kante_km)
+        schluessel, hex_idx = np.unique((q + _VERSATZ) << 21 | (r + _VERSATZ), return_inverse=True)
+
+        form = (len(schluessel), len(tage), len(TOPICS))
+        codes, anzahl = np.unique(np.ravel_multi_index((hex_idx, tag_idx, topic_idx), form), return_counts=True)
+        hex_idx, tag_idx, topic_idx = np.unravel_index(codes, form)
+
+        return cls(
+            kante_km,
+            ((schluessel >> 21) - _VERSATZ).astype(np.int32),
+            ((schluessel & ((1 << 21) - 1)) - _VERSATZ).astype(np.int32),
+            tage,
+            hex_idx.astype(np.int32), tag_idx.astype(np.int32), topic_idx.astype(np.int16),
+            anzahl.astype(np.int32)
+        )
+
+    def _maske(self, tag=None, topic=None):
+        maske = np.ones(len(self.anzahl), dtype=bool)
+        if tag is not None:
+            start, ende = tag
+            tage = np.array(self.tage, dtype='datetime64[D]')[self.tag_idx]
+            if start is not None:
+                maske &= tage >= np.datetime64(start, 'D')
+            if ende is not None:
+                maske &= tage <= np.datetime64(ende, 'D')
+        if topic is not None:
+            topics = [topic] if isinstance(topic, int) else topic
+            maske &= np.isin(self.topic_idx, [TOPICS.index(t) for t in topics])
+        return maske
+
+    def summe(self, tag=None, topic=None):
+        """
+        Tweets je Sechseck (Array in der Reihenfolge von hex_q/hex_r).
+        tag: (start, ende) als date, topic: Topic-Nummer oder Liste
+        """
+        maske = self._maske(tag, topic)
+        return np.bincount(self.hex_idx[maske], weights=self.anzahl[maske], minlength=len(self)).astype(np.int64)
+
+    def summe_nach(self, achse, tag=None, topic=None):
+        """Matrix Sechseck × Tag bzw. Sechseck × Topic als DataFrame"""
+        maske = self._maske(tag, topic)
+        spalten, beschriftung = (self.tag_idx, self.tage) if achse == 'tag' else (self.topic_idx, TOPICS)
+        codes = self.hex_idx[maske].astype(np.int64) * len(beschriftung) + spalten[maske]
+        werte = np.bincount(codes, weights=self.anzahl[maske], minlength=len(self) * len(beschriftung))
+        return pd.DataFrame(werte.reshape(len(self), len(beschriftung)).astype(np.int64), columns=beschriftung)
+
+    def zentren(self):
+        return hex_zentren(self.hex_q, self.hex_r, self.kante_km)
+
+    def ecken(self):
+        return hex_ecken(self.hex_q, self.hex_r, self.kante_km)
+
+
+class HexGitter:
+    """
+    Hexagonale Dichteraster der Tweets mit Koordinaten in mehreren Auflösungen.
+    Die Projektion erfolgt einmal für alle Punkte, danach je Stufe nur das
+    vektorisierte Runden auf das Sechseck und ein Zählen der belegten Zellen.
+    """
+
+    def __init__(self, stufen):
+        self.stufen = stufen
+
+    def __getitem__(self, stufe):
+        return self.stufen[stufe]
+
+    def __len__(self):
+        return len(self.stufen)
+
+    @classmethod
+    def bauen(cls, lon, lat, tage, tag_idx, topic_idx, kanten_km=KANTEN_KM):
+        """
+        lon/lat: Koordinaten je Tweet (NaN = ohne Koordinaten, wird übersprungen)
+        tage: Tagesachse, tag_idx / topic_idx: Integer-Codes je Tweet (-1 = ungültiger Tag)
+        """
+        lon = np.asarray(lon, dtype=np.float64)
+        lat = np.asarray(lat, dtype=np.float64)
+        tag_idx = np.asarray(tag_idx)
+        topic_idx = np.asarray(topic_idx)
+
+        gueltig = ~(np.isnan(lon) | np.isnan(lat)) & (tag_idx >= 0)
+        x, y = projizieren(lon[gueltig], lat[gueltig])
+        return cls([HexAggregat.bauen(kante, x, y, tage, tag_idx[gueltig], topic_idx[gueltig])
+                    for kante in kanten_km])
+
+    def speichern(self, pfad):
+        arrays = {}
+        for i, stufe in enumerate(self.stufen):
+            for name in ['hex_q', 'hex_r', 'hex_idx', 'tag_idx', 'topic_idx', 'anzahl']:
+                arrays[f"{i}_{name}"] = getattr(stufe, name)
+        achsen = {
+            'kanten_km': [stufe.kante_km for stufe in self.stufen],
+            'tage': [tag.isoformat() for tag in self.stufen[0].tage] if self.stufen else [],
+            'topic': TOPICS
+        }
+        np.savez_compressed(pfad, achsen=np.array(json.dumps(achsen)), **arrays)
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        achsen = json.loads(str(data['achsen']))
+        if achsen['topic'] != TOPICS:
+            raise ValueError("Gespeichertes Hex-Gitter passt nicht zu TOPICS - bitte neu bauen")
+        tage = [date.fromisoformat(tag) for tag in achsen['tage']]
+        return cls([
+            HexAggregat(kante, data[f"{i}_hex_q"], data[f"{i}_hex_r"], tage, data[f"{i}_hex_idx"],
+                        data[f"{i}_tag_idx"], data[f"{i}_topic_idx"], data[f"{i}_anzahl"])
+            for i, kante in enumerate(achsen['kanten_km'])
+        ])
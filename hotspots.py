@@ -0,0 +1,231 @@
+import itertools
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from gazetteer import einheitsvektoren, ERDRADIUS_KM
+
+# Standardparameter: Nachbarschaftsradius (km) und Mindestanzahl Tweets für einen Kernpunkt
+EPS_KM = 2.0
+MIN_TWEETS = 30
+
+# Nachbarpaare je Block (begrenzt den Speicher für die Nachbarlisten)
+PAARE_JE_BLOCK = 5_000_000
+
+RAUSCHEN = -1
+
+# Zellschlüssel: drei Ganzzahlkoordinaten zu je 21 Bit
+_ZELLEN_VERSATZ = 1 << 20
+
+
+def _sehne(km):
+    """Großkreisabstand (km) → Sehnenlänge auf der Einheitskugel (gleiche Reihenfolge wie Haversine)"""
+    return 2 * np.sin(km / ERDRADIUS_KM / 2)
+
+
+def _bloecke(laengen, budget=PAARE_JE_BLOCK):
+    """Blockgrenzen (start, ende), sodass jeder Block höchstens ca. budget Nachbarpaare liefert"""
+    kumuliert = np.cumsum(laengen)
+    start = 0
+    while start < len(laengen):
+        bisher = kumuliert[start] - laengen[start]
+        ende = max(int(np.searchsorted(kumuliert, bisher + budget, side='right')), start + 1)
+        yield start, ende
+        start = ende
+
+
+def _nachbarn(baum, punkte, radius):
+    """Nachbarlisten eines Blocks als flache Arrays (Zeile, Nachbar), parallel über alle Kerne"""
+    listen = baum.query_ball_point(punkte, radius, workers=-1, return_sorted=False)
+    laengen = np.fromiter((len(liste) for liste in listen), dtype=np.int64, count=len(listen))
+    zeilen = np.repeat(np.arange(len(listen)), laengen)
+    spalten = np.concatenate(listen).astype(np.int64) if laengen.sum() else np.empty(0, dtype=np.int64)
+    return zeilen, spalten
+
+
+def _zellen_nachbarn(schluessel):
+    """
+    Paare benachbarter belegter Zellen (Versatz bis ±2 je Achse, jede Paarung einmal).
+    schluessel: sortierte int64-Schlüssel der Zellen
+    """
+    paare = []
+    for versatz in itertools.product(range(-2, 3), repeat=3):
+        if versatz <= (0, 0, 0):
+            continue
+        gesucht = schluessel + (versatz[0] << 42) + (versatz[1] << 21) + versatz[2]
+        pos = np.minimum(np.searchsorted(schluessel, gesucht), len(schluessel) - 1)
+        treffer = np.flatnonzero(schluessel[pos] == gesucht)
+        paare.append(np.column_stack([treffer, pos[treffer]]))
+    return np.concatenate(paare)
+
+
+def _zellen_schluessel(zellen):
+    return ((zellen[..., 0] + _ZELLEN_VERSATZ) << 42) | ((zellen[..., 1] + _ZELLEN_VERSATZ) << 21) \
+        | (zellen[..., 2] + _ZELLEN_VERSATZ)
+
+
+def _komponenten(punkte, radius):
+    """
+    Zusammenhangskomponenten der Kernpunkte (Kante = Abstand <= radius) ohne alle
+    Nachbarpaare aufzuzählen (Gitter-DBSCAN):
+    - Würfelzellen mit Kantenlänge radius/√3: alle Punkte einer Zelle liegen höchstens
+      radius auseinander und gehören zur selben Komponente
+    - benachbarte Zellen: zuerst über je einen Vertreterpunkt verbunden (vektorisiert),
+      übrige Paare über den nächsten Punkt per KD-Baum (exakt)
+    Returns: Komponente je Punkt
+    """
+    zellen = np.floor(punkte / (radius / np.sqrt(3))).astype(np.int64)
+    schluessel, erste, zelle_idx = np.unique(_zellen_schluessel(zellen), return_inverse=True, return_index=True)
+    zelle_idx = zelle_idx.ravel()
+    paare = _zellen_nachbarn(schluessel)
+    anzahl_zellen = len(schluessel)
+
+    # Vertreter (erster Punkt je Zelle) nah genug → Zellen sicher verbunden
+    abstand = np.linalg.norm(punkte[erste[paare[:, 0]]] - punkte[erste[paare[:, 1]]], axis=1)
+    verbunden = paare[abstand <= radius]
+    graph = coo_matrix((np.ones(len(verbunden), dtype=np.int8), (verbunden[:, 0], verbunden[:, 1])),
+                       shape=(anzahl_zellen, anzahl_zellen))
+    komponente = connected_components(graph, directed=False)[1]
+
+    # Übrige Paare aus verschiedenen Komponenten exakt prüfen
+    offen = paare[komponente[paare[:, 0]] != komponente[paare[:, 1]]]
+    if len(offen):
+        reihenfolge = np.argsort(zelle_idx, kind='stable')
+        grenzen = np.searchsorted(zelle_idx[reihenfolge], np.arange(anzahl_zellen + 1))
+        baeume = {}
+        for a, b in offen:
+            if komponente[a] == komponente[b]:
+                continue
+            if b not in baeume:
+                baeume[b] = cKDTree(punkte[reihenfolge[grenzen[b]:grenzen[b + 1]]])
+            abstand, _ = baeume[b].query(punkte[reihenfolge[grenzen[a]:grenzen[a + 1]]],
+                                         distance_upper_bound=radius)
+            if np.isfinite(abstand).any():
+                komponente[komponente == komponente[b]] = komponente[a]
+
+    return komponente[zelle_idx]
+
+
+def dbscan(lon, lat, eps_km=EPS_KM, min_tweets=MIN_TWEETS, gewichte=None):
+    """
+    DBSCAN über Großkreisabstände: KD-Baum auf der Einheitskugel, der Sehnenabstand
+    ist monoton im Haversine-Abstand, die eps-Kugel ist also exakt.
+    - Kernpunkte: Nachbaranzahl zuerst ohne Listen gezählt (parallel); gewichtete
+      Summen nur für Punkte, die ungewichtet unter min_tweets bleiben
+    - Cluster: Zusammenhangskomponenten der Kernpunkte über Gitterzellen (_komponenten)
+    - Randpunkte: Cluster des nächsten Kernpunkts innerhalb von eps
+    Returns: Cluster-Nummer je Punkt (RAUSCHEN = -1), nach Größe absteigend nummeriert
+    """
+    n = len(lon)
+    gewichte = np.ones(n, dtype=np.int64) if gewichte is None else np.asarray(gewichte, dtype=np.int64)
+    labels = np.full(n, RAUSCHEN, dtype=np.int64)
+    if n == 0:
+        return labels
+
+    punkte = einheitsvektoren(lat, lon)
+    radius = _sehne(eps_km)
+    baum = cKDTree(punkte)
+
+    # 1. Kernpunkte (Gewichte >= 1, ungewichtet genügend Nachbarn reicht also)
+    anzahl = baum.query_ball_point(punkte, radius, workers=-1, return_length=True).astype(np.int64)
+    offen = np.flatnonzero(anzahl < min_tweets)
+    if (gewichte > 1).any():
+        for start, ende in _bloecke(anzahl[offen]):
+            zeilen, spalten = _nachbarn(baum, punkte[offen[start:ende]], radius)
+            anzahl[offen[start:ende]] = np.bincount(zeilen, weights=gewichte[spalten], minlength=ende - start)
+    kern = np.flatnonzero(anzahl >= min_tweets)
+    if len(kern) == 0:
+        return labels
+
+    # 2. Kernpunkte verbinden
+    komponente = _komponenten(punkte[kern], radius)
+    kern_baum = cKDTree(punkte[kern])
+
+    # 3. Randpunkte dem nächsten Kernpunkt zuordnen
+    kern_labels = np.full(n, RAUSCHEN, dtype=np.int64)
+    kern_labels[kern] = komponente
+    rand = np.flatnonzero(kern_labels == RAUSCHEN)
+    if len(rand):
+        abstand, naechster = kern_baum.query(punkte[rand], distance_upper_bound=radius, workers=-1)
+        treffer = np.isfinite(abstand)
+        kern_labels[rand[treffer]] = komponente[naechster[treffer]]
+
+    # Nach Größe (Tweets) absteigend umnummerieren
+    zugeordnet = kern_labels != RAUSCHEN
+    groesse = np.bincount(kern_labels[zugeordnet], weights=gewichte[zugeordnet])
+    rang = np.empty(len(groesse), dtype=np.int64)
+    rang[np.argsort(-groesse, kind='stable')] = np.arange(len(groesse))
+    labels[zugeordnet] = rang[kern_labels[zugeordnet]]
+    return labels
+
+
+def hotspots(lon, lat, eps_km=EPS_KM, min_tweets=MIN_TWEETS):
+    """
+    DBSCAN je Tweet. Viele Tweets teilen exakt dieselben Koordinaten (Ortsmittelpunkte),
+    daher wird jeder Ort nur einmal mit seiner Tweet-Anzahl als Gewicht geclustert.
+    Tweets ohne Koordinaten (NaN) erhalten RAUSCHEN.
+    """
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    labels = np.full(len(lon), RAUSCHEN, dtype=np.int64)
+
+    gueltig = np.flatnonzero(~(np.isnan(lon) | np.isnan(lat)))
+    orte, inverse, gewichte = np.unique(np.column_stack([lon[gueltig], lat[gueltig]]), axis=0,
+                                        return_inverse=True, return_counts=True)
+    labels[gueltig] = dbscan(orte[:, 0], orte[:, 1], eps_km, min_tweets, gewichte)[inverse.ravel()]
+    return labels
+
+
+def zusammenfassen(labels, lon, lat, tage=None, topics=None, top_n=3, topic_namen=None):
+    """
+    Steckbrief je Cluster: Größe, Mittelpunkt, Ausdehnung (km), Zeitraum, dominante Topics.
+    tage: datetime64[D] je Tweet (NaT erlaubt), topics: Topic je Tweet (-1 = ohne Topic),
+    topic_namen: optionales dict Topic → Beschriftung
+    Returns: DataFrame (eine Zeile je Cluster, nach Größe sortiert)
+    """
+    labels = np.asarray(labels)
+    maske = labels != RAUSCHEN
+    if not maske.any():
+        return pd.DataFrame(columns=['cluster', 'anzahl', 'lon', 'lat', 'ausdehnung_km',
+                                     'erster_tag', 'letzter_tag', 'dominante_topics'])
+
+    cluster = labels[maske]
+    punkte = einheitsvektoren(np.asarray(lat)[maske], np.asarray(lon)[maske])
+    anzahl = np.bincount(cluster)
+
+    # Mittelpunkt = normierter Mittelwert der Einheitsvektoren
+    summe = np.column_stack([np.bincount(cluster, weights=punkte[:, i]) for i in range(3)])
+    mitte = summe / np.linalg.norm(summe, axis=1, keepdims=True)
+    abstand = np.arccos(np.clip((punkte * mitte[cluster]).sum(axis=1), -1, 1)) * ERDRADIUS_KM
+    ausdehnung = np.zeros(len(anzahl))
+    np.maximum.at(ausdehnung, cluster, abstand)
+
+    df = pd.DataFrame({
+        'cluster': np.arange(len(anzahl)),
+        'anzahl': anzahl,
+        'lon': np.degrees(np.arctan2(mitte[:, 1], mitte[:, 0])),
+        'lat': np.degrees(np.arcsin(mitte[:, 2])),
+        'ausdehnung_km': ausdehnung.round(2)
+    })
+
+    if tage is not None:
+        zeitraum = pd.DataFrame({'cluster': cluster, 'tag': pd.to_datetime(np.asarray(tage)[maske])})
+        zeitraum = zeitraum.groupby('cluster')['tag'].agg(['min', 'max'])
+        df['erster_tag'] = zeitraum['min'].reindex(df['cluster']).dt.date.values
+        df['letzter_tag'] = zeitraum['max'].reindex(df['cluster']).dt.date.values
+
+    if topics is not None:
+        topic_namen = topic_namen or {}
+        paare = pd.DataFrame({'cluster': cluster, 'topic': np.asarray(topics)[maske]})
+        paare = paare[paare['topic'] >= 0]
+        haeufigkeit = paare.groupby(['cluster', 'topic']).size().rename('n').reset_index()
+        haeufigkeit = haeufigkeit.sort_values(['cluster', 'n'], ascending=[True, False])
+        texte = {}
+        for nummer, gruppe in haeufigkeit.groupby('cluster'):
+            texte[nummer] = ', '.join(
+                f"{topic_namen.get(topic, topic)} ({n / anzahl[nummer]:.0%})"
+                for topic, n in zip(gruppe['topic'].head(top_n), gruppe['n'].head(top_n)))
+        df['dominante_topics'] = df['cluster'].map(texte).fillna('')
+
+    return df
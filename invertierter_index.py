@@ -0,0 +1,361 @@
+import os
+import re
+import json
+from array import array
+from bisect import bisect_right
+import numpy as np
+
+# Wörter im Originaltext (Unicode, inkl. Umlaute)
+WORT_MUSTER = re.compile(r'\w+')
+
+# Präfixe der Indexterme je Feld
+PRAEFIX_TOKEN = 't:'
+PRAEFIX_HASHTAG = '#'
+PRAEFIX_TEXT = 'w:'
+
+
+def index_terme(tweet):
+    """Alle Indexterme eines Tweets: Tokens, Hashtags und Wörter des Originaltexts"""
+    terme = {PRAEFIX_TOKEN + token for token in tweet.get('tokens', [])}
+    terme.update(PRAEFIX_HASHTAG + tag.lower() for tag in tweet.get('entities', {}).get('hashtags', []))
+    terme.update(PRAEFIX_TEXT + wort for wort in WORT_MUSTER.findall(tweet.get('original_text', '').lower()))
+    return terme
+
+
+def varint_kodieren(werte):
+    """Kodiert nicht-negative Ganzzahlen als Varints (7 Bit pro Byte, vektorisiert)"""
+    werte = np.asarray(werte, dtype=np.uint64)
+
+    # Anzahl Bytes pro Wert
+    laengen = np.ones(len(werte), dtype=np.int64)
+    for k in range(1, 10):
+        laengen += werte >= np.uint64(1 << (7 * k))
+
+    gesamt = int(laengen.sum())
+    wert_idx = np.repeat(np.arange(len(werte)), laengen)
+    pos = np.arange(gesamt) - np.repeat(np.cumsum(laengen) - laengen, laengen)
+
+    daten = ((werte[wert_idx] >> (7 * pos).astype(np.uint64)) & np.uint64(0x7F)).astype(np.uint8)
+    daten[pos < laengen[wert_idx] - 1] |= 0x80  # Fortsetzungsbit
+    return daten, laengen
+
+
+def varint_dekodieren(daten):
+    """Dekodiert eine Varint-Bytefolge zurück in uint64-Werte (vektorisiert)"""
+    daten = np.asarray(daten, dtype=np.uint8)
+    if len(daten) == 0:
+        return np.zeros(0, dtype=np.uint64)
+
+    ende = daten < 0x80
+    starts = np.flatnonzero(np.r_[True, ende[:-1]])
+    gruppe = np.cumsum(np.r_[False, ende[:-1]])
+    pos = np.arange(len(daten)) - starts[gruppe]
+
+    beitraege = (daten & 0x7F).astype(np.uint64) << (7 * pos).astype(np.uint64)
+    return np.add.reduceat(beitraege, starts)
+
+
+def _postings_kodieren(term_ids, ordinale):
+    """(Term, Ordinalzahl)-Paare → varint-kodierte Postings und Grenzen je Term"""
+    # Paare nach Term gruppieren (stabil → Ordinalzahlen bleiben aufsteigend)
+    term_ids = np.frombuffer(term_ids, dtype=np.uint32)
+    ordinale = np.frombuffer(ordinale, dtype=np.uint32).astype(np.int64)
+    reihenfolge = np.argsort(term_ids, kind='stable')
+    term_ids = term_ids[reihenfolge]
+    ordinale = ordinale[reihenfolge]
+
+    # Delta-Kodierung, am Anfang jeder Postingliste der absolute Wert
+    term_starts = np.flatnonzero(np.r_[True, term_ids[1:] != term_ids[:-1]])
+    deltas = np.diff(ordinale, prepend=0)
+    deltas[term_starts] = ordinale[term_starts]
+
+    postings, laengen = varint_kodieren(deltas)
+    grenzen = np.r_[0, np.cumsum(np.add.reduceat(laengen, term_starts))].astype(np.int64)
+    return postings, grenzen
+
+
+class _Segment:
+    """
+    Ein unveränderliches Index-Segment (ein Aktualisierungslauf).
+    Postings sind delta- und varint-kodierte globale Tweet-Ordinalzahlen.
+    """
+
+    def __init__(self, pfad):
+        data = np.load(pfad)
+        self.quelle = str(data['quelle'])
+        self.erste_ordinale = int(data['erste_ordinale'])
+        self.ende_byte = int(data['ende_byte'])
+        self.byte_offsets = data['byte_offsets']
+        self.postings = data['postings']
+        self.grenzen = data['grenzen']
+
+        terme = data['terme'].tobytes().decode('utf-8')
+        self.lexikon = {term: i for i, term in enumerate(terme.split('\x00'))} if terme else {}
+
+    def __len__(self):
+        return len(self.byte_offsets)
+
+    def postings_von(self, term):
+        i = self.lexikon.get(term)
+        if i is None:
+            return None
+        return np.cumsum(varint_dekodieren(self.postings[self.grenzen[i]:self.grenzen[i + 1]])).astype(np.int64)
+
+
+class _AnfrageParser:
+    """
+    Rekursiver Parser für Boolesche Anfragen.
+    Syntax: maske  #lockdown  text:Maske  "bleibt zu hause"  AND  OR  NOT  ( )
+    Mehrere Terme ohne Operator werden mit AND verknüpft.
+    """
+
+    def __init__(self, anfrage):
+        self.teile = re.findall(r'"[^"]*"|\(|\)|[^\s()]+', anfrage)
+        self.pos = 0
+
+    def _naechstes(self):
+        return self.teile[self.pos] if self.pos < len(self.teile) else None
+
+    def parse(self):
+        knoten = self._oder()
+        if self._naechstes() is not None:
+            raise ValueError(f"Unerwartetes Element in Anfrage: {self._naechstes()}")
+        return knoten
+
+    def _oder(self):
+        knoten = self._und()
+        while self._naechstes() == 'OR':
+            self.pos += 1
+            knoten = ('oder', knoten, self._und())
+        return knoten
+
+    def _und(self):
+        knoten = self._nicht()
+        while self._naechstes() not in (None, 'OR', ')'):
+            if self._naechstes() == 'AND':
+                self.pos += 1
+            knoten = ('und', knoten, self._nicht())
+        return knoten
+
+    def _nicht(self):
+        if self._naechstes() == 'NOT':
+            self.pos += 1
+            return ('nicht', self._nicht())
+        return self._atom()
+
+    def _atom(self):
+        teil = self._naechstes()
+        if teil is None or teil == ')':
+            raise ValueError("Unvollständige Anfrage")
+        self.pos += 1
+
+        if teil == '(':
+            knoten = self._oder()
+            if self._naechstes() != ')':
+                raise ValueError("Fehlende schließende Klammer")
+            self.pos += 1
+            return knoten
+        if teil.startswith('"'):
+            return ('phrase', teil.strip('"'))
+        if teil.startswith('#'):
+            return ('term', PRAEFIX_HASHTAG + teil[1:].lower())
+        if teil.lower().startswith('text:'):
+            return ('term', PRAEFIX_TEXT + teil[5:].lower())
+        return ('term', PRAEFIX_TOKEN + teil.lower())
+
+
+class InvertierterIndex:
+    """
+    Persistenter invertierter Index über bereinigte Tweets (JSONL).
+    - Terme: Tokens, Hashtags (#...) und Wörter des Originaltexts (text:...)
+    - Postings: komprimierte Listen von Tweet-Ordinalzahlen
+    - Byte-Offsets je Tweet für den Direktzugriff (KWIC)
+    - Inkrementell: jede Aktualisierung schreibt ein neues Segment und liest
+      nur Zeilen, die noch nicht indexiert sind
+    """
+
+    def __init__(self, index_dir):
+        self.index_dir = index_dir
+        os.makedirs(index_dir, exist_ok=True)
+
+        dateien = sorted(f for f in os.listdir(index_dir) if f.startswith('segment_') and f.endswith('.npz'))
+        self.segmente = [_Segment(os.path.join(index_dir, f)) for f in dateien]
+        self._dateien = {}
+
+    @property
+    def anzahl_tweets(self):
+        return sum(len(segment) for segment in self.segmente)
+
+    def aktualisieren(self, jsonl_datei):
+        """
+        Indexiert neue Tweets einer JSONL-Datei. Bereits indexierte Dateien
+        werden ab dem zuletzt gelesenen Byte fortgesetzt (angehängte Zeilen).
+        Returns: Anzahl neu indexierter Tweets
+        """
+        quelle = os.path.abspath(jsonl_datei)
+        start_byte = max((s.ende_byte for s in self.segmente if s.quelle == quelle), default=0)
+        if os.path.getsize(quelle) < start_byte:
+            raise ValueError(f"Datei ist kürzer als beim letzten Indexieren (neu geschrieben?): {quelle}")
+
+        erste_ordinale = self.anzahl_tweets
+        lexikon = {}
+        term_ids = array('I')
+        ordinale = array('I')
+        byte_offsets = array('q')
+
+        offset = start_byte
+        with open(quelle, 'rb') as f:
+            f.seek(start_byte)
+            for line in f:
+                # Unvollständige letzte Zeile (Datei wird noch geschrieben) auslassen
+                if not line.endswith(b'\n'):
+                    break
+
+                zeilen_offset = offset
+                offset += len(line)
+
+                try:
+                    tweet = json.loads(line)
+                except:
+                    continue
+
+                ordinal = erste_ordinale + len(byte_offsets)
+                byte_offsets.append(zeilen_offset)
+                for term in index_terme(tweet):
+                    term_ids.append(lexikon.setdefault(term.replace('\x00', ''), len(lexikon)))
+                    ordinale.append(ordinal)
+
+        if not byte_offsets:
+            return 0
+
+        if term_ids:
+            postings, grenzen = _postings_kodieren(term_ids, ordinale)
+        else:
+            # Nur Tweets ohne Indexterme: Segment ohne Postings, die Byte-Offsets zählen trotzdem
+            postings, grenzen = np.zeros(0, dtype=np.uint8), np.zeros(1, dtype=np.int64)
+
+        terme = '\x00'.join(sorted(lexikon, key=lexikon.get)).encode('utf-8')
+        pfad = os.path.join(self.index_dir, f"segment_{len(self.segmente):04d}.npz")
+        np.savez(
+            pfad,
+            quelle=np.array(quelle),
+            erste_ordinale=np.array(erste_ordinale),
+            ende_byte=np.array(offset),
+            byte_offsets=np.frombuffer(byte_offsets, dtype=np.int64),
+            postings=postings,
+            grenzen=grenzen,
+            terme=np.frombuffer(terme, dtype=np.uint8)
+        )
+        self.segmente.append(_Segment(pfad))
+
+        return len(byte_offsets)
+
+    def postings(self, term):
+        """Sortierte Ordinalzahlen aller Tweets mit dem (präfixierten) Indexterm"""
+        teile = [p for p in (segment.postings_von(term) for segment in self.segmente) if p is not None]
+        if not teile:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(teile)
+
+    def tweets(self, ordinale):
+        """Liest Tweets per Byte-Offset direkt aus den JSONL-Dateien"""
+        starts = [segment.erste_ordinale for segment in self.segmente]
+
+        for ordinal in ordinale:
+            segment = self.segmente[bisect_right(starts, ordinal) - 1]
+
+            f = self._dateien.get(segment.quelle)
+            if f is None:
+                f = self._dateien[segment.quelle] = open(segment.quelle, 'rb')
+
+            f.seek(int(segment.byte_offsets[ordinal - segment.erste_ordinale]))
+            yield int(ordinal), json.loads(f.readline())
+
+    def schliessen(self):
+        for f in self._dateien.values():
+            f.close()
+        self._dateien = {}
+
+    def _phrase_muster(self, phrase):
+        woerter = WORT_MUSTER.findall(phrase.lower())
+        return woerter, re.compile(r'\b' + r'\W+'.join(map(re.escape, woerter)) + r'\b', re.IGNORECASE)
+
+    def _auswerten(self, knoten):
+        art = knoten[0]
+
+        if art == 'term':
+            return self.postings(knoten[1])
+
+        if art == 'phrase':
+            woerter, muster = self._phrase_muster(knoten[1])
+            if not woerter:
+                return np.zeros(0, dtype=np.int64)
+
+            # Kandidaten über die Wortpostings, danach Prüfung am Originaltext
+            kandidaten = self.postings(PRAEFIX_TEXT + woerter[0])
+            for wort in woerter[1:]:
+                kandidaten = np.intersect1d(kandidaten, self.postings(PRAEFIX_TEXT + wort), assume_unique=True)
+            if len(woerter) == 1:
+                return kandidaten
+            return np.array([ordinal for ordinal, tweet in self.tweets(kandidaten)
+                             if muster.search(tweet.get('original_text', ''))], dtype=np.int64)
+
+        if art == 'nicht':
+            return np.setdiff1d(np.arange(self.anzahl_tweets), self._auswerten(knoten[1]), assume_unique=True)
+
+        if art == 'und':
+            links = self._auswerten(knoten[1])
+            # "a AND NOT b" als Differenz statt über das Komplement
+            if knoten[2][0] == 'nicht':
+                return np.setdiff1d(links, self._auswerten(knoten[2][1]), assume_unique=True)
+            return np.intersect1d(links, self._auswerten(knoten[2]), assume_unique=True)
+
+        return np.union1d(self._auswerten(knoten[1]), self._auswerten(knoten[2]))
+
+    def suche(self, anfrage):
+        """Boolesche Anfrage (AND, OR, NOT, Klammern, "Phrasen") → sortierte Ordinalzahlen"""
+        return self._auswerten(_AnfrageParser(anfrage).parse())
+
+    def _hervorhebungen(self, knoten):
+        """Regex-Muster aller positiven Terme einer Anfrage (für KWIC)"""
+        art = knoten[0]
+        if art == 'nicht':
+            return []
+        if art in ('und', 'oder'):
+            return self._hervorhebungen(knoten[1]) + self._hervorhebungen(knoten[2])
+        if art == 'phrase':
+            return [self._phrase_muster(knoten[1])[1].pattern]
+
+        term = knoten[1]
+        if term.startswith(PRAEFIX_HASHTAG):
+            return [re.escape(term) + r'\b']
+        if term.startswith(PRAEFIX_TEXT):
+            return [r'\b' + re.escape(term[len(PRAEFIX_TEXT):]) + r'\b']
+        # Tokens sind Lemmata: Wortanfang genügt (maske → Masken)
+        return [r'\b' + re.escape(term[len(PRAEFIX_TOKEN):])]
+
+    def kwic(self, anfrage, breite=40, limit=20):
+        """
+        Keyword-in-Context: Treffer einer Anfrage mit umgebendem Originaltext.
+        Returns: (Anzahl Treffer, Liste von Dicts mit ordinal, tweet_id, created_at, links, treffer, rechts)
+        """
+        knoten = _AnfrageParser(anfrage).parse()
+        ordinale = self._auswerten(knoten)
+        muster = re.compile('|'.join(self._hervorhebungen(knoten)) or r'$^', re.IGNORECASE)
+
+        zeilen = []
+        for ordinal, tweet in self.tweets(ordinale[:limit]):
+            text = ' '.join(tweet.get('original_text', '').split())
+            fund = muster.search(text)
+            start, ende = (fund.start(), fund.end()) if fund else (0, 0)
+
+            zeilen.append({
+                'ordinal': ordinal,
+                'tweet_id': tweet.get('tweet_id'),
+                'created_at': tweet.get('created_at'),
+                'links': text[max(0, start - breite):start],
+                'treffer': text[start:ende],
+                'rechts': text[ende:ende + breite]
+            })
+
+        return len(ordinale), zeilen
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# Items mit weniger Vorkommen (beide Gruppen zusammen) werden nicht bewertet
+MIN_ANZAHL = 5
+
+# Ersatzwert für Nullzählungen im Log-Ratio (Hardie 2014)
+NULL_ERSATZ = 0.5
+
+SPALTEN = ['item', 'anzahl', 'anzahl_ref', 'pro_mio', 'pro_mio_ref',
+           'g2', 'p_wert', 'chi2', 'log_ratio', 'ki_unten', 'ki_oben']
+
+
+def _x_log_x_durch(x, erwartet):
+    """x · ln(x / erwartet) mit 0 · ln 0 = 0"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(x > 0, x * np.log(x / erwartet), 0.0)
+
+
+def masse(a, b, n1, n2, konfidenz=0.95):
+    """
+    Keyness-Maße elementweise für Arrays (ein Eintrag je Item).
+    a, b: Vorkommen in Ziel- und Referenzgruppe; n1, n2: Größe der Gruppen (alle Vorkommen)
+    g2:        Log-Likelihood der 2×2-Tafel (Dunning), Vorzeichen + = im Ziel überrepräsentiert
+    chi2:      Pearson-Chi² der 2×2-Tafel (ohne Yates-Korrektur)
+    log_ratio: log2 der relativen Häufigkeiten (Effektgröße), mit Konfidenzintervall
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    n1 = np.asarray(n1, dtype=np.float64)
+    n2 = np.asarray(n2, dtype=np.float64)
+    n = n1 + n2
+
+    # Vollständige 2×2-Tafel: Item / übrige Vorkommen × Ziel / Referenz
+    c, d = n1 - a, n2 - b
+    g2 = 2 * (_x_log_x_durch(a, n1 * (a + b) / n) + _x_log_x_durch(b, n2 * (a + b) / n)
+              + _x_log_x_durch(c, n1 * (c + d) / n) + _x_log_x_durch(d, n2 * (c + d) / n))
+    # Rundungsfehler abfangen (g2 ist theoretisch >= 0)
+    g2 = np.maximum(g2, 0.0)
+    ueber = a * n2 >= b * n1
+    p_wert = stats.chi2.sf(g2, df=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        chi2 = n * (a * d - b * c) ** 2 / ((a + b) * (c + d) * n1 * n2)
+
+    a_glatt = np.where(a > 0, a, NULL_ERSATZ)
+    b_glatt = np.where(b > 0, b, NULL_ERSATZ)
+    log_ratio = np.log2((a_glatt / n1) / (b_glatt / n2))
+    # Standardfehler des log-Ratenverhältnisses (Poisson): sqrt(1/a + 1/b), umgerechnet in log2
+    fehler = np.sqrt(1 / a_glatt + 1 / b_glatt) / np.log(2)
+    z = stats.norm.ppf(0.5 + konfidenz / 2)
+
+    return {
+        'pro_mio': a / n1 * 1e6,
+        'pro_mio_ref': b / n2 * 1e6,
+        'g2': np.where(ueber, g2, -g2),
+        'p_wert': p_wert,
+        'chi2': np.nan_to_num(chi2),
+        'log_ratio': log_ratio,
+        'ki_unten': log_ratio - z * fehler,
+        'ki_oben': log_ratio + z * fehler
+    }
+
+
+def _tabelle(items, a, b, werte, sortieren):
+    df = pd.DataFrame({'item': items, 'anzahl': a.astype(np.int64), 'anzahl_ref': b.astype(np.int64), **werte},
+                      columns=SPALTEN)
+    if sortieren:
+        df = df.sort_values('g2', ascending=False, kind='stable').reset_index(drop=True)
+    return df
+
+
+def _objekte(werte):
+    """Liste als Objekt-Array (Items können Tupel sein)"""
+    array = np.empty(len(werte), dtype=object)
+    array[:] = werte
+    return array
+
+
+def _summe(zaehlung, gruppen):
+    """Zählungen einer Gruppe bzw. Summe über eine Liste von Gruppen (dichter Vektor über alle Items)"""
+    namen = gruppen if isinstance(gruppen, list) else [gruppen]
+    zeilen = [zaehlung.gruppen.index(name) for name in namen]
+    return np.asarray(zaehlung.matrix[zeilen].sum(axis=0)).ravel().astype(np.float64)
+
+
+def vergleich(zaehlung, gruppe, referenz, min_anzahl=MIN_ANZAHL, konfidenz=0.95):
+    """
+    Keyness aller Items zwischen zwei Gruppen einer GruppenTopK-Zählung (z.B. 'Urban' gegen 'Rural').
+    gruppe / referenz: Gruppenname oder Liste von Gruppen (werden summiert)
+    Returns: DataFrame (SPALTEN), absteigend nach vorzeichenbehaftetem G²
+    (oben typisch für gruppe, unten typisch für referenz)
+    """
+    a = _summe(zaehlung, gruppe)
+    b = _summe(zaehlung, referenz)
+    n1, n2 = a.sum(), b.sum()
+    if n1 == 0 or n2 == 0:
+        return pd.DataFrame(columns=SPALTEN)
+
+    behalten = np.flatnonzero(a + b >= max(min_anzahl, 1))
+    a, b = a[behalten], b[behalten]
+    return _tabelle(_objekte(zaehlung.items)[behalten], a, b, masse(a, b, n1, n2, konfidenz), sortieren=True)
+
+
+def gegen_rest(zaehlung, min_anzahl=MIN_ANZAHL, konfidenz=0.95):
+    """
+    Jede Gruppe gegen alle übrigen in einem Durchgang über die Nicht-Null-Einträge der
+    Zählmatrix (z.B. 16 Bundesländer × gesamtes Vokabular). Items, die in einer Gruppe
+    nicht vorkommen, erscheinen dort nicht (sie können nur unterrepräsentiert sein).
+    Returns: lange Tabelle mit 'gruppe' + SPALTEN, je Gruppe absteigend nach G²
+    """
+    matrix = zaehlung.matrix.tocsr()
+    gruppen_summen = np.asarray(matrix.sum(axis=1)).ravel().astype(np.float64)
+    item_summen = np.asarray(matrix.sum(axis=0)).ravel().astype(np.float64)
+    gesamt = gruppen_summen.sum()
+
+    zeilen = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+    spalten = matrix.indices
+    a = matrix.data.astype(np.float64)
+    b = item_summen[spalten] - a
+    n1 = gruppen_summen[zeilen]
+    n2 = gesamt - n1
+
+    behalten = (item_summen[spalten] >= min_anzahl) & (n2 > 0)
+    zeilen, spalten, a, b, n1, n2 = (x[behalten] for x in (zeilen, spalten, a, b, n1, n2))
+
+    df = _tabelle(_objekte(zaehlung.items)[spalten], a, b, masse(a, b, n1, n2, konfidenz), sortieren=False)
+    df.insert(0, 'gruppe', _objekte(zaehlung.gruppen)[zeilen])
+    # Gruppen in Zählreihenfolge, innerhalb absteigend nach G²
+    reihenfolge = np.lexsort((-df['g2'].to_numpy(), zeilen))
+    return df.iloc[reihenfolge].reset_index(drop=True)
+
+
+def top(ergebnis, n=20, p_max=0.001, richtung=1):
+    """
+    Die n stärksten signifikanten Items (p < p_max) aus vergleich() oder gegen_rest().
+    richtung: 1 = überrepräsentiert, -1 = unterrepräsentiert
+    """
+    treffer = ergebnis[(ergebnis['p_wert'] < p_max) & (np.sign(ergebnis['g2']) == richtung)]
+    treffer = treffer.sort_values('g2', ascending=richtung < 0, kind='stable')
+    if 'gruppe' in treffer.columns:
+        return treffer.groupby('gruppe', sort=False).head(n).reset_index(drop=True)
+    return treffer.head(n).reset_index(drop=True)
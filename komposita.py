@@ -0,0 +1,99 @@
+import json
+from collections import Counter
+
+# Tokens mit weniger Vorkommen im Korpus zählen nicht als Bestandteil
+MIN_VORKOMMEN = 5
+
+# Kürzester Bestandteil und kürzestes Token, das überhaupt zerlegt wird
+MIN_TEILLAENGE = 3
+MIN_LAENGE = 8
+
+# Fugenelemente zwischen den Bestandteilen (Maske-n-pflicht, Gesundheit-s-amt),
+# längere zuerst; zusätzlich getilgtes Schluss-e (Schul-schließung → schule)
+FUGEN = ('ens', 'es', 'en', 'er', 's', 'n', 'e')
+
+
+class KompositaZerleger:
+    """
+    Zerlegt deutsche Komposita anhand der Korpushäufigkeiten (Koehn & Knight 2003):
+    Ein Token wird an der Stelle geteilt, an der das geometrische Mittel der
+    Häufigkeiten beider Teile am größten ist - aber nur, wenn es die Häufigkeit
+    des ganzen Tokens übersteigt. Erhalten bleibt ein Kompositum also nur, wenn
+    anzahl(ganz)² >= anzahl(vorne) · anzahl(hinten); auch häufige Komposita werden
+    zerlegt, wenn ihre Teile noch häufiger sind (maske 500, pflicht 300,
+    maskenpflicht 200 → maske + pflicht).
+    Teile werden rekursiv weiter zerlegt. Jede Entscheidung je verschiedenem
+    Token liegt in einem Memo, das mit den Häufigkeiten gespeichert wird.
+    """
+
+    def __init__(self, haeufigkeiten, ganz=(), zerlegungen=None, min_vorkommen=MIN_VORKOMMEN):
+        self.haeufigkeiten = {token: anzahl for token, anzahl in haeufigkeiten.items() if anzahl >= min_vorkommen}
+        self.min_vorkommen = min_vorkommen
+        # Tokens, die nie zerlegt werden (z.B. zusammengeschriebene Eigennamen aus 07)
+        self.ganz = {token.lower() for token in ganz}
+        self.zerlegungen = {token: tuple(teile) for token, teile in (zerlegungen or {}).items()}
+
+    def __len__(self):
+        return len(self.zerlegungen)
+
+    @classmethod
+    def aus_tokens(cls, dokumente, min_vorkommen=MIN_VORKOMMEN, **kwargs):
+        """Häufigkeiten aus Token-Listen (z.B. tweet['tokens'] aus 07)"""
+        zaehler = Counter()
+        for tokens in dokumente:
+            zaehler.update(tokens)
+        return cls(zaehler, min_vorkommen=min_vorkommen, **kwargs)
+
+    def speichern(self, pfad):
+        with open(pfad, 'w', encoding='utf-8') as f:
+            json.dump({'min_vorkommen': self.min_vorkommen, 'haeufigkeiten': self.haeufigkeiten,
+                       'zerlegungen': self.zerlegungen}, f, ensure_ascii=False)
+
+    @classmethod
+    def laden(cls, pfad, **kwargs):
+        with open(pfad, 'r', encoding='utf-8') as f:
+            daten = json.load(f)
+        return cls(daten['haeufigkeiten'], zerlegungen=daten['zerlegungen'],
+                   min_vorkommen=daten['min_vorkommen'], **kwargs)
+
+    def _bestandteil(self, teil):
+        """Häufigste Grundform eines vorderen Bestandteils (mit/ohne Fuge, getilgtes e) und ihre Häufigkeit"""
+        beste, beste_anzahl = teil, self.haeufigkeiten.get(teil, 0)
+        kandidaten = [teil[:-len(fuge)] for fuge in FUGEN if teil.endswith(fuge)] + [teil + 'e']
+        for kandidat in kandidaten:
+            anzahl = self.haeufigkeiten.get(kandidat, 0)
+            if len(kandidat) >= MIN_TEILLAENGE and anzahl > beste_anzahl:
+                beste, beste_anzahl = kandidat, anzahl
+        return beste, beste_anzahl
+
+    def zerlegen(self, token):
+        """Token → Tupel der Bestandteile (unzerlegt: (token,))"""
+        # Kurze Tokens und Eigennamen kommen nicht ins Memo
+        if len(token) < MIN_LAENGE or token in self.ganz or not token.isalpha():
+            return (token,)
+        ergebnis = self.zerlegungen.get(token)
+        if ergebnis is not None:
+            return ergebnis
+
+        bester_wert = self.haeufigkeiten.get(token, 0) ** 2
+        beste_teilung = None
+        for grenze in range(MIN_TEILLAENGE, len(token) - MIN_TEILLAENGE + 1):
+            rest_anzahl = self.haeufigkeiten.get(token[grenze:], 0)
+            if not rest_anzahl:
+                continue
+            vorne, vorne_anzahl = self._bestandteil(token[:grenze])
+            # Geometrisches Mittel, quadriert verglichen
+            wert = vorne_anzahl * rest_anzahl
+            if wert > bester_wert:
+                bester_wert, beste_teilung = wert, (vorne, token[grenze:])
+
+        ergebnis = (token,)
+        if beste_teilung is not None:
+            vorne, rest = beste_teilung
+            ergebnis = self.zerlegen(vorne) + self.zerlegen(rest)
+        self.zerlegungen[token] = ergebnis
+        return ergebnis
+
+    def anwenden(self, tokens):
+        """Token-Liste mit zerlegten Komposita (Reihenfolge bleibt erhalten)"""
+        return [teil for token in tokens for teil in self.zerlegen(token)]
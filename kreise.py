@@ -0,0 +1,175 @@
+import json
+from datetime import date
+import numpy as np
+import pandas as pd
+from aggregationswuerfel import TOPICS, achsen_summe
+from regionen import extract_bundesland
+from reverse_geocoder import koordinaten
+from gazetteer import Gazetteer, normalisiere
+
+UNBEKANNT = 'Unbekannt'
+
+# VG250-Kreisarten (BEZ), deren Namen mit Kreis-Präfix indiziert werden: Landkreis München
+# und die kreisfreie Stadt München haben dasselbe GEN, aber verschiedene Schlüssel
+LANDKREIS_ARTEN = {'Kreis', 'Landkreis'}
+
+
+def lade_einwohner(einwohner_file):
+    """
+    Einwohner je Kreis aus lokaler CSV (z.B. Destatis 12411-0015, Stand 31.12.2019).
+    Erwartete Spalten: ags (Kreisschlüssel, 5-stellig), einwohner; Trennzeichen ; oder ,
+    Returns: Series (Index = ags)
+    """
+    df = pd.read_csv(einwohner_file, sep=None, engine='python', dtype={'ags': str}, encoding='utf-8-sig')
+    df['ags'] = df['ags'].str.strip().str.zfill(5)
+    return df.set_index('ags')['einwohner'].astype(np.int64)
+
+
+class KreisZuordnung:
+    """
+    Kreis (5-stelliger AGS) je Tweet:
+    1. Koordinaten → Punkt-in-Polygon über den ReverseGeocoder
+    2. sonst city/county aus place bzw. geo → Namensindex der VG250-Gemeinden und -Kreise
+       (innerhalb des Bundeslands, nur eindeutige Namen; Aliase aus dem Gazetteer).
+       Landkreise nur mit Präfix (county 'Landkreis München'), Städte ohne.
+    """
+
+    def __init__(self, geocoder):
+        self.geocoder = geocoder
+        self.gazetteer = Gazetteer.laden()
+        self._land_ags = {name: ags for ags, name in geocoder.land_namen.items()}
+
+        gemeinden = geocoder.gemeinden
+        self._gemeinde_index = self._namensindex(gemeinden['ags'].str[:5], gemeinden['name'])
+        if not geocoder.kreis_arten:
+            print("⚠ Geocoder-Cache ohne Kreisarten (BEZ) - Landkreise werden nicht über den Namen "
+                  "zugeordnet, bitte Cache mit 37 neu bauen")
+        kreis_ags = list(geocoder.kreis_namen.keys())
+        kreis_namen = [f"Kreis {name}" if geocoder.kreis_arten.get(ags) in LANDKREIS_ARTEN else name
+                       for ags, name in geocoder.kreis_namen.items()]
+        self._kreis_index = self._namensindex(pd.Series(kreis_ags), pd.Series(kreis_namen))
+        self._cache = {}
+
+    @staticmethod
+    def _namensindex(kreis_ags, namen):
+        """(Land-AGS, Name) → Kreis-AGS, nur für eindeutige Namen; Name auch ohne Klammerzusatz"""
+        kandidaten = {}
+        for ags, name in zip(kreis_ags, namen):
+            formen = {normalisiere(name), normalisiere(name.split('(')[0])}
+            for form in formen:
+                kandidaten.setdefault((ags[:2], form), set()).add(ags)
+        return {schluessel: next(iter(werte)) for schluessel, werte in kandidaten.items() if len(werte) == 1}
+
+    def _aus_ortsnamen(self, tweet):
+        geo_source = tweet.get('geo_source')
+        if geo_source == 'place' and tweet.get('place'):
+            location_data = tweet['place']
+        elif geo_source == 'coordinates' and tweet.get('geo'):
+            location_data = tweet['geo']
+        else:
+            return None
+
+        bundesland = extract_bundesland(tweet)
+        land = self._land_ags.get(bundesland)
+        if land is None:
+            return None
+
+        schluessel = (land, location_data.get('city'), location_data.get('county'))
+        if schluessel not in self._cache:
+            kreis = None
+            # Englische Namen großer Städte über die Aliase des Gazetteers (Munich → München)
+            if location_data.get('city'):
+                form = normalisiere(self.gazetteer.kanonischer_name(location_data['city'], bundesland))
+                kreis = self._gemeinde_index.get((land, form))
+            if kreis is None and location_data.get('county'):
+                form = normalisiere(self.gazetteer.kanonischer_name(location_data['county'], bundesland))
+                kreis = self._kreis_index.get((land, form)) or self._gemeinde_index.get((land, form))
+            self._cache[schluessel] = kreis
+        return self._cache[schluessel]
+
+    def kreise(self, tweets):
+        """
+        Returns: (kreis_ags als object-Array mit None, Quelle je Tweet:
+                  'koordinaten', 'ortsname' oder None)
+        """
+        lon, lat = koordinaten(tweets)
+        kreis_ags = self.geocoder.zuordnen(lon, lat)['kreis_ags'].to_numpy(dtype=object, copy=True)
+        quelle = np.where(pd.notna(kreis_ags), 'koordinaten', None).astype(object)
+
+        for i in np.flatnonzero(pd.isna(kreis_ags)):
+            kreis = self._aus_ortsnamen(tweets[i])
+            if kreis is not None:
+                kreis_ags[i] = kreis
+                quelle[i] = 'ortsname'
+
+        return kreis_ags, quelle
+
+
+class KreisWuerfel:
+    """
+    Zählwürfel Kreis × Tag × Topic (ca. 400 × Tage × 15).
+    Aufbau per bincount, Auswertung per Filtern und Summieren (siehe Aggregationswuerfel).
+    """
+
+    def __init__(self, kreise, tage, werte):
+        self.kreise = list(kreise)
+        self.tage = list(tage)
+        self.werte = werte
+        self.achsen = {
+            'kreis': self.kreise,
+            'tag': self.tage,
+            'topic': TOPICS
+        }
+
+    @classmethod
+    def bauen(cls, kreise, tage, kreis_idx, tag_idx, topic_idx):
+        """kreise: Kreis-AGS inkl. UNBEKANNT; *_idx: Integer-Codes je Tweet"""
+        form = (len(kreise), len(tage), len(TOPICS))
+        codes = np.ravel_multi_index((kreis_idx, tag_idx, topic_idx), form)
+        werte = np.bincount(codes, minlength=int(np.prod(form))).reshape(form).astype(np.int32)
+        return cls(kreise, tage, werte)
+
+    def speichern(self, pfad):
+        np.savez_compressed(
+            pfad,
+            werte=self.werte,
+            achsen=np.array(json.dumps({
+                'kreise': self.kreise,
+                'tage': [tag.isoformat() for tag in self.tage],
+                'topic': TOPICS
+            }, ensure_ascii=False))
+        )
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        achsen = json.loads(str(data['achsen']))
+        if achsen['topic'] != TOPICS:
+            raise ValueError("Gespeicherter Kreis-Würfel passt nicht zu TOPICS - bitte neu bauen")
+        return cls(achsen['kreise'], [date.fromisoformat(tag) for tag in achsen['tage']], data['werte'])
+
+    def summe(self, nach=(), **auswahl):
+        """
+        nach: Achsen, die erhalten bleiben (kreis, tag, topic)
+        auswahl: z.B. kreis=['09162', '11000'], topic=[0, 2], tag=(start, ende)
+        """
+        namen = ['kreis', 'tag', 'topic']
+        return achsen_summe(self.werte, namen, [self.achsen[name] for name in namen], nach, auswahl)
+
+    def pro_100k(self, einwohner, **auswahl):
+        """
+        Tweets je Kreis absolut und pro 100.000 Einwohner (ohne UNBEKANNT).
+        einwohner: Series (Index = Kreis-AGS), siehe lade_einwohner
+        Returns: DataFrame (Index = Kreis-AGS) mit Anzahl, Einwohner, Pro_100k
+        """
+        anzahl = self.summe(nach=('kreis',), **auswahl).drop(UNBEKANNT, errors='ignore')
+        df = anzahl.to_frame('Anzahl')
+        df['Einwohner'] = einwohner.reindex(df.index)
+        df['Pro_100k'] = df['Anzahl'] / df['Einwohner'] * 100_000
+        return df
+
+    def pro_100k_nach(self, einwohner, achse, **auswahl):
+        """Raten pro 100.000 Einwohner als Matrix Kreis × achse (z.B. topic oder tag)"""
+        anzahl = self.summe(nach=('kreis', achse), **auswahl).unstack(achse)
+        anzahl = anzahl.drop(UNBEKANNT, errors='ignore')
+        return anzahl.div(einwohner.reindex(anzahl.index), axis=0) * 100_000
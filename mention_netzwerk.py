@@ -0,0 +1,187 @@
+import json
+from array import array
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from aggregationswuerfel import REGIONEN
+
+# Konten mit weniger Erwähnungen bleiben außen vor (Tippfehler, Einzelfälle)
+MIN_ERWAEHNUNGEN = 3
+
+# Ein Konto "erreicht" ein Bundesland ab so vielen verschiedenen Nutzern
+MIN_NUTZER_REGION = 3
+
+# Tweet ohne Nutzer-ID
+KEIN_NUTZER = -1
+
+
+def konto_form(mention):
+    """Vergleichsform: Twitter-Namen sind unabhängig von der Schreibweise (@RKI_de = @rki_de)"""
+    return mention.lower()
+
+
+class MentionNetzwerk:
+    """
+    Erwähnungs-Netzwerk Nutzer → erwähntes Konto als dünn besetzte Matrizen.
+    - Inzidenz Tweet × Konto (CSR, zeilengleich zu Cleaned_Data.jsonl und den Merkmalen aus 07b)
+    - Nutzer je Tweet als Integer-Code
+    Kanten Nutzer × Konto, Rankings und Reichweiten entstehen per Zeilenauswahl über eine
+    Merkmals-Maske (Bundesland, Woche, Stadt/Land) und Sparse-Produkten.
+    Die Daten enthalten nur Nutzer-IDs, erwähnt werden Twitter-Namen: Der Graph hat
+    ausschließlich Kanten Nutzer → Konto, Konten geben kein Gewicht weiter.
+    """
+
+    def __init__(self, tweet_ids, nutzer_idx, konten, inzidenz):
+        self.tweet_ids = np.asarray(tweet_ids)
+        self.nutzer_idx = np.asarray(nutzer_idx, dtype=np.int64)
+        self.konten = list(konten)
+        self.inzidenz = sparse.csr_matrix(inzidenz, dtype=np.int32)
+        self.n_nutzer = int(self.nutzer_idx.max()) + 1 if len(self.nutzer_idx) else 0
+
+    def __len__(self):
+        return len(self.konten)
+
+    @classmethod
+    def bauen(cls, input_file, min_erwaehnungen=MIN_ERWAEHNUNGEN):
+        """
+        Liest die JSONL-Datei zeilenweise (gleiche Zeilen wie 07b): user_id und
+        entities['mentions'] aus 04/05 (Mehrfachnennung im Tweet zählt einmal).
+        """
+        print(f"Baue Mention-Netzwerk aus: {input_file}")
+
+        konto_idx = {}
+        nutzer_codes = {}
+        tweet_ids = []
+        nutzer_idx = array('q')
+        zeilen = array('I')
+        spalten = array('I')
+
+        with open(input_file, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                if line_num % 100000 == 0:
+                    print(f"  {line_num:,} Zeilen gelesen...")
+
+                try:
+                    tweet = json.loads(line.strip())
+                except:
+                    continue
+
+                zeile = len(tweet_ids)
+                tweet_ids.append(str(tweet.get('tweet_id')))
+                nutzer = tweet.get('user_id')
+                nutzer_idx.append(KEIN_NUTZER if nutzer is None else
+                                  nutzer_codes.setdefault(str(nutzer), len(nutzer_codes)))
+                for konto in {konto_form(m) for m in tweet.get('entities', {}).get('mentions', [])}:
+                    zeilen.append(zeile)
+                    spalten.append(konto_idx.setdefault(konto, len(konto_idx)))
+
+        inzidenz = sparse.csr_matrix(
+            (np.ones(len(zeilen), dtype=np.int32),
+             (np.frombuffer(zeilen, dtype=np.uint32), np.frombuffer(spalten, dtype=np.uint32))),
+            shape=(len(tweet_ids), len(konto_idx))
+        )
+
+        # Selten erwähnte Konten entfernen
+        konten = np.array(sorted(konto_idx, key=konto_idx.get), dtype=object)
+        behalten = np.flatnonzero(np.asarray(inzidenz.sum(axis=0)).ravel() >= min_erwaehnungen)
+        netzwerk = cls(tweet_ids, np.frombuffer(nutzer_idx, dtype=np.int64), konten[behalten].tolist(),
+                       inzidenz[:, behalten])
+
+        print(f"✓ {len(tweet_ids):,} Tweets, {len(nutzer_codes):,} Nutzer, {len(netzwerk):,} Konten "
+              f"(min_erwaehnungen={min_erwaehnungen}), {netzwerk.inzidenz.nnz:,} Erwähnungen\n")
+        return netzwerk
+
+    def speichern(self, pfad):
+        np.savez_compressed(pfad, tweet_ids=self.tweet_ids, nutzer_idx=self.nutzer_idx,
+                            indptr=self.inzidenz.indptr, indices=self.inzidenz.indices,
+                            konten=np.array(json.dumps(self.konten, ensure_ascii=False)))
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        konten = json.loads(str(data['konten']))
+        inzidenz = sparse.csr_matrix((np.ones(len(data['indices']), dtype=np.int32), data['indices'], data['indptr']),
+                                     shape=(len(data['tweet_ids']), len(konten)))
+        return cls(data['tweet_ids'], data['nutzer_idx'], konten, inzidenz)
+
+    def pruefen(self, merkmale):
+        """Stellt sicher, dass das Netzwerk zeilengleich zu den Merkmalen (07b) ist"""
+        if len(merkmale) != len(self.tweet_ids) or not np.array_equal(merkmale.tweet_ids, self.tweet_ids):
+            raise ValueError("Mention-Netzwerk passt nicht zu den Merkmalen - bitte neu bauen")
+
+    def _auswahl(self, maske):
+        """Inzidenz und Nutzer der ausgewählten Tweets mit Nutzer-ID"""
+        gueltig = self.nutzer_idx != KEIN_NUTZER
+        if maske is not None:
+            gueltig &= np.asarray(maske, dtype=bool)
+        return self.inzidenz[gueltig].tocoo(), self.nutzer_idx[gueltig]
+
+    def kanten(self, maske=None):
+        """Gewichtete Kanten Nutzer × Konto (Anzahl Tweets mit Erwähnung) als CSR"""
+        x, nutzer = self._auswahl(maske)
+        return sparse.csr_matrix((x.data, (nutzer[x.row], x.col)), shape=(self.n_nutzer, len(self)))
+
+    @staticmethod
+    def _gewicht(kanten):
+        """
+        Nutzer-normierter In-Grad je Konto: jeder Nutzer verteilt das Gewicht 1 anteilig
+        (nach Tweets) auf die von ihm erwähnten Konten, Vielschreiber zählen nicht mehrfach.
+        Returns: ndarray je Konto (Anteil am Gewicht aller erwähnenden Nutzer, Summe 1)
+        """
+        ausgang = np.asarray(kanten.sum(axis=1)).ravel()
+        aktiv = ausgang > 0
+        if not aktiv.any():
+            return np.zeros(kanten.shape[1])
+        normiert = sparse.diags(np.divide(1.0, ausgang, out=np.zeros(len(ausgang)), where=aktiv)) @ kanten
+        return np.asarray(normiert.sum(axis=0)).ravel() / aktiv.sum()
+
+    def ranking(self, n=20, maske=None, mass='gewicht'):
+        """
+        Konten nach Erwähnungen (Tweets), verschiedenen erwähnenden Nutzern (In-Grad)
+        und nutzer-normiertem In-Grad. mass: 'erwaehnungen', 'nutzer' oder 'gewicht'
+        Returns: DataFrame mit konto, erwaehnungen, nutzer, gewicht
+        """
+        kanten = self.kanten(maske)
+        erwaehnungen = np.asarray(kanten.sum(axis=0)).ravel()
+        nutzer = np.bincount(kanten.indices, minlength=len(self))
+        gewicht = self._gewicht(kanten)
+
+        werte = {'erwaehnungen': erwaehnungen, 'nutzer': nutzer, 'gewicht': gewicht}[mass]
+        kandidaten = np.flatnonzero(erwaehnungen > 0)
+        if len(kandidaten) > n:
+            kandidaten = kandidaten[np.argpartition(-werte[kandidaten], n)[:n]]
+        kandidaten = kandidaten[np.argsort(-werte[kandidaten], kind='stable')]
+
+        return pd.DataFrame({
+            'konto': [self.konten[j] for j in kandidaten],
+            'erwaehnungen': erwaehnungen[kandidaten],
+            'nutzer': nutzer[kandidaten],
+            'gewicht': gewicht[kandidaten]
+        })
+
+    def reichweite(self, merkmale, konten=None, maske=None):
+        """
+        Regionale Reichweite: Anteil der aktiven Nutzer je Bundesland (mit mindestens einem
+        Tweet dort), die das Konto erwähnen. Ein Nutzer zählt je Bundesland und Konto einmal.
+        konten: Auswahl (Standard: alle); Returns: DataFrame Bundesland × Konto (Prozent)
+        und Series mit der Anzahl erreichter Bundesländer (>= MIN_NUTZER_REGION Nutzer)
+        """
+        gueltig = self.nutzer_idx != KEIN_NUTZER
+        if maske is not None:
+            gueltig &= np.asarray(maske, dtype=bool)
+        region = merkmale.bundesland.astype(np.int64)
+        schluessel = region * self.n_nutzer + self.nutzer_idx
+
+        # Verschiedene (Bundesland, Nutzer) mit Tweets bzw. mit Erwähnung je Konto
+        aktive = np.bincount(np.unique(schluessel[gueltig]) // self.n_nutzer, minlength=len(REGIONEN))
+        x = self.inzidenz[gueltig].tocoo()
+        paare = sparse.csr_matrix((np.ones(len(x.data)), (schluessel[gueltig][x.row], x.col)),
+                                  shape=(len(REGIONEN) * self.n_nutzer, len(self))).tocoo()
+        nutzer = sparse.csr_matrix((np.ones(paare.nnz, dtype=np.int64), (paare.row // self.n_nutzer, paare.col)),
+                                   shape=(len(REGIONEN), len(self)))
+
+        spalten = list(range(len(self))) if konten is None else [self.konten.index(konto_form(k)) for k in konten]
+        anzahl = pd.DataFrame(nutzer[:, spalten].toarray(), index=REGIONEN,
+                              columns=[self.konten[j] for j in spalten]).drop(index='Unbekannt')
+        anteil = anzahl.div(pd.Series(aktive, index=REGIONEN).drop('Unbekannt').replace(0, np.nan), axis=0) * 100
+        return anteil, (anzahl >= MIN_NUTZER_REGION).sum().rename('Bundesländer')
@@ -0,0 +1,194 @@
+import os
+import json
+import warnings
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Nachbarschaft (Queen): Flächen mit gemeinsamer Kante oder Ecke. Die Grenzen im
+# Geometrie-Artefakt sind vereinfacht (siehe geometrie.TOLERANZEN), daher werden
+# Lücken bis zu dieser Breite (Grad) überbrückt.
+NACHBAR_PUFFER = 0.002
+
+PERMUTATIONEN = 9999
+SIGNIFIKANZ = 0.05
+
+# Permutationen je Block bei LISA (begrenzt den Speicher: Regionen × Block × Nachbarn)
+LISA_BLOCK = 1000
+
+# LISA-Quadranten (Wert und räumlicher Lag jeweils über/unter dem Mittel)
+QUADRANTEN = {1: 'High-High', 2: 'Low-High', 3: 'Low-Low', 4: 'High-Low'}
+NICHT_SIGNIFIKANT = 'nicht signifikant'
+
+
+class Gewichte:
+    """
+    Räumliche Nachbarschaft als dünn besetzte Matrix (binär, symmetrisch) mit
+    zeilenstandardisierter Variante für Lag, Moran's I und LISA.
+    """
+
+    def __init__(self, ids, matrix):
+        self.ids = list(ids)
+        self.binaer = sparse.csr_matrix(matrix, dtype=np.float64)
+        self.binaer.setdiag(0)
+        self.binaer.eliminate_zeros()
+        self.anzahl_nachbarn = np.diff(self.binaer.indptr)
+
+        # Zeilenstandardisiert; Regionen ohne Nachbarn (Inseln) behalten eine Nullzeile
+        faktor = np.divide(1.0, self.anzahl_nachbarn, out=np.zeros(len(self.ids)),
+                           where=self.anzahl_nachbarn > 0)
+        self.w = sparse.diags(faktor) @ self.binaer
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def aus_geometrien(cls, gdf, id_spalte, puffer=NACHBAR_PUFFER):
+        """Queen-Nachbarschaft über den räumlichen Index (eine Abfrage für alle Flächen)"""
+        geometrien = gdf.geometry
+        if puffer:
+            # Puffer bewusst in Grad (nur zum Schließen von Vereinfachungslücken)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                geometrien = geometrien.buffer(puffer)
+        links, rechts = gdf.sindex.query(geometrien, predicate='intersects')
+        matrix = sparse.coo_matrix((np.ones(len(links)), (links, rechts)), shape=(len(gdf), len(gdf)))
+        matrix = ((matrix + matrix.T) > 0).astype(np.float64)
+        return cls(gdf[id_spalte].tolist(), matrix)
+
+    def speichern(self, pfad):
+        np.savez_compressed(pfad, indptr=self.binaer.indptr, indices=self.binaer.indices,
+                            ids=np.array(json.dumps(self.ids, ensure_ascii=False)))
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        ids = json.loads(str(data['ids']))
+        matrix = sparse.csr_matrix((np.ones(len(data['indices'])), data['indices'], data['indptr']),
+                                   shape=(len(ids), len(ids)))
+        return cls(ids, matrix)
+
+    def teilmenge(self, maske):
+        """Gewichte nur für die ausgewählten Regionen (z.B. ohne fehlende Werte)"""
+        idx = np.flatnonzero(maske)
+        return Gewichte([self.ids[i] for i in idx], self.binaer[idx][:, idx])
+
+    def nachbarn(self, region):
+        i = self.ids.index(region)
+        return [self.ids[j] for j in self.binaer.indices[self.binaer.indptr[i]:self.binaer.indptr[i + 1]]]
+
+
+def _gewichte_pfad(geometrie_dir, ebene):
+    return os.path.join(geometrie_dir, f"gewichte_{ebene}.npz")
+
+
+def gewichte_bauen(geometrie_dir, ebene='bundeslaender'):
+    """Baut die Nachbarschaft aus dem Geometrie-Artefakt (36) und speichert sie daneben"""
+    from geometrie import lade_bundeslaender, lade_kreise
+
+    if ebene == 'kreise':
+        gewichte = Gewichte.aus_geometrien(lade_kreise(geometrie_dir, 'druck'), 'ags')
+    else:
+        gewichte = Gewichte.aus_geometrien(lade_bundeslaender(geometrie_dir, 'druck'), 'name')
+    gewichte.speichern(_gewichte_pfad(geometrie_dir, ebene))
+    return gewichte
+
+
+def lade_gewichte(geometrie_dir, ebene='bundeslaender'):
+    """Nachbarschaft 'bundeslaender' (ids = Namen) oder 'kreise' (ids = AGS); fehlt sie, wird sie gebaut"""
+    pfad = _gewichte_pfad(geometrie_dir, ebene)
+    if os.path.exists(pfad):
+        return Gewichte.laden(pfad)
+    return gewichte_bauen(geometrie_dir, ebene)
+
+
+def _ausrichten(werte, gewichte):
+    """Werte (Series mit Regions-Index) in Reihenfolge der Gewichte; fehlende Regionen fallen heraus"""
+    werte = pd.Series(werte, dtype=np.float64).reindex(gewichte.ids)
+    gueltig = werte.notna().to_numpy()
+    if not gueltig.all():
+        gewichte = gewichte.teilmenge(gueltig)
+    return werte[gueltig], gewichte
+
+
+def morans_i(werte, gewichte, permutationen=PERMUTATIONEN, seed=None):
+    """
+    Globales Moran's I mit Permutationstest (alle Permutationen als eine Matrix,
+    räumlicher Lag per Sparse-Dense-Produkt).
+    werte: Series (Index = Regionen wie gewichte.ids)
+    Returns: dict mit I, erwartung, z_sim, p_sim, n
+    """
+    werte, gewichte = _ausrichten(werte, gewichte)
+    n = len(werte)
+    z = werte.to_numpy() - werte.mean()
+    s0 = gewichte.w.sum()
+    skalierung = n / s0 / (z @ z)
+
+    beobachtet = skalierung * (z @ (gewichte.w @ z))
+
+    rng = np.random.default_rng(seed)
+    permutiert = rng.permuted(np.tile(z, (permutationen, 1)), axis=1)
+    simuliert = skalierung * np.einsum('pi,pi->p', permutiert, (gewichte.w @ permutiert.T).T)
+
+    # Pseudo-p-Wert (einseitig in Richtung der Beobachtung)
+    groesser = int((simuliert >= beobachtet).sum())
+    extrem = min(groesser, permutationen - groesser)
+    return {
+        'I': float(beobachtet),
+        'erwartung': -1 / (n - 1),
+        'z_sim': float((beobachtet - simuliert.mean()) / simuliert.std()),
+        'p_sim': (extrem + 1) / (permutationen + 1),
+        'n': n
+    }
+
+
+def lisa(werte, gewichte, permutationen=PERMUTATIONEN, seed=None, signifikanz=SIGNIFIKANZ):
+    """
+    Lokales Moran's I (LISA) mit bedingter Permutation: Für Region i werden die
+    übrigen n-1 Werte zufällig auf ihre k_i Nachbarn verteilt. Eine gemeinsame
+    Ziehung von Indizes für alle Regionen, je Region um den eigenen Index verschoben,
+    macht den Test vollständig vektorisiert (blockweise über die Permutationen).
+    Returns: DataFrame (Index = Region) mit wert, z, lag, I_lokal, p_sim, quadrant, cluster
+    """
+    werte, gewichte = _ausrichten(werte, gewichte)
+    n = len(werte)
+    z = werte.to_numpy() - werte.mean()
+    # Varianz mit n-1 wie in PySAL/esda (Moran_Local)
+    m2 = (z @ z) / (n - 1)
+    lag = gewichte.w @ z
+    beobachtet = z * lag / m2
+
+    # Nachbargewichte je Region als dichte Matrix (n × k_max), mit Nullen aufgefüllt
+    k = gewichte.anzahl_nachbarn
+    k_max = int(k.max()) if n else 0
+    nachbar_gewichte = np.zeros((n, k_max))
+    spalte = np.arange(len(gewichte.w.indices)) - np.repeat(gewichte.w.indptr[:-1], k)
+    nachbar_gewichte[np.repeat(np.arange(n), k), spalte] = gewichte.w.data
+
+    rng = np.random.default_rng(seed)
+    groesser = np.zeros(n, dtype=np.int64)
+    for start in range(0, permutationen, LISA_BLOCK):
+        block = min(LISA_BLOCK, permutationen - start)
+        # k_max Indizes ohne Zurücklegen aus den n-1 übrigen Regionen
+        idx = np.argsort(rng.random((block, n - 1)), axis=1)[:, :k_max]
+        idx = idx[None, :, :] + (idx[None, :, :] >= np.arange(n)[:, None, None])
+        lag_sim = np.einsum('ipk,ik->ip', z[idx], nachbar_gewichte)
+        simuliert = z[:, None] * lag_sim / m2
+        groesser += (simuliert >= beobachtet[:, None]).sum(axis=1)
+
+    extrem = np.minimum(groesser, permutationen - groesser)
+    p_sim = (extrem + 1) / (permutationen + 1)
+    p_sim[k == 0] = 1.0
+
+    quadrant = np.select([(z > 0) & (lag > 0), (z <= 0) & (lag > 0), (z <= 0) & (lag <= 0)], [1, 2, 3], 4)
+    cluster = np.where(p_sim <= signifikanz, pd.Series(quadrant).map(QUADRANTEN), NICHT_SIGNIFIKANT)
+
+    return pd.DataFrame({
+        'wert': werte.to_numpy(),
+        'z': z,
+        'lag': lag,
+        'I_lokal': beobachtet,
+        'p_sim': p_sim,
+        'quadrant': quadrant,
+        'cluster': cluster
+    }, index=pd.Index(gewichte.ids, name='region'))
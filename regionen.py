@@ -0,0 +1,74 @@
+# Gemeinsame Regions-Konstanten und Bundesland-Zuordnung für alle Skripte und Module
+
+# Übersetzung Englisch → Deutsch
+STATE_MAPPING = {
+    'Berlin': 'Berlin',
+    'North Rhine-Westphalia': 'Nordrhein-Westfalen',
+    'Bavaria': 'Bayern',
+    'Baden-Württemberg': 'Baden-Württemberg',
+    'Hamburg': 'Hamburg',
+    'Hesse': 'Hessen',
+    'Lower Saxony': 'Niedersachsen',
+    'Rhineland-Palatinate': 'Rheinland-Pfalz',
+    'Saxony': 'Sachsen',
+    'Brandenburg': 'Brandenburg',
+    'Schleswig-Holstein': 'Schleswig-Holstein',
+    'Saxony-Anhalt': 'Sachsen-Anhalt',
+    'Free Hanseatic City of Bremen': 'Bremen',
+    'Thuringia': 'Thüringen',
+    'Mecklenburg-Vorpommern': 'Mecklenburg-Vorpommern',
+    'Mecklenburg-Western Pomerania': 'Mecklenburg-Vorpommern',
+    'Saarland': 'Saarland'
+}
+
+# Einwohnerzahlen Bundesländer, Stand 31.12.2019
+# https://www.destatis.de/DE/Presse/Pressemitteilungen/2021/06/PD21_287_12411.html)
+EINWOHNER_2020 = {
+    'Baden-Württemberg': 11_100_400,
+    'Bayern': 13_124_700,
+    'Berlin': 3_669_500,
+    'Brandenburg': 2_521_900,
+    'Bremen': 681_200,
+    'Hamburg': 1_847_300,
+    'Hessen': 6_288_100,
+    'Mecklenburg-Vorpommern': 1_608_100,
+    'Niedersachsen': 7_993_600,
+    'Nordrhein-Westfalen': 17_947_200,
+    'Rheinland-Pfalz': 4_093_900,
+    'Saarland': 986_900,
+    'Sachsen': 4_072_000,
+    'Sachsen-Anhalt': 2_194_800,
+    'Schleswig-Holstein': 2_903_800,
+    'Thüringen': 2_133_400
+}
+
+# Alle 16 Bundesländer in fester (alphabetischer) Reihenfolge
+BUNDESLAENDER = list(EINWOHNER_2020.keys())
+
+# Ost-Bundesländer
+OST_BUNDESLAENDER = {
+    'Berlin', 'Brandenburg', 'Mecklenburg-Vorpommern',
+    'Sachsen', 'Sachsen-Anhalt', 'Thüringen'
+}
+
+# Ost-Bundesländer OHNE Berlin
+OST_OHNE_BERLIN = {
+    'Brandenburg', 'Mecklenburg-Vorpommern',
+    'Sachsen', 'Sachsen-Anhalt', 'Thüringen'
+}
+
+
+def extract_bundesland(tweet):
+    """Extrahiert und übersetzt Bundesland aus geo_source"""
+    geo_source = tweet.get('geo_source')
+
+    if not geo_source:
+        return None
+
+    bundesland_en = None
+    if geo_source == 'place' and tweet.get('place'):
+        bundesland_en = tweet['place'].get('state')
+    elif geo_source == 'coordinates' and tweet.get('geo'):
+        bundesland_en = tweet['geo'].get('state')
+
+    return STATE_MAPPING.get(bundesland_en) if bundesland_en else None
@@ -0,0 +1,150 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+import shapely
+
+# VG250 (Verwaltungsgebiete 1:250 000, BKG), Ebenen-Shapefiles
+# https://gdz.bkg.bund.de/index.php/default/verwaltungsgebiete-1-250-000-ebenen-stand-01-01-vg250-ebenen-01-01.html
+VG250_DATEIEN = {
+    'bundesland': 'VG250_LAN.shp',
+    'kreis': 'VG250_KRS.shp',
+    'gemeinde': 'VG250_GEM.shp'
+}
+
+# Geofaktor 4 = Landfläche (ohne Nord-/Ostsee und Bodensee)
+GF_LAND = 4
+
+# Punkte knapp außerhalb (Küste, Bodensee, Grenzflüsse) der nächsten Gemeinde
+# zuordnen, wenn sie höchstens so weit entfernt liegen (Grad, ca. 1 km)
+MAX_ABSTAND = 0.01
+
+
+def koordinaten(tweets):
+    """
+    GPS-Koordinaten aller Tweets als Arrays (lon, lat); ohne Koordinaten NaN.
+    Erwartet das Feld 'coordinates' = [lon, lat] (aus 04/05, durchgereicht in 07).
+    """
+    lon = np.full(len(tweets), np.nan)
+    lat = np.full(len(tweets), np.nan)
+    for i, tweet in enumerate(tweets):
+        punkt = tweet.get('coordinates')
+        if punkt and len(punkt) == 2:
+            lon[i], lat[i] = punkt
+    return lon, lat
+
+
+class ReverseGeocoder:
+    """
+    Offline-Zuordnung von Koordinaten zu Gemeinde, Kreis und Bundesland.
+    Punkt-in-Polygon nur auf Gemeinde-Ebene (STRtree, vektorisiert); Kreis und
+    Bundesland folgen hierarchisch aus dem Amtlichen Gemeindeschlüssel (AGS):
+    Stellen 1-2 = Land, 1-5 = Kreis.
+    """
+
+    def __init__(self, gemeinden, kreise, laender):
+        self.gemeinden = gemeinden.reset_index(drop=True)
+        self.kreis_namen = dict(zip(kreise['ags'], kreise['name']))
+        # Art des Kreises aus VG250 (BEZ: Landkreis, Kreis, Kreisfreie Stadt, ...); ältere Caches ohne
+        self.kreis_arten = dict(zip(kreise['ags'], kreise['art'])) if 'art' in kreise else {}
+        self.land_namen = dict(zip(laender['ags'], laender['name']))
+        self._geometrien = np.asarray(self.gemeinden.geometry.values)
+
+        # Attribute je Gemeinde vorab auflösen (Spalten für die Ausgabe, Index = Gemeinde)
+        ags = self.gemeinden['ags'].astype(str)
+        self._attribute = pd.DataFrame({
+            'bundesland': ags.str[:2].map(self.land_namen),
+            'kreis_ags': ags.str[:5],
+            'kreis': ags.str[:5].map(self.kreis_namen),
+            'gemeinde_ags': ags,
+            'gemeinde': self.gemeinden['name']
+        }).astype(object)
+        self._attribute = self._attribute.where(self._attribute.notna(), None)
+        # Letzte Zeile = kein Treffer (Index -1)
+        self._attribute.loc[len(self._attribute)] = [None] * self._attribute.shape[1]
+        self._baum = shapely.STRtree(self._geometrien)
+
+    @classmethod
+    def aus_vg250(cls, vg250_dir):
+        """Liest die VG250-Shapefiles (EPSG:25832) und transformiert nach WGS84"""
+        import geopandas as gpd
+
+        ebenen = {}
+        for ebene, datei in VG250_DATEIEN.items():
+            gdf = gpd.read_file(os.path.join(vg250_dir, datei))
+            gdf = gdf[gdf['GF'] == GF_LAND].to_crs(epsg=4326)
+            spalten = ['ags', 'name', 'art', 'geometry'] if ebene == 'kreis' else ['ags', 'name', 'geometry']
+            ebenen[ebene] = gdf.rename(columns={'AGS': 'ags', 'GEN': 'name', 'BEZ': 'art'})[spalten]
+            print(f"✓ {ebene}: {len(gdf):,} Flächen")
+
+        # Kreise und Länder werden nur über den Schlüssel gebraucht
+        return cls(ebenen['gemeinde'],
+                   pd.DataFrame(ebenen['kreis'].drop(columns='geometry')),
+                   pd.DataFrame(ebenen['bundesland'].drop(columns='geometry')))
+
+    def speichern(self, cache_dir):
+        """Gemeinde-Geometrien als GeoParquet, Kreis-/Ländernamen und Kreisarten als JSON"""
+        os.makedirs(cache_dir, exist_ok=True)
+        self.gemeinden.to_parquet(os.path.join(cache_dir, 'gemeinden.parquet'))
+        with open(os.path.join(cache_dir, 'schluessel.json'), 'w', encoding='utf-8') as f:
+            json.dump({'kreise': self.kreis_namen, 'kreis_arten': self.kreis_arten, 'laender': self.land_namen},
+                      f, ensure_ascii=False)
+
+    @classmethod
+    def laden(cls, cache_dir):
+        import geopandas as gpd
+
+        with open(os.path.join(cache_dir, 'schluessel.json'), 'r', encoding='utf-8') as f:
+            schluessel = json.load(f)
+        kreise = pd.DataFrame(list(schluessel['kreise'].items()), columns=['ags', 'name'])
+        if 'kreis_arten' in schluessel:
+            kreise['art'] = kreise['ags'].map(schluessel['kreis_arten'])
+        return cls(
+            gpd.read_parquet(os.path.join(cache_dir, 'gemeinden.parquet')),
+            kreise,
+            pd.DataFrame(list(schluessel['laender'].items()), columns=['ags', 'name'])
+        )
+
+    def gemeinde_indizes(self, lon, lat, max_abstand=MAX_ABSTAND):
+        """
+        Batch-Abfrage: Index der Gemeinde je Punkt (-1 = keine Gemeinde gefunden).
+        Punkte exakt auf einer Gemeindegrenze laufen über die Nächste-Gemeinde-Suche.
+        """
+        lon = np.asarray(lon, dtype=np.float64)
+        lat = np.asarray(lat, dtype=np.float64)
+        ergebnis = np.full(len(lon), -1, dtype=np.int64)
+
+        gueltig = np.flatnonzero(~(np.isnan(lon) | np.isnan(lat)))
+        punkte = shapely.points(lon[gueltig], lat[gueltig])
+
+        # Index über die Punkte, abgefragt mit allen Gemeinde-Polygonen: jedes Polygon
+        # wird nur einmal vorbereitet und gegen seine Kandidaten-Punkte geprüft
+        # (schneller als jeden Punkt einzeln gegen den Gemeinde-Baum zu testen)
+        gemeinde_idx, punkt_idx = shapely.STRtree(punkte).query(self._geometrien, predicate='contains')
+        erste = np.unique(punkt_idx, return_index=True)[1]
+        ergebnis[gueltig[punkt_idx[erste]]] = gemeinde_idx[erste]
+
+        # Nicht getroffene Punkte: nächste Gemeinde innerhalb von max_abstand
+        if max_abstand:
+            offen = np.flatnonzero(ergebnis[gueltig] < 0)
+            if len(offen):
+                naechste_punkt, naechste_gemeinde = self._baum.query_nearest(
+                    punkte[offen], max_distance=max_abstand, all_matches=False)
+                ergebnis[gueltig[offen[naechste_punkt]]] = naechste_gemeinde
+
+        return ergebnis
+
+    def zuordnen(self, lon, lat, max_abstand=MAX_ABSTAND):
+        """
+        Returns: DataFrame mit bundesland, kreis_ags, kreis, gemeinde_ags, gemeinde
+        (eine Zeile je Punkt, None ohne Treffer)
+        """
+        idx = self.gemeinde_indizes(lon, lat, max_abstand)
+        return self._attribute.iloc[idx].reset_index(drop=True)
+
+    def zuordnen_tweets(self, tweets, max_abstand=MAX_ABSTAND):
+        """Zuordnung für eine Liste von Tweets (nur Tweets mit 'coordinates' erhalten Treffer)"""
+        lon, lat = koordinaten(tweets)
+        df = self.zuordnen(lon, lat, max_abstand)
+        df.insert(0, 'tweet_id', [tweet.get('tweet_id') for tweet in tweets])
+        return df
@@ -0,0 +1,119 @@
+import csv
+from itertools import chain
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Tweets je Stapel in SentimentBewertung (Listen werden danach verworfen)
+BATCH_GROESSE = 100_000
+
+
+class SentimentLexikon:
+    """
+    Polaritätslexikon (Term → Gewicht in [-1, 1]) mit Nachschlagen über pandas-Index.
+    Alle Terme eines Stapels werden in einem get_indexer-Aufruf gesucht und als dünn
+    besetzte Matrix Tweet × Lexikon-Eintrag mit dem Gewichtsvektor multipliziert.
+    """
+
+    def __init__(self, gewichte):
+        self._index = pd.Index(list(gewichte), dtype=object)
+        self.gewichte = np.fromiter(gewichte.values(), dtype=np.float64, count=len(gewichte))
+
+    def __len__(self):
+        return len(self._index)
+
+    @classmethod
+    def sentiws(cls, pfade):
+        """
+        SentiWS (Leipzig): Zeilen 'Lemma|Wortart<TAB>Gewicht<TAB>Flexionsform,Flexionsform,...'
+        pfade: Positiv- und Negativ-Datei. Alles kleingeschrieben wie die Tokens aus 07;
+        bei Doppelungen gilt das Lemma vor einer gleichlautenden Flexionsform.
+        """
+        lemmata, formen = {}, {}
+        for pfad in pfade:
+            with open(pfad, 'r', encoding='utf-8-sig') as f:
+                for zeile in f:
+                    teile = zeile.rstrip('\r\n').split('\t')
+                    if len(teile) < 2:
+                        continue
+                    gewicht = float(teile[1])
+                    lemmata.setdefault(teile[0].split('|')[0].lower(), gewicht)
+                    if len(teile) > 2:
+                        for form in teile[2].split(','):
+                            if form:
+                                formen.setdefault(form.lower(), gewicht)
+        return cls({**formen, **lemmata})
+
+    @classmethod
+    def emoji_ranking(cls, pfad, min_vorkommen=5):
+        """
+        Emoji Sentiment Ranking (Kralj Novak et al. 2015), CSV mit den Spalten
+        Emoji, Occurrences, Negative, Neutral, Positive. Gewicht = p(positiv) - p(negativ)
+        mit Laplace-Glättung: (Positive - Negative) / (Occurrences + 3)
+        """
+        gewichte = {}
+        with open(pfad, 'r', encoding='utf-8-sig', newline='') as f:
+            for zeile in csv.DictReader(f):
+                vorkommen = int(zeile['Occurrences'])
+                if vorkommen >= min_vorkommen:
+                    gewichte[zeile['Emoji']] = (int(zeile['Positive']) - int(zeile['Negative'])) / (vorkommen + 3)
+        return cls(gewichte)
+
+    def matrix(self, listen):
+        """Dünn besetzte Trefferzählung Tweet × Lexikon-Eintrag für eine Liste von Term-Listen"""
+        laengen = np.fromiter(map(len, listen), dtype=np.int64, count=len(listen))
+        idx = self._index.get_indexer(list(chain.from_iterable(listen)))
+        zeilen = np.repeat(np.arange(len(listen)), laengen)
+        treffer = idx >= 0
+        return sparse.csr_matrix((np.ones(int(treffer.sum())), (zeilen[treffer], idx[treffer])),
+                                 shape=(len(listen), len(self)))
+
+    def bewerten(self, listen):
+        """Summe der Gewichte und Anzahl Treffer je Liste"""
+        treffer = self.matrix(listen)
+        return treffer @ self.gewichte, np.asarray(treffer.sum(axis=1)).ravel()
+
+
+class SentimentBewertung:
+    """
+    Sentiment je Tweet aus Wort- und Emoji-Lexikon, stapelweise (hinzufuegen() merkt sich
+    Tokens und Emojis, alle BATCH_GROESSE Tweets wird ein Stapel bewertet).
+    Ergebnis je Tweet: mittleres Gewicht der Treffer, NaN = kein Lexikon-Treffer.
+    """
+
+    def __init__(self, woerter, emojis, batch_groesse=BATCH_GROESSE):
+        self.woerter = woerter
+        self.emojis = emojis
+        self.batch_groesse = batch_groesse
+        self._tokens, self._emojis = [], []
+        self._ergebnisse = []
+
+    def hinzufuegen(self, tokens, emojis):
+        self._tokens.append(tokens)
+        self._emojis.append(emojis)
+        if len(self._tokens) >= self.batch_groesse:
+            self._stapel_bewerten()
+
+    def _stapel_bewerten(self):
+        if self._tokens:
+            self._ergebnisse.append(self.woerter.bewerten(self._tokens) + self.emojis.bewerten(self._emojis))
+            self._tokens, self._emojis = [], []
+
+    def ergebnis(self):
+        """
+        Returns: dict mit float32-Arrays 'sentiment' (Wörter und Emojis zusammen),
+        'sentiment_wort' und 'sentiment_emoji' (NaN = kein Treffer)
+        """
+        self._stapel_bewerten()
+        if not self._ergebnisse:
+            leer = np.zeros(0, dtype=np.float32)
+            return {'sentiment': leer, 'sentiment_wort': leer, 'sentiment_emoji': leer}
+
+        wort_summe, wort_anzahl, emoji_summe, emoji_anzahl = (
+            np.concatenate(teil) for teil in zip(*self._ergebnisse))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'sentiment': ((wort_summe + emoji_summe) / (wort_anzahl + emoji_anzahl)).astype(np.float32),
+                'sentiment_wort': (wort_summe / wort_anzahl).astype(np.float32),
+                'sentiment_emoji': (emoji_summe / emoji_anzahl).astype(np.float32)
+            }
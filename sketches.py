@@ -0,0 +1,262 @@
+import json
+import heapq
+import hashlib
+from collections import Counter
+import numpy as np
+
+
+def _hash64(items):
+    """Deterministischer 64-Bit-Hash pro Item (prozessunabhängig, daher mergebar)"""
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest(), 'little')
+         for item in items),
+        dtype=np.uint64,
+        count=len(items)
+    )
+
+
+class SpaceSaving:
+    """
+    Space-Saving-Zusammenfassung (Metwally et al.) mit höchstens k Zählern.
+    Für jedes überwachte Item gilt: count - error <= wahre Häufigkeit <= count.
+    Der maximale Fehler ist durch N / k beschränkt (N = Summe aller Updates).
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        self._heap = []
+
+    def _min_count(self):
+        """Kleinster überwachter Zähler (0, solange noch Platz frei ist)"""
+        if len(self.counts) < self.k:
+            return 0
+
+        # Veraltete Heap-Einträge verwerfen (Zähler wachsen nur)
+        while self._heap:
+            count, item = self._heap[0]
+            current = self.counts.get(item)
+            if current == count:
+                return count
+            heapq.heappop(self._heap)
+            if current is not None:
+                heapq.heappush(self._heap, (current, item))
+        return 0
+
+    def update(self, item, count=1):
+        """Erhöht den Zähler eines Items (gewichtetes Update)"""
+        self.total += count
+
+        if item in self.counts:
+            self.counts[item] += count
+            return
+
+        if len(self.counts) < self.k:
+            self.counts[item] = count
+            self.errors[item] = 0
+            heapq.heappush(self._heap, (count, item))
+            return
+
+        # Kleinsten Zähler ersetzen
+        min_count = self._min_count()
+        _, min_item = heapq.heappop(self._heap)
+        del self.counts[min_item]
+        del self.errors[min_item]
+
+        self.counts[item] = min_count + count
+        self.errors[item] = min_count
+        heapq.heappush(self._heap, (min_count + count, item))
+
+    def update_many(self, items):
+        """Batch-Update: Items werden vorab aggregiert, dann gewichtet eingefügt"""
+        for item, count in Counter(items).items():
+            self.update(item, count)
+
+    def merge(self, other):
+        """
+        Führt zwei Zusammenfassungen zusammen (Agarwal et al., Mergeable Summaries).
+        Items, die in einer Zusammenfassung fehlen, erhalten dort deren Minimum
+        als Zähler und als Fehler. Die Fehlerschranke N / k bleibt erhalten.
+        """
+        min_self = self._min_count()
+        min_other = other._min_count()
+
+        merged = SpaceSaving(max(self.k, other.k))
+        merged.total = self.total + other.total
+
+        kandidaten = []
+        for item in set(self.counts) | set(other.counts):
+            count = self.counts.get(item, min_self) + other.counts.get(item, min_other)
+            error = self.errors.get(item, min_self) + other.errors.get(item, min_other)
+            kandidaten.append((count, error, item))
+
+        for count, error, item in heapq.nlargest(merged.k, kandidaten):
+            merged.counts[item] = count
+            merged.errors[item] = error
+            merged._heap.append((count, item))
+        heapq.heapify(merged._heap)
+
+        return merged
+
+    def top_n(self, n):
+        """
+        Returns: Liste von (item, count, error, garantiert) absteigend nach count.
+        garantiert=True heißt: das Item gehört sicher zu den Top n.
+        """
+        ranking = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)
+        naechster = ranking[n][1] if len(ranking) > n else self._min_count()
+
+        return [(item, count, self.errors[item], count - self.errors[item] >= naechster)
+                for item, count in ranking[:n]]
+
+    def to_dict(self):
+        return {'k': self.k, 'total': self.total,
+                'items': [[item, count, self.errors[item]] for item, count in self.counts.items()]}
+
+    @classmethod
+    def from_dict(cls, data):
+        summary = cls(data['k'])
+        summary.total = data['total']
+        for item, count, error in data['items']:
+            summary.counts[item] = count
+            summary.errors[item] = error
+            summary._heap.append((count, item))
+        heapq.heapify(summary._heap)
+        return summary
+
+
+class CountMinSketch:
+    """
+    Count-Min-Sketch (Cormode & Muthukrishnan) mit fester Speichergröße.
+    Schätzung >= wahre Häufigkeit, Überschätzung <= e / width * N
+    mit Wahrscheinlichkeit 1 - exp(-depth).
+    """
+
+    def __init__(self, width=2 ** 14, depth=4):
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self.table = np.zeros((depth, width), dtype=np.uint32)
+
+    def _indices(self, items):
+        """Zeilenweise Spaltenindizes per Double Hashing aus einem 64-Bit-Hash"""
+        hashes = _hash64(items)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((h1[None, :] + rows * h2[None, :]) % np.uint64(self.width)).astype(np.int64)
+
+    def update_many(self, items, counts=None):
+        """Vektorisiertes Batch-Update"""
+        if counts is None:
+            aggregated = Counter(items)
+            items = list(aggregated.keys())
+            counts = list(aggregated.values())
+        if not items:
+            return
+
+        counts = np.asarray(counts, dtype=np.uint32)
+        indices = self._indices(items)
+        for row in range(self.depth):
+            np.add.at(self.table[row], indices[row], counts)
+        self.total += int(counts.sum())
+
+    def estimate(self, items):
+        """Schätzt die Häufigkeiten mehrerer Items auf einmal"""
+        if not items:
+            return np.zeros(0, dtype=np.int64)
+        indices = self._indices(items)
+        return self.table[np.arange(self.depth)[:, None], indices].min(axis=0).astype(np.int64)
+
+    def error_bound(self):
+        """Maximale additive Überschätzung (mit Wahrscheinlichkeit 1 - exp(-depth))"""
+        return np.e / self.width * self.total
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Count-Min-Sketches mit unterschiedlicher Größe können nicht zusammengeführt werden")
+        merged = CountMinSketch(self.width, self.depth)
+        merged.table = self.table + other.table
+        merged.total = self.total + other.total
+        return merged
+
+
+class HeavyHitterSketch:
+    """
+    Kombination aus Space-Saving (Kandidaten) und Count-Min (Punktschätzung).
+    Liefert Top-N-Listen mit Unter- und Obergrenze pro Item bei
+    konstantem Speicherbedarf, unabhängig von der Datensatzgröße.
+    """
+
+    def __init__(self, k=5000, width=2 ** 14, depth=4):
+        self.space_saving = SpaceSaving(k)
+        self.count_min = CountMinSketch(width, depth)
+
+    @property
+    def total(self):
+        return self.space_saving.total
+
+    def update_many(self, items):
+        aggregated = Counter(items)
+        for item, count in aggregated.items():
+            self.space_saving.update(item, count)
+        self.count_min.update_many(list(aggregated.keys()), list(aggregated.values()))
+
+    def merge(self, other):
+        merged = HeavyHitterSketch.__new__(HeavyHitterSketch)
+        merged.space_saving = self.space_saving.merge(other.space_saving)
+        merged.count_min = self.count_min.merge(other.count_min)
+        return merged
+
+    def top_n(self, n):
+        """
+        Returns: Liste von Dicts mit item, schaetzung, untergrenze, obergrenze, garantiert.
+        Die Schätzung ist das Minimum aus Space-Saving- und Count-Min-Zähler.
+        """
+        ranking = self.space_saving.top_n(n)
+        cms_estimates = self.count_min.estimate([item for item, _, _, _ in ranking])
+
+        result = []
+        for (item, count, error, garantiert), cms in zip(ranking, cms_estimates):
+            result.append({
+                'item': item,
+                'schaetzung': int(min(count, cms)),
+                'untergrenze': int(count - error),
+                'obergrenze': int(min(count, cms)),
+                'garantiert': garantiert
+            })
+        return result
+
+    def speichern(self, pfad):
+        """Speichert den Sketch als .npz (Count-Min-Tabelle + Space-Saving als JSON)"""
+        np.savez_compressed(
+            pfad,
+            table=self.count_min.table,
+            cms_total=np.array(self.count_min.total),
+            space_saving=np.array(json.dumps(self.space_saving.to_dict(), ensure_ascii=False))
+        )
+
+    @classmethod
+    def laden(cls, pfad):
+        data = np.load(pfad)
+        sketch = cls.__new__(cls)
+        sketch.space_saving = SpaceSaving.from_dict(json.loads(str(data['space_saving'])))
+        depth, width = data['table'].shape
+        sketch.count_min = CountMinSketch(width, depth)
+        sketch.count_min.table = data['table']
+        sketch.count_min.total = int(data['cms_total'])
+        return sketch
+
+
+def kombiniere(sketches):
+    """Führt beliebig viele Sketches (z.B. Tages-Sketches eines Zeitraums) zusammen"""
+    sketches = list(sketches)
+    if not sketches:
+        return None
+
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged = merged.merge(sketch)
+    return merged
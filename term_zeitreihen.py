@@ -0,0 +1,193 @@
+import os
+import json
+from array import array
+from datetime import datetime, date
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from regionen import BUNDESLAENDER, extract_bundesland
+
+# Regions-Achse: 16 Bundesländer + Tweets ohne Bundesland
+REGIONEN = BUNDESLAENDER + ['Unbekannt']
+
+
+def parse_twitter_date(date_str):
+    """Konvertiert Twitter-Datum in datetime-Objekt"""
+    return datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y')
+
+
+class TermZeitreihen:
+    """
+    Dünn besetzte Zählmatrix (Region × Tag) × Term.
+    Zeile = region_idx * Anzahl Tage + tag_idx, Spalte = Term.
+    Einmal gebaut, ist jede Zeitreihe (auch pro Bundesland) ein
+    Spaltenzugriff statt eines Durchlaufs über alle Tweets.
+    """
+
+    def __init__(self, matrix, tage, terme, token_summen, tweet_summen):
+        self.matrix = matrix.tocsc()
+        self.tage = tage
+        self.terme = terme
+        self.token_summen = token_summen
+        self.tweet_summen = tweet_summen
+        self._term_idx = {term: i for i, term in enumerate(terme)}
+
+    @classmethod
+    def bauen(cls, input_file, min_count=5):
+        """
+        Liest die JSONL-Datei zeilenweise und zählt Tokens pro Tag und Region.
+        Terme mit weniger als min_count Vorkommen werden verworfen
+        (die Token-Summen zur Normalisierung enthalten sie weiterhin).
+        """
+        print(f"Baue Term-Zeitreihen aus: {input_file}")
+
+        tag_idx = {}
+        term_idx = {}
+        region_idx = {region: i for i, region in enumerate(REGIONEN)}
+        zeilen_tag = array('I')
+        zeilen_region = array('B')
+        spalten = array('I')
+        tweet_tag = array('I')
+        tweet_region = array('B')
+
+        with open(input_file, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                if line_num % 100000 == 0:
+                    print(f"  {line_num:,} Zeilen gelesen...")
+
+                try:
+                    tweet = json.loads(line.strip())
+                    # Vorberechneter Kalendertag aus 07 (Ortszeit), sonst UTC-Datum
+                    if tweet.get('datum_lokal'):
+                        tag = date.fromisoformat(tweet['datum_lokal'])
+                    else:
+                        tag = parse_twitter_date(tweet['created_at']).date()
+                except:
+                    continue
+
+                t = tag_idx.setdefault(tag, len(tag_idx))
+                r = region_idx[extract_bundesland(tweet) or 'Unbekannt']
+                tweet_tag.append(t)
+                tweet_region.append(r)
+
+                for token in tweet.get('tokens', []):
+                    zeilen_tag.append(t)
+                    zeilen_region.append(r)
+                    spalten.append(term_idx.setdefault(token, len(term_idx)))
+
+        # Tage chronologisch sortieren und Indizes umschreiben
+        tage = sorted(tag_idx)
+        umsortierung = np.empty(len(tage), dtype=np.int64)
+        umsortierung[[tag_idx[tag] for tag in tage]] = np.arange(len(tage))
+        n_tage = len(tage)
+
+        zeilen = (np.frombuffer(zeilen_region, dtype=np.uint8).astype(np.int64) * n_tage
+                  + umsortierung[np.frombuffer(zeilen_tag, dtype=np.uint32)])
+        spalten = np.frombuffer(spalten, dtype=np.uint32).astype(np.int64)
+        n_zeilen = len(REGIONEN) * n_tage
+
+        matrix = sparse.coo_matrix(
+            (np.ones(len(zeilen), dtype=np.int32), (zeilen, spalten)),
+            shape=(n_zeilen, len(term_idx))
+        ).tocsr()
+
+        token_summen = np.asarray(matrix.sum(axis=1)).ravel()
+        tweet_zeilen = (np.frombuffer(tweet_region, dtype=np.uint8).astype(np.int64) * n_tage
+                        + umsortierung[np.frombuffer(tweet_tag, dtype=np.uint32)])
+        tweet_summen = np.bincount(tweet_zeilen, minlength=n_zeilen)
+
+        # Seltene Terme entfernen
+        terme = np.array(sorted(term_idx, key=term_idx.get), dtype=object)
+        behalten = np.flatnonzero(np.asarray(matrix.sum(axis=0)).ravel() >= min_count)
+        matrix = matrix[:, behalten]
+        terme = terme[behalten].tolist()
+
+        print(f"✓ {len(tweet_zeilen):,} Tweets, {n_tage} Tage, {len(terme):,} Terme (min_count={min_count})\n")
+        return cls(matrix, tage, terme, token_summen, tweet_summen)
+
+    def speichern(self, output_dir):
+        """Speichert Matrix (npz), Summen und Achsen-Beschriftungen"""
+        os.makedirs(output_dir, exist_ok=True)
+        sparse.save_npz(os.path.join(output_dir, 'matrix.npz'), self.matrix.tocsr())
+        np.savez(os.path.join(output_dir, 'summen.npz'),
+                 token_summen=self.token_summen, tweet_summen=self.tweet_summen)
+
+        with open(os.path.join(output_dir, 'achsen.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'tage': [tag.isoformat() for tag in self.tage],
+                'regionen': REGIONEN,
+                'terme': self.terme
+            }, f, ensure_ascii=False)
+
+    @classmethod
+    def laden(cls, output_dir):
+        with open(os.path.join(output_dir, 'achsen.json'), 'r', encoding='utf-8') as f:
+            achsen = json.load(f)
+        if achsen['regionen'] != REGIONEN:
+            raise ValueError("Gespeicherte Regions-Achse passt nicht zu REGIONEN")
+
+        summen = np.load(os.path.join(output_dir, 'summen.npz'))
+        return cls(
+            sparse.load_npz(os.path.join(output_dir, 'matrix.npz')),
+            [datetime.strptime(tag, '%Y-%m-%d').date() for tag in achsen['tage']],
+            achsen['terme'],
+            summen['token_summen'],
+            summen['tweet_summen']
+        )
+
+    def _regionen_maske(self, bundesland):
+        """Region-Indizes für None (alle), ein Bundesland oder eine Liste"""
+        if bundesland is None:
+            return list(range(len(REGIONEN)))
+        if isinstance(bundesland, str):
+            bundesland = [bundesland]
+        return [REGIONEN.index(bl) for bl in bundesland]
+
+    def _bloecke(self, werte, regionen):
+        """Summiert (Region × Tag)-Zeilen über die gewählten Regionen → (Tag, ...)"""
+        werte = werte.reshape((len(REGIONEN), len(self.tage)) + werte.shape[1:])
+        return werte[regionen].sum(axis=0)
+
+    def serie(self, terme, bundesland=None, normalisiert=True, summieren=False):
+        """
+        Tägliche Häufigkeiten für eine Menge von Termen.
+        bundesland: None (alle Regionen), Name oder Liste von Namen (werden summiert)
+        normalisiert: Vorkommen pro 10.000 Tokens des Tages/der Region
+        summieren: alle Terme zu einer Spalte zusammenfassen
+        Returns: DataFrame (Index = Datum, Spalten = Terme)
+        """
+        if isinstance(terme, str):
+            terme = [terme]
+        gefunden = [term for term in terme if term in self._term_idx]
+        regionen = self._regionen_maske(bundesland)
+
+        spalten = [self._term_idx[term] for term in gefunden]
+        werte = self._bloecke(self.matrix[:, spalten].toarray(), regionen).astype(np.float64)
+
+        df = pd.DataFrame(werte, index=pd.to_datetime(self.tage), columns=gefunden)
+        # Nicht (oft genug) vorkommende Terme als Nullreihe
+        df = df.reindex(columns=terme, fill_value=0.0)
+
+        if summieren:
+            df = df.sum(axis=1).to_frame(name=' + '.join(terme))
+
+        if normalisiert:
+            basis = self._bloecke(self.token_summen, regionen)
+            df = df.div(np.where(basis > 0, basis, np.nan), axis=0).fillna(0) * 10_000
+
+        return df
+
+    def vergleich(self, terme, bundeslaender, normalisiert=True):
+        """
+        Eine Termmenge (summiert) in mehreren Bundesländern nebeneinander.
+        Returns: DataFrame (Index = Datum, Spalten = Bundesländer)
+        """
+        return pd.concat(
+            [self.serie(terme, bl, normalisiert, summieren=True).iloc[:, 0].rename(bl) for bl in bundeslaender],
+            axis=1
+        )
+
+    def tweets_pro_tag(self, bundesland=None):
+        """Anzahl Tweets pro Tag (gesamt oder für Bundesland/Liste)"""
+        return pd.Series(self._bloecke(self.tweet_summen, self._regionen_maske(bundesland)),
+                         index=pd.to_datetime(self.tage), name='Tweets')
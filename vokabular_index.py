@@ -0,0 +1,136 @@
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick-Automat für die gleichzeitige Suche vieler Teilstrings.
+    Ein Text wird in einem einzigen Durchlauf nach allen Mustern durchsucht,
+    die Laufzeit hängt nicht mehr von der Anzahl der Muster ab.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+
+        # Zustand 0 ist die Wurzel
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern_id)
+
+        # Fehlerlinks per Breitensuche setzen
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+
+                # Ausgaben des Fehler-Zustands übernehmen (Suffix-Treffer)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def finditer(self, text):
+        """Liefert (Endposition, Muster-ID) für jeden Treffer im Text"""
+        state = 0
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        for pos, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern_id in output[state]:
+                yield pos, pattern_id
+
+    def matches(self, text):
+        """Gibt die Menge aller im Text gefundenen Muster-IDs zurück"""
+        return {pattern_id for _, pattern_id in self.finditer(text)}
+
+    def first_match(self, text):
+        """Gibt die Muster-ID des ersten Treffers zurück (oder None)"""
+        for _, pattern_id in self.finditer(text):
+            return pattern_id
+        return None
+
+
+class VokabularIndex:
+    """
+    Suchstruktur über das Token-Vokabular.
+    - Präfix-Suche über die sortierte Termliste (Binärsuche)
+    - Teilstring-Suche über ein Suffix-Array aller Terme (Binärsuche)
+    - Mehrfachmuster-Suche über einen Aho-Corasick-Automaten (ein Durchlauf)
+    Einmal aufgebaut beantwortet der Index beliebige Anfragen ohne erneuten
+    Durchlauf über das gesamte Vokabular.
+    """
+
+    def __init__(self, terms):
+        self.terms = sorted(set(terms))
+        self._terms_lower = [term.lower() for term in self.terms]
+
+        # Präfix-Index: nach Kleinschreibung sortierte Positionen
+        self._praefix_order = sorted(range(len(self.terms)), key=lambda i: self._terms_lower[i])
+        self._praefix_keys = [self._terms_lower[i] for i in self._praefix_order]
+
+        # Suffix-Array über alle Terme: jedes Suffix zeigt auf seinen Term
+        suffixe = []
+        for term_id, term in enumerate(self._terms_lower):
+            for start in range(len(term)):
+                suffixe.append((term[start:], term_id))
+        suffixe.sort()
+
+        self._suffix_keys = [suffix for suffix, _ in suffixe]
+        self._suffix_term_ids = [term_id for _, term_id in suffixe]
+
+    def __len__(self):
+        return len(self.terms)
+
+    def praefix(self, query):
+        """Alle Terme, die mit query beginnen (alphabetisch sortiert)"""
+        query = query.lower()
+        start = bisect_left(self._praefix_keys, query)
+        end = bisect_right(self._praefix_keys, query + '\U0010ffff')
+        return [self.terms[i] for i in self._praefix_order[start:end]]
+
+    def teilstring(self, query):
+        """Alle Terme, die query an beliebiger Stelle enthalten (alphabetisch sortiert)"""
+        query = query.lower()
+        if not query:
+            return list(self.terms)
+
+        start = bisect_left(self._suffix_keys, query)
+        end = bisect_right(self._suffix_keys, query + '\U0010ffff')
+        term_ids = set(self._suffix_term_ids[start:end])
+        return [self.terms[i] for i in sorted(term_ids)]
+
+    def enthaelt_eines(self, patterns):
+        """
+        Findet alle Terme, die mindestens eines der Muster enthalten.
+        Returns: {term: erstes gefundenes Muster}
+        """
+        automat = AhoCorasick([pattern.lower() for pattern in patterns])
+
+        treffer = {}
+        for term, term_lower in zip(self.terms, self._terms_lower):
+            pattern_id = automat.first_match(term_lower)
+            if pattern_id is not None:
+                treffer[term] = patterns[pattern_id]
+
+        return treffer
@@ -0,0 +1,132 @@
+import os
+import json
+import shutil
+import hashlib
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from PIL import Image
+from wordcloud import WordCloud
+import matplotlib.pyplot as plt
+
+# Standard-Layout der Wortwolken (wie in den Skripten 08, 10 und 27)
+STANDARD_PARAMETER = {
+    'width': 1600,
+    'height': 800,
+    'background_color': 'white',
+    'colormap': 'viridis',
+    'max_words': 200,
+    'relative_scaling': 0.5,
+    'min_font_size': 10,
+    'random_state': 42  # Fester Seed, damit gecachte und neu berechnete Wolken identisch sind
+}
+
+# Ausgabe in voller Qualität vs. Vorschau
+SPEICHER_DPI = 300
+VORSCHAU_DPI = 72
+VORSCHAU_FAKTOR = 0.25
+
+
+def _parameter(vorschau, wolken_parameter):
+    """Kombiniert Standard-Layout, eigene Parameter und ggf. Vorschau-Auflösung"""
+    params = {**STANDARD_PARAMETER, **wolken_parameter}
+
+    if vorschau:
+        params['width'] = int(params['width'] * VORSCHAU_FAKTOR)
+        params['height'] = int(params['height'] * VORSCHAU_FAKTOR)
+        params['min_font_size'] = max(4, int(params['min_font_size'] * VORSCHAU_FAKTOR))
+
+    return params
+
+
+def _relevante_frequenzen(frequencies, max_words):
+    """
+    Die Einträge, die WordCloud tatsächlich verwendet (Top max_words,
+    gleiche Sortierung wie generate_from_frequencies)
+    """
+    return sorted(frequencies.items(), key=itemgetter(1), reverse=True)[:max_words]
+
+
+def cache_schluessel(frequencies, params, extra=None):
+    """Hash über Frequenztabelle und Layout-Parameter"""
+    inhalt = {
+        'frequenzen': [[wort, float(wert)] for wort, wert in _relevante_frequenzen(frequencies, params['max_words'])],
+        'parameter': params,
+        'extra': extra
+    }
+    return hashlib.sha256(json.dumps(inhalt, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def erzeuge_wortwolke(frequencies, cache_dir=None, vorschau=False, **wolken_parameter):
+    """
+    Erzeugt das Wortwolken-Bild als Array. Ist die Kombination aus
+    Frequenzen und Layout bereits im Cache, wird das Bild nur geladen.
+    """
+    params = _parameter(vorschau, wolken_parameter)
+    cache_file = None
+
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_file = os.path.join(cache_dir, f"wolke_{cache_schluessel(frequencies, params)}.png")
+        if os.path.exists(cache_file):
+            return np.asarray(Image.open(cache_file))
+
+    wordcloud = WordCloud(**params).generate_from_frequencies(dict(frequencies))
+
+    if cache_file:
+        wordcloud.to_file(cache_file)
+
+    return wordcloud.to_array()
+
+
+def _erzeuge_job(job):
+    """Worker für die parallele Erzeugung (muss auf Modulebene liegen)"""
+    frequencies, cache_dir, vorschau, wolken_parameter = job
+    return erzeuge_wortwolke(frequencies, cache_dir, vorschau, **wolken_parameter)
+
+
+def erzeuge_parallel(frequenz_liste, cache_dir=None, vorschau=False, max_workers=None, **wolken_parameter):
+    """
+    Erzeugt mehrere Wortwolken parallel in eigenen Prozessen.
+    Reihenfolge der Ergebnisse entspricht der Reihenfolge der Eingaben.
+    """
+    jobs = [(dict(frequencies), cache_dir, vorschau, wolken_parameter) for frequencies in frequenz_liste]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_erzeuge_job, jobs))
+
+
+def speichere_wortwolke(frequencies, output_file, titel, cache_dir=None, vorschau=False,
+                        figsize=(20, 10), titel_format=None, **wolken_parameter):
+    """
+    Erzeugt eine Wortwolke mit Titel und speichert sie als PNG.
+    Mit cache_dir wird zusätzlich die fertige Grafik gecacht: bei
+    unveränderten Frequenzen, Layout und Titel wird sie nur kopiert.
+    """
+    titel_format = titel_format or {'fontsize': 20, 'pad': 20}
+    params = _parameter(vorschau, wolken_parameter)
+    dpi = VORSCHAU_DPI if vorschau else SPEICHER_DPI
+
+    figur_cache = None
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        schluessel = cache_schluessel(frequencies, params, extra=[titel, list(figsize), titel_format, dpi])
+        figur_cache = os.path.join(cache_dir, f"figur_{schluessel}.png")
+        if os.path.exists(figur_cache):
+            shutil.copyfile(figur_cache, output_file)
+            return output_file
+
+    bild = erzeuge_wortwolke(frequencies, cache_dir, vorschau, **wolken_parameter)
+
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.imshow(bild, interpolation='bilinear')
+    ax.axis('off')
+    ax.set_title(titel, **titel_format)
+
+    plt.savefig(output_file, dpi=dpi, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+
+    if figur_cache:
+        shutil.copyfile(output_file, figur_cache)
+
+    return output_file
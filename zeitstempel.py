@@ -0,0 +1,150 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+import numpy as np
+import pandas as pd
+
+# Tagesgrenzen nach deutscher Ortszeit (statt UTC)
+ZEITZONE = 'Europe/Berlin'
+
+# Twitter Format: "Sat Feb 01 17:11:42 +0000 2020" (immer 30 Zeichen)
+TWITTER_FORMAT_LAENGE = 30
+
+_WOCHENTAGE = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+_WOCHENTAGS_CODES = np.array([(ord(w[0]) << 14) | (ord(w[1]) << 7) | ord(w[2]) for w in _WOCHENTAGE], dtype=np.int64)
+_MONATE = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+_MONATS_CODES = np.array([(ord(m[0]) << 14) | (ord(m[1]) << 7) | ord(m[2]) for m in _MONATE], dtype=np.int64)
+_MONATS_REIHENFOLGE = np.argsort(_MONATS_CODES)
+_MONATS_NUMMERN = {monat: nummer for nummer, monat in enumerate(_MONATE, 1)}
+_EPOCHE = date(1970, 1, 1).toordinal()
+_ZONE = ZoneInfo(ZEITZONE)
+
+# Positionen der Ziffern und Trennzeichen im festen Format
+_ZIFFERN_POSITIONEN = [8, 9, 11, 12, 14, 15, 17, 18, 21, 22, 23, 24, 26, 27, 28, 29]
+_TRENNER = {3: ' ', 7: ' ', 10: ' ', 13: ':', 16: ':', 19: ' ', 25: ' '}
+_TRENNER_POSITIONEN = list(_TRENNER)
+_TRENNER_CODES = np.array([ord(zeichen) for zeichen in _TRENNER.values()], dtype=np.int64)
+
+
+def _zahl(zeichen, *positionen):
+    """Liest eine mehrstellige Zahl aus festen Spalten der Zeichenmatrix"""
+    wert = np.zeros(len(zeichen), dtype=np.int64)
+    for pos in positionen:
+        wert = wert * 10 + (zeichen[:, pos] - 48)
+    return wert
+
+
+def parse_twitter_dates(date_strs):
+    """
+    Vektorisiertes Parsen von Twitter-Zeitstempeln (ohne strptime pro Zeile).
+    Ungültig wie bei strptime sind auch Werte außerhalb der Bereiche (30. Februar,
+    Stunde 24, Minute/Sekunde 60, Offset ab 24 h, Jahr 0).
+    Returns: datetime64[s]-Array in UTC, ungültige Einträge als NaT
+    """
+    werte = np.asarray(date_strs, dtype=f'U{TWITTER_FORMAT_LAENGE}')
+    ergebnis = np.full(len(werte), np.datetime64('NaT'), dtype='datetime64[s]')
+    if len(werte) == 0:
+        return ergebnis
+
+    # Zeichenmatrix (n × 30) der Unicode-Codepoints
+    zeichen = werte.view(np.uint32).reshape(-1, TWITTER_FORMAT_LAENGE).astype(np.int64)
+
+    ziffern = zeichen[:, _ZIFFERN_POSITIONEN] - 48
+    monats_code = (zeichen[:, 4] << 14) | (zeichen[:, 5] << 7) | zeichen[:, 6]
+    monat = _MONATS_REIHENFOLGE[np.minimum(np.searchsorted(_MONATS_CODES[_MONATS_REIHENFOLGE], monats_code), 11)]
+    wochentags_code = (zeichen[:, 0] << 14) | (zeichen[:, 1] << 7) | zeichen[:, 2]
+
+    gueltig = (
+        (np.char.str_len(werte) == TWITTER_FORMAT_LAENGE)
+        & np.all((ziffern >= 0) & (ziffern <= 9), axis=1)
+        & np.all(zeichen[:, _TRENNER_POSITIONEN] == _TRENNER_CODES, axis=1)
+        & (_MONATS_CODES[monat] == monats_code)
+        & np.isin(wochentags_code, _WOCHENTAGS_CODES)
+        & np.isin(zeichen[:, 20], [ord('+'), ord('-')])
+    )
+    if not gueltig.any():
+        return ergebnis
+
+    zeilen = np.flatnonzero(gueltig)
+    zeichen = zeichen[gueltig]
+    jahr = _zahl(zeichen, 26, 27, 28, 29)
+    tag = _zahl(zeichen, 8, 9)
+    stunde, minute, sekunde = _zahl(zeichen, 11, 12), _zahl(zeichen, 14, 15), _zahl(zeichen, 17, 18)
+    offset_stunden, offset_minuten = _zahl(zeichen, 21, 22), _zahl(zeichen, 23, 24)
+
+    monatsanfang = (jahr - 1970).astype('datetime64[Y]').astype('datetime64[M]') + monat[gueltig].astype('timedelta64[M]')
+    monatslaenge = ((monatsanfang + 1).astype('datetime64[D]') - monatsanfang.astype('datetime64[D]')).astype(np.int64)
+
+    # Bereiche wie bei strptime, sonst liefe z.B. der 30. Februar in den März über
+    im_bereich = ((jahr >= 1) & (tag >= 1) & (tag <= monatslaenge)
+                  & (stunde < 24) & (minute < 60) & (sekunde < 60)
+                  & (offset_stunden < 24) & (offset_minuten < 60))
+
+    sekunden = stunde * 3600 + minute * 60 + sekunde
+    offset = (offset_stunden * 3600 + offset_minuten * 60) * np.where(zeichen[:, 20] == ord('-'), -1, 1)
+    datum = monatsanfang.astype('datetime64[D]') + (tag - 1).astype('timedelta64[D]')
+    zeiten = datum.astype('datetime64[s]') + (sekunden - offset).astype('timedelta64[s]')
+
+    ergebnis[zeilen[im_bereich]] = zeiten[im_bereich]
+    return ergebnis
+
+
+def epochs(tweets):
+    """
+    Zeitpunkte aller Tweets als datetime64[s] (UTC).
+    Nutzt die in 07 vorberechnete Spalte created_at_epoch, sonst vektorisiertes Parsen.
+    """
+    vorberechnet = [tweet.get('created_at_epoch') for tweet in tweets]
+    fehlend = [i for i, epoch in enumerate(vorberechnet) if epoch is None]
+
+    zeiten = np.array([epoch if epoch is not None else 0 for epoch in vorberechnet],
+                      dtype=np.int64).astype('datetime64[s]')
+    if fehlend:
+        zeiten[fehlend] = parse_twitter_dates([tweets[i].get('created_at') or '' for i in fehlend])
+    return zeiten
+
+
+def lokale_zeit(zeiten_utc):
+    """UTC-Zeitpunkte → Ortszeit Europe/Berlin (datetime64[s] ohne Zeitzone)"""
+    lokal = pd.DatetimeIndex(zeiten_utc).tz_localize('UTC').tz_convert(ZEITZONE).tz_localize(None)
+    return lokal.values.astype('datetime64[s]')
+
+
+def lokale_tage(tweets):
+    """
+    Kalendertag nach Ortszeit Europe/Berlin je Tweet (datetime64[D], ungültig = NaT).
+    Nutzt die in 07 vorberechnete Spalte datum_lokal, sonst Epoch bzw. created_at.
+    """
+    vorberechnet = [tweet.get('datum_lokal') for tweet in tweets]
+    if all(vorberechnet):
+        return np.array(vorberechnet, dtype='datetime64[D]')
+    return lokale_zeit(epochs(tweets)).astype('datetime64[D]')
+
+
+def zeitstempel_felder(date_str):
+    """
+    Epoch (Sekunden) und lokales Datum (ISO) für einen einzelnen Tweet, z.B. in 07.
+    Skalarer Pfad ohne NumPy-Arrays (gleiche Prüfungen und Ergebnisse wie
+    parse_twitter_dates, das für viele Zeitstempel auf einmal schneller ist).
+    """
+    if not date_str or len(date_str) != TWITTER_FORMAT_LAENGE or date_str[20] not in '+-':
+        return None, None
+    monat = _MONATS_NUMMERN.get(date_str[4:7])
+    ziffern = ''.join(date_str[pos] for pos in _ZIFFERN_POSITIONEN)
+    if (monat is None or date_str[:3] not in _WOCHENTAGE or not (ziffern.isascii() and ziffern.isdigit())
+            or any(date_str[pos] != zeichen for pos, zeichen in _TRENNER.items())):
+        return None, None
+
+    stunde, minute, sekunde = int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19])
+    offset_stunden, offset_minuten = int(date_str[21:23]), int(date_str[23:25])
+    if stunde >= 24 or minute >= 60 or sekunde >= 60 or offset_stunden >= 24 or offset_minuten >= 60:
+        return None, None
+    try:
+        # date() prüft Jahr und Tag im Monat (30. Februar → ValueError)
+        tage = date(int(date_str[26:30]), monat, int(date_str[8:10])).toordinal() - _EPOCHE
+    except ValueError:
+        return None, None
+    sekunden = stunde * 3600 + minute * 60 + sekunde
+    offset = (offset_stunden * 3600 + offset_minuten * 60) * (-1 if date_str[20] == '-' else 1)
+
+    epoch = tage * 86400 + sekunden - offset
+    return epoch, datetime.fromtimestamp(epoch, _ZONE).date().isoformat()